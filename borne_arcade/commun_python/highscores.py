@@ -0,0 +1,555 @@
+"""Stockage des highscores partage par les jeux Python de la borne.
+
+Le fichier ``highscore`` d un jeu garde le format lu par le menu Java: une
+ligne ``NOM-score`` par entree, du meilleur au moins bon, dix au plus par
+defaut (``nombre_max_lignes=None`` ne tronque pas). Il devient un instantane, remplace uniquement par ecriture dans un fichier
+temporaire puis renommage atomique: une coupure de courant laisse l ancien
+ou le nouveau fichier, jamais un melange.
+
+Entre deux instantanes, chaque score est ajoute a un journal
+``highscore.journal`` (une ligne par operation, synchronisee sur disque).
+La premiere ligne du journal porte l empreinte de l instantane auquel il
+s applique: apres un renommage reussi, un journal dont l empreinte ne
+correspond plus est deja integre et il est ignore, ce qui evite de compter
+deux fois une operation si la coupure survient pendant le compactage. Une
+derniere ligne tronquee est ignoree.
+
+Un fichier existant n est jamais modifie a l ouverture. Le premier score
+enregistre le reecrit trie et limite au nombre de lignes du stock; c est la
+migration des anciens fichiers (NeonSumo ecrivait ``J1``, ``J2`` puis
+``AAA-0`` dans cet ordre fixe).
+
+Les ecritures passent par un fil d arriere-plan: ``ajouter_score`` et
+``incrementer_score`` mettent seulement a jour le cache en memoire, lu par
+``lire_scores`` sans acces disque. Le menu Java ne lisant que l instantane,
+chaque fin de match appelle ``publier_instantane``, qui le fait reecrire par
+ce meme fil.
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import os
+import queue
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+
+SUFFIXE_JOURNAL = ".journal"
+SUFFIXE_TEMPORAIRE = ".tmp"
+PREFIXE_EMPREINTE = "#"
+OPERATION_AJOUT = "A"
+OPERATION_INCREMENT = "I"
+# Demande de reecriture de l instantane, jamais journalisee.
+OPERATION_COMPACTION = "C"
+SEPARATEUR_JOURNAL = "\t"
+# Le menu Java affiche dix lignes et refuse les noms contenant un tiret.
+NOMBRE_MAX_LIGNES_DEFAUT = 10
+SEUIL_COMPACTION_DEFAUT = 32
+FIN_ECRITURES = None
+
+Operation = Tuple[str, str, int]
+
+
+@dataclass
+class EtatDisqueHighscore:
+    """Contenu tel qu ecrit sur disque, tenu par le fil d ecriture.
+
+    Attributes:
+        scores: Scores de l instantane et du journal deja ecrits.
+        empreinte: Empreinte de l instantane courant.
+        operations_journal: Nombre d operations dans le journal.
+        journal_valide: False si le journal doit etre recree avant le prochain ajout.
+        ecriture_en_echec: True si une operation n a pas pu etre ecrite depuis le compactage.
+    """
+
+    scores: List[Tuple[str, int]]
+    empreinte: str
+    operations_journal: int
+    journal_valide: bool
+    ecriture_en_echec: bool = False
+
+
+@dataclass
+class StockHighscore:
+    """Highscores d un jeu: cache en memoire et ecriture differee.
+
+    Attributes:
+        chemin: Fichier ``highscore`` du jeu.
+        nombre_max_lignes: Nombre d entrees conservees, None pour tout garder.
+        seuil_compaction: Operations journalisees avant reecriture de l instantane.
+        scores: Cache des scores, tries du meilleur au moins bon.
+        disque: Etat ecrit sur disque, manipule par le seul fil d ecriture.
+        file_ecritures: Operations en attente d ecriture.
+        fil_ecriture: Fil d ecriture, None en mode synchrone ou apres fermeture.
+        erreurs: Nombre d ecritures echouees (disque plein, droits).
+    """
+
+    chemin: Path
+    nombre_max_lignes: Optional[int]
+    seuil_compaction: int
+    scores: List[Tuple[str, int]]
+    disque: EtatDisqueHighscore
+    file_ecritures: "queue.Queue[Optional[Operation]]" = field(default_factory=queue.Queue)
+    fil_ecriture: Optional[threading.Thread] = None
+    erreurs: int = 0
+
+
+def calculer_empreinte(contenu: bytes) -> str:
+    """Empreinte d un instantane.
+
+    Args:
+        contenu: Octets du fichier ``highscore``.
+
+    Returns:
+        Empreinte hexadecimale.
+    """
+
+    return hashlib.sha1(contenu).hexdigest()
+
+
+def analyser_instantane(texte: str) -> List[Tuple[str, int]]:
+    """Lit les lignes ``NOM-score`` d un instantane.
+
+    Args:
+        texte: Contenu du fichier.
+
+    Returns:
+        Entrees lisibles, dans l ordre du fichier.
+    """
+
+    scores = []
+    for ligne in texte.splitlines():
+        nom, separateur, valeur = ligne.strip().rpartition("-")
+        if not separateur or not nom:
+            continue
+        try:
+            scores.append((nom, int(valeur)))
+        except ValueError:
+            continue
+    return scores
+
+
+def formater_instantane(scores: List[Tuple[str, int]]) -> bytes:
+    """Produit le contenu d un instantane.
+
+    Args:
+        scores: Entrees triees.
+
+    Returns:
+        Octets du fichier ``highscore``.
+    """
+
+    return "".join(f"{nom}-{valeur}\n" for nom, valeur in scores).encode("utf-8")
+
+
+def appliquer_operation(
+    scores: List[Tuple[str, int]],
+    operation: Operation,
+    nombre_max_lignes: Optional[int],
+) -> None:
+    """Applique un ajout ou un increment, puis retrie et tronque.
+
+    Args:
+        scores: Entrees modifiees sur place.
+        operation: Triplet (type, nom, valeur).
+        nombre_max_lignes: Nombre d entrees conservees, None pour tout garder.
+
+    Returns:
+        None.
+    """
+
+    type_operation, nom, valeur = operation
+    if type_operation == OPERATION_INCREMENT:
+        for indice, (nom_existant, valeur_existante) in enumerate(scores):
+            if nom_existant == nom:
+                scores[indice] = (nom, valeur_existante + valeur)
+                break
+        else:
+            scores.append((nom, valeur))
+    else:
+        scores.append((nom, valeur))
+    # Tri stable: a egalite, l entree la plus ancienne reste devant.
+    scores.sort(key=lambda entree: -entree[1])
+    if nombre_max_lignes is not None:
+        del scores[nombre_max_lignes:]
+
+
+def lire_journal(chemin: Path, empreinte: str) -> Optional[List[Operation]]:
+    """Relit les operations d un journal s il s applique a l instantane.
+
+    Args:
+        chemin: Fichier journal.
+        empreinte: Empreinte de l instantane courant.
+
+    Returns:
+        Operations completes, liste vide sans journal, None si le journal est perime.
+    """
+
+    try:
+        texte = chemin.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return []
+    except (OSError, UnicodeDecodeError):
+        return None
+    lignes = texte.split("\n")
+    if lignes[0] != PREFIXE_EMPREINTE + empreinte:
+        return None
+    operations = []
+    # La derniere ligne n est complete que si elle se termine par un saut de ligne.
+    for ligne in lignes[1:-1]:
+        champs = ligne.split(SEPARATEUR_JOURNAL)
+        if len(champs) != 3 or champs[0] not in (OPERATION_AJOUT, OPERATION_INCREMENT):
+            continue
+        try:
+            operations.append((champs[0], champs[1], int(champs[2])))
+        except ValueError:
+            continue
+    return operations
+
+
+def ecrire_fichier_atomique(chemin: Path, contenu: bytes) -> None:
+    """Remplace un fichier par ecriture temporaire, synchronisation et renommage.
+
+    Args:
+        chemin: Fichier cible.
+        contenu: Nouveau contenu.
+
+    Returns:
+        None.
+
+    Raises:
+        OSError: Si l ecriture echoue; le fichier cible est alors intact.
+    """
+
+    temporaire = chemin.with_name(chemin.name + SUFFIXE_TEMPORAIRE)
+    try:
+        with temporaire.open("wb") as flux:
+            flux.write(contenu)
+            flux.flush()
+            os.fsync(flux.fileno())
+        os.replace(temporaire, chemin)
+    except OSError:
+        temporaire.unlink(missing_ok=True)
+        raise
+    synchroniser_dossier(chemin.parent)
+
+
+def synchroniser_dossier(dossier: Path) -> None:
+    """Rend durable un renommage dans un dossier (sans effet si non supporte).
+
+    Args:
+        dossier: Dossier a synchroniser.
+
+    Returns:
+        None.
+    """
+
+    try:
+        descripteur = os.open(dossier, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(descripteur)
+    except OSError:
+        pass
+    finally:
+        os.close(descripteur)
+
+
+def chemin_journal(stock: StockHighscore) -> Path:
+    """Chemin du journal d un stock.
+
+    Args:
+        stock: Stock de highscores.
+
+    Returns:
+        Fichier journal a cote de l instantane.
+    """
+
+    return stock.chemin.with_name(stock.chemin.name + SUFFIXE_JOURNAL)
+
+
+def compacter_stock_highscore(stock: StockHighscore) -> None:
+    """Reecrit l instantane avec le journal puis repart d un journal vide.
+
+    A appeler depuis le fil d ecriture, ou en mode synchrone.
+
+    Args:
+        stock: Stock de highscores.
+
+    Returns:
+        None.
+
+    Raises:
+        OSError: Si l ecriture echoue.
+    """
+
+    disque = stock.disque
+    contenu = formater_instantane(disque.scores)
+    ecrire_fichier_atomique(stock.chemin, contenu)
+    disque.empreinte = calculer_empreinte(contenu)
+    ecrire_fichier_atomique(
+        chemin_journal(stock), f"{PREFIXE_EMPREINTE}{disque.empreinte}\n".encode("utf-8")
+    )
+    disque.operations_journal = 0
+    disque.journal_valide = True
+    disque.ecriture_en_echec = False
+
+
+def compacter_si_modifie(stock: StockHighscore) -> None:
+    """Reecrit l instantane s il reste des operations journalisees ou en echec.
+
+    A appeler depuis le fil d ecriture, ou en mode synchrone.
+
+    Args:
+        stock: Stock de highscores.
+
+    Returns:
+        None.
+    """
+
+    if not (stock.disque.operations_journal or stock.disque.ecriture_en_echec):
+        return
+    try:
+        compacter_stock_highscore(stock)
+    except OSError:
+        stock.erreurs += 1
+
+
+def ecrire_operation(stock: StockHighscore, operation: Operation) -> None:
+    """Journalise une operation et compacte au-dela du seuil.
+
+    Args:
+        stock: Stock de highscores.
+        operation: Triplet (type, nom, valeur).
+
+    Returns:
+        None.
+    """
+
+    disque = stock.disque
+    appliquer_operation(disque.scores, operation, stock.nombre_max_lignes)
+    try:
+        if not disque.journal_valide:
+            compacter_stock_highscore(stock)
+            return
+        type_operation, nom, valeur = operation
+        with chemin_journal(stock).open("a", encoding="utf-8") as flux:
+            flux.write(f"{type_operation}{SEPARATEUR_JOURNAL}{nom}{SEPARATEUR_JOURNAL}{valeur}\n")
+            flux.flush()
+            os.fsync(flux.fileno())
+        disque.operations_journal += 1
+        if disque.operations_journal >= stock.seuil_compaction:
+            compacter_stock_highscore(stock)
+    except OSError:
+        stock.erreurs += 1
+        # Le prochain ajout (ou la fermeture) reecrira l instantane avec tout l etat en memoire.
+        disque.journal_valide = False
+        disque.ecriture_en_echec = True
+
+
+def boucler_ecritures(stock: StockHighscore) -> None:
+    """Corps du fil d ecriture: traite la file jusqu au marqueur de fin.
+
+    Args:
+        stock: Stock de highscores.
+
+    Returns:
+        None.
+    """
+
+    while True:
+        operation = stock.file_ecritures.get()
+        try:
+            if operation is FIN_ECRITURES:
+                return
+            if operation[0] == OPERATION_COMPACTION:
+                compacter_si_modifie(stock)
+            else:
+                ecrire_operation(stock, operation)
+        finally:
+            stock.file_ecritures.task_done()
+
+
+def ouvrir_stock_highscore(
+    chemin: Path,
+    nombre_max_lignes: Optional[int] = NOMBRE_MAX_LIGNES_DEFAUT,
+    seuil_compaction: int = SEUIL_COMPACTION_DEFAUT,
+    asynchrone: bool = True,
+) -> StockHighscore:
+    """Charge l instantane et son journal, puis demarre le fil d ecriture.
+
+    Args:
+        chemin: Fichier ``highscore`` du jeu.
+        nombre_max_lignes: Nombre d entrees conservees, None pour tout garder.
+        seuil_compaction: Operations journalisees avant reecriture de l instantane.
+        asynchrone: False pour ecrire dans le fil appelant (tests, outils).
+
+    Returns:
+        StockHighscore pret a l emploi; il est ferme automatiquement a la sortie.
+    """
+
+    try:
+        contenu = chemin.read_bytes()
+    except OSError:
+        contenu = b""
+    scores: List[Tuple[str, int]] = []
+    for entree in analyser_instantane(contenu.decode("utf-8", errors="replace")):
+        appliquer_operation(scores, (OPERATION_AJOUT, *entree), nombre_max_lignes)
+    empreinte = calculer_empreinte(contenu)
+    stock = StockHighscore(
+        chemin=chemin,
+        nombre_max_lignes=nombre_max_lignes,
+        seuil_compaction=max(1, seuil_compaction),
+        scores=[],
+        disque=EtatDisqueHighscore(scores, empreinte, 0, journal_valide=False),
+    )
+    operations = lire_journal(chemin_journal(stock), empreinte)
+    for operation in operations or ():
+        appliquer_operation(scores, operation, nombre_max_lignes)
+    stock.disque.operations_journal = len(operations or ())
+    stock.disque.journal_valide = operations is not None and chemin_journal(stock).exists()
+    stock.scores = list(scores)
+
+    if asynchrone:
+        stock.fil_ecriture = threading.Thread(
+            target=boucler_ecritures,
+            args=(stock,),
+            name=f"highscore_{chemin.parent.name}",
+            daemon=True,
+        )
+        stock.fil_ecriture.start()
+    atexit.register(fermer_stock_highscore, stock)
+    return stock
+
+
+def soumettre_operation(stock: StockHighscore, operation: Operation) -> None:
+    """Met a jour le cache puis confie l ecriture au fil d arriere-plan.
+
+    Args:
+        stock: Stock de highscores.
+        operation: Triplet (type, nom, valeur).
+
+    Returns:
+        None.
+    """
+
+    appliquer_operation(stock.scores, operation, stock.nombre_max_lignes)
+    if stock.fil_ecriture is None:
+        ecrire_operation(stock, operation)
+    else:
+        stock.file_ecritures.put(operation)
+
+
+def ajouter_score(stock: StockHighscore, nom: str, score: int) -> None:
+    """Ajoute une entree au classement (jeux a score).
+
+    Args:
+        stock: Stock de highscores.
+        nom: Nom du joueur, sans tiret.
+        score: Score obtenu.
+
+    Returns:
+        None.
+    """
+
+    soumettre_operation(stock, (OPERATION_AJOUT, nom, int(score)))
+
+
+def incrementer_score(stock: StockHighscore, nom: str, increment: int = 1) -> None:
+    """Ajoute un increment au score d un nom, cree a zero si absent (compteurs de victoires).
+
+    Args:
+        stock: Stock de highscores.
+        nom: Nom du joueur, sans tiret.
+        increment: Valeur ajoutee.
+
+    Returns:
+        None.
+    """
+
+    soumettre_operation(stock, (OPERATION_INCREMENT, nom, int(increment)))
+
+
+def publier_instantane(stock: StockHighscore) -> None:
+    """Fait reecrire l instantane lu par le menu Java, a appeler en fin de match.
+
+    La reecriture passe par le fil d ecriture, apres les operations deja soumises:
+    l appelant ne touche pas au disque.
+
+    Args:
+        stock: Stock de highscores.
+
+    Returns:
+        None.
+    """
+
+    if stock.fil_ecriture is None:
+        compacter_si_modifie(stock)
+    else:
+        stock.file_ecritures.put((OPERATION_COMPACTION, "", 0))
+
+
+def lire_scores(stock: StockHighscore) -> List[Tuple[str, int]]:
+    """Retourne le classement courant depuis le cache.
+
+    Args:
+        stock: Stock de highscores.
+
+    Returns:
+        Copie des entrees, du meilleur au moins bon.
+    """
+
+    return list(stock.scores)
+
+
+def vider_stock_highscore(stock: StockHighscore) -> None:
+    """Attend l ecriture des operations en attente.
+
+    Args:
+        stock: Stock de highscores.
+
+    Returns:
+        None.
+    """
+
+    if stock.fil_ecriture is not None:
+        stock.file_ecritures.join()
+
+
+def fermer_stock_highscore(stock: StockHighscore) -> None:
+    """Ecrit les operations en attente, compacte le journal et arrete le fil.
+
+    Le menu de la borne ne lit que l instantane: il est a jour apres fermeture.
+
+    Args:
+        stock: Stock de highscores.
+
+    Returns:
+        None.
+    """
+
+    if stock.fil_ecriture is not None:
+        stock.file_ecritures.put(FIN_ECRITURES)
+        stock.fil_ecriture.join()
+        stock.fil_ecriture = None
+    compacter_si_modifie(stock)
+
+
+__all__ = [
+    "NOMBRE_MAX_LIGNES_DEFAUT",
+    "SEUIL_COMPACTION_DEFAUT",
+    "StockHighscore",
+    "ouvrir_stock_highscore",
+    "ajouter_score",
+    "incrementer_score",
+    "lire_scores",
+    "publier_instantane",
+    "vider_stock_highscore",
+    "compacter_stock_highscore",
+    "fermer_stock_highscore",
+]
@@ -0,0 +1,452 @@
+"""Profilage du temps image partage par les jeux Python de la borne.
+
+Un jeu s y abonne en appelant, a chaque tour de sa boucle principale:
+``debuter_image`` puis ``enregistrer_evenements`` apres la lecture de la file
+d evenements, ``marquer_phase`` apres la mise a jour, le dessin et la
+presentation, et enfin ``terminer_image``. Le profilage est desactive par
+defaut; ``creer_profileur`` retourne alors None et le jeu ne paie rien.
+
+Variables d environnement:
+    BORNE_PROFILAGE=1: active la mesure et l overlay (bascule par F3).
+    BORNE_PROFILAGE_OVERLAY=1: affiche l overlay des le lancement.
+    BORNE_PROFILAGE_CSV=1: ecrit une ligne CSV par image dans le dossier logs.
+
+Le module n importe pygame qu au premier affichage de l overlay.
+"""
+
+from __future__ import annotations
+
+import atexit
+import csv
+import os
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Deque, Dict, Iterable, List, Mapping, Sequence, TextIO, Tuple
+
+
+VARIABLE_ACTIVATION = "BORNE_PROFILAGE"
+VARIABLE_OVERLAY = "BORNE_PROFILAGE_OVERLAY"
+VARIABLE_CSV = "BORNE_PROFILAGE_CSV"
+VALEURS_VRAIES = {"1", "true", "oui", "on"}
+RACINE_PROJET = Path(__file__).resolve().parents[2]
+DOSSIER_CACHE_LOGS_RELATIF = Path(".cache") / "maintenance_logicielle" / "logs"
+DOSSIER_TEMPORAIRE_LOGS = Path("/tmp") / "maintenance_logicielle" / "logs"
+PHASE_EVENEMENTS = "evenements"
+PHASE_MISE_A_JOUR = "mise_a_jour"
+PHASE_DESSIN = "dessin"
+PHASE_PRESENTATION = "presentation"
+PHASES = (PHASE_EVENEMENTS, PHASE_MISE_A_JOUR, PHASE_DESSIN, PHASE_PRESENTATION)
+MESURE_TRAVAIL = "travail"
+MESURE_INTERVALLE = "intervalle"
+MESURE_LATENCE = "latence_evenements"
+TAILLE_FENETRE_PROFILAGE = 600
+INTERVALLE_RAFRAICHISSEMENT_OVERLAY = 30
+CENTILES_OVERLAY = (50.0, 95.0, 99.0)
+TAILLE_POLICE_OVERLAY = 20
+MARGE_OVERLAY = 6
+COULEUR_FOND_OVERLAY = (0, 0, 0)
+COULEUR_TEXTE_OVERLAY = (120, 255, 160)
+COLONNES_CSV = (
+    "image",
+    "debut_s",
+    *(f"{phase}_ms" for phase in PHASES),
+    f"{MESURE_TRAVAIL}_ms",
+    f"{MESURE_INTERVALLE}_ms",
+    f"{MESURE_LATENCE}_ms",
+)
+
+
+@dataclass
+class ProfileurImages:
+    """Mesures glissantes du temps image d un jeu.
+
+    Attributes:
+        nom_jeu: Nom du jeu profile, repris dans le nom du fichier CSV.
+        horloge: Source de temps monotone en secondes.
+        fenetres: Dernieres durees mesurees (secondes), par phase ou mesure.
+        durees_image: Durees des phases de l image en cours.
+        debut_image: Instant de debut de l image en cours.
+        dernier_marqueur: Instant du dernier marquage de phase.
+        dernier_sondage: Instant de la derniere lecture de la file d evenements.
+        latence_image: Latence d evenements de l image en cours, si evenements.
+        intervalle_image: Ecart avec le debut de l image precedente.
+        numero_image: Nombre d images terminees.
+        overlay_visible: Indique si l overlay est dessine.
+        touche_bascule: Code de touche qui bascule l overlay (resolu a la creation).
+        type_touche: Type d evenement clavier associe a la touche de bascule.
+        flux_csv: Fichier CSV ouvert, si la trace est active.
+        ecrivain_csv: Ecrivain CSV associe.
+        chemin_csv: Chemin du fichier CSV, si la trace est active.
+        lignes_overlay: Lignes de texte affichees par l overlay.
+        rendus_overlay: Surfaces de texte pre-rendues de l overlay.
+        police_overlay: Police de l overlay, creee au premier affichage.
+    """
+
+    nom_jeu: str
+    horloge: Callable[[], float] = time.perf_counter
+    fenetres: Dict[str, Deque[float]] = field(default_factory=dict)
+    durees_image: Dict[str, float] = field(default_factory=dict)
+    debut_image: float | None = None
+    dernier_marqueur: float = 0.0
+    dernier_sondage: float | None = None
+    latence_image: float | None = None
+    intervalle_image: float | None = None
+    numero_image: int = 0
+    overlay_visible: bool = False
+    touche_bascule: int | None = None
+    type_touche: int | None = None
+    flux_csv: TextIO | None = None
+    ecrivain_csv: object | None = None
+    chemin_csv: Path | None = None
+    lignes_overlay: List[str] = field(default_factory=list)
+    rendus_overlay: List[object] = field(default_factory=list)
+    police_overlay: object | None = None
+
+    def __post_init__(self) -> None:
+        """Cree les fenetres glissantes de chaque mesure.
+
+        Returns:
+            None.
+        """
+
+        for nom in (*PHASES, MESURE_TRAVAIL, MESURE_INTERVALLE, MESURE_LATENCE):
+            self.fenetres.setdefault(nom, deque(maxlen=TAILLE_FENETRE_PROFILAGE))
+
+
+def lire_option_booleenne(environnement: Mapping[str, str], nom: str) -> bool:
+    """Interprete une variable d environnement booleenne.
+
+    Args:
+        environnement: Variables d environnement.
+        nom: Nom de la variable.
+
+    Returns:
+        True si la variable vaut 1/true/oui/on.
+    """
+
+    return environnement.get(nom, "").strip().lower() in VALEURS_VRAIES
+
+
+def lister_dossiers_logs_candidats(racine_projet: Path = RACINE_PROJET) -> List[Path]:
+    """Liste les dossiers de logs, dans l ordre de preference de la borne.
+
+    Args:
+        racine_projet: Racine du depot.
+
+    Returns:
+        Liste ordonnee des dossiers candidats.
+    """
+
+    return [
+        racine_projet / "logs",
+        Path.home() / DOSSIER_CACHE_LOGS_RELATIF,
+        DOSSIER_TEMPORAIRE_LOGS,
+    ]
+
+
+def ouvrir_trace_csv(
+    profileur: ProfileurImages,
+    dossiers_candidats: Sequence[Path] | None = None,
+) -> Path | None:
+    """Ouvre le fichier CSV de trace dans le premier dossier de logs inscriptible.
+
+    Args:
+        profileur: Profileur a equiper.
+        dossiers_candidats: Dossiers essayes dans l ordre (defaut: dossiers de la borne).
+
+    Returns:
+        Chemin du fichier ouvert, ou None si aucun dossier n est inscriptible.
+    """
+
+    horodatage = datetime.now().strftime("%Y%m%d_%H%M%S")
+    nom_fichier = f"profilage_{profileur.nom_jeu}_{horodatage}_{os.getpid()}.csv"
+    for dossier in dossiers_candidats or lister_dossiers_logs_candidats():
+        try:
+            dossier.mkdir(parents=True, exist_ok=True)
+            flux = (dossier / nom_fichier).open("w", encoding="utf-8", newline="")
+        except OSError:
+            continue
+        profileur.flux_csv = flux
+        profileur.ecrivain_csv = csv.writer(flux)
+        profileur.ecrivain_csv.writerow(COLONNES_CSV)
+        profileur.chemin_csv = dossier / nom_fichier
+        return profileur.chemin_csv
+    return None
+
+
+def resoudre_touche_bascule() -> Tuple[int | None, int | None]:
+    """Resout le type d evenement clavier et la touche F3 de pygame.
+
+    Returns:
+        Tuple (type_evenement, touche), ou (None, None) sans pygame.
+    """
+
+    try:
+        import pygame  # pylint: disable=import-outside-toplevel
+    except ModuleNotFoundError:
+        return None, None
+    return pygame.KEYDOWN, pygame.K_F3
+
+
+def creer_profileur(
+    nom_jeu: str,
+    environnement: Mapping[str, str] | None = None,
+    horloge: Callable[[], float] = time.perf_counter,
+) -> ProfileurImages | None:
+    """Cree le profileur d un jeu si le profilage est active.
+
+    Args:
+        nom_jeu: Nom du jeu profile.
+        environnement: Variables lues (defaut: os.environ).
+        horloge: Source de temps monotone en secondes.
+
+    Returns:
+        ProfileurImages pret a l emploi, ou None si le profilage est desactive.
+    """
+
+    variables = os.environ if environnement is None else environnement
+    if not lire_option_booleenne(variables, VARIABLE_ACTIVATION):
+        return None
+
+    profileur = ProfileurImages(nom_jeu=nom_jeu, horloge=horloge)
+    profileur.overlay_visible = lire_option_booleenne(variables, VARIABLE_OVERLAY)
+    profileur.type_touche, profileur.touche_bascule = resoudre_touche_bascule()
+    if lire_option_booleenne(variables, VARIABLE_CSV):
+        if ouvrir_trace_csv(profileur) is None:
+            print(f"AVERTISSEMENT: aucun dossier de logs inscriptible pour {nom_jeu}.")
+        else:
+            atexit.register(fermer_profileur, profileur)
+    return profileur
+
+
+def debuter_image(profileur: ProfileurImages) -> None:
+    """Ouvre la mesure d une nouvelle image.
+
+    Args:
+        profileur: Profileur du jeu.
+
+    Returns:
+        None.
+    """
+
+    maintenant = profileur.horloge()
+    if profileur.debut_image is not None:
+        profileur.intervalle_image = maintenant - profileur.debut_image
+    profileur.debut_image = maintenant
+    profileur.dernier_marqueur = maintenant
+    profileur.durees_image.clear()
+    profileur.latence_image = None
+
+
+def marquer_phase(profileur: ProfileurImages, phase: str) -> None:
+    """Impute a une phase le temps ecoule depuis le marquage precedent.
+
+    Args:
+        profileur: Profileur du jeu.
+        phase: Nom de la phase (voir PHASES).
+
+    Returns:
+        None.
+    """
+
+    maintenant = profileur.horloge()
+    duree = maintenant - profileur.dernier_marqueur
+    profileur.durees_image[phase] = profileur.durees_image.get(phase, 0.0) + duree
+    profileur.dernier_marqueur = maintenant
+
+
+def enregistrer_evenements(profileur: ProfileurImages, evenements: Iterable[object]) -> None:
+    """Termine la phase evenements et mesure la latence de la file.
+
+    pygame ne date pas ses evenements: la latence retenue est l ecart avec la
+    lecture precedente de la file, borne haute de l attente d un evenement.
+    La touche F3 bascule l overlay.
+
+    Args:
+        profileur: Profileur du jeu.
+        evenements: Evenements lus pendant l image.
+
+    Returns:
+        None.
+    """
+
+    marquer_phase(profileur, PHASE_EVENEMENTS)
+    maintenant = profileur.dernier_marqueur
+    presents = False
+    for evenement in evenements:
+        presents = True
+        if (
+            profileur.touche_bascule is not None
+            and getattr(evenement, "type", None) == profileur.type_touche
+            and getattr(evenement, "key", None) == profileur.touche_bascule
+        ):
+            basculer_overlay(profileur)
+    if presents and profileur.dernier_sondage is not None:
+        profileur.latence_image = maintenant - profileur.dernier_sondage
+    profileur.dernier_sondage = maintenant
+
+
+def terminer_image(profileur: ProfileurImages) -> None:
+    """Archive les mesures de l image et ecrit la ligne CSV eventuelle.
+
+    Args:
+        profileur: Profileur du jeu.
+
+    Returns:
+        None.
+    """
+
+    travail = profileur.dernier_marqueur - profileur.debut_image
+    for phase in PHASES:
+        profileur.fenetres[phase].append(profileur.durees_image.get(phase, 0.0))
+    profileur.fenetres[MESURE_TRAVAIL].append(travail)
+    if profileur.intervalle_image is not None:
+        profileur.fenetres[MESURE_INTERVALLE].append(profileur.intervalle_image)
+    if profileur.latence_image is not None:
+        profileur.fenetres[MESURE_LATENCE].append(profileur.latence_image)
+    profileur.numero_image += 1
+
+    if profileur.ecrivain_csv is not None:
+        profileur.ecrivain_csv.writerow(
+            [
+                profileur.numero_image,
+                f"{profileur.debut_image:.6f}",
+                *(formater_ms(profileur.durees_image.get(phase, 0.0)) for phase in PHASES),
+                formater_ms(travail),
+                formater_ms(profileur.intervalle_image),
+                formater_ms(profileur.latence_image),
+            ]
+        )
+        # Vidage regulier: un jeu tue par le menu de la borne garde sa trace.
+        if profileur.numero_image % INTERVALLE_RAFRAICHISSEMENT_OVERLAY == 0:
+            profileur.flux_csv.flush()
+
+
+def formater_ms(duree: float | None) -> str:
+    """Formate une duree en millisecondes pour le CSV.
+
+    Args:
+        duree: Duree en secondes, ou None.
+
+    Returns:
+        Texte avec trois decimales, vide si la duree est absente.
+    """
+
+    return "" if duree is None else f"{duree * 1000.0:.3f}"
+
+
+def calculer_centiles(valeurs: Iterable[float], centiles: Sequence[float]) -> List[float]:
+    """Calcule des centiles par la methode du rang le plus proche.
+
+    Args:
+        valeurs: Echantillon.
+        centiles: Centiles voulus, entre 0 et 100.
+
+    Returns:
+        Valeurs des centiles, 0.0 si l echantillon est vide.
+    """
+
+    triees = sorted(valeurs)
+    if not triees:
+        return [0.0 for _ in centiles]
+    derniere_position = len(triees) - 1
+    resultats = []
+    for centile in centiles:
+        rang = max(0, min(derniere_position, -(-len(triees) * centile // 100) - 1))
+        resultats.append(triees[int(rang)])
+    return resultats
+
+
+def construire_lignes_overlay(profileur: ProfileurImages) -> List[str]:
+    """Construit le texte de l overlay a partir des fenetres glissantes.
+
+    Args:
+        profileur: Profileur du jeu.
+
+    Returns:
+        Lignes de texte, une par mesure.
+    """
+
+    intervalles = profileur.fenetres[MESURE_INTERVALLE]
+    moyenne = sum(intervalles) / len(intervalles) if intervalles else 0.0
+    ips = 1.0 / moyenne if moyenne > 0.0 else 0.0
+    lignes = [f"{profileur.nom_jeu} {ips:5.1f} ips  p50/p95/p99 ms"]
+    for nom in (MESURE_INTERVALLE, MESURE_TRAVAIL, *PHASES, MESURE_LATENCE):
+        centiles = calculer_centiles(profileur.fenetres[nom], CENTILES_OVERLAY)
+        valeurs = "/".join(f"{valeur * 1000.0:.1f}" for valeur in centiles)
+        lignes.append(f"{nom:<18} {valeurs}")
+    return lignes
+
+
+def basculer_overlay(profileur: ProfileurImages) -> None:
+    """Affiche ou masque l overlay.
+
+    Args:
+        profileur: Profileur du jeu.
+
+    Returns:
+        None.
+    """
+
+    profileur.overlay_visible = not profileur.overlay_visible
+
+
+def dessiner_overlay_profilage(profileur: ProfileurImages, surface, police=None):
+    """Dessine l overlay des centiles en haut a gauche de la surface.
+
+    Le texte n est recalcule et re-rendu que toutes les
+    INTERVALLE_RAFRAICHISSEMENT_OVERLAY images.
+
+    Args:
+        profileur: Profileur du jeu.
+        surface: Surface pygame cible.
+        police: Police pygame (defaut: police systeme creee a la demande).
+
+    Returns:
+        Rectangle pygame modifie, ou None si l overlay est masque.
+    """
+
+    if not profileur.overlay_visible:
+        return None
+    import pygame  # pylint: disable=import-outside-toplevel
+
+    if police is None:
+        if profileur.police_overlay is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            profileur.police_overlay = pygame.font.Font(None, TAILLE_POLICE_OVERLAY)
+        police = profileur.police_overlay
+    rafraichir = profileur.numero_image % INTERVALLE_RAFRAICHISSEMENT_OVERLAY == 0
+    if rafraichir or not profileur.rendus_overlay:
+        profileur.lignes_overlay = construire_lignes_overlay(profileur)
+        profileur.rendus_overlay = [
+            police.render(ligne, True, COULEUR_TEXTE_OVERLAY) for ligne in profileur.lignes_overlay
+        ]
+
+    largeur = max(rendu.get_width() for rendu in profileur.rendus_overlay) + 2 * MARGE_OVERLAY
+    hauteur = sum(rendu.get_height() for rendu in profileur.rendus_overlay) + 2 * MARGE_OVERLAY
+    rectangle = pygame.Rect(0, 0, largeur, hauteur)
+    surface.fill(COULEUR_FOND_OVERLAY, rectangle)
+    y = MARGE_OVERLAY
+    for rendu in profileur.rendus_overlay:
+        surface.blit(rendu, (MARGE_OVERLAY, y))
+        y += rendu.get_height()
+    return rectangle.clip(surface.get_rect())
+
+
+def fermer_profileur(profileur: ProfileurImages) -> None:
+    """Ferme la trace CSV du profileur.
+
+    Args:
+        profileur: Profileur du jeu.
+
+    Returns:
+        None.
+    """
+
+    if profileur.flux_csv is not None and not profileur.flux_csv.closed:
+        profileur.flux_csv.close()
+    profileur.ecrivain_csv = None
@@ -0,0 +1,166 @@
+"""Tests unitaires du stockage partage des highscores."""
+
+from __future__ import annotations
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+DOSSIER_COMMUN = Path(__file__).resolve().parents[1]
+if str(DOSSIER_COMMUN) not in sys.path:
+    sys.path.insert(0, str(DOSSIER_COMMUN))
+
+import highscores  # noqa: E402
+
+
+class TestHighscores(unittest.TestCase):
+    """Valide le format du menu, le journal, le compactage et la reprise apres coupure."""
+
+    def setUp(self) -> None:
+        """Cree un dossier de jeu temporaire.
+
+        Returns:
+            None.
+        """
+
+        self.dossier = tempfile.TemporaryDirectory()
+        self.chemin = Path(self.dossier.name) / "highscore"
+
+    def tearDown(self) -> None:
+        """Supprime le dossier temporaire.
+
+        Returns:
+            None.
+        """
+
+        self.dossier.cleanup()
+
+    def ouvrir(self, **options) -> highscores.StockHighscore:
+        """Ouvre le stock de test en mode synchrone par defaut.
+
+        Args:
+            **options: Options de ``ouvrir_stock_highscore``.
+
+        Returns:
+            StockHighscore ouvert.
+        """
+
+        options.setdefault("asynchrone", False)
+        return highscores.ouvrir_stock_highscore(self.chemin, **options)
+
+    def test_instantane_au_format_du_menu(self) -> None:
+        """Le fichier reste en lignes NOM-score triees et limitees a dix."""
+
+        self.chemin.write_text("J1-2\nJ2-5\nAAA-0\n", encoding="utf-8")
+        stock = self.ouvrir()
+        highscores.incrementer_score(stock, "J1", 4)
+        for score in range(12):
+            highscores.ajouter_score(stock, "BOB", score)
+        classement = highscores.lire_scores(stock)
+        highscores.fermer_stock_highscore(stock)
+
+        lignes = self.chemin.read_text(encoding="utf-8").splitlines()
+        self.assertEqual(lignes[:2], ["BOB-11", "BOB-10"])
+        # A egalite, l entree la plus ancienne reste devant.
+        self.assertLess(lignes.index("J1-6"), lignes.index("BOB-6"))
+        self.assertNotIn("AAA-0", lignes)
+        self.assertEqual(len(lignes), highscores.NOMBRE_MAX_LIGNES_DEFAUT)
+        self.assertEqual([f"{nom}-{valeur}" for nom, valeur in classement], lignes)
+        self.assertFalse((Path(self.dossier.name) / "highscore.tmp").exists())
+
+    def test_fichier_historique_intact_sans_nouveau_score(self) -> None:
+        """Ouvrir puis fermer un ancien fichier NeonSumo ne le reecrit pas."""
+
+        self.chemin.write_text("J1-2\nJ2-5\nAAA-0\n", encoding="utf-8")
+        stock = self.ouvrir(asynchrone=True)
+        classement = highscores.lire_scores(stock)
+        highscores.fermer_stock_highscore(stock)
+
+        self.assertEqual(classement, [("J2", 5), ("J1", 2), ("AAA", 0)])
+        self.assertEqual(self.chemin.read_text(encoding="utf-8"), "J1-2\nJ2-5\nAAA-0\n")
+        self.assertFalse(highscores.chemin_journal(stock).exists())
+
+    def test_journal_rejoue_apres_arret_brutal(self) -> None:
+        """Sans fermeture, les operations journalisees sont relues a l ouverture suivante."""
+
+        stock = self.ouvrir(seuil_compaction=100)
+        highscores.incrementer_score(stock, "J1")
+        highscores.incrementer_score(stock, "J2")
+        highscores.incrementer_score(stock, "J1")
+        instantane = self.chemin.read_text(encoding="utf-8")
+        with highscores.chemin_journal(stock).open("a", encoding="utf-8") as flux:
+            flux.write("I\tJ2\t")
+
+        relu = self.ouvrir()
+
+        # Seul le premier ajout, sans journal existant, a reecrit l instantane.
+        self.assertEqual(instantane, "J1-1\n")
+        self.assertEqual(highscores.lire_scores(relu), [("J1", 2), ("J2", 1)])
+
+    def test_coupure_pendant_compactage_sans_double_comptage(self) -> None:
+        """Un journal deja integre a l instantane renomme est ignore."""
+
+        stock = self.ouvrir(seuil_compaction=100)
+        highscores.incrementer_score(stock, "J1")
+        highscores.incrementer_score(stock, "J1")
+        # Coupure entre le renommage de l instantane et la remise a zero du journal.
+        highscores.ecrire_fichier_atomique(
+            self.chemin, highscores.formater_instantane(stock.disque.scores)
+        )
+
+        relu = self.ouvrir()
+        highscores.incrementer_score(relu, "J1")
+        highscores.fermer_stock_highscore(relu)
+
+        self.assertEqual(self.chemin.read_text(encoding="utf-8"), "J1-3\n")
+
+    def test_compactage_periodique_et_ecriture_en_arriere_plan(self) -> None:
+        """Le fil d ecriture journalise puis compacte tous les ``seuil_compaction`` ajouts."""
+
+        stock = self.ouvrir(asynchrone=True, seuil_compaction=4)
+        for score in range(6):
+            highscores.ajouter_score(stock, "ZED", score * 10)
+        self.assertEqual(highscores.lire_scores(stock)[0], ("ZED", 50))
+        highscores.vider_stock_highscore(stock)
+
+        instantane = self.chemin.read_text(encoding="utf-8").splitlines()
+        journal = highscores.chemin_journal(stock).read_text(encoding="utf-8").splitlines()
+        highscores.fermer_stock_highscore(stock)
+
+        self.assertIsNone(stock.fil_ecriture)
+        self.assertEqual(stock.erreurs, 0)
+        self.assertEqual(instantane[0], "ZED-40")
+        self.assertEqual(len(journal), 2)
+        self.assertEqual(self.chemin.read_text(encoding="utf-8").splitlines()[0], "ZED-50")
+
+    def test_instantane_publie_en_fin_de_match(self) -> None:
+        """``publier_instantane`` met l instantane a jour sans attendre le seuil."""
+
+        stock = self.ouvrir(asynchrone=True, seuil_compaction=100)
+        highscores.incrementer_score(stock, "J1")
+        highscores.incrementer_score(stock, "J2")
+        highscores.publier_instantane(stock)
+        highscores.vider_stock_highscore(stock)
+
+        instantane = self.chemin.read_text(encoding="utf-8")
+        journal = highscores.chemin_journal(stock).read_text(encoding="utf-8").splitlines()
+        highscores.fermer_stock_highscore(stock)
+
+        self.assertEqual(instantane, "J1-1\nJ2-1\n")
+        self.assertEqual(len(journal), 1)
+        self.assertEqual(stock.erreurs, 0)
+
+    def test_sans_limite_de_lignes(self) -> None:
+        """``nombre_max_lignes=None`` garde toutes les entrees (ancien fichier ball-blast)."""
+
+        stock = self.ouvrir(nombre_max_lignes=None)
+        for score in range(15):
+            highscores.ajouter_score(stock, "BOB", score)
+        highscores.fermer_stock_highscore(stock)
+
+        self.assertEqual(len(self.chemin.read_text(encoding="utf-8").splitlines()), 15)
+
+
+if __name__ == "__main__":
+    unittest.main()
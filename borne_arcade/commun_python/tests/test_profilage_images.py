@@ -0,0 +1,184 @@
+"""Tests unitaires du profilage du temps image partage."""
+
+from __future__ import annotations
+
+import csv
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+
+DOSSIER_COMMUN = Path(__file__).resolve().parents[1]
+if str(DOSSIER_COMMUN) not in sys.path:
+    sys.path.insert(0, str(DOSSIER_COMMUN))
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import profilage_images  # noqa: E402
+
+try:
+    import pygame as module_pygame
+except ModuleNotFoundError:  # pragma: no cover - pygame absent
+    module_pygame = None
+
+
+class HorlogeManuelle:
+    """Horloge de test avancee explicitement."""
+
+    def __init__(self) -> None:
+        """Demarre l horloge a une seconde.
+
+        Returns:
+            None.
+        """
+
+        self.instant = 1.0
+
+    def __call__(self) -> float:
+        """Retourne l instant courant.
+
+        Returns:
+            Instant en secondes.
+        """
+
+        return self.instant
+
+    def avancer(self, duree: float) -> None:
+        """Avance l horloge.
+
+        Args:
+            duree: Duree en secondes.
+
+        Returns:
+            None.
+        """
+
+        self.instant += duree
+
+
+def jouer_image(profileur, horloge: HorlogeManuelle, evenements=()) -> None:
+    """Simule une image de 1 ms d evenements, 2 ms de mise a jour, 3 ms de dessin, 4 ms de flip.
+
+    Args:
+        profileur: Profileur teste.
+        horloge: Horloge manuelle du profileur.
+        evenements: Evenements lus pendant l image.
+
+    Returns:
+        None.
+    """
+
+    profilage_images.debuter_image(profileur)
+    horloge.avancer(0.001)
+    profilage_images.enregistrer_evenements(profileur, evenements)
+    horloge.avancer(0.002)
+    profilage_images.marquer_phase(profileur, profilage_images.PHASE_MISE_A_JOUR)
+    horloge.avancer(0.003)
+    profilage_images.marquer_phase(profileur, profilage_images.PHASE_DESSIN)
+    horloge.avancer(0.004)
+    profilage_images.marquer_phase(profileur, profilage_images.PHASE_PRESENTATION)
+    profilage_images.terminer_image(profileur)
+    horloge.avancer(0.010)
+
+
+class TestProfilageImages(unittest.TestCase):
+    """Valide l activation, les mesures par phase et la trace CSV."""
+
+    def test_desactive_par_defaut(self) -> None:
+        """Sans variable d environnement, aucun profileur n est cree."""
+
+        self.assertIsNone(profilage_images.creer_profileur("Jeu", environnement={}))
+        self.assertIsNone(
+            profilage_images.creer_profileur("Jeu", environnement={"BORNE_PROFILAGE": "0"})
+        )
+
+    def test_mesures_par_phase_et_latence(self) -> None:
+        """Chaque phase recoit son temps et la latence suit l ecart entre lectures."""
+
+        horloge = HorlogeManuelle()
+        profileur = profilage_images.creer_profileur(
+            "Jeu", environnement={"BORNE_PROFILAGE": "1"}, horloge=horloge
+        )
+
+        jouer_image(profileur, horloge)
+        jouer_image(profileur, horloge, evenements=[SimpleNamespace(type=0)])
+
+        fenetres = profileur.fenetres
+        self.assertEqual(profileur.numero_image, 2)
+        self.assertAlmostEqual(fenetres[profilage_images.PHASE_EVENEMENTS][1], 0.001)
+        self.assertAlmostEqual(fenetres[profilage_images.PHASE_MISE_A_JOUR][1], 0.002)
+        self.assertAlmostEqual(fenetres[profilage_images.PHASE_DESSIN][1], 0.003)
+        self.assertAlmostEqual(fenetres[profilage_images.PHASE_PRESENTATION][1], 0.004)
+        self.assertAlmostEqual(fenetres[profilage_images.MESURE_TRAVAIL][1], 0.010)
+        self.assertEqual(len(fenetres[profilage_images.MESURE_INTERVALLE]), 1)
+        self.assertAlmostEqual(fenetres[profilage_images.MESURE_INTERVALLE][0], 0.020)
+        self.assertEqual(len(fenetres[profilage_images.MESURE_LATENCE]), 1)
+        self.assertAlmostEqual(fenetres[profilage_images.MESURE_LATENCE][0], 0.020)
+
+    def test_centiles_rang_le_plus_proche(self) -> None:
+        """Les centiles suivent la methode du rang le plus proche."""
+
+        valeurs = [float(valeur) for valeur in range(1, 101)]
+
+        self.assertEqual(
+            profilage_images.calculer_centiles(valeurs, (50.0, 95.0, 99.0)), [50.0, 95.0, 99.0]
+        )
+        self.assertEqual(profilage_images.calculer_centiles([3.0], (50.0, 99.0)), [3.0, 3.0])
+        self.assertEqual(profilage_images.calculer_centiles([], (50.0,)), [0.0])
+
+    def test_trace_csv_dans_le_premier_dossier_inscriptible(self) -> None:
+        """La trace est ecrite ligne par ligne dans le premier dossier de logs utilisable."""
+
+        horloge = HorlogeManuelle()
+        profileur = profilage_images.ProfileurImages(nom_jeu="Jeu", horloge=horloge)
+        with tempfile.TemporaryDirectory() as dossier_temporaire:
+            fichier_bloquant = Path(dossier_temporaire) / "fichier"
+            fichier_bloquant.write_text("", encoding="utf-8")
+            dossier_logs = Path(dossier_temporaire) / "logs"
+
+            chemin = profilage_images.ouvrir_trace_csv(
+                profileur, [fichier_bloquant / "logs", dossier_logs]
+            )
+            jouer_image(profileur, horloge)
+            jouer_image(profileur, horloge)
+            profilage_images.fermer_profileur(profileur)
+
+            with chemin.open("r", encoding="utf-8", newline="") as flux:
+                lignes = list(csv.DictReader(flux))
+
+        self.assertEqual(chemin.parent, dossier_logs)
+        self.assertTrue(chemin.name.startswith("profilage_Jeu_"))
+        self.assertEqual(len(lignes), 2)
+        self.assertEqual(lignes[0]["dessin_ms"], "3.000")
+        self.assertEqual(lignes[0]["intervalle_ms"], "")
+        self.assertEqual(lignes[1]["intervalle_ms"], "20.000")
+        self.assertEqual(lignes[1]["latence_evenements_ms"], "")
+
+    @unittest.skipIf(module_pygame is None, "pygame est requis pour l overlay")
+    def test_overlay_bascule_par_f3(self) -> None:
+        """F3 affiche l overlay, dessine dans un rectangle borne en haut a gauche."""
+
+        module_pygame.display.init()
+        module_pygame.font.init()
+        horloge = HorlogeManuelle()
+        profileur = profilage_images.creer_profileur(
+            "Jeu", environnement={"BORNE_PROFILAGE": "1"}, horloge=horloge
+        )
+        surface = module_pygame.Surface((640, 480))
+
+        self.assertIsNone(profilage_images.dessiner_overlay_profilage(profileur, surface))
+        touche_f3 = module_pygame.event.Event(module_pygame.KEYDOWN, key=module_pygame.K_F3)
+        jouer_image(profileur, horloge, evenements=[touche_f3])
+        rectangle = profilage_images.dessiner_overlay_profilage(profileur, surface)
+
+        self.assertTrue(profileur.overlay_visible)
+        self.assertEqual(rectangle.topleft, (0, 0))
+        self.assertLess(rectangle.width, 640)
+        # En-tete, intervalle, travail, phases puis latence.
+        self.assertEqual(len(profileur.lignes_overlay), 4 + len(profilage_images.PHASES))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -141,6 +141,23 @@ preparer_classpath_mg2d() {
   CLASSPATH_MG2D="${CHEMIN_MG2D}"
 }
 
+#######################################
+# Indique si un jeu fait partie de la
+# selection JEUX_A_COMPILER (liste separee
+# par des espaces, tous les jeux si absente).
+# Arguments:
+#   $1: nom du jeu
+# Retour:
+#   0 si le jeu doit etre compile, 1 sinon
+#######################################
+jeu_a_compiler() {
+  local nom_jeu="$1"
+  if [[ -z "${JEUX_A_COMPILER+x}" ]]; then
+    return 0
+  fi
+  [[ " ${JEUX_A_COMPILER} " == *" ${nom_jeu} "* ]]
+}
+
 #######################################
 # Compile les classes Java du menu principal.
 # Arguments:
@@ -181,6 +198,7 @@ compiler_jeux_java() {
 
     local nom_jeu
     nom_jeu="$(basename "${dossier_jeu}")"
+    jeu_a_compiler "${nom_jeu}" || continue
     local dossier_classes_jeu=""
     dossier_classes_jeu="$(obtenir_dossier_classes_jeu_compilation "${nom_jeu}")"
     local fichiers_java=()
@@ -266,7 +284,11 @@ main() {
   verifier_acces_ecriture_build_compilation
   preparer_classpath_mg2d
   preparer_dossiers_build_java
-  compiler_menu
+  if [[ "${COMPILER_MENU:-1}" == "1" ]]; then
+    compiler_menu
+  else
+    echo "Compilation du menu ignoree (COMPILER_MENU=0)"
+  fi
   compiler_jeux_java
 }
 
@@ -48,6 +48,8 @@ main() {
     return 0
   fi
 
+  # Modules Python partages (profilage du temps image, ...).
+  export PYTHONPATH="${SCRIPT_DIR}/commun_python${PYTHONPATH:+:${PYTHONPATH}}"
   cd "${SCRIPT_DIR}/projet/${nom_jeu}"
   touch highscore
   "${COMMANDE_PYTHON}" "${script_entree}"
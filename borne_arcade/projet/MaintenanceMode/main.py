@@ -4,13 +4,19 @@ from __future__ import annotations
 
 import queue
 import threading
+import time
+from collections import deque
 from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List
+from typing import Deque, Dict, Iterable, List
 
 import pygame
 
 from operations import (
+    JetonAnnulation,
+    annuler_operation,
     charger_configuration,
     creer_fichier_verrouillage,
     executer_operation,
@@ -33,6 +39,10 @@ MARGE_BARRE_DEFILEMENT_JOURNAL_HORIZONTAL_GAUCHE = 14
 MARGE_BARRE_DEFILEMENT_JOURNAL_HORIZONTAL_DROITE = 28
 SEUIL_MIN_POUCE_BARRE_DEFILEMENT = 16
 SEUIL_MIN_POUCE_BARRE_DEFILEMENT_HORIZONTAL = 28
+TAILLE_CACHE_RENDU_LIGNES_JOURNAL = 256
+LIGNES_MAX_PAR_IMAGE_PAR_DEFAUT = 400
+BUDGET_VIDAGE_JOURNAL_MS_PAR_DEFAUT = 4
+SEUIL_SATURATION_JOURNAL_PAR_DEFAUT = 2000
 
 
 TAILLES_PAR_DEFAUT = {
@@ -67,6 +77,43 @@ THEME_PAR_DEFAUT = {
 }
 
 
+@dataclass
+class JournalCirculaire:
+    """Historique borne du journal affiche, avec la longueur maximale suivie en continu.
+
+    ``occurrences_longueurs`` compte les lignes par longueur: retirer la plus
+    longue ligne ne demande de rechercher le nouveau maximum que parmi les
+    longueurs distinctes encore presentes, jamais parmi toutes les lignes.
+    """
+
+    lignes: Deque[str] = field(default_factory=deque)
+    occurrences_longueurs: Dict[int, int] = field(default_factory=dict)
+    longueur_max: int = 0
+
+    def __len__(self) -> int:
+        """Retourne le nombre de lignes conservees.
+
+        Returns:
+            Nombre de lignes du journal.
+        """
+
+        return len(self.lignes)
+
+
+@dataclass
+class BudgetVidageJournal:
+    """Limite le travail consacre a chaque image au transfert des logs vers le journal affiche.
+
+    Au-dela de ``seuil_saturation`` lignes en attente, seules les plus recentes
+    qui tiennent dans l historique affiche sont conservees; le fichier de
+    journal reste complet.
+    """
+
+    lignes_max_par_image: int = LIGNES_MAX_PAR_IMAGE_PAR_DEFAUT
+    duree_max_ms: int = BUDGET_VIDAGE_JOURNAL_MS_PAR_DEFAUT
+    seuil_saturation: int = SEUIL_SATURATION_JOURNAL_PAR_DEFAUT
+
+
 @dataclass
 class EtatInterface:
     """Conserve l etat mutable de l interface maintenance."""
@@ -76,11 +123,81 @@ class EtatInterface:
     succes_operation: bool = True
     operation_en_cours: bool = False
     titre_operation_en_cours: str = ""
-    journal_visible: List[str] = field(default_factory=list)
+    journal_visible: JournalCirculaire = field(default_factory=JournalCirculaire)
     auto_scroll_journal: bool = True
     decalage_lignes_journal: int = 0
     decalage_colonnes_journal: int = 0
     thread_operation: threading.Thread | None = None
+    jeton_annulation: JetonAnnulation | None = None
+    lots_journal_en_attente: Deque[List[str]] = field(default_factory=deque)
+    index_lot_journal: int = 0
+    lignes_journal_en_attente: int = 0
+
+
+def empiler_ligne_journal(journal: JournalCirculaire, ligne: str, limite_lignes: int) -> None:
+    """Ajoute une ligne en fin de journal et retire les plus anciennes au-dela de la limite.
+
+    Args:
+        journal: Journal circulaire modifie sur place.
+        ligne: Ligne a ajouter.
+        limite_lignes: Nombre maximal de lignes conservees.
+
+    Returns:
+        Aucun.
+    """
+
+    journal.lignes.append(ligne)
+    longueur = len(ligne)
+    journal.occurrences_longueurs[longueur] = journal.occurrences_longueurs.get(longueur, 0) + 1
+    journal.longueur_max = max(journal.longueur_max, longueur)
+
+    max_recalcule = False
+    while len(journal.lignes) > max(1, limite_lignes):
+        longueur_retiree = len(journal.lignes.popleft())
+        restantes = journal.occurrences_longueurs[longueur_retiree] - 1
+        if restantes:
+            journal.occurrences_longueurs[longueur_retiree] = restantes
+            continue
+        del journal.occurrences_longueurs[longueur_retiree]
+        max_recalcule = max_recalcule or longueur_retiree == journal.longueur_max
+    if max_recalcule:
+        journal.longueur_max = max(journal.occurrences_longueurs, default=0)
+
+
+def creer_journal_circulaire(lignes: Iterable[str], limite_lignes: int) -> JournalCirculaire:
+    """Construit un journal circulaire a partir de lignes existantes.
+
+    Args:
+        lignes: Lignes initiales, de la plus ancienne a la plus recente.
+        limite_lignes: Nombre maximal de lignes conservees.
+
+    Returns:
+        Journal circulaire contenant au plus ``limite_lignes`` lignes.
+    """
+
+    journal = JournalCirculaire()
+    for ligne in lignes:
+        empiler_ligne_journal(journal, ligne, limite_lignes)
+    return journal
+
+
+def lister_lignes_journal(
+    journal: JournalCirculaire,
+    index_debut: int,
+    index_fin: int,
+) -> List[str]:
+    """Extrait une tranche du journal sans copier tout l historique.
+
+    Args:
+        journal: Journal circulaire.
+        index_debut: Premier index inclus.
+        index_fin: Dernier index exclu.
+
+    Returns:
+        Lignes de la tranche demandee.
+    """
+
+    return list(islice(journal.lignes, max(0, index_debut), max(0, index_fin)))
 
 
 def calculer_decalage_max_journal(nombre_lignes_total: int, nombre_lignes_visibles: int) -> int:
@@ -164,23 +281,20 @@ def ajuster_decalage_journal(
 
 
 def calculer_decalage_horizontal_max_journal(
-    lignes: List[str],
+    journal: JournalCirculaire,
     nombre_colonnes_visibles: int,
 ) -> int:
     """Calcule le decalage horizontal maximal du journal.
 
     Args:
-        lignes: Historique complet des lignes du journal.
+        journal: Historique du journal et sa longueur de ligne maximale.
         nombre_colonnes_visibles: Nombre de colonnes affichables.
 
     Returns:
         Valeur maximale de decalage horizontal.
     """
 
-    if not lignes:
-        return 0
-    longueur_max = max(len(ligne) for ligne in lignes)
-    return max(0, longueur_max - max(1, nombre_colonnes_visibles))
+    return max(0, journal.longueur_max - max(1, nombre_colonnes_visibles))
 
 
 def borner_decalage_horizontal_journal(
@@ -243,6 +357,31 @@ def extraire_segment_horizontal(
     return texte[colonne_depart:colonne_fin]
 
 
+@lru_cache(maxsize=TAILLE_CACHE_RENDU_LIGNES_JOURNAL)
+def rendre_ligne_journal(
+    police: pygame.font.Font,
+    texte: str,
+    decalage: int,
+    nombre_colonnes_visibles: int,
+    couleur: tuple[int, int, int],
+) -> pygame.Surface:
+    """Rend la tranche visible d une ligne du journal et la conserve en cache LRU.
+
+    Args:
+        police: Police du journal.
+        texte: Ligne de journal complete.
+        decalage: Decalage horizontal en colonnes.
+        nombre_colonnes_visibles: Nombre de colonnes affichables.
+        couleur: Couleur RGB du texte.
+
+    Returns:
+        Surface de la tranche rendue, partagee entre les images.
+    """
+
+    segment = extraire_segment_horizontal(texte, decalage, nombre_colonnes_visibles)
+    return police.render(segment, True, couleur)
+
+
 def charger_parametres() -> Dict[str, object]:
     """Charge la configuration locale du mode maintenance.
 
@@ -306,6 +445,36 @@ def extraire_couleur(
     return (composantes[0], composantes[1], composantes[2])
 
 
+def charger_budget_vidage_journal(
+    section_journal: Dict[str, object],
+    limite_lignes: int,
+) -> BudgetVidageJournal:
+    """Lit le budget de vidage du journal par image.
+
+    Args:
+        section_journal: Section ``journal`` de la configuration.
+        limite_lignes: Taille max du journal visible, plancher du seuil de saturation.
+
+    Returns:
+        Budget de vidage borne.
+    """
+
+    lignes_max = extraire_entier(
+        section_journal, "lignes_max_par_image", LIGNES_MAX_PAR_IMAGE_PAR_DEFAUT
+    )
+    duree_max_ms = extraire_entier(
+        section_journal, "budget_vidage_ms", BUDGET_VIDAGE_JOURNAL_MS_PAR_DEFAUT
+    )
+    seuil_saturation = extraire_entier(
+        section_journal, "seuil_saturation_lignes", SEUIL_SATURATION_JOURNAL_PAR_DEFAUT
+    )
+    return BudgetVidageJournal(
+        lignes_max_par_image=max(1, lignes_max),
+        duree_max_ms=max(1, duree_max_ms),
+        seuil_saturation=max(limite_lignes, seuil_saturation),
+    )
+
+
 def charger_tailles_interface(configuration: Dict[str, object]) -> Dict[str, int]:
     """Charge les tailles d interface depuis la configuration.
 
@@ -624,13 +793,15 @@ def dessiner_zone_journal(
         largeur_disponible -= LARGEUR_BARRE_DEFILEMENT_JOURNAL + MARGE_BARRE_DEFILEMENT_JOURNAL_DROITE
     largeur_disponible = max(largeur_caractere, largeur_disponible)
     nombre_colonnes_visibles = max(1, largeur_disponible // largeur_caractere)
-    decalage_horizontal_max = calculer_decalage_horizontal_max_journal(etat.journal_visible, nombre_colonnes_visibles)
+    decalage_horizontal_max = calculer_decalage_horizontal_max_journal(
+        etat.journal_visible, nombre_colonnes_visibles
+    )
     borner_decalage_horizontal_journal(etat, decalage_horizontal_max)
     decalage_horizontal = etat.decalage_colonnes_journal
 
     index_fin = nombre_lignes_total - decalage
     index_debut = max(0, index_fin - nombre_lignes)
-    lignes = etat.journal_visible[index_debut:index_fin]
+    lignes = lister_lignes_journal(etat.journal_visible, index_debut, index_fin)
     hauteur_zone_lignes = nombre_lignes * tailles["hauteur_ligne_journal"]
     hauteur_bloc_lignes = len(lignes) * tailles["hauteur_ligne_journal"]
     base_y = rectangle.y + MARGE_JOURNAL_HAUT + max(0, hauteur_zone_lignes - hauteur_bloc_lignes)
@@ -657,8 +828,13 @@ def dessiner_zone_journal(
     )
 
     for index, ligne in enumerate(lignes):
-        ligne_affichable = extraire_segment_horizontal(ligne, decalage_horizontal, nombre_colonnes_visibles)
-        rendu = polices["journal"].render(ligne_affichable, True, theme["texte_principal"])
+        rendu = rendre_ligne_journal(
+            polices["journal"],
+            ligne,
+            decalage_horizontal,
+            nombre_colonnes_visibles,
+            theme["texte_principal"],
+        )
         fenetre.blit(rendu, (rectangle.x + MARGE_JOURNAL_GAUCHE, base_y + index * tailles["hauteur_ligne_journal"]))
 
     if nombre_lignes_total > nombre_lignes:
@@ -753,7 +929,7 @@ def dessiner_pied(
 
     dessiner_panneau(fenetre, rectangle, theme["panneau"], theme["panneau_bord"], tailles["rayon_bordure"])
     controles = (
-        "Haut/Bas: selection | F: executer | PgUp/PgDn: scroll vertical | "
+        "Haut/Bas: selection | F: executer | G: annuler | PgUp/PgDn: scroll vertical | "
         "Gauche/Droite: scroll horizontal | A: auto-scroll | Fin: bas | Home: gauche | H: lock+quitter | Echap: quitter"
     )
     controles = tronquer_texte(polices["journal"], controles, rectangle.width - 28)
@@ -857,44 +1033,48 @@ def ajouter_ligne_journal(
         Aucun.
     """
 
-    etat.journal_visible.append(ligne)
-    excedent = len(etat.journal_visible) - limite_lignes
-    if excedent > 0:
-        del etat.journal_visible[:excedent]
+    empiler_ligne_journal(etat.journal_visible, ligne, limite_lignes)
     borner_decalage_journal(etat, len(etat.journal_visible), nombre_lignes_visibles)
 
 
 def executer_operation_en_arriere_plan(
     operation_id: str,
     configuration: Dict[str, object],
-    file_journal: queue.Queue[str],
+    file_journal: queue.Queue[List[str]],
     file_resultat: queue.Queue[tuple[bool, str, Path]],
+    jeton_annulation: JetonAnnulation | None = None,
 ) -> None:
     """Execute une operation dans un thread dedie.
 
     Args:
         operation_id: Identifiant operation a executer.
         configuration: Configuration chargee.
-        file_journal: File des lignes de log temps reel.
+        file_journal: File des lots de lignes de log temps reel.
         file_resultat: File du resultat final.
+        jeton_annulation: Jeton permettant d annuler l operation depuis l interface.
 
     Returns:
         Aucun.
     """
 
-    def pousser_ligne(message: str) -> None:
-        """Alimente la file de logs depuis le worker.
+    def pousser_lot(lignes: List[str]) -> None:
+        """Alimente la file de logs depuis le worker, un lot par element.
 
         Args:
-            message: Ligne de log issue de l operation.
+            lignes: Lignes de log issues de l operation.
 
         Returns:
             Aucun.
         """
 
-        file_journal.put(message)
+        file_journal.put(lignes)
 
-    succes, message, chemin_journal = executer_operation(operation_id, configuration, pousser_ligne)
+    succes, message, chemin_journal = executer_operation(
+        operation_id,
+        configuration,
+        consommateur_lot=pousser_lot,
+        annulation=jeton_annulation,
+    )
     file_resultat.put((succes, message, chemin_journal))
 
 
@@ -902,7 +1082,7 @@ def lancer_operation_asynchrone(
     operations: List[Dict[str, str]],
     configuration: Dict[str, object],
     etat: EtatInterface,
-    file_journal: queue.Queue[str],
+    file_journal: queue.Queue[List[str]],
     file_resultat: queue.Queue[tuple[bool, str, Path]],
     limite_lignes: int,
     nombre_lignes_visibles: int,
@@ -941,42 +1121,146 @@ def lancer_operation_asynchrone(
         nombre_lignes_visibles,
     )
 
+    etat.jeton_annulation = JetonAnnulation()
     thread_operation = threading.Thread(
         target=executer_operation_en_arriere_plan,
-        args=(operation["id"], configuration, file_journal, file_resultat),
+        args=(operation["id"], configuration, file_journal, file_resultat, etat.jeton_annulation),
         daemon=True,
     )
     etat.thread_operation = thread_operation
     thread_operation.start()
 
 
+def recevoir_lots_journal(etat: EtatInterface, file_journal: queue.Queue[List[str]]) -> None:
+    """Deplace les lots deja produits par le worker vers la file d attente de l interface.
+
+    Args:
+        etat: Etat courant.
+        file_journal: File des lots de logs.
+
+    Returns:
+        Aucun.
+    """
+
+    while True:
+        try:
+            lot = file_journal.get_nowait()
+        except queue.Empty:
+            return
+        if lot:
+            etat.lots_journal_en_attente.append(lot)
+            etat.lignes_journal_en_attente += len(lot)
+
+
+def ecarter_lignes_journal_en_retard(etat: EtatInterface, lignes_conservees: int) -> int:
+    """Abandonne les plus anciennes lignes en attente pour n en garder que les plus recentes.
+
+    Args:
+        etat: Etat courant.
+        lignes_conservees: Nombre de lignes recentes a conserver.
+
+    Returns:
+        Nombre de lignes ecartees.
+    """
+
+    a_ecarter = etat.lignes_journal_en_attente - max(0, lignes_conservees)
+    if a_ecarter <= 0:
+        return 0
+
+    restant = a_ecarter
+    while restant > 0:
+        lot = etat.lots_journal_en_attente[0]
+        disponibles = len(lot) - etat.index_lot_journal
+        if disponibles > restant:
+            etat.index_lot_journal += restant
+            break
+        etat.lots_journal_en_attente.popleft()
+        etat.index_lot_journal = 0
+        restant -= disponibles
+    etat.lignes_journal_en_attente -= a_ecarter
+    return a_ecarter
+
+
+def vider_journal_avec_budget(
+    etat: EtatInterface,
+    budget: BudgetVidageJournal,
+    limite_lignes: int,
+    nombre_lignes_visibles: int,
+) -> int:
+    """Ajoute au journal affiche les lignes en attente dans la limite du budget de l image.
+
+    Args:
+        etat: Etat courant.
+        budget: Nombre de lignes et duree maximaux par image, seuil de saturation.
+        limite_lignes: Taille max du journal visible.
+        nombre_lignes_visibles: Nombre de lignes visibles dans le journal.
+
+    Returns:
+        Nombre de lignes ajoutees au journal affiche.
+    """
+
+    if etat.lignes_journal_en_attente > max(1, budget.seuil_saturation):
+        ecartees = ecarter_lignes_journal_en_retard(etat, limite_lignes - 1)
+        marqueur = f"[INFO] {ecartees} lignes non affichees (flux trop rapide), voir le journal."
+        ajouter_ligne_journal(etat, marqueur, limite_lignes, nombre_lignes_visibles)
+
+    echeance = time.perf_counter() + max(0, budget.duree_max_ms) / 1000.0
+    ajoutees = 0
+    while etat.lots_journal_en_attente and ajoutees < max(1, budget.lignes_max_par_image):
+        if ajoutees and time.perf_counter() >= echeance:
+            break
+        lot = etat.lots_journal_en_attente[0]
+        ligne = lot[etat.index_lot_journal]
+        ajouter_ligne_journal(etat, ligne, limite_lignes, nombre_lignes_visibles)
+        ajoutees += 1
+        etat.index_lot_journal += 1
+        if etat.index_lot_journal >= len(lot):
+            etat.lots_journal_en_attente.popleft()
+            etat.index_lot_journal = 0
+    etat.lignes_journal_en_attente -= ajoutees
+    return ajoutees
+
+
 def traiter_flux_asynchrones(
     etat: EtatInterface,
-    file_journal: queue.Queue[str],
+    file_journal: queue.Queue[List[str]],
     file_resultat: queue.Queue[tuple[bool, str, Path]],
     limite_lignes: int,
     nombre_lignes_visibles: int,
+    budget: BudgetVidageJournal | None = None,
 ) -> None:
-    """Vide les files de logs/resultats vers l interface.
+    """Transfere les files de logs/resultats vers l interface sans depasser le budget par image.
+
+    Le resultat final n est applique qu une fois toutes les lignes en attente
+    affichees, pour que le statut ne precede jamais les derniers logs.
 
     Args:
         etat: Etat courant.
-        file_journal: File de logs.
+        file_journal: File des lots de logs.
         file_resultat: File de resultats finaux.
         limite_lignes: Taille max du journal visible.
         nombre_lignes_visibles: Nombre de lignes visibles dans le journal.
+        budget: Budget de vidage par image (valeurs par defaut si absent).
 
     Returns:
         Aucun.
     """
 
-    while not file_journal.empty():
-        ajouter_ligne_journal(etat, file_journal.get_nowait(), limite_lignes, nombre_lignes_visibles)
+    recevoir_lots_journal(etat, file_journal)
+    vider_journal_avec_budget(
+        etat,
+        budget if budget is not None else BudgetVidageJournal(),
+        limite_lignes,
+        nombre_lignes_visibles,
+    )
+    if etat.lots_journal_en_attente:
+        return
 
     while not file_resultat.empty():
         succes, message, chemin_journal = file_resultat.get_nowait()
         etat.operation_en_cours = False
         etat.titre_operation_en_cours = ""
+        etat.jeton_annulation = None
         etat.succes_operation = succes
         etat.message_statut = f"{message} Journal: {chemin_journal}"
 
@@ -986,7 +1270,7 @@ def gerer_evenement_touche(
     operations: List[Dict[str, str]],
     configuration: Dict[str, object],
     etat: EtatInterface,
-    file_journal: queue.Queue[str],
+    file_journal: queue.Queue[List[str]],
     file_resultat: queue.Queue[tuple[bool, str, Path]],
     limite_lignes: int,
     nombre_lignes_visibles: int,
@@ -1035,6 +1319,17 @@ def gerer_evenement_touche(
         )
         return False
 
+    if evenement.key == pygame.K_g:
+        if not etat.operation_en_cours or etat.jeton_annulation is None:
+            etat.succes_operation = False
+            etat.message_statut = "Aucune operation en cours a annuler."
+            return False
+
+        annuler_operation(etat.jeton_annulation)
+        etat.succes_operation = False
+        etat.message_statut = "Annulation demandee: arret de la commande en cours."
+        return False
+
     if evenement.key == pygame.K_PAGEUP:
         ajuster_decalage_journal(
             etat,
@@ -1169,14 +1464,20 @@ def boucle_principale(configuration: Dict[str, object]) -> int:
         ),
     )
 
+    budget_vidage = charger_budget_vidage_journal(section_journal, limite_lignes)
+
     operations = lister_operations()
     etat = EtatInterface()
-    etat.journal_visible = [
-        "Pret: F pour executer une operation, H pour reverrouiller.",
-        "Journal: PgUp/PgDn (vertical), Gauche/Droite (horizontal), A auto, Fin bas, Home gauche.",
-    ]
+    etat.journal_visible = creer_journal_circulaire(
+        [
+            "Pret: F pour executer une operation, G pour l annuler, H pour reverrouiller.",
+            "Journal: PgUp/PgDn (vertical), Gauche/Droite (horizontal), "
+            "A auto, Fin bas, Home gauche.",
+        ],
+        limite_lignes,
+    )
 
-    file_journal: queue.Queue[str] = queue.Queue()
+    file_journal: queue.Queue[List[str]] = queue.Queue()
     file_resultat: queue.Queue[tuple[bool, str, Path]] = queue.Queue()
 
     en_cours = True
@@ -1207,7 +1508,14 @@ def boucle_principale(configuration: Dict[str, object]) -> int:
                     en_cours = False
                     break
 
-        traiter_flux_asynchrones(etat, file_journal, file_resultat, limite_lignes, nombre_lignes_visibles)
+        traiter_flux_asynchrones(
+            etat,
+            file_journal,
+            file_resultat,
+            limite_lignes,
+            nombre_lignes_visibles,
+            budget_vidage,
+        )
         dessiner_interface(fenetre, fond, polices, theme, tailles, operations, etat)
         pygame.display.flip()
         clock.tick(fps)
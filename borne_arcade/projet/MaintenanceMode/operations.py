@@ -2,24 +2,45 @@
 
 from __future__ import annotations
 
+import argparse
+import asyncio
 import datetime
+import gzip
 import json
 import os
-import select
 import shutil
 import subprocess
+import sys
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Callable, Dict, List, Tuple
+from typing import Callable, Dict, List, TextIO, Tuple
 
 
 ConsommateurJournal = Callable[[str], None]
+ConsommateurLot = Callable[[List[str]], None]
 TIMEOUT_PAR_DEFAUT = 120
 TIMEOUT_DIAGNOSTIC_SECONDES = 20
+SONDES_PARALLELES_DIAGNOSTIC_PAR_DEFAUT = 4
+TIMEOUT_DIFF_POST_PULL_SECONDES = 30
 INTERVALLE_LECTURE_PAR_DEFAUT_MS = 100
+TAILLE_BLOC_LECTURE_OCTETS = 64 * 1024
+DELAI_ARRET_PROCESSUS_SECONDES = 1.0
+DELAI_VIDAGE_SORTIE_SECONDES = 0.5
+INTERVALLE_SONDE_PROCESSUS_SECONDES = 0.02
+TAILLE_TAMPON_JOURNAL_OCTETS = 64 * 1024
+INTERVALLE_VIDAGE_JOURNAL_PAR_DEFAUT_MS = 1000
+JOURNAUX_NON_COMPRESSES_PAR_DEFAUT = 5
+ARCHIVES_JOURNAUX_MAX_PAR_DEFAUT = 50
+MOTIF_JOURNAUX_OPERATIONS = "maintenance_mode_*.log"
 DOSSIER_CACHE_LOGS_RELATIF = Path(".cache") / "maintenance_logicielle" / "logs"
 DOSSIER_TEMPORAIRE_LOGS = Path("/tmp") / "maintenance_logicielle" / "logs"
 FICHIER_TEST_ECRITURE_LOGS = ".ecriture_logs_maintenance.tmp"
+FICHIER_INVENTAIRE_PRE_REQUIS = ".inventaire_pre_requis.json"
+FICHIER_STATUT_DPKG = Path("/var/lib/dpkg/status")
+VERSION_INVENTAIRE_PRE_REQUIS = 1
 PAQUETS_SYSTEME_BORNE = [
     "git",
     "curl",
@@ -73,8 +94,34 @@ REPERTOIRES_RESET_RELATIFS = [
     Path("site"),
     Path(".cache") / "bootstrap_borne",
 ]
+ETAPES_PIPELINE_POST_PULL = ["installation", "compilation", "lint", "tests", "documentation"]
+OUTILS_LINT_POST_PULL = ["shellcheck", "checkstyle", "pylint"]
+FICHIER_REPERTOIRES_PYLINT = Path("config") / "pylint_repertoires.txt"
+FICHIER_COMMIT_DERNIERE_MAJ = Path(".commit_derniere_maj")
+PREFIXE_JEUX_POST_PULL = "borne_arcade/projet/"
+PREFIXES_IMPACT_GLOBAL_POST_PULL = [
+    "MG2D/",
+    "config/",
+    "scripts/lib/",
+    "scripts/lint/",
+    "scripts/deploiement/",
+    "borne_arcade/commun_python/",
+    "borne_arcade/compilation.sh",
+    ".pylintrc",
+]
+PREFIXES_INSTALLATION_POST_PULL = ["scripts/install/", "bootstrap_borne.sh", "requirements"]
+PREFIXES_TESTS_SEULS_POST_PULL = [
+    "scripts/tests/",
+    "borne_arcade/tests/",
+    "borne_arcade/config/",
+    "borne_arcade/img/",
+    "borne_arcade/sound/",
+    "borne_arcade/fonts/",
+    ".githooks/",
+]
 FICHIERS_RESET_RELATIFS = [
     Path(".etat_derniere_maj"),
+    FICHIER_COMMIT_DERNIERE_MAJ,
     Path(".post_pull.lock"),
 ]
 
@@ -112,9 +159,14 @@ CONFIGURATION_PAR_DEFAUT = {
     "journal": {
         "taille_max_lignes_interface": 240,
         "intervalle_lecture_processus_ms": 100,
+        "intervalle_vidage_journal_ms": INTERVALLE_VIDAGE_JOURNAL_PAR_DEFAUT_MS,
+        "journaux_non_compresses": JOURNAUX_NON_COMPRESSES_PAR_DEFAUT,
+        "archives_journaux_max": ARCHIVES_JOURNAUX_MAX_PAR_DEFAUT,
         "pas_scroll_journal": 6,
         "pas_scroll_horizontal_journal": 8,
     },
+    "diagnostic": {"sondes_paralleles": SONDES_PARALLELES_DIAGNOSTIC_PAR_DEFAUT},
+    "deploiement": {"pipeline_incremental": True},
     "temps_max_secondes": {
         "diagnostic": 20,
         "git_pull": 240,
@@ -127,6 +179,115 @@ CONFIGURATION_PAR_DEFAUT = {
 }
 
 
+@dataclass
+class InventairePreRequis:
+    """Paquets installes et commandes resolues dans le PATH pour les pre-requis de la borne.
+
+    Attributes:
+        paquets_installes: Paquets apt cibles effectivement installes.
+        commandes: Chemin resolu par commande cible, None si introuvable.
+        depuis_cache: True si l inventaire a ete relu depuis le cache persistant.
+    """
+
+    paquets_installes: set[str] = field(default_factory=set)
+    commandes: Dict[str, str | None] = field(default_factory=dict)
+    depuis_cache: bool = False
+
+
+@dataclass
+class PlanPostPull:
+    """Etapes du pipeline post-pull a rejouer d apres les fichiers modifies par le pull.
+
+    Attributes:
+        etapes: Etapes retenues, dans l ordre de ``ETAPES_PIPELINE_POST_PULL``.
+        jeux: Jeux a compiler; None pour tous les jeux.
+        compiler_menu: True si le menu Java doit etre recompile.
+        outils_lint: Outils de lint a executer.
+        repertoires_pylint: Repertoires analyses par pylint; None pour la liste configuree.
+        complet: True si le pipeline complet est rejoue sans filtre.
+    """
+
+    etapes: List[str] = field(default_factory=lambda: list(ETAPES_PIPELINE_POST_PULL))
+    jeux: List[str] | None = None
+    compiler_menu: bool = True
+    outils_lint: List[str] = field(default_factory=lambda: list(OUTILS_LINT_POST_PULL))
+    repertoires_pylint: List[str] | None = None
+    complet: bool = True
+
+
+@dataclass
+class JetonAnnulation:
+    """Permet a l interface d annuler l operation en cours depuis son thread.
+
+    Attributes:
+        annule: True des que l annulation est demandee.
+        rappels: Rappels des commandes en cours, appeles a l annulation.
+        verrou: Protege ``annule`` et ``rappels`` entre threads.
+    """
+
+    annule: bool = False
+    rappels: List[Callable[[], None]] = field(default_factory=list)
+    verrou: threading.Lock = field(default_factory=threading.Lock)
+
+
+@dataclass
+class Journaliseur:
+    """Journalise les lignes d une operation dans son fichier et vers l interface.
+
+    S appelle comme un ``ConsommateurJournal``; ``executer_commande`` lui
+    transmet la sortie des processus par lots via ``journaliser_lot``. Le
+    fichier reste ouvert pendant l operation: le tampon est vide quand il est
+    plein ou apres ``intervalle_vidage`` secondes, et synchronise sur disque
+    par ``fermer_journaliseur`` seulement.
+
+    Attributes:
+        chemin_journal: Fichier de journal de l operation.
+        consommateur_journal: Callback optionnel recevant chaque ligne.
+        consommateur_lot: Callback optionnel recevant chaque lot de lignes; prioritaire.
+        annulation: Jeton d annulation de l operation.
+        flux: Fichier ouvert en ecriture tamponnee, None une fois ferme.
+        intervalle_vidage: Delai maximal en secondes avant vidage du tampon.
+        dernier_vidage: Instant monotone du dernier vidage.
+    """
+
+    chemin_journal: Path
+    consommateur_journal: ConsommateurJournal | None = None
+    consommateur_lot: ConsommateurLot | None = None
+    annulation: JetonAnnulation = field(default_factory=JetonAnnulation)
+    flux: TextIO | None = field(default=None, repr=False)
+    intervalle_vidage: float = INTERVALLE_VIDAGE_JOURNAL_PAR_DEFAUT_MS / 1000.0
+    dernier_vidage: float = 0.0
+
+    def __call__(self, message: str) -> None:
+        """Ecrit une ligne dans le journal et notifie l interface.
+
+        Args:
+            message: Message a tracer.
+
+        Returns:
+            Aucun.
+        """
+
+        journaliser_lot(self, [message])
+
+
+def annuler_operation(jeton: JetonAnnulation) -> None:
+    """Demande l arret de l operation: la commande en cours est tuee, les suivantes refusees.
+
+    Args:
+        jeton: Jeton de l operation a annuler.
+
+    Returns:
+        Aucun.
+    """
+
+    with jeton.verrou:
+        jeton.annule = True
+        rappels = list(jeton.rappels)
+    for rappel in rappels:
+        rappel()
+
+
 def charger_configuration(chemin_configuration: Path) -> Dict[str, object]:
     """Charge la configuration JSON du mode maintenance.
 
@@ -255,7 +416,7 @@ def lister_operations() -> List[Dict[str, str]]:
         {
             "id": "pipeline_post_pull",
             "titre": "Pipeline post-pull",
-            "description": "Compilation, lint, tests et documentation.",
+            "description": "Compilation, lint, tests et docs des changements du dernier pull.",
         },
         {
             "id": "mise_a_jour_os",
@@ -330,34 +491,163 @@ def extraire_premiere_ligne_sortie(sortie: str) -> str:
     return lignes[0]
 
 
-def paquet_systeme_installe(nom_paquet: str) -> bool:
-    """Indique si un paquet systeme est installe via dpkg-query.
+def lister_paquets_systeme_installes(noms_paquets: List[str]) -> set[str]:
+    """Indique en un seul appel dpkg-query quels paquets systeme sont installes.
 
     Args:
-        nom_paquet: Nom du paquet apt.
+        noms_paquets: Noms des paquets apt a verifier.
 
     Returns:
-        True si le paquet est installe, sinon False.
+        Sous-ensemble des paquets installes (vide si dpkg-query est absent).
     """
 
-    if shutil.which("dpkg-query") is None:
-        return False
+    if not noms_paquets or shutil.which("dpkg-query") is None:
+        return set()
 
+    # Un paquet inconnu rend le code retour non nul sans empecher de lister les autres.
     resultat = subprocess.run(
-        ["dpkg-query", "-W", "-f=${Status}", nom_paquet],
+        ["dpkg-query", "-W", "-f=${Package}\t${Status}\n", *noms_paquets],
         stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
+        stderr=subprocess.DEVNULL,
         text=True,
         check=False,
     )
-    return resultat.returncode == 0 and "install ok installed" in resultat.stdout
+    installes = set()
+    for ligne in resultat.stdout.splitlines():
+        nom_paquet, _, statut = ligne.partition("\t")
+        if "install ok installed" in statut:
+            installes.add(nom_paquet)
+    return installes & set(noms_paquets)
+
 
+def paquet_systeme_installe(nom_paquet: str) -> bool:
+    """Indique si un paquet systeme est installe via dpkg-query.
+
+    Args:
+        nom_paquet: Nom du paquet apt.
 
-def diagnostiquer_pre_requis_borne(journaliser: ConsommateurJournal) -> bool:
+    Returns:
+        True si le paquet est installe, sinon False.
+    """
+
+    return nom_paquet in lister_paquets_systeme_installes([nom_paquet])
+
+
+def calculer_cle_inventaire_pre_requis(
+    paquets: List[str],
+    commandes: List[str],
+) -> Dict[str, object]:
+    """Calcule ce qui invalide l inventaire: base dpkg, PATH et contenu de ses dossiers.
+
+    Args:
+        paquets: Paquets apt inventories.
+        commandes: Commandes recherchees dans le PATH.
+
+    Returns:
+        Cle serialisable en JSON; deux cles egales designent le meme inventaire.
+    """
+
+    def lire_mtime(chemin: Path) -> int | None:
+        """Lit la date de modification d un chemin.
+
+        Args:
+            chemin: Fichier ou dossier.
+
+        Returns:
+            Date en nanosecondes, None si le chemin est absent.
+        """
+
+        try:
+            return chemin.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    chemin_recherche = os.environ.get("PATH", os.defpath)
+    dossiers_path = [dossier for dossier in chemin_recherche.split(os.pathsep) if dossier]
+    return {
+        "version": VERSION_INVENTAIRE_PRE_REQUIS,
+        "statut_dpkg": lire_mtime(FICHIER_STATUT_DPKG),
+        "path": chemin_recherche,
+        # Un outil installe hors apt (pip, copie manuelle) modifie son dossier du PATH.
+        "dossiers_path": [lire_mtime(Path(dossier)) for dossier in dossiers_path],
+        "paquets": sorted(paquets),
+        "commandes": sorted(commandes),
+    }
+
+
+def inventorier_pre_requis(paquets: List[str], commandes: List[str]) -> InventairePreRequis:
+    """Interroge dpkg et le PATH pour construire l inventaire des pre-requis.
+
+    Args:
+        paquets: Paquets apt a verifier.
+        commandes: Commandes a rechercher dans le PATH.
+
+    Returns:
+        Inventaire fraichement calcule.
+    """
+
+    return InventairePreRequis(
+        paquets_installes=lister_paquets_systeme_installes(paquets),
+        commandes={commande: shutil.which(commande) for commande in commandes},
+    )
+
+
+def charger_inventaire_pre_requis(dossier_cache: Path | None = None) -> InventairePreRequis:
+    """Retourne l inventaire des pre-requis, relu du cache tant que dpkg et le PATH sont inchanges.
+
+    Args:
+        dossier_cache: Dossier du cache persistant (dossier des logs); sans dossier,
+            l inventaire est recalcule a chaque appel.
+
+    Returns:
+        Inventaire des paquets de reset et de diagnostic et de leurs commandes.
+    """
+
+    paquets = sorted(set(PAQUETS_SYSTEME_BORNE) | set(PAQUETS_RESET_NON_SYSTEME_BORNE))
+    commandes = sorted(
+        {commande for cibles in COMMANDES_PRE_REQUIS_BORNE.values() for commande in cibles}
+    )
+    if dossier_cache is None:
+        return inventorier_pre_requis(paquets, commandes)
+
+    cle = calculer_cle_inventaire_pre_requis(paquets, commandes)
+    chemin_cache = dossier_cache / FICHIER_INVENTAIRE_PRE_REQUIS
+    try:
+        contenu = json.loads(chemin_cache.read_text(encoding="utf-8"))
+        if contenu["cle"] == cle:
+            return InventairePreRequis(
+                paquets_installes=set(contenu["paquets_installes"]),
+                commandes=dict(contenu["commandes"]),
+                depuis_cache=True,
+            )
+    except (OSError, ValueError, TypeError, KeyError):
+        pass
+
+    inventaire = inventorier_pre_requis(paquets, commandes)
+    contenu = {
+        "cle": cle,
+        "paquets_installes": sorted(inventaire.paquets_installes),
+        "commandes": inventaire.commandes,
+    }
+    chemin_temporaire = chemin_cache.with_name(chemin_cache.name + ".tmp")
+    try:
+        chemin_temporaire.write_text(json.dumps(contenu, indent=2), encoding="utf-8")
+        os.replace(chemin_temporaire, chemin_cache)
+    except OSError:
+        # Cache facultatif: un dossier de logs en lecture seule ne bloque pas le diagnostic.
+        pass
+    return inventaire
+
+
+def diagnostiquer_pre_requis_borne(
+    journaliser: ConsommateurJournal,
+    dossier_cache: Path | None = None,
+) -> bool:
     """Diagnostique la presence des pre-requis systeme cibles de la borne.
 
     Args:
         journaliser: Fonction de journalisation.
+        dossier_cache: Dossier du cache d inventaire (voir ``charger_inventaire_pre_requis``).
 
     Returns:
         True si tous les pre-requis sont detectes, sinon False.
@@ -365,17 +655,21 @@ def diagnostiquer_pre_requis_borne(journaliser: ConsommateurJournal) -> bool:
 
     journaliser("=== Verification prerequis borne ===")
     succes_global = True
+    inventaire = charger_inventaire_pre_requis(dossier_cache)
+    if inventaire.depuis_cache:
+        journaliser("Inventaire prerequis relu depuis le cache (base dpkg et PATH inchanges).")
 
     for paquet in PAQUETS_SYSTEME_BORNE:
         commandes_cibles = COMMANDES_PRE_REQUIS_BORNE.get(paquet, [])
-        if paquet_systeme_installe(paquet):
+        if paquet in inventaire.paquets_installes:
             journaliser(f"OK prerequis paquet: {paquet}")
             continue
 
-        if commandes_cibles and any(shutil.which(commande) is not None for commande in commandes_cibles):
-            commande_presente = next(
-                commande for commande in commandes_cibles if shutil.which(commande) is not None
-            )
+        commande_presente = next(
+            (commande for commande in commandes_cibles if inventaire.commandes.get(commande)),
+            None,
+        )
+        if commande_presente is not None:
             journaliser(
                 f"OK prerequis outil: {commande_presente} (paquet apt attendu: {paquet})"
             )
@@ -393,42 +687,93 @@ def diagnostiquer_pre_requis_borne(journaliser: ConsommateurJournal) -> bool:
 def creer_journaliseur(
     chemin_journal: Path,
     consommateur_journal: ConsommateurJournal | None,
-) -> ConsommateurJournal:
-    """Construit une fonction de journalisation commune.
+    consommateur_lot: ConsommateurLot | None = None,
+    annulation: JetonAnnulation | None = None,
+    intervalle_vidage_secondes: float = INTERVALLE_VIDAGE_JOURNAL_PAR_DEFAUT_MS / 1000.0,
+) -> Journaliseur:
+    """Construit le journaliseur commun d une operation et ouvre son fichier.
 
     Args:
         chemin_journal: Chemin du fichier de journal cible.
         consommateur_journal: Callback optionnel pour diffusion temps reel.
+        consommateur_lot: Callback optionnel recevant les lignes par lots.
+        annulation: Jeton d annulation de l operation (un nouveau si None).
+        intervalle_vidage_secondes: Delai maximal avant vidage du tampon sur le fichier.
 
     Returns:
-        Fonction prenant une ligne de journal et la persistant.
+        Journaliseur prenant une ligne de journal et la persistant; a fermer
+        avec ``fermer_journaliseur``.
     """
 
-    chemin_journal.write_text("", encoding="utf-8")
+    # pylint: disable-next=consider-using-with
+    flux = chemin_journal.open("w", encoding="utf-8", buffering=TAILLE_TAMPON_JOURNAL_OCTETS)
+    return Journaliseur(
+        chemin_journal,
+        consommateur_journal,
+        consommateur_lot,
+        annulation if annulation is not None else JetonAnnulation(),
+        flux=flux,
+        intervalle_vidage=max(0.0, intervalle_vidage_secondes),
+        dernier_vidage=time.monotonic(),
+    )
 
-    def journaliser(message: str) -> None:
-        """Ecrit une ligne dans le journal et notifie l interface.
 
-        Args:
-            message: Message a tracer.
+def fermer_journaliseur(journaliseur: Journaliseur) -> None:
+    """Vide le tampon, synchronise le journal sur disque et ferme le fichier.
 
-        Returns:
-            Aucun.
-        """
+    Args:
+        journaliseur: Journaliseur de l operation terminee.
 
-        ligne = preparer_ligne_journal(message)
-        with chemin_journal.open("a", encoding="utf-8") as flux:
-            flux.write(ligne + "\n")
-        if consommateur_journal is not None:
-            consommateur_journal(ligne)
+    Returns:
+        Aucun.
+    """
+
+    flux = journaliseur.flux
+    if flux is None:
+        return
+    journaliseur.flux = None
+    try:
+        flux.flush()
+        os.fsync(flux.fileno())
+    finally:
+        flux.close()
+
+
+def journaliser_lot(journaliseur: Journaliseur, messages: List[str]) -> None:
+    """Ecrit un lot de lignes en une seule ecriture et le diffuse d un bloc.
 
-    return journaliser
+    Args:
+        journaliseur: Journaliseur de l operation.
+        messages: Messages a tracer, dans l ordre.
+
+    Returns:
+        Aucun.
+    """
+
+    lignes = [preparer_ligne_journal(message) for message in messages]
+    texte = "".join(ligne + "\n" for ligne in lignes)
+    if journaliseur.flux is None:
+        with journaliseur.chemin_journal.open("a", encoding="utf-8") as flux:
+            flux.write(texte)
+    else:
+        journaliseur.flux.write(texte)
+        maintenant = time.monotonic()
+        if maintenant - journaliseur.dernier_vidage >= journaliseur.intervalle_vidage:
+            journaliseur.flux.flush()
+            journaliseur.dernier_vidage = maintenant
+    if journaliseur.consommateur_lot is not None:
+        journaliseur.consommateur_lot(lignes)
+    elif journaliseur.consommateur_journal is not None:
+        for ligne in lignes:
+            journaliseur.consommateur_journal(ligne)
 
 
 def executer_operation(
     operation_id: str,
     configuration: Dict[str, object],
     consommateur_journal: ConsommateurJournal | None = None,
+    consommateur_lot: ConsommateurLot | None = None,
+    annulation: JetonAnnulation | None = None,
 ) -> Tuple[bool, str, Path]:
     """Execute une operation de maintenance et journalise son resultat.
 
@@ -436,6 +781,8 @@ def executer_operation(
         operation_id: Identifiant de l operation a executer.
         configuration: Configuration chargee du mode maintenance.
         consommateur_journal: Callback optionnel pour afficher les logs en direct.
+        consommateur_lot: Callback optionnel recevant les logs par lots (prioritaire).
+        annulation: Jeton permettant a l interface d annuler l operation.
 
     Returns:
         Un tuple (succes, message, chemin_journal).
@@ -443,12 +790,31 @@ def executer_operation(
 
     racine_projet = obtenir_racine_projet()
     chemin_journal = DOSSIER_TEMPORAIRE_LOGS / "maintenance_mode_journal_indisponible.log"
-    journaliser: ConsommateurJournal | None = None
+    journaliser: Journaliseur | None = None
 
     try:
         chemin_journal = preparer_fichier_journal(racine_projet, operation_id)
-        journaliser = creer_journaliseur(chemin_journal, consommateur_journal)
+        intervalle_vidage_ms = extraire_parametre_journal(
+            configuration, "intervalle_vidage_journal_ms", INTERVALLE_VIDAGE_JOURNAL_PAR_DEFAUT_MS
+        )
+        journaliser = creer_journaliseur(
+            chemin_journal,
+            consommateur_journal,
+            consommateur_lot,
+            annulation,
+            intervalle_vidage_ms / 1000.0,
+        )
         journaliser(f"Debut de l operation '{operation_id}'.")
+        faire_tourner_journaux(
+            chemin_journal,
+            extraire_parametre_journal(
+                configuration, "journaux_non_compresses", JOURNAUX_NON_COMPRESSES_PAR_DEFAUT
+            ),
+            extraire_parametre_journal(
+                configuration, "archives_journaux_max", ARCHIVES_JOURNAUX_MAX_PAR_DEFAUT
+            ),
+            journaliser,
+        )
 
         if operation_id == "diagnostic":
             succes, message, _ = operation_diagnostic(configuration, racine_projet, chemin_journal, journaliser)
@@ -491,9 +857,14 @@ def executer_operation(
         ligne = f"ERREUR: {message}"
         if journaliser is not None:
             journaliser(ligne)
+        elif consommateur_lot is not None:
+            consommateur_lot([preparer_ligne_journal(ligne)])
         elif consommateur_journal is not None:
             consommateur_journal(preparer_ligne_journal(ligne))
         return False, message, chemin_journal
+    finally:
+        if journaliser is not None:
+            fermer_journaliseur(journaliser)
 
 
 def preparer_fichier_journal(racine_projet: Path, operation_id: str) -> Path:
@@ -512,6 +883,112 @@ def preparer_fichier_journal(racine_projet: Path, operation_id: str) -> Path:
     return dossier_logs / f"maintenance_mode_{operation_id}_{horodatage}.log"
 
 
+def compresser_journal(chemin_journal: Path) -> Path:
+    """Compresse un journal en ``.log.gz`` puis supprime l original.
+
+    Args:
+        chemin_journal: Journal termine a archiver.
+
+    Returns:
+        Chemin de l archive creee.
+    """
+
+    chemin_archive = chemin_journal.with_name(chemin_journal.name + ".gz")
+    chemin_temporaire = chemin_journal.with_name(chemin_journal.name + ".gz.tmp")
+    statut = chemin_journal.stat()
+    with chemin_journal.open("rb") as source, gzip.open(chemin_temporaire, "wb") as archive:
+        shutil.copyfileobj(source, archive)
+    # L archive garde la date du journal: la purge suit l age reel des operations.
+    os.utime(chemin_temporaire, ns=(statut.st_atime_ns, statut.st_mtime_ns))
+    os.replace(chemin_temporaire, chemin_archive)
+    chemin_journal.unlink()
+    return chemin_archive
+
+
+def faire_tourner_journaux(
+    journal_courant: Path,
+    nombre_non_compresses: int,
+    nombre_archives_max: int,
+    journaliser: ConsommateurJournal,
+) -> None:
+    """Compresse les anciens journaux d operation et purge les archives les plus anciennes.
+
+    Les ``nombre_non_compresses`` journaux les plus recents (hors journal
+    courant) restent lisibles tels quels; au-dela, ils sont compresses et
+    seules les ``nombre_archives_max`` archives les plus recentes sont gardees.
+    Un echec est journalise sans interrompre l operation.
+
+    Args:
+        journal_courant: Journal de l operation qui demarre, jamais modifie.
+        nombre_non_compresses: Nombre de journaux recents laisses en clair.
+        nombre_archives_max: Nombre maximal d archives ``.log.gz`` conservees.
+        journaliser: Fonction de journalisation.
+
+    Returns:
+        Aucun.
+    """
+
+    dossier_logs = journal_courant.parent
+
+    def trier_recents(chemins: List[Path]) -> List[Path]:
+        """Trie des fichiers du plus recent au plus ancien.
+
+        Args:
+            chemins: Fichiers a trier.
+
+        Returns:
+            Liste triee par date de modification decroissante.
+        """
+
+        return sorted(
+            chemins, key=lambda chemin: (chemin.stat().st_mtime, chemin.name), reverse=True
+        )
+
+    try:
+        journaux = trier_recents(
+            [
+                chemin
+                for chemin in dossier_logs.glob(MOTIF_JOURNAUX_OPERATIONS)
+                if chemin != journal_courant
+            ]
+        )
+        for chemin_journal in journaux[max(0, nombre_non_compresses) :]:
+            compresser_journal(chemin_journal)
+        archives = trier_recents(list(dossier_logs.glob(MOTIF_JOURNAUX_OPERATIONS + ".gz")))
+        for chemin_archive in archives[max(0, nombre_archives_max) :]:
+            chemin_archive.unlink()
+    except OSError as erreur:
+        journaliser(
+            f"ATTENTION: rotation des anciens journaux impossible: {erreur}. "
+            f"Action recommandee: verifier l espace libre et les permissions de {dossier_logs}."
+        )
+
+
+def extraire_parametre_journal(
+    configuration: Dict[str, object],
+    cle: str,
+    valeur_par_defaut: int,
+) -> int:
+    """Retourne un entier positif de la section ``journal`` de la configuration.
+
+    Args:
+        configuration: Configuration chargee.
+        cle: Cle du parametre.
+        valeur_par_defaut: Valeur si la section ou la cle est absente ou invalide.
+
+    Returns:
+        Valeur entiere, au moins 0.
+    """
+
+    section_journal = configuration.get("journal", {})
+    if not isinstance(section_journal, dict):
+        return valeur_par_defaut
+    try:
+        return max(0, int(section_journal.get(cle, valeur_par_defaut)))
+    except (TypeError, ValueError):
+        return valeur_par_defaut
+
+
 def extraire_timeout(configuration: Dict[str, object], operation_id: str) -> int:
     """Retourne le timeout configure pour une operation.
 
@@ -540,7 +1017,7 @@ def extraire_intervalle_lecture(configuration: Dict[str, object]) -> float:
         configuration: Configuration chargee.
 
     Returns:
-        Intervalle en secondes pour la lecture non bloquante.
+        Delai maximal en secondes avant diffusion d un lot de lignes.
     """
 
     section_journal = configuration.get("journal", {})
@@ -557,6 +1034,74 @@ def extraire_intervalle_lecture(configuration: Dict[str, object]) -> float:
     return millisecondes / 1000.0
 
 
+def extraire_sondes_paralleles_diagnostic(configuration: Dict[str, object]) -> int:
+    """Retourne le nombre de sondes de diagnostic executees en parallele.
+
+    Args:
+        configuration: Configuration chargee.
+
+    Returns:
+        Taille du pool de sondes, au moins 1.
+    """
+
+    section_diagnostic = configuration.get("diagnostic", {})
+    if not isinstance(section_diagnostic, dict):
+        return SONDES_PARALLELES_DIAGNOSTIC_PAR_DEFAUT
+    valeur = section_diagnostic.get("sondes_paralleles", SONDES_PARALLELES_DIAGNOSTIC_PAR_DEFAUT)
+    try:
+        return max(1, int(valeur))
+    except (TypeError, ValueError):
+        return SONDES_PARALLELES_DIAGNOSTIC_PAR_DEFAUT
+
+
+def journaliser_lignes(journaliser: ConsommateurJournal, lignes: List[str]) -> None:
+    """Journalise des lignes deja collectees, en un seul lot si possible.
+
+    Args:
+        journaliser: Fonction de trace et diffusion en direct.
+        lignes: Lignes a journaliser dans l ordre.
+
+    Returns:
+        Aucun.
+    """
+
+    if isinstance(journaliser, Journaliseur):
+        journaliser_lot(journaliser, lignes)
+        return
+    for ligne in lignes:
+        journaliser(ligne)
+
+
+def executer_sonde_diagnostic(
+    commande: List[str],
+    racine_projet: Path,
+    intervalle_lecture: float,
+    annulation: JetonAnnulation | None,
+) -> Tuple[bool, str, List[str]]:
+    """Execute une commande de diagnostic en collectant sa sortie sans la diffuser.
+
+    Args:
+        commande: Commande de diagnostic.
+        racine_projet: Racine du depot.
+        intervalle_lecture: Delai maximal avant diffusion d un lot de lignes.
+        annulation: Jeton d annulation de l operation.
+
+    Returns:
+        Un tuple (succes, sortie texte, lignes collectees).
+    """
+
+    lignes: List[str] = []
+    succes, sortie = executer_commande(
+        commande,
+        racine_projet,
+        timeout_secondes=TIMEOUT_DIAGNOSTIC_SECONDES,
+        consommateur_sortie=lignes.append,
+        intervalle_lecture_secondes=intervalle_lecture,
+        annulation=annulation,
+    )
+    return succes, sortie, lignes
+
+
 def operation_diagnostic(
     configuration: Dict[str, object],
     racine_projet: Path,
@@ -565,6 +1110,9 @@ def operation_diagnostic(
 ) -> Tuple[bool, str, Path]:
     """Execute un diagnostic rapide du systeme.
 
+    Les pre-requis et les commandes sont sondes en parallele sur un pool borne;
+    leurs sorties sont collectees puis journalisees dans l ordre de la liste.
+
     Args:
         configuration: Configuration chargee.
         racine_projet: Racine du depot.
@@ -575,7 +1123,6 @@ def operation_diagnostic(
         Resultat (succes, message, chemin journal).
     """
 
-    _ = chemin_journal
     commandes = [
         ["uname", "-a"],
         ["python3", "--version"],
@@ -584,29 +1131,44 @@ def operation_diagnostic(
         ["df", "-h", str(racine_projet)],
     ]
 
-    succes_global = diagnostiquer_pre_requis_borne(journaliser)
     intervalle_lecture = extraire_intervalle_lecture(configuration)
-    journaliser("=== Diagnostic maintenance ===")
-
-    for commande in commandes:
-        if shutil.which(commande[0]) is None:
-            succes_global = False
-            journaliser(
-                "ATTENTION: commande diagnostique indisponible: "
-                f"{commande[0]}. Action recommandee: relancez sudo ./bootstrap_borne.sh."
-            )
-            continue
-        journaliser(f"$ {' '.join(commande)}")
-        succes, sortie = executer_commande(
-            commande,
-            racine_projet,
-            timeout_secondes=TIMEOUT_DIAGNOSTIC_SECONDES,
-            consommateur_sortie=journaliser,
-            intervalle_lecture_secondes=intervalle_lecture,
+    annulation = journaliser.annulation if isinstance(journaliser, Journaliseur) else None
+    lignes_pre_requis: List[str] = []
+    sondes: List[Tuple[List[str], Future | None]] = []
+
+    with ThreadPoolExecutor(
+        max_workers=extraire_sondes_paralleles_diagnostic(configuration),
+        thread_name_prefix="diagnostic",
+    ) as pool:
+        sonde_pre_requis = pool.submit(
+            diagnostiquer_pre_requis_borne, lignes_pre_requis.append, chemin_journal.parent
         )
-        if not succes:
-            succes_global = False
-            journaliser(f"ERREUR: {extraire_premiere_ligne_sortie(sortie)}")
+        for commande in commandes:
+            if shutil.which(commande[0]) is None:
+                sondes.append((commande, None))
+                continue
+            sonde = pool.submit(
+                executer_sonde_diagnostic, commande, racine_projet, intervalle_lecture, annulation
+            )
+            sondes.append((commande, sonde))
+
+        succes_global = sonde_pre_requis.result()
+        journaliser_lignes(journaliser, lignes_pre_requis)
+        journaliser("=== Diagnostic maintenance ===")
+
+        for commande, sonde in sondes:
+            if sonde is None:
+                succes_global = False
+                journaliser(
+                    "ATTENTION: commande diagnostique indisponible: "
+                    f"{commande[0]}. Action recommandee: relancez sudo ./bootstrap_borne.sh."
+                )
+                continue
+            succes, sortie, lignes = sonde.result()
+            journaliser_lignes(journaliser, [f"$ {' '.join(commande)}", *lignes])
+            if not succes:
+                succes_global = False
+                journaliser(f"ERREUR: {extraire_premiere_ligne_sortie(sortie)}")
 
     if succes_global:
         return True, "Diagnostic termine avec succes.", chemin_journal
@@ -770,6 +1332,272 @@ def operation_git_retour_precedent(
     return True, "Retour commit precedent termine.", chemin_journal
 
 
+def lire_repertoires_pylint(racine_projet: Path) -> List[str]:
+    """Lit les repertoires Python analyses par pylint dans la configuration du lint.
+
+    Args:
+        racine_projet: Racine du depot.
+
+    Returns:
+        Chemins relatifs a la racine, sans barre finale.
+    """
+
+    try:
+        contenu = (racine_projet / FICHIER_REPERTOIRES_PYLINT).read_text(encoding="utf-8")
+    except OSError:
+        return []
+    repertoires = []
+    for ligne in contenu.splitlines():
+        ligne = ligne.strip()
+        if ligne and not ligne.startswith("#"):
+            repertoires.append(ligne.rstrip("/"))
+    return repertoires
+
+
+def lire_commit_derniere_maj(racine_projet: Path) -> str | None:
+    """Lit le dernier commit reconstruit avec succes par ``post_pull_update.sh``.
+
+    Args:
+        racine_projet: Racine du depot.
+
+    Returns:
+        Identifiant du commit, ou None si aucun pipeline n a encore abouti.
+    """
+
+    try:
+        commit = (racine_projet / FICHIER_COMMIT_DERNIERE_MAJ).read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+    return commit or None
+
+
+def lister_fichiers_modifies_post_pull(
+    racine_projet: Path,
+    commit_reference: str | None,
+) -> List[str] | None:
+    """Liste les fichiers modifies entre ``commit_reference`` et HEAD.
+
+    Args:
+        racine_projet: Racine du depot.
+        commit_reference: Dernier commit reconstruit, ou toute reference git.
+
+    Returns:
+        Chemins relatifs a la racine (liste vide si rien n a change), ou None si
+        la reference est inconnue, n est pas un ancetre de HEAD (historique
+        reecrit, retour en arriere) ou si le diff est indisponible.
+    """
+
+    if not commit_reference:
+        return None
+    try:
+        resultat_ancetre = subprocess.run(
+            [
+                "git",
+                "-C",
+                str(racine_projet),
+                "merge-base",
+                "--is-ancestor",
+                commit_reference,
+                "HEAD",
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=False,
+            timeout=TIMEOUT_DIFF_POST_PULL_SECONDES,
+        )
+        if resultat_ancetre.returncode != 0:
+            return None
+        resultat = subprocess.run(
+            ["git", "-C", str(racine_projet), "diff", "--name-only", commit_reference, "HEAD"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            check=False,
+            timeout=TIMEOUT_DIFF_POST_PULL_SECONDES,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    if resultat.returncode != 0:
+        return None
+    return [ligne.strip() for ligne in resultat.stdout.splitlines() if ligne.strip()]
+
+
+def planifier_pipeline_post_pull(
+    fichiers_modifies: List[str] | None,
+    repertoires_pylint: List[str],
+) -> PlanPostPull:
+    """Associe les fichiers modifies aux jeux et aux etapes du pipeline a rejouer.
+
+    Tout chemin a impact global ou non reconnu rejoue le pipeline complet.
+
+    Args:
+        fichiers_modifies: Chemins relatifs modifies, None si inconnus.
+        repertoires_pylint: Repertoires analyses par pylint.
+
+    Returns:
+        Plan du pipeline; ``complet`` si les changements ne sont pas localisables.
+    """
+
+    if fichiers_modifies is None:
+        return PlanPostPull()
+
+    etapes: set[str] = set()
+    jeux: set[str] = set()
+    outils_lint: set[str] = set()
+    repertoires_pylint_cibles: set[str] = set()
+    compiler_menu = False
+
+    for chemin in fichiers_modifies:
+        if any(chemin.startswith(prefixe) for prefixe in PREFIXES_IMPACT_GLOBAL_POST_PULL):
+            return PlanPostPull()
+
+        if chemin.startswith("docs/") or chemin == "mkdocs.yml":
+            etapes.add("documentation")
+            continue
+        if chemin.endswith(".md"):
+            # Les README et notes hors docs/ ne sont ni compiles ni publies.
+            continue
+
+        if chemin.endswith(".sh") or chemin.startswith(".githooks/"):
+            outils_lint.add("shellcheck")
+        if chemin.endswith(".py"):
+            for repertoire in repertoires_pylint:
+                if chemin.startswith(repertoire + "/"):
+                    outils_lint.add("pylint")
+                    repertoires_pylint_cibles.add(repertoire)
+
+        if chemin.endswith("requirements.txt"):
+            # Les requirements des jeux ne sont installes que par installer_borne.sh.
+            etapes.add("installation")
+        if chemin.startswith(PREFIXE_JEUX_POST_PULL):
+            nom_jeu = chemin[len(PREFIXE_JEUX_POST_PULL):].split("/", 1)[0]
+            jeux.add(nom_jeu)
+            etapes.update(("compilation", "tests"))
+        elif chemin.startswith("borne_arcade/") and chemin.count("/") == 1:
+            if chemin.endswith(".java"):
+                compiler_menu = True
+                outils_lint.add("checkstyle")
+                etapes.add("compilation")
+            etapes.add("tests")
+        elif any(chemin.startswith(prefixe) for prefixe in PREFIXES_INSTALLATION_POST_PULL):
+            etapes.update(("installation", "tests"))
+        elif any(chemin.startswith(prefixe) for prefixe in PREFIXES_TESTS_SEULS_POST_PULL):
+            if chemin.startswith("borne_arcade/tests/") and chemin.endswith(".java"):
+                outils_lint.add("checkstyle")
+            etapes.add("tests")
+        elif chemin.startswith("scripts/docs/"):
+            etapes.add("documentation")
+        else:
+            return PlanPostPull()
+
+    if outils_lint:
+        etapes.add("lint")
+    return PlanPostPull(
+        etapes=[etape for etape in ETAPES_PIPELINE_POST_PULL if etape in etapes],
+        jeux=sorted(jeux),
+        compiler_menu=compiler_menu,
+        outils_lint=[outil for outil in OUTILS_LINT_POST_PULL if outil in outils_lint],
+        repertoires_pylint=sorted(repertoires_pylint_cibles),
+        complet=False,
+    )
+
+
+def environnement_plan_post_pull(plan: PlanPostPull) -> Dict[str, str]:
+    """Traduit un plan en variables lues par ``scripts/deploiement/post_pull_update.sh``.
+
+    Args:
+        plan: Plan du pipeline.
+
+    Returns:
+        Variables d environnement; vide pour le pipeline complet.
+    """
+
+    if plan.complet:
+        return {}
+    environnement = {
+        "POST_PULL_ETAPES": " ".join(plan.etapes),
+        "POST_PULL_COMPILER_MENU": "1" if plan.compiler_menu else "0",
+        "POST_PULL_OUTILS_LINT": " ".join(plan.outils_lint),
+    }
+    if plan.jeux is not None:
+        environnement["POST_PULL_JEUX"] = " ".join(plan.jeux)
+    if plan.repertoires_pylint is not None:
+        environnement["POST_PULL_REPERTOIRES_PYLINT"] = " ".join(plan.repertoires_pylint)
+    return environnement
+
+
+def decrire_plan_post_pull(
+    plan: PlanPostPull,
+    nombre_fichiers: int | None,
+    commit_reference: str | None,
+) -> List[str]:
+    """Resume le plan du pipeline pour le journal.
+
+    Args:
+        plan: Plan du pipeline.
+        nombre_fichiers: Nombre de fichiers modifies, None si inconnu.
+        commit_reference: Reference depuis laquelle le diff est calcule.
+
+    Returns:
+        Lignes de journal.
+    """
+
+    if nombre_fichiers is None:
+        return [
+            "Pipeline complet: fichiers modifies inconnus "
+            "(dernier commit reconstruit absent ou hors de l historique de HEAD)."
+        ]
+    if plan.complet:
+        return [f"Pipeline complet: {nombre_fichiers} fichier(s) modifie(s), impact global."]
+    lignes = [
+        f"Pipeline incremental: {nombre_fichiers} fichier(s) modifie(s) "
+        f"depuis {str(commit_reference)[:12]}.",
+        "Etapes: " + (", ".join(plan.etapes) or "aucune"),
+    ]
+    if "compilation" in plan.etapes:
+        cibles = (["menu"] if plan.compiler_menu else []) + list(plan.jeux or [])
+        lignes.append("Compilation: " + ", ".join(cibles))
+    if "lint" in plan.etapes:
+        lignes.append("Lint: " + ", ".join(plan.outils_lint))
+    return lignes
+
+
+def calculer_plan_post_pull(
+    racine_projet: Path,
+    commit_reference: str | None,
+) -> Tuple[PlanPostPull, List[str]]:
+    """Planifie le pipeline d apres les fichiers modifies depuis ``commit_reference``.
+
+    Args:
+        racine_projet: Racine du depot.
+        commit_reference: Dernier commit reconstruit, ou toute reference git.
+
+    Returns:
+        Plan du pipeline et son resume pour le journal.
+    """
+
+    fichiers_modifies = lister_fichiers_modifies_post_pull(racine_projet, commit_reference)
+    plan = planifier_pipeline_post_pull(fichiers_modifies, lire_repertoires_pylint(racine_projet))
+    nombre_fichiers = None if fichiers_modifies is None else len(fichiers_modifies)
+    return plan, decrire_plan_post_pull(plan, nombre_fichiers, commit_reference)
+
+
+def pipeline_incremental_active(configuration: Dict[str, object]) -> bool:
+    """Indique si le pipeline post-pull peut se limiter aux changements non reconstruits.
+
+    Args:
+        configuration: Configuration chargee.
+
+    Returns:
+        False seulement si ``deploiement.pipeline_incremental`` vaut false.
+    """
+
+    section_deploiement = configuration.get("deploiement", {})
+    if not isinstance(section_deploiement, dict):
+        return True
+    return section_deploiement.get("pipeline_incremental", True) is not False
+
+
 def operation_pipeline_post_pull(
     configuration: Dict[str, object],
     racine_projet: Path,
@@ -778,6 +1606,11 @@ def operation_pipeline_post_pull(
 ) -> Tuple[bool, str, Path]:
     """Execute le pipeline post-pull versionne du projet.
 
+    Les fichiers modifies depuis le dernier commit reconstruit avec succes
+    (``.commit_derniere_maj``) limitent les etapes et les jeux traites: les
+    changements d un pipeline en echec sont repris au suivant. Sans commit
+    connu, ou s il n est plus un ancetre de HEAD, tout est rejoue.
+
     Args:
         configuration: Configuration chargee.
         racine_projet: Racine du depot.
@@ -793,6 +1626,17 @@ def operation_pipeline_post_pull(
     script_pipeline = racine_projet / "scripts" / "deploiement" / "post_pull_update.sh"
     commande = [str(script_pipeline)]
 
+    environnement: Dict[str, str] = {}
+    if pipeline_incremental_active(configuration) and shutil.which("git") is not None:
+        plan, lignes_plan = calculer_plan_post_pull(
+            racine_projet, lire_commit_derniere_maj(racine_projet)
+        )
+        journaliser_lignes(journaliser, lignes_plan)
+        if not plan.etapes:
+            message = "Pipeline post-pull inutile: aucun changement a reconstruire."
+            return True, message, chemin_journal
+        environnement = environnement_plan_post_pull(plan)
+
     journaliser(f"$ {' '.join(commande)}")
     succes, sortie = executer_commande(
         commande,
@@ -800,6 +1644,7 @@ def operation_pipeline_post_pull(
         timeout_secondes=timeout_secondes,
         consommateur_sortie=journaliser,
         intervalle_lecture_secondes=intervalle_lecture,
+        environnement=environnement or None,
     )
 
     if succes:
@@ -903,24 +1748,23 @@ def nettoyer_artefacts_reset(racine_projet: Path, journaliser: ConsommateurJourn
     return True, "Nettoyage local termine."
 
 
-def lister_paquets_reset_non_systeme_installes() -> List[str]:
+def lister_paquets_reset_non_systeme_installes(dossier_cache: Path | None = None) -> List[str]:
     """Liste les paquets non-systeme effectivement installes et purgables en mode sur.
 
     Args:
-        Aucun.
+        dossier_cache: Dossier du cache d inventaire (voir ``charger_inventaire_pre_requis``).
 
     Returns:
         Liste ordonnee des paquets installes ciblables par le reset sur.
     """
 
     paquets_proteges = set(PAQUETS_RESET_SYSTEME_PROTEGES_BORNE)
-    paquets_installes: List[str] = []
-    for paquet in PAQUETS_RESET_NON_SYSTEME_BORNE:
-        if paquet in paquets_proteges:
-            continue
-        if paquet_systeme_installe(paquet):
-            paquets_installes.append(paquet)
-    return paquets_installes
+    inventaire = charger_inventaire_pre_requis(dossier_cache)
+    return [
+        paquet
+        for paquet in PAQUETS_RESET_NON_SYSTEME_BORNE
+        if paquet not in paquets_proteges and paquet in inventaire.paquets_installes
+    ]
 
 
 def operation_reset_pre_requis(
@@ -952,7 +1796,9 @@ def operation_reset_pre_requis(
         journaliser(f"ERREUR: {message}")
         return False, message, chemin_journal
 
-    paquets_non_systeme_installes = lister_paquets_reset_non_systeme_installes()
+    paquets_non_systeme_installes = lister_paquets_reset_non_systeme_installes(
+        chemin_journal.parent
+    )
     if paquets_non_systeme_installes:
         journaliser(
             "Mode sur: purge uniquement des prerequis non-systeme installes: "
@@ -1046,101 +1892,394 @@ def executer_commande(
     timeout_secondes: int,
     consommateur_sortie: ConsommateurJournal | None = None,
     intervalle_lecture_secondes: float = INTERVALLE_LECTURE_PAR_DEFAUT_MS / 1000.0,
+    annulation: JetonAnnulation | None = None,
+    environnement: Dict[str, str] | None = None,
 ) -> Tuple[bool, str]:
     """Execute une commande systeme et retourne sa sortie combinee.
 
+    La commande tourne dans une boucle asyncio propre a l appel: la sortie est
+    lue par blocs, le timeout et l annulation sont attendus sans scrutation.
+
     Args:
         commande: Liste des arguments de la commande.
         repertoire_travail: Repertoire de travail de la commande.
         timeout_secondes: Delai maximal en secondes.
-        consommateur_sortie: Callback optionnel pour remonter les lignes en direct.
-        intervalle_lecture_secondes: Intervalle de polling du flux processus.
+        consommateur_sortie: Callback optionnel pour remonter les lignes en direct;
+            un ``Journaliseur`` les recoit par lots.
+        intervalle_lecture_secondes: Delai maximal avant diffusion des lignes lues.
+        annulation: Jeton d annulation; par defaut celui du ``Journaliseur`` fourni.
+        environnement: Variables d environnement ajoutees a celles du processus courant.
 
     Returns:
         Un tuple (succes, sortie texte).
     """
 
-    try:
-        processus = subprocess.Popen(
+    if isinstance(consommateur_sortie, Journaliseur):
+        journaliseur = consommateur_sortie
+
+        def diffuser_lot(lignes: List[str]) -> None:
+            """Transmet un lot de sortie au journaliseur de l operation.
+
+            Args:
+                lignes: Lignes lues depuis la derniere diffusion.
+
+            Returns:
+                Aucun.
+            """
+
+            journaliser_lot(journaliseur, lignes)
+
+        if annulation is None:
+            annulation = journaliseur.annulation
+    else:
+
+        def diffuser_lot(lignes: List[str]) -> None:
+            """Transmet un lot de sortie ligne par ligne au callback.
+
+            Args:
+                lignes: Lignes lues depuis la derniere diffusion.
+
+            Returns:
+                Aucun.
+            """
+
+            for ligne in lignes:
+                diffuser_ligne(consommateur_sortie, ligne)
+
+    return asyncio.run(
+        executer_commande_async(
             commande,
+            repertoire_travail,
+            timeout_secondes,
+            diffuser_lot,
+            max(0.01, intervalle_lecture_secondes),
+            annulation if annulation is not None else JetonAnnulation(),
+            None if environnement is None else {**os.environ, **environnement},
+        )
+    )
+
+
+async def lire_sortie_par_lots(
+    flux: asyncio.StreamReader,
+    lignes_capturees: List[str],
+    diffuser_lot: ConsommateurLot,
+    intervalle_diffusion: float,
+) -> None:
+    """Lit un flux par blocs et diffuse ses lignes non vides par lots.
+
+    Un lot part au plus ``intervalle_diffusion`` secondes apres sa premiere
+    ligne, via un minuteur de la boucle, et en fin de flux.
+
+    Args:
+        flux: Sortie combinee du processus.
+        lignes_capturees: Liste completee avec toutes les lignes lues.
+        diffuser_lot: Callback recevant chaque lot.
+        intervalle_diffusion: Delai maximal avant diffusion d une ligne.
+
+    Returns:
+        Aucun.
+    """
+
+    boucle = asyncio.get_running_loop()
+    lot: List[str] = []
+    minuteur: List[asyncio.TimerHandle] = []
+
+    def vider_lot() -> None:
+        """Diffuse le lot courant et arrete son minuteur.
+
+        Returns:
+            Aucun.
+        """
+
+        if minuteur:
+            minuteur.pop().cancel()
+        if lot:
+            lignes = lot[:]
+            lot.clear()
+            diffuser_lot(lignes)
+
+    def ajouter_lignes(lignes_brutes: List[bytes]) -> None:
+        """Decode les lignes completes et arme le minuteur du lot.
+
+        Args:
+            lignes_brutes: Lignes sans leur fin de ligne.
+
+        Returns:
+            Aucun.
+        """
+
+        for ligne_brute in lignes_brutes:
+            ligne = ligne_brute.decode("utf-8", errors="replace").rstrip("\r")
+            if ligne:
+                lignes_capturees.append(ligne)
+                lot.append(ligne)
+        if lot and not minuteur:
+            minuteur.append(boucle.call_later(intervalle_diffusion, vider_lot))
+
+    reste = b""
+    try:
+        while True:
+            bloc = await flux.read(TAILLE_BLOC_LECTURE_OCTETS)
+            if not bloc:
+                break
+            morceaux = (reste + bloc).split(b"\n")
+            reste = morceaux.pop()
+            ajouter_lignes(morceaux)
+        ajouter_lignes([reste])
+    finally:
+        vider_lot()
+
+
+async def attendre_code_retour(processus: asyncio.subprocess.Process) -> int:
+    """Attend la fin du processus lui-meme, tubes ouverts ou non.
+
+    ``Process.wait`` ne rend la main qu une fois tous les tubes fermes, ce qui
+    n arrive pas tant qu un petit-fils en arriere-plan herite de la sortie; le
+    code retour, lui, est connu des la fin du processus et est donc sonde.
+
+    Args:
+        processus: Processus lance par ``asyncio.create_subprocess_exec``.
+
+    Returns:
+        Code retour du processus.
+    """
+
+    while processus.returncode is None:
+        await asyncio.sleep(INTERVALLE_SONDE_PROCESSUS_SECONDES)
+    return processus.returncode
+
+
+async def terminer_lecture_sortie(lecture: asyncio.Task[None], delai_secondes: float) -> None:
+    """Laisse la lecture de la sortie se terminer, puis l interrompt apres le delai.
+
+    L interruption diffuse encore le lot en cours (voir ``lire_sortie_par_lots``).
+
+    Args:
+        lecture: Tache de lecture de la sortie.
+        delai_secondes: Delai laisse pour atteindre la fin du flux.
+
+    Returns:
+        Aucun.
+    """
+
+    termines, _ = await asyncio.wait({lecture}, timeout=delai_secondes)
+    if lecture not in termines:
+        lecture.cancel()
+        try:
+            await lecture
+        except asyncio.CancelledError:
+            pass
+
+
+def fermer_transport_processus(processus: asyncio.subprocess.Process) -> None:
+    """Ferme le transport du processus avant la fermeture de la boucle asyncio.
+
+    Tant qu un petit-fils garde le tube ouvert, asyncio ne ferme pas le transport
+    de lui-meme; son finaliseur echouerait alors sur une boucle deja fermee.
+    ``asyncio.subprocess.Process`` n expose pas de ``close``.
+
+    Args:
+        processus: Processus lance par ``asyncio.create_subprocess_exec``.
+
+    Returns:
+        Aucun.
+    """
+
+    transport = getattr(processus, "_transport", None)
+    if transport is not None:
+        transport.close()
+
+
+async def executer_commande_async(
+    commande: List[str],
+    repertoire_travail: Path,
+    timeout_secondes: int,
+    diffuser_lot: ConsommateurLot,
+    intervalle_diffusion: float,
+    annulation: JetonAnnulation,
+    environnement: Dict[str, str] | None = None,
+) -> Tuple[bool, str]:
+    """Coeur asyncio de ``executer_commande``.
+
+    Args:
+        commande: Liste des arguments de la commande.
+        repertoire_travail: Repertoire de travail de la commande.
+        timeout_secondes: Delai maximal en secondes.
+        diffuser_lot: Callback recevant la sortie par lots.
+        intervalle_diffusion: Delai maximal avant diffusion d une ligne.
+        annulation: Jeton d annulation de l operation.
+        environnement: Environnement complet du processus, celui du parent si None.
+
+    Returns:
+        Un tuple (succes, sortie texte).
+    """
+
+    def diffuser_message(message: str) -> Tuple[bool, str]:
+        """Diffuse un message d echec et le retourne comme resultat.
+
+        Args:
+            message: Message actionnable.
+
+        Returns:
+            Le tuple (False, message).
+        """
+
+        diffuser_lot([message])
+        return False, message
+
+    message_annulation = (
+        f"Commande annulee depuis l interface: {' '.join(commande)}. "
+        "Action recommandee: consulter le journal puis relancer l operation si necessaire."
+    )
+    if annulation.annule:
+        return diffuser_message(message_annulation)
+
+    try:
+        processus = await asyncio.create_subprocess_exec(
+            *commande,
             cwd=str(repertoire_travail),
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            env=environnement,
         )
     except FileNotFoundError:
-        message = (
+        return diffuser_message(
             f"Commande introuvable: {commande[0]}. "
             "Action recommandee: installez la commande manquante puis relancez l operation."
         )
-        diffuser_ligne(consommateur_sortie, message)
-        return False, message
 
-    flux_sortie = processus.stdout
-    if flux_sortie is None:
+    if processus.stdout is None:
         processus.kill()
-        message = (
+        await processus.wait()
+        return diffuser_message(
             "Sortie standard indisponible pour la commande. "
             "Action recommandee: relancez la commande depuis un terminal pour diagnostic detaille."
         )
-        diffuser_ligne(consommateur_sortie, message)
-        return False, message
 
-    lignes_capturees: List[str] = []
-    instant_depart = time.monotonic()
-    limite_temps = instant_depart + max(1, timeout_secondes)
-    intervalle_lecture = max(0.02, intervalle_lecture_secondes)
+    boucle = asyncio.get_running_loop()
+    evenement_annulation = asyncio.Event()
 
+    def signaler_annulation() -> None:
+        """Reveille la boucle depuis le thread de l interface.
+
+        Returns:
+            Aucun.
+        """
+
+        try:
+            boucle.call_soon_threadsafe(evenement_annulation.set)
+        except RuntimeError:
+            pass
+
+    with annulation.verrou:
+        annulation.rappels.append(signaler_annulation)
+        if annulation.annule:
+            evenement_annulation.set()
+
+    lignes_capturees: List[str] = []
+    lecture = asyncio.create_task(
+        lire_sortie_par_lots(processus.stdout, lignes_capturees, diffuser_lot, intervalle_diffusion)
+    )
+    attente_annulation = asyncio.create_task(evenement_annulation.wait())
+    attente_processus = asyncio.create_task(attendre_code_retour(processus))
     try:
-        while True:
-            maintenant = time.monotonic()
-            if maintenant >= limite_temps:
+        termines, _ = await asyncio.wait(
+            {attente_processus, attente_annulation},
+            timeout=max(1, timeout_secondes),
+            return_when=asyncio.FIRST_COMPLETED,
+        )
+        if attente_processus in termines:
+            # Un petit-fils lance en arriere-plan peut heriter du tube et le garder ouvert:
+            # la fin du processus fait foi, la sortie restante n est attendue que brievement.
+            await terminer_lecture_sortie(lecture, DELAI_VIDAGE_SORTIE_SECONDES)
+            code_retour = attente_processus.result()
+        else:
+            try:
                 processus.kill()
-                try:
-                    processus.wait(timeout=1)
-                except subprocess.TimeoutExpired:
-                    pass
-                message_timeout = (
-                    f"Commande expiree apres {timeout_secondes} secondes: {' '.join(commande)}. "
-                    "Action recommandee: verifier la connectivite puis ajuster le timeout dans config_maintenance.json."
-                )
-                diffuser_ligne(consommateur_sortie, message_timeout)
-                return False, message_timeout
-
-            temps_restant = max(0.0, limite_temps - maintenant)
-            attente = min(intervalle_lecture, temps_restant)
-            flux_pret, _, _ = select.select([flux_sortie], [], [], attente)
-
-            if flux_sortie in flux_pret:
-                ligne_brute = flux_sortie.readline()
-                if ligne_brute:
-                    ligne = ligne_brute.rstrip("\n")
-                    if ligne:
-                        lignes_capturees.append(ligne)
-                        diffuser_ligne(consommateur_sortie, ligne)
-
-            if processus.poll() is not None:
-                break
-
-        sortie_restante = flux_sortie.read()
-        if sortie_restante:
-            for ligne in sortie_restante.splitlines():
-                if ligne:
-                    lignes_capturees.append(ligne)
-                    diffuser_ligne(consommateur_sortie, ligne)
+            except ProcessLookupError:
+                pass
+            # La fin du processus ferme le tube: les dernieres lignes lues partent avant le message.
+            await asyncio.wait({attente_processus}, timeout=DELAI_ARRET_PROCESSUS_SECONDES)
+            await terminer_lecture_sortie(lecture, DELAI_ARRET_PROCESSUS_SECONDES)
+            if attente_annulation in termines:
+                return diffuser_message(message_annulation)
+            return diffuser_message(
+                f"Commande expiree apres {timeout_secondes} secondes: {' '.join(commande)}. "
+                "Action recommandee: verifier la connectivite puis ajuster le timeout "
+                "dans config_maintenance.json."
+            )
     finally:
-        flux_sortie.close()
+        attente_annulation.cancel()
+        attente_processus.cancel()
+        lecture.cancel()
+        fermer_transport_processus(processus)
+        with annulation.verrou:
+            annulation.rappels.remove(signaler_annulation)
 
     if not lignes_capturees:
         lignes_capturees.append("(aucune sortie)")
-        diffuser_ligne(consommateur_sortie, "(aucune sortie)")
+        diffuser_lot(["(aucune sortie)"])
 
     sortie_complete = "\n".join(lignes_capturees)
-    code_retour = processus.returncode if processus.returncode is not None else 1
     if code_retour == 0:
         return True, sortie_complete
 
     message_echec = f"Commande en echec (code={code_retour}) pour: {' '.join(commande)}"
-    diffuser_ligne(consommateur_sortie, message_echec)
+    diffuser_lot([message_echec])
     return False, f"{message_echec}\n{sortie_complete}"
+
+
+def construire_analyseur() -> argparse.ArgumentParser:
+    """Construit l analyseur d arguments de la commande de plan post-pull.
+
+    Returns:
+        ArgumentParser configure.
+    """
+
+    analyseur = argparse.ArgumentParser(
+        description="Affiche le plan du pipeline post-pull en variables POST_PULL_*."
+    )
+    analyseur.add_argument("--racine", type=Path, default=Path.cwd(), help="Racine du depot.")
+    analyseur.add_argument(
+        "--depuis",
+        default=None,
+        help="Reference git de depart (defaut: dernier commit reconstruit avec succes).",
+    )
+    return analyseur
+
+
+def main(arguments: List[str] | None = None) -> int:
+    """Point d entree utilise par le hook ``.githooks/post-merge``.
+
+    La sortie standard ne contient que des lignes ``CLE=valeur`` a exporter
+    avant ``post_pull_update.sh`` (aucune pour le pipeline complet, et
+    ``POST_PULL_ETAPES`` vide si rien n est a reconstruire); le resume du plan
+    part sur la sortie d erreur.
+
+    Args:
+        arguments: Arguments de ligne de commande, sys.argv si None.
+
+    Returns:
+        Code de sortie: toujours 0, le pipeline complet servant de repli.
+    """
+
+    options = construire_analyseur().parse_args(arguments)
+    configuration = charger_configuration(
+        Path(__file__).resolve().parent / "config_maintenance.json"
+    )
+    if not pipeline_incremental_active(configuration) or shutil.which("git") is None:
+        print("Pipeline complet: pipeline incremental indisponible.", file=sys.stderr)
+        return 0
+    racine_projet = options.racine.resolve()
+    plan, lignes_plan = calculer_plan_post_pull(
+        racine_projet, options.depuis or lire_commit_derniere_maj(racine_projet)
+    )
+    for ligne in lignes_plan:
+        print(ligne, file=sys.stderr)
+    for cle, valeur in environnement_plan_post_pull(plan).items():
+        print(f"{cle}={valeur}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
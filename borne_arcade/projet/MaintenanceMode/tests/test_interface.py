@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import queue
 import sys
 import types
 import unittest
@@ -18,6 +19,7 @@ if "pygame" not in sys.modules:
         sys.modules["pygame"] = types.SimpleNamespace()
 
 from main import (  # pylint: disable=import-error
+    BudgetVidageJournal,
     EtatInterface,
     activer_auto_scroll_journal,
     ajouter_ligne_journal,
@@ -25,7 +27,12 @@ from main import (  # pylint: disable=import-error
     ajuster_decalage_journal,
     calculer_decalage_horizontal_max_journal,
     calculer_decalage_max_journal,
+    creer_journal_circulaire,
+    empiler_ligne_journal,
     extraire_segment_horizontal,
+    lister_lignes_journal,
+    rendre_ligne_journal,
+    traiter_flux_asynchrones,
 )
 
 
@@ -56,7 +63,9 @@ class TestInterfaceMaintenanceMode(unittest.TestCase):
         """
 
         etat = EtatInterface()
-        etat.journal_visible = [f"ligne {index}" for index in range(20)]
+        etat.journal_visible = creer_journal_circulaire(
+            [f"ligne {index}" for index in range(20)], 240
+        )
 
         ajuster_decalage_journal(etat, 7, len(etat.journal_visible), 5)
 
@@ -77,7 +86,9 @@ class TestInterfaceMaintenanceMode(unittest.TestCase):
         """
 
         etat = EtatInterface(auto_scroll_journal=False, decalage_lignes_journal=4)
-        etat.journal_visible = [f"ligne {index}" for index in range(12)]
+        etat.journal_visible = creer_journal_circulaire(
+            [f"ligne {index}" for index in range(12)], 240
+        )
 
         ajuster_decalage_journal(etat, -4, len(etat.journal_visible), 6)
 
@@ -95,12 +106,14 @@ class TestInterfaceMaintenanceMode(unittest.TestCase):
         """
 
         etat = EtatInterface(auto_scroll_journal=False, decalage_lignes_journal=8)
-        etat.journal_visible = [f"ligne {index}" for index in range(12)]
+        etat.journal_visible = creer_journal_circulaire(
+            [f"ligne {index}" for index in range(12)], 240
+        )
 
         ajouter_ligne_journal(etat, "nouvelle", limite_lignes=10, nombre_lignes_visibles=5)
 
         self.assertEqual(len(etat.journal_visible), 10)
-        self.assertEqual(etat.journal_visible[-1], "nouvelle")
+        self.assertEqual(etat.journal_visible.lignes[-1], "nouvelle")
         self.assertEqual(etat.decalage_lignes_journal, 5)
 
         activer_auto_scroll_journal(etat)
@@ -117,9 +130,33 @@ class TestInterfaceMaintenanceMode(unittest.TestCase):
             Aucun.
         """
 
-        lignes = ["abc", "abcdefghij", "abcd"]
-        self.assertEqual(calculer_decalage_horizontal_max_journal(lignes, 4), 6)
-        self.assertEqual(calculer_decalage_horizontal_max_journal(lignes, 20), 0)
+        journal = creer_journal_circulaire(["abc", "abcdefghij", "abcd"], 240)
+        self.assertEqual(calculer_decalage_horizontal_max_journal(journal, 4), 6)
+        self.assertEqual(calculer_decalage_horizontal_max_journal(journal, 20), 0)
+
+    def test_journal_circulaire_suit_la_longueur_max(self) -> None:
+        """Controle que la longueur maximale suit les ajouts et les retraits d historique.
+
+        Args:
+            Aucun.
+
+        Returns:
+            Aucun.
+        """
+
+        journal = creer_journal_circulaire(["abcdefghij", "abc", "abcdefghij", "ab"], 4)
+        self.assertEqual(journal.longueur_max, 10)
+
+        empiler_ligne_journal(journal, "a", 4)
+        self.assertEqual(journal.longueur_max, 10)
+        empiler_ligne_journal(journal, "abcd", 4)
+        self.assertEqual(journal.longueur_max, 10)
+        empiler_ligne_journal(journal, "abcde", 4)
+
+        self.assertEqual(list(journal.lignes), ["ab", "a", "abcd", "abcde"])
+        self.assertEqual(journal.longueur_max, 5)
+        self.assertEqual(sum(journal.occurrences_longueurs.values()), len(journal))
+        self.assertEqual(lister_lignes_journal(journal, 1, 3), ["a", "abcd"])
 
     def test_ajuster_decalage_horizontal_journal_borne(self) -> None:
         """Controle le bornage du decalage horizontal en mode manuel.
@@ -156,6 +193,116 @@ class TestInterfaceMaintenanceMode(unittest.TestCase):
         self.assertEqual(extraire_segment_horizontal(texte, 3, 4), "defg")
         self.assertEqual(extraire_segment_horizontal(texte, 9, 4), "j")
 
+    def test_rendre_ligne_journal_reutilise_le_rendu(self) -> None:
+        """Controle qu une ligne deja rendue au meme decalage n est pas rendue a nouveau.
+
+        Args:
+            Aucun.
+
+        Returns:
+            Aucun.
+        """
+
+        class PoliceComptee:
+            """Police factice comptant les rendus demandes."""
+
+            def __init__(self) -> None:
+                """Initialise la liste des rendus.
+
+                Returns:
+                    Aucun.
+                """
+
+                self.rendus: list[str] = []
+
+            def render(self, texte: str, _lisse: bool, _couleur: tuple) -> str:
+                """Enregistre le texte rendu.
+
+                Args:
+                    texte: Texte demande.
+                    _lisse: Anticrenelage ignore.
+                    _couleur: Couleur ignoree.
+
+                Returns:
+                    Texte rendu, en guise de surface.
+                """
+
+                self.rendus.append(texte)
+                return texte
+
+        police = PoliceComptee()
+        blanc = (255, 255, 255)
+        for _ in range(3):
+            self.assertEqual(rendre_ligne_journal(police, "abcdefghij", 0, 4, blanc), "abcd")
+        self.assertEqual(rendre_ligne_journal(police, "abcdefghij", 3, 4, blanc), "defg")
+
+        self.assertEqual(police.rendus, ["abcd", "defg"])
+
+
+class TestVidageJournalMaintenanceMode(unittest.TestCase):
+    """Verifie le transfert budgete des logs du worker vers le journal affiche."""
+
+    def test_vidage_limite_par_image_et_resultat_differe(self) -> None:
+        """Controle le plafond de lignes par image et l ordre statut/derniers logs.
+
+        Args:
+            Aucun.
+
+        Returns:
+            Aucun.
+        """
+
+        etat = EtatInterface(operation_en_cours=True)
+        file_journal: queue.Queue = queue.Queue()
+        file_resultat: queue.Queue = queue.Queue()
+        file_journal.put([f"a{index}" for index in range(5)])
+        file_journal.put([f"b{index}" for index in range(4)])
+        file_resultat.put((True, "Operation terminee.", Path("journal.log")))
+        budget = BudgetVidageJournal(
+            lignes_max_par_image=4, duree_max_ms=1000, seuil_saturation=100
+        )
+
+        traiter_flux_asynchrones(etat, file_journal, file_resultat, 50, 5, budget)
+        self.assertEqual(list(etat.journal_visible.lignes), ["a0", "a1", "a2", "a3"])
+        self.assertEqual(etat.lignes_journal_en_attente, 5)
+        self.assertTrue(etat.operation_en_cours)
+
+        traiter_flux_asynchrones(etat, file_journal, file_resultat, 50, 5, budget)
+        traiter_flux_asynchrones(etat, file_journal, file_resultat, 50, 5, budget)
+
+        self.assertEqual(list(etat.journal_visible.lignes)[-3:], ["b1", "b2", "b3"])
+        self.assertEqual(len(etat.journal_visible), 9)
+        self.assertEqual(etat.lignes_journal_en_attente, 0)
+        self.assertFalse(etat.operation_en_cours)
+        self.assertIn("Operation terminee.", etat.message_statut)
+
+    def test_saturation_remplacee_par_un_marqueur(self) -> None:
+        """Controle qu un flot au-dela du seuil ne garde que les lignes recentes et un marqueur.
+
+        Args:
+            Aucun.
+
+        Returns:
+            Aucun.
+        """
+
+        etat = EtatInterface()
+        file_journal: queue.Queue = queue.Queue()
+        for lot in range(30):
+            file_journal.put([f"{lot}-{index}" for index in range(10)])
+        budget = BudgetVidageJournal(
+            lignes_max_par_image=1000, duree_max_ms=1000, seuil_saturation=100
+        )
+
+        traiter_flux_asynchrones(etat, file_journal, queue.Queue(), 40, 5, budget)
+
+        lignes = list(etat.journal_visible.lignes)
+        self.assertEqual(len(lignes), 40)
+        self.assertIn("261 lignes non affichees", lignes[0])
+        self.assertEqual(lignes[1], "26-1")
+        self.assertEqual(lignes[-1], "29-9")
+        self.assertEqual(etat.lignes_journal_en_attente, 0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -2,9 +2,16 @@
 
 from __future__ import annotations
 
+import gc
+import gzip
+import io
+import os
 import sys
 import tempfile
+import threading
+import time
 import unittest
+from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
 from unittest.mock import patch
 
@@ -72,6 +79,230 @@ class TestOperationsMaintenance(unittest.TestCase):
         self.assertIn("Commande expiree", sortie)
         self.assertIn("Action recommandee", sortie)
 
+    def test_executer_commande_bornee_apres_fermeture_sortie(self) -> None:
+        """Controle le delai et l annulation d un processus qui ferme sa sortie puis continue.
+
+        Args:
+            Aucun.
+
+        Returns:
+            Aucun.
+        """
+
+        commande = [
+            sys.executable,
+            "-c",
+            "import os, time; print('debut', flush=True); os.close(1); os.close(2); time.sleep(30)",
+        ]
+        instant_depart = time.monotonic()
+        succes_expire, sortie_expiree = operations.executer_commande(
+            commande, Path.cwd(), timeout_secondes=1, intervalle_lecture_secondes=0.05
+        )
+        duree_expiration = time.monotonic() - instant_depart
+
+        jeton = operations.JetonAnnulation()
+        minuteur = threading.Timer(0.5, operations.annuler_operation, args=(jeton,))
+        instant_depart = time.monotonic()
+        minuteur.start()
+        succes_annule, sortie_annulee = operations.executer_commande(
+            commande,
+            Path.cwd(),
+            timeout_secondes=20,
+            intervalle_lecture_secondes=0.05,
+            annulation=jeton,
+        )
+        duree_annulation = time.monotonic() - instant_depart
+
+        self.assertFalse(succes_expire)
+        self.assertIn("Commande expiree", sortie_expiree)
+        self.assertLess(duree_expiration, 5.0)
+        self.assertFalse(succes_annule)
+        self.assertIn("Commande annulee", sortie_annulee)
+        self.assertLess(duree_annulation, 5.0)
+
+    def test_executer_commande_reussie_malgre_petit_fils_en_arriere_plan(self) -> None:
+        """Controle qu un petit-fils gardant le tube ouvert ne transforme pas un succes en echec.
+
+        Args:
+            Aucun.
+
+        Returns:
+            Aucun.
+        """
+
+        commande = [
+            sys.executable,
+            "-c",
+            "import subprocess, sys; "
+            "subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(5)']); print('hi')",
+        ]
+        exceptions_ignorees: list[object] = []
+        instant_depart = time.monotonic()
+        with patch.object(sys, "unraisablehook", exceptions_ignorees.append):
+            succes, sortie = operations.executer_commande(
+                commande, Path.cwd(), timeout_secondes=3, intervalle_lecture_secondes=0.05
+            )
+            gc.collect()
+        duree = time.monotonic() - instant_depart
+
+        self.assertTrue(succes)
+        self.assertEqual(sortie, "hi")
+        self.assertLess(duree, 2.5)
+        self.assertEqual(exceptions_ignorees, [])
+
+    def test_executer_commande_diffuse_sortie_par_lots(self) -> None:
+        """Controle qu un flot de sortie arrive au journal par lots, sans perte ni desordre.
+
+        Args:
+            Aucun.
+
+        Returns:
+            Aucun.
+        """
+
+        lots: list[list[str]] = []
+        commande = [
+            sys.executable,
+            "-c",
+            "import sys; sys.stdout.write(''.join(f'l{i}\\n' for i in range(5000)) + 'fin')",
+        ]
+        with tempfile.TemporaryDirectory() as dossier_temporaire:
+            journaliser = operations.creer_journaliseur(
+                Path(dossier_temporaire) / "journal.log", None, lots.append
+            )
+            succes, sortie = operations.executer_commande(
+                commande, Path.cwd(), timeout_secondes=10, consommateur_sortie=journaliser
+            )
+            operations.fermer_journaliseur(journaliser)
+            lignes_fichier = journaliser.chemin_journal.read_text(encoding="utf-8").splitlines()
+
+        lignes_diffusees = [ligne.split("] ", 1)[1] for lot in lots for ligne in lot]
+        self.assertTrue(succes)
+        self.assertEqual(lignes_diffusees, [f"l{index}" for index in range(5000)] + ["fin"])
+        self.assertEqual(sortie.splitlines(), lignes_diffusees)
+        self.assertEqual(len(lignes_fichier), 5001)
+        self.assertLess(len(lots), 100)
+
+    def test_executer_commande_annulee_depuis_un_autre_thread(self) -> None:
+        """Controle que l annulation tue la commande puis refuse les commandes suivantes.
+
+        Args:
+            Aucun.
+
+        Returns:
+            Aucun.
+        """
+
+        jeton = operations.JetonAnnulation()
+        lignes_capturees: list[str] = []
+        commande = [sys.executable, "-u", "-c", "import time; print('debut'); time.sleep(30)"]
+        minuteur = threading.Timer(0.5, operations.annuler_operation, args=(jeton,))
+        instant_depart = time.monotonic()
+        minuteur.start()
+
+        succes, sortie = operations.executer_commande(
+            commande,
+            Path.cwd(),
+            timeout_secondes=20,
+            consommateur_sortie=lignes_capturees.append,
+            intervalle_lecture_secondes=0.05,
+            annulation=jeton,
+        )
+        duree = time.monotonic() - instant_depart
+        succes_suivant, _ = operations.executer_commande(
+            [sys.executable, "-c", "print('jamais')"],
+            Path.cwd(),
+            timeout_secondes=5,
+            annulation=jeton,
+        )
+
+        self.assertFalse(succes)
+        self.assertIn("Commande annulee", sortie)
+        self.assertEqual(lignes_capturees[0], "debut")
+        self.assertLess(duree, 5.0)
+        self.assertFalse(succes_suivant)
+        self.assertEqual(jeton.rappels, [])
+
+    def test_journaliseur_garde_le_fichier_ouvert_et_vide_a_la_fermeture(self) -> None:
+        """Controle que les lignes restent en tampon jusqu a l intervalle ou la fermeture.
+
+        Args:
+            Aucun.
+
+        Returns:
+            Aucun.
+        """
+
+        lignes_capturees: list[str] = []
+        with tempfile.TemporaryDirectory() as dossier_temporaire:
+            chemin_journal = Path(dossier_temporaire) / "journal.log"
+            journaliser = operations.creer_journaliseur(
+                chemin_journal, lignes_capturees.append, intervalle_vidage_secondes=60.0
+            )
+            flux = journaliser.flux
+            for index in range(100):
+                journaliser(f"ligne {index}")
+            contenu_avant_fermeture = chemin_journal.read_text(encoding="utf-8")
+            operations.fermer_journaliseur(journaliser)
+            operations.fermer_journaliseur(journaliser)
+            journaliser("apres fermeture")
+            lignes_fichier = chemin_journal.read_text(encoding="utf-8").splitlines()
+
+        self.assertEqual(contenu_avant_fermeture, "")
+        self.assertIs(flux.closed, True)
+        self.assertIsNone(journaliser.flux)
+        self.assertEqual(len(lignes_capturees), 101)
+        self.assertEqual(len(lignes_fichier), 101)
+        self.assertTrue(lignes_fichier[-1].endswith("apres fermeture"))
+
+    def test_faire_tourner_journaux_compresse_puis_purge(self) -> None:
+        """Controle la compression des anciens journaux et la purge des archives en trop.
+
+        Args:
+            Aucun.
+
+        Returns:
+            Aucun.
+        """
+
+        with tempfile.TemporaryDirectory() as dossier_temporaire:
+            dossier_logs = Path(dossier_temporaire)
+            for index in range(6):
+                chemin = dossier_logs / f"maintenance_mode_diagnostic_{index}.log"
+                chemin.write_text(f"journal {index}\n", encoding="utf-8")
+                os.utime(chemin, (1000 + index * 10, 1000 + index * 10))
+            for index in range(3):
+                chemin = dossier_logs / f"maintenance_mode_git_pull_{index}.log.gz"
+                chemin.write_bytes(gzip.compress(b"ancien\n"))
+                os.utime(chemin, (index, index))
+            journal_courant = dossier_logs / "maintenance_mode_diagnostic_courant.log"
+            journal_courant.write_text("", encoding="utf-8")
+            autre_fichier = dossier_logs / "notes.log"
+            autre_fichier.write_text("", encoding="utf-8")
+            lignes_capturees: list[str] = []
+
+            operations.faire_tourner_journaux(journal_courant, 2, 4, lignes_capturees.append)
+            restants = sorted(chemin.name for chemin in dossier_logs.iterdir())
+            contenu_archive = gzip.decompress(
+                (dossier_logs / "maintenance_mode_diagnostic_3.log.gz").read_bytes()
+            )
+
+        self.assertEqual(lignes_capturees, [])
+        self.assertEqual(
+            restants,
+            [
+                "maintenance_mode_diagnostic_0.log.gz",
+                "maintenance_mode_diagnostic_1.log.gz",
+                "maintenance_mode_diagnostic_2.log.gz",
+                "maintenance_mode_diagnostic_3.log.gz",
+                "maintenance_mode_diagnostic_4.log",
+                "maintenance_mode_diagnostic_5.log",
+                "maintenance_mode_diagnostic_courant.log",
+                "notes.log",
+            ],
+        )
+        self.assertEqual(contenu_archive, b"journal 3\n")
+
     def test_executer_operation_inconnue_journalise_erreur(self) -> None:
         """Controle qu une operation inconnue genere un journal utile.
 
@@ -219,6 +450,343 @@ class TestOperationsMaintenance(unittest.TestCase):
                 self.assertIn("Diagnostic termine avec erreurs", message)
                 self.assertTrue(any("(sortie indisponible)" in ligne for ligne in lignes_capturees))
 
+    def test_operation_diagnostic_sondes_paralleles_en_ordre_stable(self) -> None:
+        """Controle que les sondes tournent ensemble et que le journal garde l ordre de la liste.
+
+        Args:
+            Aucun.
+
+        Returns:
+            Aucun.
+        """
+
+        configuration = operations.charger_configuration(Path("config_introuvable.json"))
+        lignes_capturees: list[str] = []
+        en_cours = {"courant": 0, "max": 0}
+        verrou = threading.Lock()
+
+        def sonde_factice(commande, _racine, **options):
+            """Simule une commande, uname etant la plus lente.
+
+            Args:
+                commande: Commande demandee.
+                _racine: Repertoire de travail ignore.
+                **options: Options de ``executer_commande``.
+
+            Returns:
+                Un tuple (succes, sortie texte).
+            """
+
+            with verrou:
+                en_cours["courant"] += 1
+                en_cours["max"] = max(en_cours["max"], en_cours["courant"])
+            time.sleep(0.05 if commande[0] == "uname" else 0.01)
+            options["consommateur_sortie"](f"sortie {commande[0]}")
+            with verrou:
+                en_cours["courant"] -= 1
+            return True, f"sortie {commande[0]}"
+
+        with tempfile.TemporaryDirectory() as dossier_temporaire:
+            racine_temporaire = Path(dossier_temporaire)
+            with (
+                patch.object(operations, "diagnostiquer_pre_requis_borne", return_value=True),
+                patch.object(operations.shutil, "which", return_value="/usr/bin/outil"),
+                patch.object(operations, "executer_commande", side_effect=sonde_factice),
+            ):
+                succes, _, _ = operations.operation_diagnostic(
+                    configuration,
+                    racine_temporaire,
+                    racine_temporaire / "journal.log",
+                    lignes_capturees.append,
+                )
+
+        self.assertTrue(succes)
+        self.assertGreater(en_cours["max"], 1)
+        commandes = [ligne.split()[1] for ligne in lignes_capturees if ligne.startswith("$ ")]
+        self.assertEqual(commandes, ["uname", "python3", "java", "free", "df"])
+        self.assertEqual(lignes_capturees[lignes_capturees.index("$ uname -a") + 1], "sortie uname")
+
+    def test_pre_requis_verifies_en_un_seul_appel_dpkg(self) -> None:
+        """Controle que tous les paquets sont interroges par un unique dpkg-query.
+
+        Args:
+            Aucun.
+
+        Returns:
+            Aucun.
+        """
+
+        sortie_dpkg = "git\tinstall ok installed\ncurl\tdeinstall ok config-files\n"
+        resultat = operations.subprocess.CompletedProcess([], 1, stdout=sortie_dpkg)
+        lignes_capturees: list[str] = []
+        with (
+            patch.object(
+                operations.shutil,
+                "which",
+                side_effect=lambda nom: "/usr/bin/dpkg-query" if nom == "dpkg-query" else None,
+            ),
+            patch.object(operations.subprocess, "run", return_value=resultat) as mock_run,
+        ):
+            succes = operations.diagnostiquer_pre_requis_borne(lignes_capturees.append)
+
+        self.assertFalse(succes)
+        mock_run.assert_called_once()
+        paquets_interroges = set(mock_run.call_args.args[0][3:])
+        self.assertTrue(set(operations.PAQUETS_SYSTEME_BORNE) <= paquets_interroges)
+        self.assertEqual(lignes_capturees[1], "OK prerequis paquet: git")
+        self.assertIn("prerequis manquant: curl", lignes_capturees[2])
+        self.assertEqual(len(lignes_capturees), len(operations.PAQUETS_SYSTEME_BORNE) + 1)
+
+    def test_inventaire_pre_requis_relu_jusqu_au_changement_de_dpkg_ou_path(self) -> None:
+        """Controle que le cache d inventaire n est recalcule qu a l evolution de dpkg ou du PATH.
+
+        Args:
+            Aucun.
+
+        Returns:
+            Aucun.
+        """
+
+        with tempfile.TemporaryDirectory() as dossier_temporaire:
+            dossier = Path(dossier_temporaire)
+            statut_dpkg = dossier / "status"
+            statut_dpkg.write_text("Package: git\n", encoding="utf-8")
+            dossier_bin = dossier / "bin"
+            dossier_bin.mkdir()
+            inventaire_calcule = operations.InventairePreRequis(
+                paquets_installes={"git"}, commandes={"git": "/usr/bin/git", "love": None}
+            )
+            with (
+                patch.object(operations, "FICHIER_STATUT_DPKG", statut_dpkg),
+                patch.dict(os.environ, {"PATH": str(dossier_bin)}),
+                patch.object(
+                    operations, "inventorier_pre_requis", return_value=inventaire_calcule
+                ) as mock_inventaire,
+            ):
+                premier = operations.charger_inventaire_pre_requis(dossier)
+                relu = operations.charger_inventaire_pre_requis(dossier)
+                os.utime(statut_dpkg, ns=(0, statut_dpkg.stat().st_mtime_ns + 10**9))
+                apres_dpkg = operations.charger_inventaire_pre_requis(dossier)
+                apres_dpkg_relu = operations.charger_inventaire_pre_requis(dossier)
+                (dossier_bin / "pylint").write_text("", encoding="utf-8")
+                os.utime(dossier_bin, ns=(0, dossier_bin.stat().st_mtime_ns + 10**9))
+                apres_outil = operations.charger_inventaire_pre_requis(dossier)
+                os.environ["PATH"] = f"{dossier_bin}{os.pathsep}/usr/bin"
+                apres_path = operations.charger_inventaire_pre_requis(dossier)
+                sans_cache = operations.charger_inventaire_pre_requis()
+
+        self.assertFalse(premier.depuis_cache)
+        self.assertTrue(relu.depuis_cache)
+        self.assertEqual(relu.paquets_installes, {"git"})
+        self.assertEqual(relu.commandes, {"git": "/usr/bin/git", "love": None})
+        self.assertFalse(apres_dpkg.depuis_cache)
+        self.assertTrue(apres_dpkg_relu.depuis_cache)
+        self.assertFalse(apres_outil.depuis_cache)
+        self.assertFalse(apres_path.depuis_cache)
+        self.assertFalse(sans_cache.depuis_cache)
+        self.assertEqual(mock_inventaire.call_count, 5)
+
+    def test_planifier_pipeline_post_pull_selon_fichiers_modifies(self) -> None:
+        """Controle l association des chemins modifies aux jeux et aux etapes.
+
+        Args:
+            Aucun.
+
+        Returns:
+            Aucun.
+        """
+
+        repertoires_pylint = ["scripts", "borne_arcade/projet/NeonSumo"]
+
+        plan_jeu = operations.planifier_pipeline_post_pull(
+            ["borne_arcade/projet/NeonSumo/main.py", "borne_arcade/projet/Pong/README.md"],
+            repertoires_pylint,
+        )
+        plan_menu = operations.planifier_pipeline_post_pull(
+            ["borne_arcade/Main.java", "docs/tests.md", "scripts/tests/test_jeux.sh"],
+            repertoires_pylint,
+        )
+        plan_docs = operations.planifier_pipeline_post_pull(["docs/index.md"], repertoires_pylint)
+        plan_vide = operations.planifier_pipeline_post_pull([], repertoires_pylint)
+        plan_requirements = operations.planifier_pipeline_post_pull(
+            ["borne_arcade/projet/PianoTile/requirements.txt"], repertoires_pylint
+        )
+
+        self.assertFalse(plan_jeu.complet)
+        self.assertEqual(plan_jeu.etapes, ["compilation", "lint", "tests"])
+        # Le README de Pong n est ni compile ni publie: Pong n est pas reconstruit.
+        self.assertEqual(plan_jeu.jeux, ["NeonSumo"])
+        self.assertFalse(plan_jeu.compiler_menu)
+        self.assertEqual(plan_jeu.outils_lint, ["pylint"])
+        self.assertEqual(plan_jeu.repertoires_pylint, ["borne_arcade/projet/NeonSumo"])
+        self.assertEqual(plan_menu.etapes, ["compilation", "lint", "tests", "documentation"])
+        self.assertEqual(plan_menu.jeux, [])
+        self.assertTrue(plan_menu.compiler_menu)
+        self.assertEqual(plan_menu.outils_lint, ["shellcheck", "checkstyle"])
+        self.assertEqual(plan_docs.etapes, ["documentation"])
+        self.assertEqual(plan_vide.etapes, [])
+        self.assertEqual(plan_requirements.etapes, ["installation", "compilation", "tests"])
+        self.assertEqual(plan_requirements.jeux, ["PianoTile"])
+        for fichiers in (None, ["MG2D/MG2D/Fenetre.java"], ["src/inconnu.txt"]):
+            plan = operations.planifier_pipeline_post_pull(fichiers, repertoires_pylint)
+            self.assertTrue(plan.complet)
+            self.assertEqual(plan.etapes, operations.ETAPES_PIPELINE_POST_PULL)
+            self.assertEqual(operations.environnement_plan_post_pull(plan), {})
+
+        self.assertEqual(
+            operations.environnement_plan_post_pull(plan_jeu),
+            {
+                "POST_PULL_ETAPES": "compilation lint tests",
+                "POST_PULL_COMPILER_MENU": "0",
+                "POST_PULL_OUTILS_LINT": "pylint",
+                "POST_PULL_JEUX": "NeonSumo",
+                "POST_PULL_REPERTOIRES_PYLINT": "borne_arcade/projet/NeonSumo",
+            },
+        )
+
+    def test_operation_pipeline_post_pull_incremental(self) -> None:
+        """Controle que le script recoit le plan et qu un diff vide ne lance rien.
+
+        Args:
+            Aucun.
+
+        Returns:
+            Aucun.
+        """
+
+        configuration = operations.charger_configuration(Path("config_introuvable.json"))
+        lignes_capturees: list[str] = []
+        with tempfile.TemporaryDirectory() as dossier_temporaire:
+            racine_temporaire = Path(dossier_temporaire)
+            (racine_temporaire / operations.FICHIER_COMMIT_DERNIERE_MAJ).write_text(
+                "abc123\n", encoding="utf-8"
+            )
+            ancetre = operations.subprocess.CompletedProcess([], 0)
+            diffs = []
+            for sortie in ("borne_arcade/projet/Pong/Pong.java\n", ""):
+                diffs.append(ancetre)
+                diffs.append(operations.subprocess.CompletedProcess([], 0, stdout=sortie))
+            with (
+                patch.object(operations.shutil, "which", return_value="/usr/bin/git"),
+                patch.object(operations.subprocess, "run", side_effect=diffs) as mock_diff,
+                patch.object(
+                    operations, "executer_commande", return_value=(True, "ok")
+                ) as mock_exec,
+            ):
+                succes, _, _ = operations.operation_pipeline_post_pull(
+                    configuration,
+                    racine_temporaire,
+                    racine_temporaire / "journal.log",
+                    lignes_capturees.append,
+                )
+                succes_vide, message_vide, _ = operations.operation_pipeline_post_pull(
+                    configuration,
+                    racine_temporaire,
+                    racine_temporaire / "journal.log",
+                    lignes_capturees.append,
+                )
+
+        self.assertTrue(succes)
+        self.assertTrue(succes_vide)
+        self.assertIn("aucun changement", message_vide)
+        self.assertEqual(mock_exec.call_count, 1)
+        commande_ancetre = mock_diff.call_args_list[0].args[0]
+        self.assertEqual(commande_ancetre[-3:], ["--is-ancestor", "abc123", "HEAD"])
+        self.assertEqual(mock_diff.call_args.args[0][-2:], ["abc123", "HEAD"])
+        environnement = mock_exec.call_args.kwargs["environnement"]
+        self.assertEqual(environnement["POST_PULL_JEUX"], "Pong")
+        self.assertEqual(environnement["POST_PULL_ETAPES"], "compilation tests")
+        self.assertIn("Compilation: Pong", lignes_capturees)
+
+    def test_operation_pipeline_post_pull_complet_sans_commit_exploitable(self) -> None:
+        """Controle le repli sur le pipeline complet sans commit reconstruit ancetre de HEAD.
+
+        Args:
+            Aucun.
+
+        Returns:
+            Aucun.
+        """
+
+        configuration = operations.charger_configuration(Path("config_introuvable.json"))
+        lignes_capturees: list[str] = []
+        with tempfile.TemporaryDirectory() as dossier_temporaire:
+            racine_temporaire = Path(dossier_temporaire)
+            with (
+                patch.object(operations.shutil, "which", return_value="/usr/bin/git"),
+                patch.object(
+                    operations.subprocess,
+                    "run",
+                    return_value=operations.subprocess.CompletedProcess([], 1),
+                ) as mock_git,
+                patch.object(
+                    operations, "executer_commande", return_value=(True, "ok")
+                ) as mock_exec,
+            ):
+                operations.operation_pipeline_post_pull(
+                    configuration,
+                    racine_temporaire,
+                    racine_temporaire / "journal.log",
+                    lignes_capturees.append,
+                )
+                appels_sans_commit = mock_git.call_count
+                (racine_temporaire / operations.FICHIER_COMMIT_DERNIERE_MAJ).write_text(
+                    "abc123\n", encoding="utf-8"
+                )
+                operations.operation_pipeline_post_pull(
+                    configuration,
+                    racine_temporaire,
+                    racine_temporaire / "journal.log",
+                    lignes_capturees.append,
+                )
+
+        self.assertEqual(appels_sans_commit, 0)
+        # Historique reecrit: le commit memorise n est plus un ancetre, aucun diff n est tente.
+        self.assertEqual(mock_git.call_count, 1)
+        self.assertIn("--is-ancestor", mock_git.call_args.args[0])
+        self.assertEqual(mock_exec.call_count, 2)
+        for appel in mock_exec.call_args_list:
+            self.assertIsNone(appel.kwargs["environnement"])
+        self.assertEqual(sum(ligne.startswith("Pipeline complet") for ligne in lignes_capturees), 2)
+
+    def test_main_plan_post_pull_exporte_les_variables(self) -> None:
+        """Controle la sortie de la commande lancee par le hook post-merge.
+
+        Args:
+            Aucun.
+
+        Returns:
+            Aucun.
+        """
+
+        resultats = [
+            operations.subprocess.CompletedProcess([], 0),
+            operations.subprocess.CompletedProcess(
+                [], 0, stdout="borne_arcade/projet/Pong/Pong.java\n"
+            ),
+            operations.subprocess.CompletedProcess([], 0),
+            operations.subprocess.CompletedProcess([], 0, stdout="README.md\n"),
+        ]
+        sortie_plan = io.StringIO()
+        sortie_vide = io.StringIO()
+        with tempfile.TemporaryDirectory() as dossier_temporaire:
+            with (
+                patch.object(operations.shutil, "which", return_value="/usr/bin/git"),
+                patch.object(operations.subprocess, "run", side_effect=resultats) as mock_git,
+                redirect_stderr(io.StringIO()) as erreurs,
+            ):
+                arguments = ["--racine", dossier_temporaire, "--depuis", "ORIG_HEAD"]
+                with redirect_stdout(sortie_plan):
+                    code = operations.main(arguments)
+                with redirect_stdout(sortie_vide):
+                    operations.main(arguments)
+
+        self.assertEqual(code, 0)
+        self.assertEqual(mock_git.call_args.args[0][-2:], ["ORIG_HEAD", "HEAD"])
+        self.assertIn("POST_PULL_JEUX=Pong", sortie_plan.getvalue().splitlines())
+        self.assertIn("POST_PULL_ETAPES=", sortie_vide.getvalue().splitlines())
+        self.assertIn("depuis ORIG_HEAD", erreurs.getvalue())
+
     def test_operation_reset_pre_requis_refuse_sans_sudo(self) -> None:
         """Controle le message actionnable sans privileges sudo non interactifs.
 
@@ -315,7 +883,9 @@ class TestOperationsMaintenance(unittest.TestCase):
             resultat_statut = type("Resultat", (), {"returncode": 0, "stdout": ""})()
             with (
                 patch.object(operations, "verifier_git_disponible", return_value=True),
-                patch.object(operations, "executer_commande", return_value=(True, "ok")) as mock_exec,
+                patch.object(
+                    operations, "executer_commande", return_value=(True, "ok")
+                ) as mock_exec,
                 patch.object(operations.subprocess, "run", return_value=resultat_statut),
             ):
                 succes, message, _ = operations.operation_git_retour_precedent(
@@ -341,7 +911,7 @@ class TestOperationsMaintenance(unittest.TestCase):
 
         with (
             patch.object(operations, "PAQUETS_RESET_NON_SYSTEME_BORNE", ["python3", "checkstyle"]),
-            patch.object(operations, "paquet_systeme_installe", return_value=True),
+            patch.object(operations, "lister_paquets_systeme_installes", side_effect=set),
         ):
             paquets = operations.lister_paquets_reset_non_systeme_installes()
             self.assertEqual(paquets, ["checkstyle"])
@@ -369,7 +939,9 @@ class TestOperationsMaintenance(unittest.TestCase):
                     "lister_paquets_reset_non_systeme_installes",
                     return_value=["checkstyle", "pylint"],
                 ),
-                patch.object(operations, "executer_commande", return_value=(True, "ok")) as mock_exec,
+                patch.object(
+                    operations, "executer_commande", return_value=(True, "ok")
+                ) as mock_exec,
                 patch.object(
                     operations,
                     "nettoyer_artefacts_reset",
@@ -409,7 +981,9 @@ class TestOperationsMaintenance(unittest.TestCase):
             with (
                 patch.object(operations, "obtenir_prefixe_privileges_systeme", return_value=["sudo", "-n"]),
                 patch.object(operations, "lister_paquets_reset_non_systeme_installes", return_value=[]),
-                patch.object(operations, "executer_commande", return_value=(True, "ok")) as mock_exec,
+                patch.object(
+                    operations, "executer_commande", return_value=(True, "ok")
+                ) as mock_exec,
                 patch.object(
                     operations,
                     "nettoyer_artefacts_reset",
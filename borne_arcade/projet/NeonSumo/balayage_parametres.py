@@ -0,0 +1,348 @@
+"""Balayage multiprocessus des parametres d equilibrage de Neon Sumo.
+
+Chaque combinaison d une grille de ``ParametresCombat`` est evaluee par des
+matchs simules (``simulation.simuler_match``) repartis sur un
+``ProcessPoolExecutor``. Les statistiques sont ecrites en CSV, une colonne
+par parametre ou indicateur. Avec NumPy et assez de matchs par combinaison,
+les politiques sans action (``inactive``, ``attract``) jouent tous les matchs
+dans un meme lot (``moteur_vectoriel.simuler_matchs_lot``), aux resultats
+identiques.
+
+Exemple:
+    python3 balayage_parametres.py --grille impulsion_bump=250,290,330 \\
+        --grille cooldown_dash=0.8,1.2 --matchs 40 --sortie balayage.csv
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import csv
+import itertools
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, fields
+from pathlib import Path
+from statistics import mean, median
+from typing import Dict, List, Sequence, Tuple
+
+from logique import ParametresCombat
+from moteur_vectoriel import NUMPY_DISPONIBLE, POLITIQUES_LOT, simuler_matchs_lot
+from simulation import (
+    VAINQUEUR_EGALITE,
+    politique_agressive,
+    politique_attract,
+    politique_inactive,
+    simuler_match,
+)
+
+
+RACINE_JEU = Path(__file__).resolve().parent
+FICHIER_CONFIG = RACINE_JEU / "config_jeu.json"
+FICHIER_SORTIE_DEFAUT = Path("neon_sumo_balayage.csv")
+NOMBRE_MATCHS_DEFAUT = 20
+SEED_DEFAUT = 0
+# En dessous, le cout fixe de chaque pas NumPy depasse celui des matchs scalaires.
+NOMBRE_MATCHS_MIN_LOT = 16
+POLITIQUES = {
+    "inactive": politique_inactive,
+    "attract": politique_attract,
+    "agressive": politique_agressive,
+}
+CHEMINS_PARAMETRES_COMBAT: Dict[str, Tuple[str, str]] = {
+    "acceleration": ("physique", "acceleration"),
+    "friction_base": ("physique", "friction_base"),
+    "friction_frein": ("physique", "friction_frein"),
+    "vitesse_max": ("physique", "vitesse_max"),
+    "coefficient_rebond_collision": ("physique", "coefficient_rebond_collision"),
+    "impulsion_dash": ("gameplay", "impulsion_dash"),
+    "impulsion_bump": ("gameplay", "impulsion_bump"),
+    "rayon_bump": ("gameplay", "rayon_bump"),
+    "multiplicateur_bouclier": ("gameplay", "reduction_knockback_bouclier"),
+    "duree_bouclier": ("gameplay", "duree_bouclier"),
+    "cooldown_dash": ("cooldowns", "dash"),
+    "cooldown_bump": ("cooldowns", "bump"),
+    "cooldown_bouclier": ("cooldowns", "bouclier"),
+    "cooldown_taunt": ("cooldowns", "taunt"),
+    "gain_ultime_par_seconde": ("ultime", "gain_par_seconde"),
+    "gain_ultime_par_impact": ("ultime", "gain_par_impact"),
+    "rayon_ultime": ("ultime", "rayon"),
+    "impulsion_ultime": ("ultime", "impulsion"),
+    "delai_sortie_arene": ("gameplay", "delai_sortie_arene"),
+}
+COLONNES_STATISTIQUES = (
+    "matchs",
+    "taux_victoire_j1",
+    "taux_victoire_j2",
+    "taux_match_sans_vainqueur",
+    "manches",
+    "duree_manche_moyenne",
+    "duree_manche_mediane",
+    "taux_sortie_arene",
+    "taux_double_sortie",
+    "taux_mort_subite",
+    "style_moyen_j1",
+    "style_moyen_j2",
+)
+
+
+@dataclass
+class TacheBalayage:
+    """Decrit une combinaison de parametres a evaluer.
+
+    Attributes:
+        valeurs: Valeurs de ParametresCombat imposees, par nom de champ.
+        configuration: Configuration de base du jeu.
+        politique_j1: Nom de la politique de J1.
+        politique_j2: Nom de la politique de J2.
+        seeds: Graines des matchs a jouer.
+    """
+
+    valeurs: Dict[str, float]
+    configuration: Dict[str, object]
+    politique_j1: str
+    politique_j2: str
+    seeds: Tuple[int, ...]
+
+
+def appliquer_valeurs_combat(
+    configuration: Dict[str, object],
+    valeurs: Dict[str, float],
+) -> Dict[str, object]:
+    """Retourne une copie de la configuration avec des parametres surcharges.
+
+    Args:
+        configuration: Configuration de base.
+        valeurs: Valeurs de ParametresCombat a imposer.
+
+    Returns:
+        Nouvelle configuration.
+    """
+
+    configuration_modifiee = copy.deepcopy(configuration)
+    for nom_parametre, valeur in valeurs.items():
+        section, cle = CHEMINS_PARAMETRES_COMBAT[nom_parametre]
+        configuration_modifiee.setdefault(section, {})[cle] = valeur
+    return configuration_modifiee
+
+
+def lire_grille(specifications: Sequence[str]) -> Dict[str, List[float]]:
+    """Interprete les options ``--grille nom=v1,v2,...``.
+
+    Args:
+        specifications: Specifications brutes de la ligne de commande.
+
+    Returns:
+        Dictionnaire nom de parametre -> valeurs a tester.
+    """
+
+    noms_valides = {champ.name for champ in fields(ParametresCombat)}
+    grille: Dict[str, List[float]] = {}
+    for specification in specifications:
+        nom, separateur, valeurs_brutes = specification.partition("=")
+        nom = nom.strip()
+        if not separateur or nom not in noms_valides:
+            raise ValueError(f"Parametre de grille invalide: {specification}")
+        try:
+            valeurs = [float(valeur) for valeur in valeurs_brutes.split(",") if valeur.strip()]
+        except ValueError as erreur:
+            raise ValueError(f"Valeurs non numeriques pour {nom}: {valeurs_brutes}") from erreur
+        if not valeurs:
+            raise ValueError(f"Aucune valeur fournie pour {nom}.")
+        grille[nom] = valeurs
+    return grille
+
+
+def construire_taches(
+    configuration: Dict[str, object],
+    grille: Dict[str, List[float]],
+    politique_j1: str,
+    politique_j2: str,
+    nombre_matchs: int,
+    seed: int,
+) -> List[TacheBalayage]:
+    """Construit une tache par combinaison du produit cartesien de la grille.
+
+    Toutes les combinaisons rejouent les memes seeds pour rester comparables.
+
+    Args:
+        configuration: Configuration de base.
+        grille: Valeurs a tester par parametre.
+        politique_j1: Nom de la politique de J1.
+        politique_j2: Nom de la politique de J2.
+        nombre_matchs: Nombre de matchs par combinaison.
+        seed: Premiere graine utilisee.
+
+    Returns:
+        Liste des taches a executer.
+    """
+
+    noms = list(grille)
+    seeds = tuple(range(seed, seed + nombre_matchs))
+    return [
+        TacheBalayage(
+            valeurs=dict(zip(noms, combinaison)),
+            configuration=configuration,
+            politique_j1=politique_j1,
+            politique_j2=politique_j2,
+            seeds=seeds,
+        )
+        for combinaison in itertools.product(*(grille[nom] for nom in noms))
+    ]
+
+
+def evaluer_tache(tache: TacheBalayage) -> Dict[str, float]:
+    """Joue les matchs d une combinaison et agrege leurs statistiques.
+
+    Args:
+        tache: Combinaison a evaluer.
+
+    Returns:
+        Ligne de resultats (parametres puis statistiques).
+    """
+
+    configuration = appliquer_valeurs_combat(tache.configuration, tache.valeurs)
+    en_lot = NUMPY_DISPONIBLE and len(tache.seeds) >= NOMBRE_MATCHS_MIN_LOT
+    if en_lot and {tache.politique_j1, tache.politique_j2} <= set(POLITIQUES_LOT):
+        resultats = simuler_matchs_lot(
+            configuration, tache.politique_j1, tache.politique_j2, tache.seeds
+        )
+    else:
+        politique_j1 = POLITIQUES[tache.politique_j1]
+        politique_j2 = POLITIQUES[tache.politique_j2]
+        resultats = [
+            simuler_match(configuration, politique_j1, politique_j2, seed) for seed in tache.seeds
+        ]
+    manches = [manche for resultat in resultats for manche in resultat.manches]
+    nombre_matchs = max(1, len(resultats))
+    nombre_manches = max(1, len(manches))
+    durees = [manche.duree for manche in manches] or [0.0]
+
+    ligne: Dict[str, float] = dict(tache.valeurs)
+    ligne.update(
+        {
+            "matchs": len(resultats),
+            "taux_victoire_j1": sum(r.vainqueur == "J1" for r in resultats) / nombre_matchs,
+            "taux_victoire_j2": sum(r.vainqueur == "J2" for r in resultats) / nombre_matchs,
+            "taux_match_sans_vainqueur": sum(not r.vainqueur for r in resultats) / nombre_matchs,
+            "manches": len(manches),
+            "duree_manche_moyenne": mean(durees),
+            "duree_manche_mediane": median(durees),
+            "taux_sortie_arene": sum(not m.interrompue for m in manches) / nombre_manches,
+            "taux_double_sortie": sum(m.vainqueur == VAINQUEUR_EGALITE and not m.interrompue for m in manches)
+            / nombre_manches,
+            "taux_mort_subite": sum(m.mort_subite for m in manches) / nombre_manches,
+            "style_moyen_j1": mean(r.style_j1 for r in resultats) if resultats else 0.0,
+            "style_moyen_j2": mean(r.style_j2 for r in resultats) if resultats else 0.0,
+        }
+    )
+    return ligne
+
+
+def executer_balayage(taches: Sequence[TacheBalayage], nombre_processus: int) -> List[Dict[str, float]]:
+    """Repartit les taches sur un pool de processus.
+
+    Args:
+        taches: Combinaisons a evaluer.
+        nombre_processus: Nombre de processus; 1 execute en sequentiel.
+
+    Returns:
+        Lignes de resultats dans l ordre des taches.
+    """
+
+    if nombre_processus <= 1:
+        return [evaluer_tache(tache) for tache in taches]
+    with ProcessPoolExecutor(max_workers=nombre_processus) as executeur:
+        return list(executeur.map(evaluer_tache, taches))
+
+
+def ecrire_resultats_csv(
+    chemin_sortie: Path,
+    noms_parametres: Sequence[str],
+    lignes: Sequence[Dict[str, float]],
+) -> None:
+    """Ecrit les resultats du balayage en CSV.
+
+    Args:
+        chemin_sortie: Fichier CSV cible.
+        noms_parametres: Colonnes de parametres, en tete de fichier.
+        lignes: Lignes de resultats.
+
+    Returns:
+        None.
+    """
+
+    chemin_sortie.parent.mkdir(parents=True, exist_ok=True)
+    with chemin_sortie.open("w", encoding="utf-8", newline="") as flux:
+        ecrivain = csv.DictWriter(flux, fieldnames=[*noms_parametres, *COLONNES_STATISTIQUES])
+        ecrivain.writeheader()
+        ecrivain.writerows(lignes)
+
+
+def construire_analyseur() -> argparse.ArgumentParser:
+    """Construit l analyseur de la ligne de commande.
+
+    Returns:
+        ArgumentParser configure.
+    """
+
+    analyseur = argparse.ArgumentParser(description="Balayage des parametres de combat Neon Sumo.")
+    analyseur.add_argument(
+        "--grille",
+        action="append",
+        default=[],
+        metavar="NOM=V1,V2",
+        help="Valeurs a tester pour un champ de ParametresCombat (option repetable).",
+    )
+    analyseur.add_argument("--matchs", type=int, default=NOMBRE_MATCHS_DEFAUT, help="Matchs par combinaison.")
+    analyseur.add_argument("--seed", type=int, default=SEED_DEFAUT, help="Premiere graine des matchs.")
+    analyseur.add_argument("--politique-j1", choices=sorted(POLITIQUES), default="agressive")
+    analyseur.add_argument("--politique-j2", choices=sorted(POLITIQUES), default="attract")
+    analyseur.add_argument(
+        "--processus",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Nombre de processus (defaut: tous les coeurs).",
+    )
+    analyseur.add_argument("--config", type=Path, default=FICHIER_CONFIG, help="Configuration de base.")
+    analyseur.add_argument("--sortie", type=Path, default=FICHIER_SORTIE_DEFAUT, help="Fichier CSV produit.")
+    return analyseur
+
+
+def main(arguments: Sequence[str] | None = None) -> int:
+    """Point d entree du balayage en ligne de commande.
+
+    Args:
+        arguments: Arguments de la ligne de commande (defaut: sys.argv).
+
+    Returns:
+        Code de sortie du programme.
+    """
+
+    options = construire_analyseur().parse_args(arguments)
+    try:
+        grille = lire_grille(options.grille)
+    except ValueError as erreur:
+        print(f"ERREUR: {erreur}", file=sys.stderr)
+        return 2
+
+    with options.config.open("r", encoding="utf-8") as flux:
+        configuration = json.load(flux)
+    taches = construire_taches(
+        configuration,
+        grille,
+        options.politique_j1,
+        options.politique_j2,
+        max(1, options.matchs),
+        options.seed,
+    )
+    lignes = executer_balayage(taches, options.processus)
+    ecrire_resultats_csv(options.sortie, list(grille), lignes)
+    print(f"{len(lignes)} combinaison(s) ecrite(s) dans {options.sortie}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
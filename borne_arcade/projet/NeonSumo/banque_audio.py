@@ -0,0 +1,362 @@
+"""Banque de sons Neon Sumo: decodage en arriere-plan, cache WAV et canaux reserves.
+
+Les MP3 du jeu sont decodes une seule fois: le PCM obtenu est ecrit en WAV
+dans un cache sur disque, indexe par la date de modification et la taille de
+la source ainsi que par le format du mixer. Les lancements suivants relisent
+ce PCM brut sans decodeur. Le chargement tourne sur un fil d arriere-plan:
+la premiere image s affiche sans attendre les sons, et un son pas encore
+pret est simplement ignore. pygame n est importe qu a la creation de la
+banque, comme dans ``main.py``.
+
+Les sons prioritaires (elimination, ultime) jouent sur des canaux reserves du
+mixer, que ``Sound.play`` n utilise jamais: ils ne sont donc jamais perdus
+faute de canal libre.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import wave
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:  # pragma: no cover - pygame est importe a la demande
+    import pygame
+
+
+RACINE_JEU = Path(__file__).resolve().parent
+DOSSIER_SONS = RACINE_JEU / "assets" / "sons"
+DOSSIER_CACHE_AUDIO_DEFAUT = RACINE_JEU / "cache_audio"
+EXTENSION_CACHE_AUDIO = ".wav"
+PRIORITE_NORMALE = 0
+PRIORITE_HAUTE = 1
+# Formats du mixer representables en WAV PCM: 8 bits non signe, 16 bits signe.
+LARGEUR_ECHANTILLON_PAR_FORMAT = {8: 1, -16: 2}
+# Ordre de chargement: les sons prioritaires sont prets en premier.
+SONS_JEU = (
+    ("elimination", "elimination.mp3", PRIORITE_HAUTE),
+    ("ultime", "ultime.mp3", PRIORITE_HAUTE),
+    ("bump", "bump.mp3", PRIORITE_NORMALE),
+    ("dash", "dash.mp3", PRIORITE_NORMALE),
+    ("bouclier", "bouclier.mp3", PRIORITE_NORMALE),
+    ("taunt", "taunt.mp3", PRIORITE_NORMALE),
+)
+
+
+@dataclass
+class ParametresAudio:
+    """Reglages de la banque audio (section ``audio`` de la configuration).
+
+    Attributes:
+        dossier_cache: Dossier du cache WAV.
+        canaux_reserves: Canaux du mixer reserves aux sons prioritaires.
+        chargement_asynchrone: False pour charger les sons avant la premiere image.
+    """
+
+    dossier_cache: Path = DOSSIER_CACHE_AUDIO_DEFAUT
+    canaux_reserves: int = 2
+    chargement_asynchrone: bool = True
+
+
+@dataclass
+class BanqueAudio:
+    """Sons du jeu et canaux qui leur sont reserves.
+
+    Attributes:
+        parametres: Reglages de la banque.
+        sons: Son charge par nom; absent tant que le fil de chargement ne l a pas traite.
+        priorites: Priorite de chaque son.
+        canaux_prioritaires: Canaux reserves aux sons de priorite haute, du moins
+            recemment au plus recemment utilise.
+        fil_chargement: Fil d arriere-plan, None en chargement synchrone.
+    """
+
+    parametres: ParametresAudio
+    sons: Dict[str, Optional[pygame.mixer.Sound]] = field(default_factory=dict)
+    priorites: Dict[str, int] = field(default_factory=dict)
+    canaux_prioritaires: List[pygame.mixer.Channel] = field(default_factory=list)
+    fil_chargement: Optional[threading.Thread] = None
+
+
+def construire_parametres_audio(configuration: Dict[str, object]) -> ParametresAudio:
+    """Lit la section ``audio`` de la configuration.
+
+    Args:
+        configuration: Configuration globale du jeu.
+
+    Returns:
+        ParametresAudio avec valeurs par defaut pour les champs absents.
+    """
+
+    audio = configuration.get("audio", {})
+    dossier_cache = Path(str(audio.get("dossier_cache", DOSSIER_CACHE_AUDIO_DEFAUT)))
+    if not dossier_cache.is_absolute():
+        dossier_cache = RACINE_JEU / dossier_cache
+    return ParametresAudio(
+        dossier_cache=dossier_cache,
+        canaux_reserves=max(0, int(audio.get("canaux_reserves", 2))),
+        chargement_asynchrone=bool(audio.get("chargement_asynchrone", True)),
+    )
+
+
+def nommer_fichier_cache(source: Path, format_mixer: Tuple[int, int, int]) -> str:
+    """Construit le nom du PCM en cache d une source.
+
+    La date de modification et la taille invalident le cache quand la source
+    change; le format du mixer, quand la borne change de sortie audio.
+
+    Args:
+        source: Fichier audio source.
+        format_mixer: Triplet (frequence, format, canaux) de ``pygame.mixer.get_init``.
+
+    Returns:
+        Nom du fichier WAV.
+    """
+
+    statistiques = source.stat()
+    frequence, format_echantillon, canaux = format_mixer
+    return (
+        f"{source.stem}_{statistiques.st_mtime_ns}_{statistiques.st_size}"
+        f"_{frequence}_{format_echantillon}_{canaux}{EXTENSION_CACHE_AUDIO}"
+    )
+
+
+def ecrire_cache_wav(
+    son: pygame.mixer.Sound,
+    chemin: Path,
+    format_mixer: Tuple[int, int, int],
+    nom_source: str,
+) -> bool:
+    """Ecrit le PCM d un son decode dans un WAV, de maniere atomique.
+
+    Les anciennes versions du meme son sont supprimees.
+
+    Args:
+        son: Son decode au format du mixer.
+        chemin: Fichier WAV cible.
+        format_mixer: Triplet (frequence, format, canaux) du mixer.
+        nom_source: Nom de la source sans extension.
+
+    Returns:
+        True si le cache est ecrit, False si le format n est pas representable ou en cas d erreur.
+    """
+
+    frequence, format_echantillon, canaux = format_mixer
+    largeur = LARGEUR_ECHANTILLON_PAR_FORMAT.get(format_echantillon)
+    if largeur is None:
+        return False
+    temporaire = chemin.with_suffix(".tmp")
+    try:
+        chemin.parent.mkdir(parents=True, exist_ok=True)
+        with wave.open(str(temporaire), "wb") as flux:
+            flux.setnchannels(canaux)
+            flux.setsampwidth(largeur)
+            flux.setframerate(frequence)
+            flux.writeframes(son.get_raw())
+        os.replace(temporaire, chemin)
+        for ancien in chemin.parent.glob(f"{nom_source}_*{EXTENSION_CACHE_AUDIO}"):
+            # Le nom de la source suivi des cinq champs de nommer_fichier_cache.
+            if ancien != chemin and ancien.stem[len(nom_source) + 1 :].count("_") == 4:
+                ancien.unlink(missing_ok=True)
+    except OSError:
+        temporaire.unlink(missing_ok=True)
+        return False
+    return True
+
+
+def lire_cache_wav(
+    chemin: Path,
+    format_mixer: Tuple[int, int, int],
+) -> Optional[pygame.mixer.Sound]:
+    """Recharge un PCM en cache s il correspond au format du mixer.
+
+    Args:
+        chemin: Fichier WAV du cache.
+        format_mixer: Triplet (frequence, format, canaux) du mixer.
+
+    Returns:
+        Son pret a jouer, ou None si le cache est absent ou inutilisable.
+    """
+
+    import pygame  # pylint: disable=import-outside-toplevel,redefined-outer-name
+
+    frequence, format_echantillon, canaux = format_mixer
+    try:
+        with wave.open(str(chemin), "rb") as flux:
+            if (
+                flux.getframerate() != frequence
+                or flux.getnchannels() != canaux
+                or flux.getsampwidth() != LARGEUR_ECHANTILLON_PAR_FORMAT.get(format_echantillon)
+            ):
+                return None
+            donnees = flux.readframes(flux.getnframes())
+        return pygame.mixer.Sound(buffer=donnees)
+    except (OSError, EOFError, wave.Error, pygame.error):
+        return None
+
+
+def charger_son_cache(
+    source: Path,
+    dossier_cache: Path,
+    format_mixer: Tuple[int, int, int],
+) -> Optional[pygame.mixer.Sound]:
+    """Charge un son depuis le cache WAV, ou le decode et remplit le cache.
+
+    Args:
+        source: Fichier audio source.
+        dossier_cache: Dossier du cache.
+        format_mixer: Triplet (frequence, format, canaux) du mixer.
+
+    Returns:
+        Son charge, ou None si la source est absente, vide ou illisible.
+    """
+
+    import pygame  # pylint: disable=import-outside-toplevel,redefined-outer-name
+
+    if not source.exists() or source.stat().st_size == 0:
+        return None
+    chemin_cache = dossier_cache / nommer_fichier_cache(source, format_mixer)
+    if chemin_cache.exists():
+        son = lire_cache_wav(chemin_cache, format_mixer)
+        if son is not None:
+            return son
+    try:
+        son = pygame.mixer.Sound(str(source))
+    except pygame.error:
+        return None
+    ecrire_cache_wav(son, chemin_cache, format_mixer, source.stem)
+    return son
+
+
+def charger_sons_banque(
+    banque: BanqueAudio,
+    sources: Sequence[Tuple[str, Path]],
+    format_mixer: Tuple[int, int, int],
+) -> None:
+    """Charge les sons dans l ordre donne (corps du fil d arriere-plan).
+
+    Args:
+        banque: Banque remplie au fur et a mesure.
+        sources: Couples (nom, fichier source).
+        format_mixer: Triplet (frequence, format, canaux) du mixer.
+
+    Returns:
+        None.
+    """
+
+    for nom, source in sources:
+        banque.sons[nom] = charger_son_cache(source, banque.parametres.dossier_cache, format_mixer)
+
+
+def creer_banque_audio(
+    configuration: Dict[str, object],
+    sons: Sequence[Tuple[str, str, int]] = SONS_JEU,
+    dossier_sons: Path = DOSSIER_SONS,
+) -> BanqueAudio:
+    """Reserve les canaux prioritaires et lance le chargement des sons.
+
+    Sans mixer initialise, la banque reste vide et ``jouer_son_banque`` ne fait rien.
+
+    Args:
+        configuration: Configuration globale du jeu.
+        sons: Triplets (nom, fichier, priorite), dans l ordre de chargement.
+        dossier_sons: Dossier des fichiers sources.
+
+    Returns:
+        BanqueAudio dont les sons arrivent pendant les premieres images.
+    """
+
+    import pygame  # pylint: disable=import-outside-toplevel,redefined-outer-name
+
+    parametres = construire_parametres_audio(configuration)
+    banque = BanqueAudio(
+        parametres=parametres,
+        priorites={nom: priorite for nom, _, priorite in sons},
+    )
+    format_mixer = pygame.mixer.get_init()
+    if format_mixer is None:
+        return banque
+
+    nombre_reserves = min(parametres.canaux_reserves, max(0, pygame.mixer.get_num_channels() - 1))
+    pygame.mixer.set_reserved(nombre_reserves)
+    banque.canaux_prioritaires = [pygame.mixer.Channel(indice) for indice in range(nombre_reserves)]
+
+    sources = [(nom, dossier_sons / fichier) for nom, fichier, _ in sons]
+    if not parametres.chargement_asynchrone:
+        charger_sons_banque(banque, sources, format_mixer)
+        return banque
+    banque.fil_chargement = threading.Thread(
+        target=charger_sons_banque,
+        args=(banque, sources, format_mixer),
+        name="neon_sumo_audio",
+        daemon=True,
+    )
+    banque.fil_chargement.start()
+    return banque
+
+
+def attendre_banque_audio(banque: BanqueAudio, delai: Optional[float] = None) -> bool:
+    """Attend la fin du chargement en arriere-plan.
+
+    Args:
+        banque: Banque audio.
+        delai: Attente maximale en secondes, None pour attendre sans limite.
+
+    Returns:
+        True si tous les sons ont ete traites.
+    """
+
+    if banque.fil_chargement is not None:
+        banque.fil_chargement.join(delai)
+        return not banque.fil_chargement.is_alive()
+    return True
+
+
+def jouer_son_banque(banque: BanqueAudio, nom: str) -> None:
+    """Joue un son de la banque s il est charge.
+
+    Un son prioritaire prend un canal reserve libre, sinon interrompt le plus
+    ancien d entre eux; les autres sons prennent un canal libre non reserve et
+    sont ignores si tous sont occupes.
+
+    Args:
+        banque: Banque audio.
+        nom: Nom du son.
+
+    Returns:
+        None.
+    """
+
+    son = banque.sons.get(nom)
+    if son is None:
+        return
+    canaux = banque.canaux_prioritaires
+    if banque.priorites.get(nom, PRIORITE_NORMALE) < PRIORITE_HAUTE or not canaux:
+        son.play()
+        return
+    indice_canal = 0
+    for indice, canal in enumerate(canaux):
+        if not canal.get_busy():
+            indice_canal = indice
+            break
+    # Tous occupes: le canal en tete porte le son lance le plus tot.
+    canal = canaux.pop(indice_canal)
+    canal.play(son)
+    canaux.append(canal)
+
+
+__all__ = [
+    "PRIORITE_NORMALE",
+    "PRIORITE_HAUTE",
+    "SONS_JEU",
+    "ParametresAudio",
+    "BanqueAudio",
+    "construire_parametres_audio",
+    "nommer_fichier_cache",
+    "charger_son_cache",
+    "creer_banque_audio",
+    "attendre_banque_audio",
+    "jouer_son_banque",
+]
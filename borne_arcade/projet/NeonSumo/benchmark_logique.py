@@ -0,0 +1,835 @@
+"""Benchmarks des fonctions chaudes de ``logique.py``.
+
+Chaque scenario mesure une operation de la boucle de combat (deplacement,
+collision, bump, ultime, sortie d arene, style), un pas de melee a huit
+combattants ou un match complet simule.
+Le temps est exprime en ns/op (meilleure repetition) et les allocations en
+octets par operation (pic ``tracemalloc``). Les resultats sont compares a une
+reference versionnee; une regression au-dela du seuil fait echouer la commande.
+
+Les temps sont normalises par une boucle de calibration mesuree en
+alternance avec chaque scenario: le ratio reste comparable d une machine a
+l autre (poste de dev, CI, borne) et resiste a une charge passagere. Un
+scenario en regression est remesure avant de conclure.
+
+Exemple:
+    python3 benchmark_logique.py                 # compare a la reference
+    python3 benchmark_logique.py --enregistrer   # met a jour la reference
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Callable, Dict, List, Sequence
+
+from logique import (
+    COOLDOWN_BUMP,
+    EtatStyleJoueur,
+    activer_ultime,
+    appliquer_deplacement_inertiel,
+    construire_parametres_combat,
+    construire_parametres_style,
+    creer_joueurs,
+    decrementer_cooldowns,
+    enregistrer_impact_style,
+    executer_bump,
+    mettre_a_jour_etat_style,
+    mettre_a_jour_sauvetage_bord,
+    resoudre_collision_capsules,
+    tenter_esquive_proche,
+    verifier_sortie_arene,
+)
+from melee import NOMBRE_MAX_COMBATTANTS, avancer_pas_melee, creer_etat_melee
+from simulation import (
+    CommandeJoueur,
+    construire_regles_simulation,
+    politique_agressive,
+    politique_attract,
+    simuler_match,
+)
+
+
+RACINE_JEU = Path(__file__).resolve().parent
+FICHIER_CONFIG = RACINE_JEU / "config_jeu.json"
+FICHIER_REFERENCE = RACINE_JEU / "benchmark_reference.json"
+VERSION_FORMAT_REFERENCE = 1
+SEUIL_REGRESSION_DEFAUT = 0.30
+MARGE_OCTETS_PAR_OP = 64
+REPETITIONS_DEFAUT = 9
+TENTATIVES_CONFIRMATION = 2
+APPELS_MESURE_ALLOCATIONS = 50
+ITERATIONS_CALIBRATION = 5000
+DELTA_TEMPS = 1.0 / 60.0
+LARGEUR_ARENE = 1280
+HAUTEUR_ARENE = 720
+SEED_MATCH = 0
+
+Operation = Callable[[], object]
+
+
+@dataclass
+class ScenarioBenchmark:
+    """Decrit un scenario mesure.
+
+    Attributes:
+        nom: Identifiant stable du scenario (cle de la reference).
+        description: Ce que couvre une operation.
+        preparer: Construit l operation a partir de la configuration.
+        iterations: Nombre d operations par repetition.
+    """
+
+    nom: str
+    description: str
+    preparer: Callable[[Dict[str, object]], Operation]
+    iterations: int
+
+
+@dataclass
+class ResultatBenchmark:
+    """Mesures d un scenario.
+
+    Attributes:
+        nom: Nom du scenario.
+        ns_par_op: Duree d une operation en nanosecondes (meilleure repetition).
+        calibration_ns: Boucle de calibration mesuree en alternance (meilleure repetition).
+        octets_par_op: Pic moyen d allocation par operation, en octets.
+    """
+
+    nom: str
+    ns_par_op: float
+    calibration_ns: float
+    octets_par_op: float
+
+    @property
+    def temps_normalise(self) -> float:
+        """Duree d une operation en unites de calibration.
+
+        Returns:
+            Rapport ns_par_op / calibration_ns.
+        """
+
+        return self.ns_par_op / self.calibration_ns
+
+
+@dataclass
+class EcartBenchmark:
+    """Comparaison d un scenario avec sa reference.
+
+    Attributes:
+        nom: Nom du scenario.
+        ratio_temps: Temps normalise courant / temps normalise de reference.
+        octets_par_op: Allocation courante.
+        octets_reference: Allocation de reference, si comparable.
+        regressions: Motifs de regression, vide si conforme.
+    """
+
+    nom: str
+    ratio_temps: float
+    octets_par_op: float
+    octets_reference: float | None
+    regressions: List[str]
+
+
+def preparer_deplacement(configuration: Dict[str, object]) -> Operation:
+    """Operation: deplacement inertiel et cooldowns des deux joueurs.
+
+    Args:
+        configuration: Configuration du jeu.
+
+    Returns:
+        Operation a mesurer.
+    """
+
+    parametres = construire_parametres_combat(configuration)
+    joueur_1, joueur_2 = creer_joueurs(configuration, LARGEUR_ARENE, HAUTEUR_ARENE)
+
+    def operation() -> None:
+        """Avance les deux joueurs d un pas.
+
+        Returns:
+            None.
+        """
+
+        appliquer_deplacement_inertiel(joueur_1, 0.7, -0.7, False, DELTA_TEMPS, parametres)
+        appliquer_deplacement_inertiel(joueur_2, -1.0, 0.0, True, DELTA_TEMPS, parametres)
+        decrementer_cooldowns(joueur_1, DELTA_TEMPS)
+        decrementer_cooldowns(joueur_2, DELTA_TEMPS)
+
+    return operation
+
+
+def preparer_collision(configuration: Dict[str, object]) -> Operation:
+    """Operation: resolution d une collision frontale avec rebond.
+
+    Args:
+        configuration: Configuration du jeu.
+
+    Returns:
+        Operation a mesurer.
+    """
+
+    parametres = construire_parametres_combat(configuration)
+    joueur_1, joueur_2 = creer_joueurs(configuration, LARGEUR_ARENE, HAUTEUR_ARENE)
+    centre_x = LARGEUR_ARENE / 2.0
+    ecart = joueur_1.rayon * 0.8
+
+    def operation() -> None:
+        """Replace les joueurs en chevauchement puis resout la collision.
+
+        Returns:
+            None.
+        """
+
+        joueur_1.position_x = centre_x - ecart
+        joueur_2.position_x = centre_x + ecart
+        joueur_1.vitesse_x = 200.0
+        joueur_2.vitesse_x = -200.0
+        resoudre_collision_capsules(joueur_1, joueur_2, parametres)
+
+    return operation
+
+
+def preparer_bump(configuration: Dict[str, object]) -> Operation:
+    """Operation: bump valide sur un adversaire a portee.
+
+    Args:
+        configuration: Configuration du jeu.
+
+    Returns:
+        Operation a mesurer.
+    """
+
+    parametres = construire_parametres_combat(configuration)
+    attaquant, defenseur = creer_joueurs(configuration, LARGEUR_ARENE, HAUTEUR_ARENE)
+    portee_contact = attaquant.rayon + defenseur.rayon
+    defenseur.position_x = attaquant.position_x + portee_contact + parametres.rayon_bump * 0.5
+    defenseur.position_y = attaquant.position_y
+
+    def operation() -> None:
+        """Rearme le bump puis le declenche.
+
+        Returns:
+            None.
+        """
+
+        attaquant.cooldowns.valeurs[COOLDOWN_BUMP] = 0.0
+        defenseur.vitesse_x = 0.0
+        executer_bump(attaquant, defenseur, parametres)
+
+    return operation
+
+
+def preparer_ultime(configuration: Dict[str, object]) -> Operation:
+    """Operation: onde ultime touchant l adversaire.
+
+    Args:
+        configuration: Configuration du jeu.
+
+    Returns:
+        Operation a mesurer.
+    """
+
+    parametres = construire_parametres_combat(configuration)
+    attaquant, defenseur = creer_joueurs(configuration, LARGEUR_ARENE, HAUTEUR_ARENE)
+    defenseur.position_x = attaquant.position_x + parametres.rayon_ultime * 0.5
+
+    def operation() -> None:
+        """Remplit la jauge puis lance l ultime.
+
+        Returns:
+            None.
+        """
+
+        attaquant.jauge_ultime = 1.0
+        defenseur.vitesse_x = 0.0
+        activer_ultime(attaquant, defenseur, parametres)
+
+    return operation
+
+
+def preparer_sortie_arene(configuration: Dict[str, object]) -> Operation:
+    """Operation: controle de sortie d arene, un joueur dedans et un dehors.
+
+    Args:
+        configuration: Configuration du jeu.
+
+    Returns:
+        Operation a mesurer.
+    """
+
+    parametres = construire_parametres_combat(configuration)
+    joueur_1, joueur_2 = creer_joueurs(configuration, LARGEUR_ARENE, HAUTEUR_ARENE)
+    centre_x = LARGEUR_ARENE / 2.0
+    centre_y = HAUTEUR_ARENE / 2.0
+    rayon_arene = float(configuration["arene"]["rayon_depart"])
+    joueur_2.position_x = centre_x + rayon_arene * 1.5
+
+    def operation() -> None:
+        """Verifie la sortie des deux joueurs.
+
+        Returns:
+            None.
+        """
+
+        verifier_sortie_arene(joueur_1, centre_x, centre_y, rayon_arene, DELTA_TEMPS, parametres)
+        verifier_sortie_arene(joueur_2, centre_x, centre_y, rayon_arene, DELTA_TEMPS, parametres)
+
+    return operation
+
+
+def preparer_style(configuration: Dict[str, object]) -> Operation:
+    """Operation: timers, esquive, sauvetage et impact du systeme de style.
+
+    Args:
+        configuration: Configuration du jeu.
+
+    Returns:
+        Operation a mesurer.
+    """
+
+    parametres_style = construire_parametres_style(configuration)
+    joueur, adversaire = creer_joueurs(configuration, LARGEUR_ARENE, HAUTEUR_ARENE)
+    etat_style = EtatStyleJoueur()
+    centre_x = LARGEUR_ARENE / 2.0
+    centre_y = HAUTEUR_ARENE / 2.0
+    rayon_arene = float(configuration["arene"]["rayon_depart"])
+    largeur_danger = float(configuration["arene"]["largeur_zone_danger"])
+    adversaire.position_x = joueur.position_x + joueur.rayon * 2.0 + 10.0
+    adversaire.position_y = joueur.position_y
+    joueur.vitesse_x = -100.0
+
+    def operation() -> None:
+        """Joue un pas complet du systeme de style.
+
+        Returns:
+            None.
+        """
+
+        etat_style.cooldown_esquive_restant = 0.0
+        mettre_a_jour_etat_style(etat_style, DELTA_TEMPS)
+        tenter_esquive_proche(joueur, adversaire, etat_style, parametres_style)
+        mettre_a_jour_sauvetage_bord(
+            joueur, etat_style, parametres_style, centre_x, centre_y, rayon_arene, largeur_danger
+        )
+        enregistrer_impact_style(etat_style, parametres_style)
+
+    return operation
+
+
+def preparer_melee(configuration: Dict[str, object]) -> Operation:
+    """Operation: pas de melee a huit combattants groupes au centre.
+
+    Args:
+        configuration: Configuration du jeu.
+
+    Returns:
+        Operation a mesurer.
+    """
+
+    regles = construire_regles_simulation(configuration)
+    etat = creer_etat_melee(configuration, NOMBRE_MAX_COMBATTANTS)
+    commandes = [CommandeJoueur(entree_x=1.0)] * NOMBRE_MAX_COMBATTANTS
+    ecart = etat.joueurs[0].rayon * 1.8
+    depart = [
+        (
+            etat.etat_manche.centre_x + (indice % 4) * ecart,
+            etat.etat_manche.centre_y + (indice // 4) * ecart,
+        )
+        for indice in range(NOMBRE_MAX_COMBATTANTS)
+    ]
+    rayon_arene = etat.etat_manche.rayon_arene
+
+    def operation() -> None:
+        """Replace le groupe puis avance la melee d un pas.
+
+        Returns:
+            None.
+        """
+
+        for indice, (position_x, position_y) in enumerate(depart):
+            joueur = etat.joueurs[indice]
+            joueur.position_x = position_x
+            joueur.position_y = position_y
+            joueur.vitesse_x = 0.0
+            joueur.vitesse_y = 0.0
+            etat.actifs[indice] = True
+        etat.etat_manche.rayon_arene = rayon_arene
+        avancer_pas_melee(etat, regles, commandes, DELTA_TEMPS)
+
+    return operation
+
+
+def preparer_match(configuration: Dict[str, object]) -> Operation:
+    """Operation: match complet simule a graine fixe.
+
+    Args:
+        configuration: Configuration du jeu.
+
+    Returns:
+        Operation a mesurer.
+    """
+
+    def operation() -> object:
+        """Joue le match de reference.
+
+        Returns:
+            ResultatMatch produit.
+        """
+
+        return simuler_match(configuration, politique_agressive, politique_attract, SEED_MATCH)
+
+    return operation
+
+
+ITERATIONS_MICRO = 5000
+SCENARIOS = (
+    ScenarioBenchmark(
+        "deplacement",
+        "2 deplacements inertiels + 2 cooldowns",
+        preparer_deplacement,
+        ITERATIONS_MICRO,
+    ),
+    ScenarioBenchmark(
+        "collision", "collision frontale avec rebond", preparer_collision, ITERATIONS_MICRO
+    ),
+    ScenarioBenchmark("bump", "bump valide sur cible a portee", preparer_bump, ITERATIONS_MICRO),
+    ScenarioBenchmark("ultime", "onde ultime touchant la cible", preparer_ultime, ITERATIONS_MICRO),
+    ScenarioBenchmark(
+        "sortie_arene", "2 controles de sortie d arene", preparer_sortie_arene, ITERATIONS_MICRO
+    ),
+    ScenarioBenchmark(
+        "style", "timers, esquive, sauvetage et impact", preparer_style, ITERATIONS_MICRO
+    ),
+    ScenarioBenchmark(
+        "melee", "pas de melee a 8 combattants groupes", preparer_melee, ITERATIONS_MICRO
+    ),
+    ScenarioBenchmark("match", "match complet simule (seed 0)", preparer_match, 1),
+)
+
+
+def mesurer_ns_par_op(operation: Operation, iterations: int, repetitions: int) -> float:
+    """Mesure la duree d une operation, en gardant la meilleure repetition.
+
+    Le minimum est l estimateur le moins sensible aux interruptions du systeme.
+
+    Args:
+        operation: Operation a mesurer.
+        iterations: Nombre d appels par repetition.
+        repetitions: Nombre de repetitions.
+
+    Returns:
+        Duree en nanosecondes par operation.
+    """
+
+    meilleure = None
+    horloge = time.perf_counter_ns
+    for _ in range(max(1, repetitions)):
+        debut = horloge()
+        for _ in range(iterations):
+            operation()
+        duree = horloge() - debut
+        meilleure = duree if meilleure is None else min(meilleure, duree)
+    return meilleure / max(1, iterations)
+
+
+def mesurer_octets_par_op(operation: Operation, appels: int) -> float:
+    """Mesure le pic moyen de memoire allouee pendant une operation.
+
+    Les objets servis par les listes libres de CPython (petits float, tuples)
+    ne passent pas par l allocateur et ne sont donc pas comptes.
+
+    Args:
+        operation: Operation a mesurer.
+        appels: Nombre d appels mesures.
+
+    Returns:
+        Octets alloues au pic, en moyenne par operation.
+    """
+
+    deja_actif = tracemalloc.is_tracing()
+    if not deja_actif:
+        tracemalloc.start()
+    try:
+        operation()
+        total = 0
+        for _ in range(max(1, appels)):
+            tracemalloc.reset_peak()
+            courant, _ = tracemalloc.get_traced_memory()
+            operation()
+            _, pic = tracemalloc.get_traced_memory()
+            total += pic - courant
+    finally:
+        if not deja_actif:
+            tracemalloc.stop()
+    return total / max(1, appels)
+
+
+def operation_calibration() -> float:
+    """Boucle Python fixe servant d unite de vitesse machine.
+
+    Returns:
+        Somme calculee.
+    """
+
+    somme = 0.0
+    valeurs = {"a": 1.5, "b": 2.5}
+    for index in range(32):
+        somme += valeurs["a"] * index - valeurs["b"]
+    return somme
+
+
+def mesurer_scenario(
+    scenario: ScenarioBenchmark,
+    configuration: Dict[str, object],
+    repetitions: int = REPETITIONS_DEFAUT,
+    facteur_iterations: float = 1.0,
+) -> ResultatBenchmark:
+    """Mesure un scenario en alternance avec la boucle de calibration.
+
+    Args:
+        scenario: Scenario a mesurer.
+        configuration: Configuration du jeu.
+        repetitions: Nombre de paires (calibration, scenario) mesurees.
+        facteur_iterations: Facteur applique au nombre d iterations (tests rapides).
+
+    Returns:
+        ResultatBenchmark du scenario.
+    """
+
+    iterations = max(1, int(scenario.iterations * facteur_iterations))
+    iterations_calibration = max(1, int(ITERATIONS_CALIBRATION * facteur_iterations))
+    operation = scenario.preparer(configuration)
+    operation()
+    ns_par_op = calibration_ns = float("inf")
+    for _ in range(max(1, repetitions)):
+        calibration_ns = min(
+            calibration_ns, mesurer_ns_par_op(operation_calibration, iterations_calibration, 1)
+        )
+        ns_par_op = min(ns_par_op, mesurer_ns_par_op(operation, iterations, 1))
+    appels_allocations = min(iterations * repetitions, APPELS_MESURE_ALLOCATIONS)
+    octets_par_op = mesurer_octets_par_op(scenario.preparer(configuration), appels_allocations)
+    return ResultatBenchmark(scenario.nom, ns_par_op, calibration_ns, octets_par_op)
+
+
+def executer_benchmarks(
+    configuration: Dict[str, object],
+    scenarios: Sequence[ScenarioBenchmark] = SCENARIOS,
+    repetitions: int = REPETITIONS_DEFAUT,
+    facteur_iterations: float = 1.0,
+) -> List[ResultatBenchmark]:
+    """Execute les scenarios demandes.
+
+    Args:
+        configuration: Configuration du jeu.
+        scenarios: Scenarios a mesurer.
+        repetitions: Repetitions par scenario.
+        facteur_iterations: Facteur applique au nombre d iterations (tests rapides).
+
+    Returns:
+        Resultats dans l ordre des scenarios.
+    """
+
+    return [
+        mesurer_scenario(scenario, configuration, repetitions, facteur_iterations)
+        for scenario in scenarios
+    ]
+
+
+def version_python() -> str:
+    """Retourne la version majeure.mineure de l interpreteur.
+
+    Returns:
+        Version sous la forme "3.11".
+    """
+
+    return ".".join(platform.python_version_tuple()[:2])
+
+
+def construire_reference(resultats: Sequence[ResultatBenchmark]) -> Dict[str, object]:
+    """Construit le contenu JSON d une reference.
+
+    Args:
+        resultats: Resultats mesures.
+
+    Returns:
+        Dictionnaire serialisable.
+    """
+
+    return {
+        "version_format": VERSION_FORMAT_REFERENCE,
+        "python": version_python(),
+        "scenarios": {
+            resultat.nom: {
+                "ns_par_op": round(resultat.ns_par_op, 1),
+                "calibration_ns": round(resultat.calibration_ns, 1),
+                "octets_par_op": round(resultat.octets_par_op, 1),
+            }
+            for resultat in resultats
+        },
+    }
+
+
+def lire_reference(chemin: Path) -> Dict[str, object] | None:
+    """Lit une reference de benchmark.
+
+    Args:
+        chemin: Fichier JSON de reference.
+
+    Returns:
+        Contenu de la reference, ou None si absente.
+
+    Raises:
+        ValueError: Si le format de la reference n est pas reconnu.
+    """
+
+    if not chemin.exists():
+        return None
+    with chemin.open("r", encoding="utf-8") as flux:
+        reference = json.load(flux)
+    if reference.get("version_format") != VERSION_FORMAT_REFERENCE:
+        raise ValueError(f"Format de reference inconnu dans {chemin}.")
+    return reference
+
+
+def ecrire_reference(chemin: Path, reference: Dict[str, object]) -> None:
+    """Ecrit une reference de benchmark.
+
+    Args:
+        chemin: Fichier JSON cible.
+        reference: Contenu a ecrire.
+
+    Returns:
+        None.
+    """
+
+    with chemin.open("w", encoding="utf-8") as flux:
+        json.dump(reference, flux, indent=2, sort_keys=True)
+        flux.write("\n")
+
+
+def comparer_a_reference(
+    resultats: Sequence[ResultatBenchmark],
+    reference: Dict[str, object],
+    seuil: float,
+) -> List[EcartBenchmark]:
+    """Compare des resultats a la reference.
+
+    Les temps sont compares en unites de calibration. Les allocations ne sont
+    comparees que pour la meme version de Python, avec une marge absolue de
+    MARGE_OCTETS_PAR_OP octets.
+
+    Args:
+        resultats: Resultats mesures.
+        reference: Reference lue par lire_reference.
+        seuil: Degradation relative toleree (0.30 = +30 %).
+
+    Returns:
+        Ecarts des scenarios presents dans la reference.
+    """
+
+    scenarios_reference = reference["scenarios"]
+    allocations_comparables = reference.get("python") == version_python()
+    ecarts = []
+    for resultat in resultats:
+        valeurs_reference = scenarios_reference.get(resultat.nom)
+        if valeurs_reference is None:
+            continue
+        temps_normalise_reference = float(valeurs_reference["ns_par_op"]) / float(
+            valeurs_reference["calibration_ns"]
+        )
+        ratio_temps = resultat.temps_normalise / temps_normalise_reference
+        regressions = []
+        if ratio_temps > 1.0 + seuil:
+            regressions.append(f"temps x{ratio_temps:.2f}")
+
+        octets_reference = None
+        if allocations_comparables:
+            octets_reference = float(valeurs_reference["octets_par_op"])
+            limite_octets = octets_reference * (1.0 + seuil) + MARGE_OCTETS_PAR_OP
+            if resultat.octets_par_op > limite_octets:
+                regressions.append(
+                    f"allocations {resultat.octets_par_op:.0f} o/op > {limite_octets:.0f}"
+                )
+        ecarts.append(
+            EcartBenchmark(
+                nom=resultat.nom,
+                ratio_temps=ratio_temps,
+                octets_par_op=resultat.octets_par_op,
+                octets_reference=octets_reference,
+                regressions=regressions,
+            )
+        )
+    return ecarts
+
+
+def confirmer_regressions(
+    resultats: Sequence[ResultatBenchmark],
+    configuration: Dict[str, object],
+    reference: Dict[str, object],
+    seuil: float,
+    repetitions: int = REPETITIONS_DEFAUT,
+    tentatives: int = TENTATIVES_CONFIRMATION,
+) -> List[ResultatBenchmark]:
+    """Remesure les scenarios en regression pour ecarter une charge passagere.
+
+    Pour chaque nouvelle mesure, le meilleur temps normalise est conserve.
+
+    Args:
+        resultats: Resultats de la premiere mesure.
+        configuration: Configuration du jeu.
+        reference: Reference lue par lire_reference.
+        seuil: Degradation relative toleree.
+        repetitions: Repetitions par mesure.
+        tentatives: Nombre maximal de nouvelles mesures.
+
+    Returns:
+        Resultats consolides, dans le meme ordre.
+    """
+
+    scenarios_par_nom = {scenario.nom: scenario for scenario in SCENARIOS}
+    consolides = list(resultats)
+    for _ in range(max(0, tentatives)):
+        suspects = {
+            ecart.nom
+            for ecart in comparer_a_reference(consolides, reference, seuil)
+            if ecart.regressions and ecart.nom in scenarios_par_nom
+        }
+        if not suspects:
+            break
+        for index, resultat in enumerate(consolides):
+            if resultat.nom not in suspects:
+                continue
+            nouveau = mesurer_scenario(scenarios_par_nom[resultat.nom], configuration, repetitions)
+            if nouveau.temps_normalise < resultat.temps_normalise:
+                consolides[index] = nouveau
+    return consolides
+
+
+def formater_rapport(
+    resultats: Sequence[ResultatBenchmark],
+    ecarts: Sequence[EcartBenchmark],
+) -> str:
+    """Met en forme le tableau des resultats.
+
+    Args:
+        resultats: Resultats mesures.
+        ecarts: Comparaisons a la reference (eventuellement vide).
+
+    Returns:
+        Texte multiligne.
+    """
+
+    ecarts_par_nom = {ecart.nom: ecart for ecart in ecarts}
+    lignes = [f"{'scenario':<14}{'ns/op':>14}{'octets/op':>12}{'vs ref':>9}  statut"]
+    for resultat in resultats:
+        ecart = ecarts_par_nom.get(resultat.nom)
+        if ecart is None:
+            comparaison, statut = "-", "sans reference"
+        else:
+            comparaison = f"x{ecart.ratio_temps:.2f}"
+            statut = "REGRESSION: " + ", ".join(ecart.regressions) if ecart.regressions else "ok"
+        lignes.append(
+            f"{resultat.nom:<14}{resultat.ns_par_op:>14.1f}{resultat.octets_par_op:>12.1f}"
+            f"{comparaison:>9}  {statut}"
+        )
+    return "\n".join(lignes)
+
+
+def construire_analyseur() -> argparse.ArgumentParser:
+    """Construit l analyseur de la ligne de commande.
+
+    Returns:
+        ArgumentParser configure.
+    """
+
+    analyseur = argparse.ArgumentParser(description="Benchmarks de la logique Neon Sumo.")
+    analyseur.add_argument(
+        "--scenario",
+        action="append",
+        choices=[scenario.nom for scenario in SCENARIOS],
+        help="Scenario a mesurer (option repetable, defaut: tous).",
+    )
+    analyseur.add_argument("--repetitions", type=int, default=REPETITIONS_DEFAUT)
+    analyseur.add_argument(
+        "--seuil",
+        type=float,
+        default=SEUIL_REGRESSION_DEFAUT,
+        help="Degradation toleree avant echec (0.30 = +30 %%).",
+    )
+    analyseur.add_argument("--reference", type=Path, default=FICHIER_REFERENCE)
+    analyseur.add_argument(
+        "--enregistrer",
+        action="store_true",
+        help="Ecrit les mesures comme nouvelle reference au lieu de comparer.",
+    )
+    analyseur.add_argument(
+        "--config", type=Path, default=FICHIER_CONFIG, help="Configuration du jeu."
+    )
+    return analyseur
+
+
+def main(arguments: Sequence[str] | None = None) -> int:
+    """Point d entree des benchmarks en ligne de commande.
+
+    Args:
+        arguments: Arguments de la ligne de commande (defaut: sys.argv).
+
+    Returns:
+        0 si aucune regression, 1 en cas de regression, 2 si reference illisible.
+    """
+
+    options = construire_analyseur().parse_args(arguments)
+    with options.config.open("r", encoding="utf-8") as flux:
+        configuration = json.load(flux)
+    noms = set(options.scenario or [])
+    scenarios = [scenario for scenario in SCENARIOS if not noms or scenario.nom in noms]
+
+    resultats = executer_benchmarks(configuration, scenarios, options.repetitions)
+
+    if options.enregistrer:
+        # Reference: meilleur temps et pire allocation sur plusieurs essais, pour ne
+        # masquer aucune regression de temps ni signaler un pic d allocation ordinaire.
+        for _ in range(TENTATIVES_CONFIRMATION):
+            nouveaux = executer_benchmarks(configuration, scenarios, options.repetitions)
+            resultats = [
+                replace(
+                    min(resultat, nouveau, key=lambda mesure: mesure.temps_normalise),
+                    octets_par_op=max(resultat.octets_par_op, nouveau.octets_par_op),
+                )
+                for resultat, nouveau in zip(resultats, nouveaux)
+            ]
+        ecrire_reference(options.reference, construire_reference(resultats))
+        print(formater_rapport(resultats, []))
+        print(f"Reference ecrite dans {options.reference}")
+        return 0
+
+    try:
+        reference = lire_reference(options.reference)
+    except (ValueError, json.JSONDecodeError) as erreur:
+        print(f"ERREUR: {erreur}", file=sys.stderr)
+        return 2
+    if reference is None:
+        print(formater_rapport(resultats, []))
+        print(f"Aucune reference dans {options.reference}: relancez avec --enregistrer.")
+        return 0
+
+    resultats = confirmer_regressions(
+        resultats, configuration, reference, options.seuil, options.repetitions
+    )
+    ecarts = comparer_a_reference(resultats, reference, options.seuil)
+    print(formater_rapport(resultats, ecarts))
+    if any(ecart.regressions for ecart in ecarts):
+        print(f"ERREUR: regression de performance au-dela de {options.seuil:.0%}.", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
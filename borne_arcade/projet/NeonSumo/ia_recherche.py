@@ -0,0 +1,464 @@
+"""IA a recherche par deroulements pour Neon Sumo.
+
+A chaque image, l IA enumere des commandes candidates (direction et action:
+dash, bump, bouclier, ultime), puis deroule chacune quelques dixiemes de
+seconde avec les fonctions pures de ``logique.py`` sur deux copies de joueurs
+preallouees. La commande au meilleur score est jouee. La recherche s arrete
+des que le budget de microsecondes de l image est consomme: la cadence du jeu
+ne depend pas du nombre de candidats.
+
+L IA respecte la signature ``simulation.Politique``: elle pilote le mode
+attract, le mode solo de ``main.py`` et les matchs simules.
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, field
+from math import cos, pi, sin, sqrt
+from time import perf_counter_ns
+from typing import Dict, List, Optional, Tuple
+
+from logique import (
+    COOLDOWN_BOUCLIER,
+    COOLDOWN_BUMP,
+    COOLDOWN_DASH,
+    Joueur,
+    activer_bouclier,
+    activer_dash,
+    activer_ultime,
+    appliquer_deplacement_inertiel,
+    executer_bump,
+    mettre_a_jour_bouclier,
+    resoudre_collision_capsules,
+    verifier_sortie_arene,
+)
+from simulation import (
+    CommandeJoueur,
+    EtatManche,
+    Politique,
+    ReglesSimulation,
+    construire_regles_simulation,
+)
+
+
+NOMBRE_DIRECTIONS_FIXES = 8
+DIRECTION_ADVERSAIRE = NOMBRE_DIRECTIONS_FIXES
+DIRECTION_CENTRE = NOMBRE_DIRECTIONS_FIXES + 1
+PAS_ANGULAIRE = 2.0 * pi / NOMBRE_DIRECTIONS_FIXES
+VECTEURS_DIRECTIONS_FIXES: Tuple[Tuple[float, float], ...] = tuple(
+    (cos(PAS_ANGULAIRE * indice), sin(PAS_ANGULAIRE * indice))
+    for indice in range(NOMBRE_DIRECTIONS_FIXES)
+)
+ACTION_AUCUNE = 0
+ACTION_DASH = 1
+ACTION_BUMP = 2
+ACTION_BOUCLIER = 3
+ACTION_ULTIME = 4
+SCORE_ELIMINATION = 1000.0
+MARGE_PORTEE_ACTION = 1.25
+NANOSECONDES_PAR_MICROSECONDE = 1000
+Candidat = Tuple[int, int]
+
+
+@dataclass
+class ParametresIA:
+    """Reglages de la recherche.
+
+    Attributes:
+        budget_us: Temps de recherche maximal par decision, en microsecondes.
+        deroulements_max: Nombre maximal de candidats evalues par decision.
+        horizon: Duree simulee par deroulement, en secondes.
+        pas_deroulement: Pas de temps des deroulements (plus grossier que le jeu).
+        bruit_score: Amplitude du bruit ajoute aux scores (variete du mode attract).
+        poids_adversaire: Poids de la marge adverse dans l evaluation.
+    """
+
+    budget_us: int = 1500
+    deroulements_max: int = 48
+    horizon: float = 0.8
+    pas_deroulement: float = 0.05
+    bruit_score: float = 2.0
+    poids_adversaire: float = 1.0
+
+
+@dataclass
+class EtatRechercheIA:
+    """Etat persistant d une IA, dont les copies de travail preallouees.
+
+    Attributes:
+        parametres: Reglages de la recherche.
+        regles: Regles du match (combat et retrecissement de l arene).
+        joueur_simule: Copie de travail du joueur pilote.
+        adversaire_simule: Copie de travail de l adversaire.
+        candidats: Liste des candidats de l image, reutilisee d une image a l autre.
+        curseur: Rang du prochain candidat a evaluer en priorite.
+        meilleur: Dernier candidat retenu.
+        deroulements_derniere_decision: Nombre de candidats evalues a la derniere decision.
+        duree_derniere_decision_ns: Duree de la derniere decision.
+    """
+
+    parametres: ParametresIA
+    regles: ReglesSimulation
+    joueur_simule: Joueur = field(
+        default_factory=lambda: Joueur("IA", 0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0)
+    )
+    adversaire_simule: Joueur = field(
+        default_factory=lambda: Joueur("ADV", 0.0, 0.0, 0.0, 0.0, 0.0, -1.0, 0.0)
+    )
+    candidats: List[Candidat] = field(default_factory=list)
+    curseur: int = 0
+    meilleur: Candidat = (DIRECTION_CENTRE, ACTION_AUCUNE)
+    deroulements_derniere_decision: int = 0
+    duree_derniere_decision_ns: int = 0
+
+
+def construire_parametres_ia(configuration: Dict[str, object]) -> ParametresIA:
+    """Lit la section ``ia`` de la configuration.
+
+    Args:
+        configuration: Configuration globale du jeu.
+
+    Returns:
+        ParametresIA, valeurs par defaut pour les cles absentes.
+    """
+
+    section = configuration.get("ia", {})
+    defaut = ParametresIA()
+    return ParametresIA(
+        budget_us=int(section.get("budget_us_par_image", defaut.budget_us)),
+        deroulements_max=int(section.get("deroulements_max", defaut.deroulements_max)),
+        horizon=float(section.get("horizon", defaut.horizon)),
+        pas_deroulement=float(section.get("pas_deroulement", defaut.pas_deroulement)),
+        bruit_score=float(section.get("bruit_score", defaut.bruit_score)),
+        poids_adversaire=float(section.get("poids_adversaire", defaut.poids_adversaire)),
+    )
+
+
+def creer_etat_recherche_ia(
+    configuration: Dict[str, object],
+    parametres: Optional[ParametresIA] = None,
+) -> EtatRechercheIA:
+    """Cree l etat d une IA pour un match.
+
+    Args:
+        configuration: Configuration globale du jeu.
+        parametres: Reglages; lus dans la configuration si None.
+
+    Returns:
+        EtatRechercheIA pret a decider.
+    """
+
+    return EtatRechercheIA(
+        parametres=parametres or construire_parametres_ia(configuration),
+        regles=construire_regles_simulation(configuration),
+    )
+
+
+def copier_joueur(source: Joueur, destination: Joueur) -> None:
+    """Copie l etat dynamique d un joueur dans une copie de travail, sans allocation.
+
+    Args:
+        source: Joueur reel.
+        destination: Copie preallouee.
+
+    Returns:
+        None.
+    """
+
+    destination.position_x = source.position_x
+    destination.position_y = source.position_y
+    destination.vitesse_x = source.vitesse_x
+    destination.vitesse_y = source.vitesse_y
+    destination.rayon = source.rayon
+    destination.direction_x = source.direction_x
+    destination.direction_y = source.direction_y
+    destination.jauge_ultime = source.jauge_ultime
+    destination.actif_bouclier = source.actif_bouclier
+    destination.temps_restant_bouclier = source.temps_restant_bouclier
+    destination.temps_hors_arene = source.temps_hors_arene
+    destination.cooldowns.valeurs[:] = source.cooldowns.valeurs
+
+
+def calculer_direction(
+    mode_direction: int,
+    joueur: Joueur,
+    adversaire: Joueur,
+    centre_x: float,
+    centre_y: float,
+) -> Tuple[float, float]:
+    """Traduit un mode de direction en axe de joystick.
+
+    Args:
+        mode_direction: Indice de direction fixe, DIRECTION_ADVERSAIRE ou DIRECTION_CENTRE.
+        joueur: Joueur pilote.
+        adversaire: Joueur adverse.
+        centre_x: Centre X de l arene.
+        centre_y: Centre Y de l arene.
+
+    Returns:
+        Axe (x, y), normalise par ``appliquer_deplacement_inertiel``.
+    """
+
+    if mode_direction == DIRECTION_ADVERSAIRE:
+        return adversaire.position_x - joueur.position_x, adversaire.position_y - joueur.position_y
+    if mode_direction == DIRECTION_CENTRE:
+        return centre_x - joueur.position_x, centre_y - joueur.position_y
+    return VECTEURS_DIRECTIONS_FIXES[mode_direction]
+
+
+def lister_candidats(etat: EtatRechercheIA, joueur: Joueur, adversaire: Joueur) -> List[Candidat]:
+    """Enumere les commandes envisageables, sans les actions indisponibles.
+
+    Args:
+        etat: Etat de l IA (liste de candidats reutilisee).
+        joueur: Joueur pilote.
+        adversaire: Joueur adverse.
+
+    Returns:
+        Liste des candidats (mode de direction, action).
+    """
+
+    parametres = etat.regles.parametres
+    candidats = etat.candidats
+    candidats.clear()
+    for mode_direction in range(DIRECTION_CENTRE + 1):
+        candidats.append((mode_direction, ACTION_AUCUNE))
+
+    cooldowns = joueur.cooldowns.valeurs
+    ecart_x = adversaire.position_x - joueur.position_x
+    ecart_y = adversaire.position_y - joueur.position_y
+    distance = sqrt(ecart_x * ecart_x + ecart_y * ecart_y)
+    if cooldowns[COOLDOWN_DASH] <= 0.0:
+        candidats.append((DIRECTION_ADVERSAIRE, ACTION_DASH))
+        candidats.append((DIRECTION_CENTRE, ACTION_DASH))
+    portee_bump = parametres.rayon_bump * MARGE_PORTEE_ACTION
+    if cooldowns[COOLDOWN_BUMP] <= 0.0 and distance <= portee_bump:
+        candidats.append((DIRECTION_ADVERSAIRE, ACTION_BUMP))
+    if cooldowns[COOLDOWN_BOUCLIER] <= 0.0 and distance <= parametres.rayon_ultime:
+        candidats.append((DIRECTION_CENTRE, ACTION_BOUCLIER))
+    if joueur.jauge_ultime >= 1.0 and distance <= parametres.rayon_ultime * MARGE_PORTEE_ACTION:
+        candidats.append((DIRECTION_ADVERSAIRE, ACTION_ULTIME))
+    return candidats
+
+
+def appliquer_action(
+    action: int,
+    joueur: Joueur,
+    adversaire: Joueur,
+    etat: EtatRechercheIA,
+) -> None:
+    """Declenche une action sur les copies de travail.
+
+    Args:
+        action: Action du candidat.
+        joueur: Copie du joueur pilote.
+        adversaire: Copie de l adversaire.
+        etat: Etat de l IA.
+
+    Returns:
+        None.
+    """
+
+    parametres = etat.regles.parametres
+    if action == ACTION_DASH:
+        activer_dash(joueur, parametres)
+    elif action == ACTION_BUMP:
+        executer_bump(joueur, adversaire, parametres)
+    elif action == ACTION_BOUCLIER:
+        activer_bouclier(joueur, parametres)
+    elif action == ACTION_ULTIME:
+        activer_ultime(joueur, adversaire, parametres)
+
+
+def derouler_candidat(
+    etat: EtatRechercheIA,
+    candidat: Candidat,
+    joueur: Joueur,
+    adversaire: Joueur,
+    etat_manche: EtatManche,
+) -> float:
+    """Simule un candidat sur l horizon et evalue la position obtenue.
+
+    L adversaire est suppose foncer sur le joueur, sans action. Le score vaut
+    la marge du joueur au bord de l arene moins celle de l adversaire, ou
+    +/- SCORE_ELIMINATION (moins le nombre de pas) en cas de sortie.
+
+    Args:
+        etat: Etat de l IA.
+        candidat: Commande evaluee.
+        joueur: Joueur reel pilote (non modifie).
+        adversaire: Joueur reel adverse (non modifie).
+        etat_manche: Etat courant de l arene.
+
+    Returns:
+        Score du candidat, plus eleve = meilleur.
+    """
+
+    regles = etat.regles
+    parametres = regles.parametres
+    pas = etat.parametres.pas_deroulement
+    simule = etat.joueur_simule
+    adverse = etat.adversaire_simule
+    copier_joueur(joueur, simule)
+    copier_joueur(adversaire, adverse)
+    centre_x = etat_manche.centre_x
+    centre_y = etat_manche.centre_y
+    rayon = etat_manche.rayon_arene
+    temps_restant = etat_manche.temps_restant
+    mode_direction, action = candidat
+
+    nombre_pas = max(1, int(etat.parametres.horizon / pas))
+    for indice_pas in range(nombre_pas):
+        axe_x, axe_y = calculer_direction(mode_direction, simule, adverse, centre_x, centre_y)
+        appliquer_deplacement_inertiel(simule, axe_x, axe_y, False, pas, parametres)
+        appliquer_deplacement_inertiel(
+            adverse,
+            simule.position_x - adverse.position_x,
+            simule.position_y - adverse.position_y,
+            False,
+            pas,
+            parametres,
+        )
+        resoudre_collision_capsules(simule, adverse, parametres)
+        mettre_a_jour_bouclier(simule, pas)
+        mettre_a_jour_bouclier(adverse, pas)
+        if indice_pas == 0:
+            appliquer_action(action, simule, adverse, etat)
+
+        temps_restant -= pas
+        multiplicateur = regles.multiplicateur_sudden_death if temps_restant <= 0.0 else 1.0
+        rayon = max(regles.rayon_min, rayon - regles.vitesse_retrecissement * multiplicateur * pas)
+        elimine = verifier_sortie_arene(simule, centre_x, centre_y, rayon, pas, parametres)
+        elimine_adverse = verifier_sortie_arene(adverse, centre_x, centre_y, rayon, pas, parametres)
+        if elimine or elimine_adverse:
+            if elimine and elimine_adverse:
+                return 0.0
+            if elimine:
+                return -SCORE_ELIMINATION + indice_pas
+            return SCORE_ELIMINATION - indice_pas
+
+    ecart_x = simule.position_x - centre_x
+    ecart_y = simule.position_y - centre_y
+    marge = rayon - sqrt(ecart_x * ecart_x + ecart_y * ecart_y)
+    ecart_x = adverse.position_x - centre_x
+    ecart_y = adverse.position_y - centre_y
+    marge_adverse = rayon - sqrt(ecart_x * ecart_x + ecart_y * ecart_y)
+    return marge - etat.parametres.poids_adversaire * marge_adverse
+
+
+def choisir_commande_ia(
+    etat: EtatRechercheIA,
+    joueur: Joueur,
+    adversaire: Joueur,
+    etat_manche: EtatManche,
+    generateur: random.Random,
+) -> CommandeJoueur:
+    """Choisit la commande de l image dans le budget de temps imparti.
+
+    Le candidat retenu a l image precedente est evalue en premier, puis les
+    autres a partir du curseur: quand le budget coupe la recherche, l image
+    suivante reprend la ou celle-ci s est arretee.
+
+    Args:
+        etat: Etat de l IA.
+        joueur: Joueur pilote.
+        adversaire: Joueur adverse.
+        etat_manche: Etat courant de l arene.
+        generateur: Generateur pseudo-aleatoire (bruit des scores).
+
+    Returns:
+        CommandeJoueur a appliquer.
+    """
+
+    debut = perf_counter_ns()
+    echeance = debut + etat.parametres.budget_us * NANOSECONDES_PAR_MICROSECONDE
+    candidats = lister_candidats(etat, joueur, adversaire)
+    nombre_candidats = len(candidats)
+    bruit = etat.parametres.bruit_score
+
+    meilleur = etat.meilleur if etat.meilleur in candidats else candidats[0]
+    meilleur_score = derouler_candidat(etat, meilleur, joueur, adversaire, etat_manche)
+    meilleur_score += generateur.uniform(0.0, bruit)
+    evalues = 1
+    rang = etat.curseur % nombre_candidats
+    for _ in range(nombre_candidats):
+        if evalues >= etat.parametres.deroulements_max or perf_counter_ns() >= echeance:
+            break
+        candidat = candidats[rang]
+        rang = (rang + 1) % nombre_candidats
+        if candidat == meilleur:
+            continue
+        score = derouler_candidat(etat, candidat, joueur, adversaire, etat_manche)
+        score += generateur.uniform(0.0, bruit)
+        evalues += 1
+        if score > meilleur_score:
+            meilleur = candidat
+            meilleur_score = score
+
+    etat.curseur = rang
+    etat.meilleur = meilleur
+    etat.deroulements_derniere_decision = evalues
+    etat.duree_derniere_decision_ns = perf_counter_ns() - debut
+
+    mode_direction, action = meilleur
+    axe_x, axe_y = calculer_direction(
+        mode_direction, joueur, adversaire, etat_manche.centre_x, etat_manche.centre_y
+    )
+    return CommandeJoueur(
+        entree_x=axe_x,
+        entree_y=axe_y,
+        dash=action == ACTION_DASH,
+        bump=action == ACTION_BUMP,
+        bouclier=action == ACTION_BOUCLIER,
+        ultime=action == ACTION_ULTIME,
+    )
+
+
+def creer_politique_ia(
+    configuration: Dict[str, object],
+    parametres: Optional[ParametresIA] = None,
+) -> Politique:
+    """Cree une politique IA avec son etat de recherche dedie.
+
+    Args:
+        configuration: Configuration globale du jeu.
+        parametres: Reglages; lus dans la configuration si None.
+
+    Returns:
+        Politique compatible avec ``simuler_match`` et la boucle de jeu.
+    """
+
+    etat = creer_etat_recherche_ia(configuration, parametres)
+
+    def politique_ia(
+        joueur: Joueur,
+        adversaire: Joueur,
+        etat_manche: EtatManche,
+        generateur: random.Random,
+    ) -> CommandeJoueur:
+        """Decide la commande de l image pour ``joueur``.
+
+        Args:
+            joueur: Joueur pilote.
+            adversaire: Joueur adverse.
+            etat_manche: Etat courant de l arene.
+            generateur: Generateur pseudo-aleatoire.
+
+        Returns:
+            CommandeJoueur choisie.
+        """
+
+        return choisir_commande_ia(etat, joueur, adversaire, etat_manche, generateur)
+
+    return politique_ia
+
+
+__all__ = [
+    "ParametresIA",
+    "EtatRechercheIA",
+    "construire_parametres_ia",
+    "creer_etat_recherche_ia",
+    "choisir_commande_ia",
+    "creer_politique_ia",
+]
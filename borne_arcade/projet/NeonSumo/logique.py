@@ -5,9 +5,11 @@ Ce module ne depend pas de pygame afin de faciliter les tests unitaires.
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
+from itertools import chain
 from math import sqrt
-from typing import Dict, Tuple
+from typing import Dict, Iterator, List, Mapping, Optional, Tuple, Union
 
 
 Vecteur = Tuple[float, float]
@@ -15,6 +17,175 @@ SEUIL_NORME_CARREE = 1e-18
 SEUIL_PROJECTION_BUMP = 0.1
 FACTEUR_PARTAGE_COLLISION = 0.5
 MULTIPLICATEUR_LIMITE_VITESSE_COLLISION = 1.8
+# Etats mis a jour a chaque image: slots sans __dict__ quand Python le permet (3.10+).
+OPTIONS_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+# Identifiants de cooldown: indices fixes dans TableCooldowns, dans l ordre de NOMS_COOLDOWNS.
+IdentifiantCooldown = int
+COOLDOWN_DASH: IdentifiantCooldown = 0
+COOLDOWN_BUMP: IdentifiantCooldown = 1
+COOLDOWN_BOUCLIER: IdentifiantCooldown = 2
+COOLDOWN_TAUNT: IdentifiantCooldown = 3
+NOMS_COOLDOWNS: Tuple[str, ...] = ("dash", "bump", "bouclier", "taunt")
+INDICES_COOLDOWNS: Dict[str, IdentifiantCooldown] = {
+    nom: indice for indice, nom in enumerate(NOMS_COOLDOWNS)
+}
+CleCooldown = Union[IdentifiantCooldown, str]
+
+
+def indice_cooldown(cle: CleCooldown) -> int:
+    """Convertit un nom ou un identifiant de cooldown en indice de table.
+
+    Args:
+        cle: Identifiant COOLDOWN_* ou nom historique ("dash", "bump", ...).
+
+    Returns:
+        Indice dans TableCooldowns.
+
+    Raises:
+        KeyError: Si le nom de cooldown est inconnu.
+    """
+
+    if isinstance(cle, str):
+        return INDICES_COOLDOWNS[cle]
+    return cle
+
+
+class TableCooldowns:
+    """Cooldowns restants d un joueur, indexes par IdentifiantCooldown.
+
+    Les valeurs sont stockees dans une liste de taille fixe pour que la boucle
+    par image evite tout hachage de chaine. L acces par nom (``table["dash"]``,
+    ``get``, ``items``) reste disponible pour le HUD et le code existant.
+    Un nom hors de NOMS_COOLDOWNS est range a part, comme dans l ancien
+    dictionnaire, au lieu de lever une erreur.
+
+    Attributes:
+        valeurs: Temps restant par cooldown, dans l ordre de NOMS_COOLDOWNS.
+        supplementaires: Temps restant des cooldowns aux noms inconnus.
+    """
+
+    __slots__ = ("valeurs", "supplementaires")
+
+    def __init__(self, valeurs: Optional[Mapping[str, float]] = None) -> None:
+        """Initialise la table a zero, puis applique des valeurs par nom.
+
+        Args:
+            valeurs: Valeurs initiales par nom de cooldown.
+
+        Returns:
+            None.
+        """
+
+        self.valeurs: List[float] = [0.0] * len(NOMS_COOLDOWNS)
+        self.supplementaires: Dict[str, float] = {}
+        if valeurs is not None:
+            for nom, valeur in valeurs.items():
+                self[nom] = float(valeur)
+
+    def __getitem__(self, cle: CleCooldown) -> float:
+        """Retourne le temps restant d un cooldown.
+
+        Args:
+            cle: Identifiant ou nom du cooldown.
+
+        Returns:
+            Temps restant en secondes.
+
+        Raises:
+            KeyError: Si le nom n a jamais ete renseigne, comme un dictionnaire.
+        """
+
+        if isinstance(cle, str) and cle not in INDICES_COOLDOWNS:
+            return self.supplementaires[cle]
+        return self.valeurs[indice_cooldown(cle)]
+
+    def __setitem__(self, cle: CleCooldown, valeur: float) -> None:
+        """Impose le temps restant d un cooldown.
+
+        Args:
+            cle: Identifiant ou nom du cooldown.
+            valeur: Temps restant en secondes.
+
+        Returns:
+            None.
+        """
+
+        if isinstance(cle, str) and cle not in INDICES_COOLDOWNS:
+            self.supplementaires[cle] = valeur
+            return
+        self.valeurs[indice_cooldown(cle)] = valeur
+
+    def __iter__(self) -> Iterator[str]:
+        """Itere sur les noms de cooldowns, comme un dictionnaire.
+
+        Returns:
+            Iterateur de noms.
+        """
+
+        return chain(NOMS_COOLDOWNS, self.supplementaires)
+
+    def __len__(self) -> int:
+        """Retourne le nombre de cooldowns.
+
+        Returns:
+            Taille de la table.
+        """
+
+        return len(NOMS_COOLDOWNS) + len(self.supplementaires)
+
+    def __eq__(self, autre: object) -> bool:
+        """Compare a une autre table ou a un dictionnaire par nom.
+
+        Args:
+            autre: Objet compare.
+
+        Returns:
+            True si tous les temps restants sont egaux.
+        """
+
+        if isinstance(autre, TableCooldowns):
+            return self.valeurs == autre.valeurs and self.supplementaires == autre.supplementaires
+        if isinstance(autre, Mapping):
+            return dict(self.items()) == dict(autre)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        """Retourne une representation lisible par nom.
+
+        Returns:
+            Representation de la table.
+        """
+
+        return f"TableCooldowns({dict(self.items())!r})"
+
+    def get(self, cle: CleCooldown, defaut: float = 0.0) -> float:
+        """Retourne le temps restant, ou une valeur par defaut si la cle est inconnue.
+
+        Args:
+            cle: Identifiant ou nom du cooldown.
+            defaut: Valeur retournee pour un nom inconnu.
+
+        Returns:
+            Temps restant en secondes.
+        """
+
+        if isinstance(cle, str) and cle not in INDICES_COOLDOWNS:
+            return self.supplementaires.get(cle, defaut)
+        try:
+            return self.valeurs[indice_cooldown(cle)]
+        except IndexError:
+            return defaut
+
+    def items(self) -> Iterator[Tuple[str, float]]:
+        """Itere sur les couples (nom, temps restant).
+
+        Returns:
+            Iterateur de couples.
+        """
+
+        return chain(zip(NOMS_COOLDOWNS, self.valeurs), self.supplementaires.items())
 
 
 @dataclass
@@ -64,7 +235,7 @@ class ParametresCombat:
     delai_sortie_arene: float
 
 
-@dataclass
+@dataclass(**OPTIONS_DATACLASS_SLOTS)
 class Joueur:
     """Represente l etat dynamique d un joueur.
 
@@ -81,7 +252,8 @@ class Joueur:
         actif_bouclier: Indique si le bouclier est actif.
         temps_restant_bouclier: Temps restant de bouclier.
         temps_hors_arene: Temps cumule hors de la zone.
-        cooldowns: Dictionnaire des cooldowns restants.
+        cooldowns: Cooldowns restants; un dictionnaire par nom est converti
+            en TableCooldowns a la construction.
     """
 
     identifiant: str
@@ -96,7 +268,17 @@ class Joueur:
     actif_bouclier: bool = False
     temps_restant_bouclier: float = 0.0
     temps_hors_arene: float = 0.0
-    cooldowns: Dict[str, float] = field(default_factory=dict)
+    cooldowns: TableCooldowns = field(default_factory=TableCooldowns)
+
+    def __post_init__(self) -> None:
+        """Convertit des cooldowns fournis par nom en table indexee.
+
+        Returns:
+            None.
+        """
+
+        if not isinstance(self.cooldowns, TableCooldowns):
+            self.cooldowns = TableCooldowns(self.cooldowns)
 
 
 @dataclass
@@ -126,7 +308,7 @@ class ParametresStyle:
     duree_affichage_action: float
 
 
-@dataclass
+@dataclass(**OPTIONS_DATACLASS_SLOTS)
 class EtatStyleJoueur:
     """Represente l etat style d un joueur.
 
@@ -244,39 +426,56 @@ def decrementer_cooldowns(joueur: Joueur, delta_temps: float) -> None:
         None.
     """
 
-    cooldowns = joueur.cooldowns
-    for cle_cooldown in cooldowns:
-        cooldown_restant = cooldowns[cle_cooldown] - delta_temps
-        cooldowns[cle_cooldown] = cooldown_restant if cooldown_restant > 0.0 else 0.0
+    valeurs = joueur.cooldowns.valeurs
+    # Cas courant: tout est a zero. count n alloue rien, contrairement a l iterateur
+    # d enumerate (environ 60 octets par appel), donc la boucle est evitee.
+    if valeurs.count(0.0) != len(valeurs):
+        for indice, valeur in enumerate(valeurs):
+            if valeur:
+                cooldown_restant = valeur - delta_temps
+                valeurs[indice] = cooldown_restant if cooldown_restant > 0.0 else 0.0
+    supplementaires = joueur.cooldowns.supplementaires
+    if not supplementaires:
+        return
+    for nom, valeur in supplementaires.items():
+        cooldown_restant = valeur - delta_temps
+        supplementaires[nom] = cooldown_restant if cooldown_restant > 0.0 else 0.0
 
 
-def cooldown_pret(joueur: Joueur, nom_action: str) -> bool:
+def cooldown_pret(joueur: Joueur, nom_action: CleCooldown) -> bool:
     """Indique si une action est prete a etre utilisee.
 
+    Un nom inconnu jamais demarre est considere comme pret.
+
     Args:
         joueur: Joueur concerne.
-        nom_action: Nom de l action.
+        nom_action: Identifiant COOLDOWN_* ou nom de l action.
 
     Returns:
         True si le cooldown est a zero, sinon False.
     """
 
-    return joueur.cooldowns.get(nom_action, 0.0) <= 0.0
+    if isinstance(nom_action, str):
+        indice = INDICES_COOLDOWNS.get(nom_action)
+        if indice is None:
+            return joueur.cooldowns.supplementaires.get(nom_action, 0.0) <= 0.0
+        return joueur.cooldowns.valeurs[indice] <= 0.0
+    return joueur.cooldowns.valeurs[nom_action] <= 0.0
 
 
-def demarrer_cooldown(joueur: Joueur, nom_action: str, duree: float) -> None:
+def demarrer_cooldown(joueur: Joueur, nom_action: CleCooldown, duree: float) -> None:
     """Demarre un cooldown sur une action.
 
     Args:
         joueur: Joueur concerne.
-        nom_action: Nom de l action.
+        nom_action: Identifiant COOLDOWN_* ou nom de l action.
         duree: Duree du cooldown.
 
     Returns:
         None.
     """
 
-    joueur.cooldowns[nom_action] = max(0.0, duree)
+    joueur.cooldowns[nom_action] = duree if duree > 0.0 else 0.0
 
 
 def activer_dash(joueur: Joueur, parametres: ParametresCombat) -> bool:
@@ -290,7 +489,7 @@ def activer_dash(joueur: Joueur, parametres: ParametresCombat) -> bool:
         True si le dash est effectue, sinon False.
     """
 
-    if not cooldown_pret(joueur, "dash"):
+    if not cooldown_pret(joueur, COOLDOWN_DASH):
         return False
 
     direction_x, direction_y = normaliser(joueur.direction_x, joueur.direction_y)
@@ -304,7 +503,7 @@ def activer_dash(joueur: Joueur, parametres: ParametresCombat) -> bool:
         joueur.vitesse_y,
         parametres.vitesse_max * 1.8,
     )
-    demarrer_cooldown(joueur, "dash", parametres.cooldown_dash)
+    demarrer_cooldown(joueur, COOLDOWN_DASH, parametres.cooldown_dash)
     return True
 
 
@@ -324,7 +523,7 @@ def executer_bump(
         True si impact valide, sinon False.
     """
 
-    if not cooldown_pret(attaquant, "bump"):
+    if not cooldown_pret(attaquant, COOLDOWN_BUMP):
         return False
 
     difference_x = defenseur.position_x - attaquant.position_x
@@ -349,7 +548,7 @@ def executer_bump(
     defenseur.vitesse_x += vers_cible_x * parametres.impulsion_bump * facteur
     defenseur.vitesse_y += vers_cible_y * parametres.impulsion_bump * facteur
     attaquant.jauge_ultime = min(1.0, attaquant.jauge_ultime + parametres.gain_ultime_par_impact)
-    demarrer_cooldown(attaquant, "bump", parametres.cooldown_bump)
+    demarrer_cooldown(attaquant, COOLDOWN_BUMP, parametres.cooldown_bump)
     return True
 
 
@@ -439,12 +638,12 @@ def activer_bouclier(joueur: Joueur, parametres: ParametresCombat) -> bool:
         True si le bouclier est active, sinon False.
     """
 
-    if not cooldown_pret(joueur, "bouclier"):
+    if not cooldown_pret(joueur, COOLDOWN_BOUCLIER):
         return False
 
     joueur.actif_bouclier = True
     joueur.temps_restant_bouclier = parametres.duree_bouclier
-    demarrer_cooldown(joueur, "bouclier", parametres.cooldown_bouclier)
+    demarrer_cooldown(joueur, COOLDOWN_BOUCLIER, parametres.cooldown_bouclier)
     return True
 
 
@@ -504,23 +703,46 @@ def activer_ultime(
     if attaquant.jauge_ultime < 1.0:
         return False
 
+    appliquer_onde_ultime(attaquant, defenseur, parametres)
+    attaquant.jauge_ultime = 0.0
+    return True
+
+
+def appliquer_onde_ultime(
+    attaquant: Joueur,
+    defenseur: Joueur,
+    parametres: ParametresCombat,
+) -> bool:
+    """Repousse une cible situee dans le rayon de l onde ultime.
+
+    Ne consomme pas la jauge: une ultime lancee dans une melee applique
+    l onde a chaque cible avant de vider la jauge une seule fois.
+
+    Args:
+        attaquant: Joueur lanceur.
+        defenseur: Joueur cible potentielle.
+        parametres: Parametres de combat.
+
+    Returns:
+        True si la cible est dans le rayon, sinon False.
+    """
+
     difference_x = defenseur.position_x - attaquant.position_x
     difference_y = defenseur.position_y - attaquant.position_y
     distance_carre = difference_x * difference_x + difference_y * difference_y
     portee = parametres.rayon_ultime + defenseur.rayon
-    if distance_carre <= portee * portee:
-        if distance_carre <= SEUIL_NORME_CARREE:
-            direction_x = 0.0
-            direction_y = 0.0
-        else:
-            inverse_distance = 1.0 / sqrt(distance_carre)
-            direction_x = difference_x * inverse_distance
-            direction_y = difference_y * inverse_distance
-        facteur = parametres.multiplicateur_bouclier if defenseur.actif_bouclier else 1.0
-        defenseur.vitesse_x += direction_x * parametres.impulsion_ultime * facteur
-        defenseur.vitesse_y += direction_y * parametres.impulsion_ultime * facteur
-
-    attaquant.jauge_ultime = 0.0
+    if distance_carre > portee * portee:
+        return False
+    if distance_carre <= SEUIL_NORME_CARREE:
+        direction_x = 0.0
+        direction_y = 0.0
+    else:
+        inverse_distance = 1.0 / sqrt(distance_carre)
+        direction_x = difference_x * inverse_distance
+        direction_y = difference_y * inverse_distance
+    facteur = parametres.multiplicateur_bouclier if defenseur.actif_bouclier else 1.0
+    defenseur.vitesse_x += direction_x * parametres.impulsion_ultime * facteur
+    defenseur.vitesse_y += direction_y * parametres.impulsion_ultime * facteur
     return True
 
 
@@ -576,6 +798,24 @@ def reinitialiser_etat_style(etat_style: EtatStyleJoueur) -> None:
     etat_style.temps_message_restant = 0.0
 
 
+def reinitialiser_style_pour_manche(etat_style: EtatStyleJoueur) -> None:
+    """Reinitialise l etat style volatile au debut d une manche.
+
+    Args:
+        etat_style: Etat style du joueur.
+
+    Returns:
+        None.
+    """
+
+    etat_style.combo_courant = 0
+    etat_style.temps_combo_restant = 0.0
+    etat_style.cooldown_esquive_restant = 0.0
+    etat_style.dans_zone_danger = False
+    etat_style.dernier_message = ""
+    etat_style.temps_message_restant = 0.0
+
+
 def mettre_a_jour_etat_style(etat_style: EtatStyleJoueur, delta_temps: float) -> None:
     """Met a jour les timers du style d un joueur.
 
@@ -748,7 +988,119 @@ def mettre_a_jour_sauvetage_bord(
     return False
 
 
+def construire_parametres_combat(configuration: Dict[str, object]) -> ParametresCombat:
+    """Construit les parametres de combat depuis la configuration.
+
+    Args:
+        configuration: Dictionnaire de configuration globale.
+
+    Returns:
+        Instance de ParametresCombat.
+    """
+
+    physique = configuration["physique"]
+    gameplay = configuration["gameplay"]
+    cooldowns = configuration["cooldowns"]
+    ulti = configuration["ultime"]
+
+    return ParametresCombat(
+        acceleration=float(physique["acceleration"]),
+        friction_base=float(physique["friction_base"]),
+        friction_frein=float(physique["friction_frein"]),
+        vitesse_max=float(physique["vitesse_max"]),
+        coefficient_rebond_collision=float(physique.get("coefficient_rebond_collision", 0.65)),
+        impulsion_dash=float(gameplay["impulsion_dash"]),
+        impulsion_bump=float(gameplay["impulsion_bump"]),
+        rayon_bump=float(gameplay["rayon_bump"]),
+        multiplicateur_bouclier=float(gameplay["reduction_knockback_bouclier"]),
+        duree_bouclier=float(gameplay["duree_bouclier"]),
+        cooldown_dash=float(cooldowns["dash"]),
+        cooldown_bump=float(cooldowns["bump"]),
+        cooldown_bouclier=float(cooldowns["bouclier"]),
+        cooldown_taunt=float(cooldowns["taunt"]),
+        gain_ultime_par_seconde=float(ulti["gain_par_seconde"]),
+        gain_ultime_par_impact=float(ulti["gain_par_impact"]),
+        rayon_ultime=float(ulti["rayon"]),
+        impulsion_ultime=float(ulti["impulsion"]),
+        delai_sortie_arene=float(gameplay["delai_sortie_arene"]),
+    )
+
+
+def construire_parametres_style(configuration: Dict[str, object]) -> ParametresStyle:
+    """Construit les parametres du systeme de style.
+
+    Args:
+        configuration: Dictionnaire de configuration globale.
+
+    Returns:
+        ParametresStyle initialises.
+    """
+
+    style = configuration.get("style", {})
+    return ParametresStyle(
+        fenetre_combo=float(style.get("fenetre_combo", 2.4)),
+        bonus_combo_par_niveau=int(style.get("bonus_combo_par_niveau", 4)),
+        points_impact=int(style.get("points_impact", 16)),
+        points_esquive=int(style.get("points_esquive", 20)),
+        points_sauvetage=int(style.get("points_sauvetage", 24)),
+        distance_esquive=float(style.get("distance_esquive", 70.0)),
+        cooldown_esquive=float(style.get("cooldown_esquive", 1.0)),
+        marge_sauvetage=float(style.get("marge_sauvetage", 20.0)),
+        duree_affichage_action=float(style.get("duree_affichage_action", 1.1)),
+    )
+
+
+def creer_joueurs(configuration: Dict[str, object], largeur: int, hauteur: int) -> Tuple[Joueur, Joueur]:
+    """Cree les deux joueurs en position de depart.
+
+    Args:
+        configuration: Configuration globale.
+        largeur: Largeur de la fenetre.
+        hauteur: Hauteur de la fenetre.
+
+    Returns:
+        Tuple (joueur_1, joueur_2).
+    """
+
+    rayon = float(configuration["physique"]["rayon_capsule"])
+    distance_depart = float(configuration["physique"]["distance_depart"])
+    centre_x = largeur / 2.0
+    centre_y = hauteur / 2.0
+
+    joueur_1 = Joueur(
+        identifiant="J1",
+        position_x=centre_x - distance_depart,
+        position_y=centre_y,
+        vitesse_x=0.0,
+        vitesse_y=0.0,
+        rayon=rayon,
+        direction_x=1.0,
+        direction_y=0.0,
+        cooldowns=TableCooldowns(),
+    )
+    joueur_2 = Joueur(
+        identifiant="J2",
+        position_x=centre_x + distance_depart,
+        position_y=centre_y,
+        vitesse_x=0.0,
+        vitesse_y=0.0,
+        rayon=rayon,
+        direction_x=-1.0,
+        direction_y=0.0,
+        cooldowns=TableCooldowns(),
+    )
+    return joueur_1, joueur_2
+
+
 __all__ = [
+    "IdentifiantCooldown",
+    "COOLDOWN_DASH",
+    "COOLDOWN_BUMP",
+    "COOLDOWN_BOUCLIER",
+    "COOLDOWN_TAUNT",
+    "NOMS_COOLDOWNS",
+    "TableCooldowns",
+    "indice_cooldown",
     "ParametresCombat",
     "ParametresStyle",
     "Joueur",
@@ -766,11 +1118,16 @@ __all__ = [
     "mettre_a_jour_bouclier",
     "charger_ultime",
     "activer_ultime",
+    "appliquer_onde_ultime",
     "verifier_sortie_arene",
     "reinitialiser_etat_style",
+    "reinitialiser_style_pour_manche",
     "mettre_a_jour_etat_style",
     "ajouter_points_style",
     "enregistrer_impact_style",
     "tenter_esquive_proche",
     "mettre_a_jour_sauvetage_bord",
+    "construire_parametres_combat",
+    "construire_parametres_style",
+    "creer_joueurs",
 ]
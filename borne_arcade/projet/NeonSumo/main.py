@@ -8,32 +8,82 @@ from __future__ import annotations
 import json
 import os
 import random
-from dataclasses import dataclass
-from math import atan2, cos, pi, sin, sqrt
+import sys
+import threading
+import time
+from dataclasses import astuple, dataclass, field, replace
+from functools import lru_cache
+from math import ceil, cos, pi, sin, sqrt
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import TYPE_CHECKING, Dict, List, Tuple
 
 from logique import (
+    COOLDOWN_BOUCLIER,
+    COOLDOWN_BUMP,
+    COOLDOWN_DASH,
     EtatStyleJoueur,
     Joueur,
     ParametresCombat,
-    ParametresStyle,
-    activer_bouclier,
-    activer_dash,
-    activer_ultime,
-    appliquer_deplacement_inertiel,
-    charger_ultime,
-    decrementer_cooldowns,
-    enregistrer_impact_style,
-    executer_bump,
+    construire_parametres_combat,
+    construire_parametres_style,
+    creer_joueurs,
     mettre_a_jour_etat_style,
-    mettre_a_jour_sauvetage_bord,
-    mettre_a_jour_bouclier,
     reinitialiser_etat_style,
-    resoudre_collision_capsules,
-    tenter_esquive_proche,
-    verifier_sortie_arene,
+    reinitialiser_style_pour_manche,
 )
+from banque_audio import (
+    BanqueAudio,
+    construire_parametres_audio,
+    creer_banque_audio,
+    jouer_son_banque,
+)
+from ia_recherche import construire_parametres_ia, creer_politique_ia
+from melee import (
+    EtatMelee,
+    ParametresMelee,
+    avancer_pas_melee,
+    choisir_commandes_melee,
+    construire_parametres_melee,
+    creer_etat_melee,
+    lister_combattants_actifs,
+)
+from replay import (
+    NOMBRE_MAX_REPLAYS_DEFAUT,
+    EnregistreurReplay,
+    Replay,
+    creer_enregistreur_replay,
+    enregistrer_image_replay,
+    finaliser_replay,
+    sauvegarder_replay,
+    terminer_manche_replay,
+)
+from simulation import (
+    CommandeJoueur,
+    EtatDuel,
+    EtatManche,
+    EvenementsJoueur,
+    Politique,
+    avancer_pas_manche,
+    construire_regles_simulation,
+)
+
+try:
+    import pygame
+except ModuleNotFoundError:  # pragma: no cover - pygame absent (outils, tests sans affichage)
+    pygame = None
+
+try:
+    import profilage_images
+except ModuleNotFoundError:  # pragma: no cover - lance hors de la borne
+    profilage_images = None
+
+try:
+    import highscores
+except ModuleNotFoundError:  # pragma: no cover - lance hors de la borne
+    highscores = None
+
+if TYPE_CHECKING:  # pragma: no cover - particules (et NumPy) est importe a la demande
+    from particules import PoolParticules
 
 
 RACINE_JEU = Path(__file__).resolve().parent
@@ -41,7 +91,20 @@ FICHIER_CONFIG = RACINE_JEU / "config_jeu.json"
 FICHIER_HIGHSCORE = RACINE_JEU / "highscore"
 VARIABLE_ENV_MODE_TEST = "NEON_SUMO_MODE_TEST"
 VALEUR_MODE_TEST_ACTIF = "1"
+VARIABLE_ENV_TRACE_DEMARRAGE = "NEON_SUMO_TRACE_DEMARRAGE"
+# Chargees une par image apres la premiere image du titre, dans cet ordre.
+ETAPES_CHARGEMENT = (
+    "polices", "audio", "calques", "arene", "modules", "particules", "highscore"
+)
 COULEUR_BLANC = (255, 255, 255)
+COULEURS_BOTS_MELEE = (
+    (255, 214, 64),
+    (120, 255, 120),
+    (255, 120, 220),
+    (255, 150, 60),
+    (170, 140, 255),
+    (90, 230, 255),
+)
 COULEUR_JAUGE_FOND = (40, 40, 40)
 COULEUR_JAUGE_REMPLISSAGE = (0, 255, 255)
 LARGEUR_JAUGE_ULTIME = 200
@@ -50,7 +113,6 @@ MARGE_JAUGE_GAUCHE = 40
 MARGE_JAUGE_DROITE = 240
 MARGE_BASSE_JAUGE = 36
 HAUTEUR_LIBELLE_JAUGE = 10
-SEUIL_NORME_DIRECTION = 1e-18
 DUREE_GEL_IMPACT_SECONDES = 0.04
 DUREE_FLASH_IMPACT_SECONDES = 0.12
 INTENSITE_FLASH_DASH = 85
@@ -59,14 +121,6 @@ INTENSITE_FLASH_ULTIME = 170
 NOMBRE_PARTICULES_DASH = 10
 NOMBRE_PARTICULES_BUMP = 16
 NOMBRE_PARTICULES_ULTIME = 24
-VITESSE_PARTICULE_MIN = 130.0
-VITESSE_PARTICULE_MAX = 360.0
-DUREE_PARTICULE_MIN_SECONDES = 0.12
-DUREE_PARTICULE_MAX_SECONDES = 0.28
-TAILLE_PARTICULE_MIN = 2
-TAILLE_PARTICULE_MAX = 5
-ANGLE_PARTICULE_DEMI_OUVERTURE = 0.45
-FREINAGE_PARTICULES = 5.0
 LARGEUR_INDICATEUR_COMPETENCE = 56
 HAUTEUR_INDICATEUR_COMPETENCE = 18
 MARGE_INTERIEURE_INDICATEUR = 2
@@ -103,6 +157,7 @@ ESPACEMENT_LIGNES_ELECTRIQUES = 2.0
 MARGE_BORD_MENU_TITRE = 36
 MARGE_CADRE_MENU_TITRE = 34
 MARGE_CONTENU_MENU_TITRE = 24
+RAYON_CADRE_MENU_TITRE = 26
 OPACITE_SURFACE_MENU_TITRE_MAX = 255
 OPACITE_SURFACE_MENU_TITRE_MIN = 0
 COULEUR_MENU_TITRE_BORD = (30, 220, 255)
@@ -114,7 +169,13 @@ COULEUR_MENU_TITRE_TEXTE_ACCENT = (255, 236, 116)
 DECALAGE_CARTE_CONTROLES = 26
 HAUTEUR_CARTE_CONTROLES = 164
 LARGEUR_BORD_PANNEAU_CONTROLES = 2
-pygame = None
+TAILLE_CACHE_TEXTES = 256
+TAILLE_CACHE_SPRITES_TEXTE_NEON = 64
+PAS_RAYON_GLOW_ARENE = 3
+HAUTEUR_BANDE_GLOW_ARENE = 8
+FREQUENCE_SIMULATION_DEFAUT = 120.0
+PAS_MAX_PAR_IMAGE_DEFAUT = 8
+EPSILON_PAS_SIMULATION = 1e-9
 
 
 @dataclass
@@ -146,31 +207,6 @@ class EntreeJoueur:
     ultime: int
 
 
-@dataclass
-class ParticuleImpact:
-    """Represente une particule de feedback visuel.
-
-    Attributes:
-        position_x: Position X de la particule.
-        position_y: Position Y de la particule.
-        vitesse_x: Vitesse X de la particule.
-        vitesse_y: Vitesse Y de la particule.
-        duree_totale: Duree de vie initiale.
-        temps_restant: Duree de vie restante.
-        taille: Rayon de rendu.
-        couleur: Couleur RGB de base.
-    """
-
-    position_x: float
-    position_y: float
-    vitesse_x: float
-    vitesse_y: float
-    duree_totale: float
-    temps_restant: float
-    taille: int
-    couleur: Tuple[int, int, int]
-
-
 @dataclass
 class EtatFeedbackCombat:
     """Contient les effets temporaires de hit feedback.
@@ -238,6 +274,25 @@ class EtatAreneNeon:
     energie_impact: float = 0.0
 
 
+@dataclass
+class CacheAreneNeon:
+    """Conserve le calque des lignes electriques de l arene entre les images.
+
+    Le calque plein ecran est alloue une fois; seules les zones touchees par
+    les lignes sont presentees puis effacees a chaque image. Les anneaux de
+    glow sont pre-rendus par palier de ``PAS_RAYON_GLOW_ARENE`` pixels.
+
+    Attributes:
+        calque_lignes: Calque SRCALPHA transparent hors du trace en cours.
+        anneaux_glow: Tuiles non vides du glow et leur decalage, par palier de rayon et couleur.
+    """
+
+    calque_lignes: pygame.Surface | None = None
+    anneaux_glow: Dict[
+        Tuple[int, Tuple[int, int, int]], Tuple[Tuple[pygame.Surface, Tuple[int, int]], ...]
+    ] = field(default_factory=dict)
+
+
 @dataclass
 class ParametresMenuTitre:
     """Regroupe les parametres visuels du menu titre.
@@ -263,6 +318,158 @@ class ParametresMenuTitre:
     taille_police_info: int
 
 
+@dataclass
+class CacheMenuTitre:
+    """Conserve les calques pre-rendus du menu titre.
+
+    Les calques statiques sont reconstruits uniquement quand la cle
+    (resolution, parametres du menu, couleur de fond) change.
+
+    Attributes:
+        cle: Cle des calques actuellement pre-rendus.
+        fond_statique: Fond opaque (couleur de fond, voile et cadre).
+        lignes_grille: Ordonnee et couleur opaque pre-melangee de chaque ligne.
+        carte_controles: Sprite du panneau de controles, sans bordure.
+        bord_carte_controles: Sprite opaque de la bordure du panneau.
+        anneaux: Sprites opaques des anneaux par rayon entier.
+        reconstructions: Nombre de reconstructions des calques statiques.
+    """
+
+    cle: Tuple[object, ...] | None = None
+    fond_statique: pygame.Surface | None = None
+    lignes_grille: List[Tuple[int, Tuple[int, int, int]]] = field(default_factory=list)
+    carte_controles: pygame.Surface | None = None
+    bord_carte_controles: pygame.Surface | None = None
+    anneaux: Dict[int, pygame.Surface] = field(default_factory=dict)
+    reconstructions: int = 0
+
+
+@dataclass
+class SuiviRectanglesSales:
+    """Accumule les zones modifiees pour le rendu par rectangles sales.
+
+    Une zone doit etre presentee si elle change dans l image courante ou si
+    elle avait change dans l image precedente (effacement de l ancien trace).
+
+    Attributes:
+        actif: Active la presentation partielle; sinon display.flip complet.
+        rectangles: Zones modifiees de l image courante.
+        rectangles_precedents: Zones modifiees de l image precedente.
+        plein_ecran: L image courante modifie tout l ecran.
+        plein_ecran_precedent: L image precedente modifiait tout l ecran.
+    """
+
+    actif: bool = False
+    rectangles: List[pygame.Rect] = field(default_factory=list)
+    rectangles_precedents: List[pygame.Rect] = field(default_factory=list)
+    plein_ecran: bool = True
+    plein_ecran_precedent: bool = True
+
+
+@dataclass
+class AccumulateurSimulation:
+    """Decoupe le temps reel en pas de simulation de duree fixe.
+
+    Attributes:
+        pas_fixe: Duree d un pas de simulation en secondes.
+        pas_max_par_image: Nombre maximal de pas joues par image.
+        reste: Temps reel accumule pas encore simule.
+    """
+
+    pas_fixe: float
+    pas_max_par_image: int
+    reste: float = 0.0
+
+
+@dataclass
+class EtatInterpolation:
+    """Memorise l etat d avant le dernier pas de simulation, pour lisser le rendu.
+
+    Attributes:
+        joueur_1: Joueur 1 memorise (detecte une manche reinitialisee).
+        joueur_2: Joueur 2 memorise.
+        position_j1: Position de J1 avant le dernier pas.
+        position_j2: Position de J2 avant le dernier pas.
+        rayon_arene: Rayon de l arene avant le dernier pas.
+    """
+
+    joueur_1: Joueur | None = None
+    joueur_2: Joueur | None = None
+    position_j1: Tuple[float, float] = (0.0, 0.0)
+    position_j2: Tuple[float, float] = (0.0, 0.0)
+    rayon_arene: float = 0.0
+
+
+@dataclass
+class TraceDemarrage:
+    """Chronologie du demarrage, en millisecondes depuis le lancement du processus.
+
+    Attributes:
+        origine: Instant ``time.perf_counter`` estime du lancement du processus.
+        etapes: Couples (nom, instant en ms) dans l ordre.
+        affichee: True pour imprimer la trace a la fin du chargement.
+    """
+
+    origine: float
+    etapes: List[Tuple[str, float]] = field(default_factory=list)
+    affichee: bool = False
+
+
+@dataclass
+class RessourcesJeu:
+    """Ressources remplacees etape par etape pendant le chargement progressif.
+
+    Avant l etape ``polices``, les polices sont celles embarquees par pygame
+    (aucune recherche fontconfig); avant l etape ``audio``, la banque est vide.
+
+    Attributes:
+        police: Police des textes principaux.
+        petite_police: Police des textes secondaires.
+        police_titre_menu: Police du titre du menu.
+        police_sous_titre_menu: Police du sous-titre du menu.
+        police_info_menu: Police des informations du menu.
+        banque_audio: Banque des sons.
+        stock_highscore: StockHighscore partage, None hors borne ou avant chargement.
+        particules_impact: Pool des particules d impact, None avant l etape ``particules``.
+    """
+
+    police: pygame.font.Font
+    petite_police: pygame.font.Font
+    police_titre_menu: pygame.font.Font
+    police_sous_titre_menu: pygame.font.Font
+    police_info_menu: pygame.font.Font
+    banque_audio: BanqueAudio
+    stock_highscore: object | None = None
+    particules_impact: PoolParticules | None = None
+
+
+@dataclass
+class ChargementProgressif:
+    """Etapes de demarrage executees apres la premiere image.
+
+    Attributes:
+        configuration: Configuration globale du jeu.
+        parametres_menu_titre: Parametres graphiques du menu.
+        cache_menu_titre: Calques du menu titre a pre-rendre.
+        taille_ecran: Largeur et hauteur de la fenetre.
+        couleur_fond: Couleur de fond de l ecran.
+        trace: Chronologie du demarrage.
+        cache_arene_neon: Cache de l arene dont les anneaux de glow sont pre-rendus.
+        etapes_restantes: Etapes de ``ETAPES_CHARGEMENT`` pas encore executees.
+        premiere_image_presentee: True une fois la premiere image a l ecran.
+    """
+
+    configuration: Dict[str, object]
+    parametres_menu_titre: ParametresMenuTitre
+    cache_menu_titre: CacheMenuTitre
+    taille_ecran: Tuple[int, int]
+    couleur_fond: Tuple[int, int, int]
+    trace: TraceDemarrage
+    cache_arene_neon: CacheAreneNeon = field(default_factory=CacheAreneNeon)
+    etapes_restantes: List[str] = field(default_factory=lambda: list(ETAPES_CHARGEMENT))
+    premiere_image_presentee: bool = False
+
+
 def mode_test_actif() -> bool:
     """Indique si un mode smoke test non interactif est active.
 
@@ -277,93 +484,109 @@ def mode_test_actif() -> bool:
 
 
 def importer_pygame():
-    """Charge pygame a la demande.
+    """Retourne pygame, importe avec le module.
+
+    Args:
+        aucun.
+
+    Returns:
+        Module pygame.
+
+    Raises:
+        RuntimeError: Si pygame n est pas installe.
+    """
+
+    if pygame is None:
+        raise RuntimeError("pygame est requis pour lancer Neon Sumo.")
+    return pygame
+
+
+@lru_cache(maxsize=None)
+def importer_particules():
+    """Charge le module de particules, et NumPy avec lui, au premier appel.
 
     Args:
         aucun.
 
     Returns:
-        Module pygame charge.
+        Module particules charge.
+    """
+
+    import particules  # pylint: disable=import-outside-toplevel
+
+    return particules
+
+
+def mesurer_age_processus() -> float:
+    """Mesure le temps ecoule depuis le lancement du processus (Linux).
+
+    Couvre le demarrage de l interpreteur et les imports; la resolution est
+    celle de ``/proc`` (10 ms en general).
+
+    Returns:
+        Age du processus en secondes, 0.0 si ``/proc`` est indisponible.
     """
 
     try:
-        import pygame as module_pygame
-    except ModuleNotFoundError as erreur:
-        raise RuntimeError("pygame est requis pour lancer Neon Sumo.") from erreur
-    return module_pygame
+        # Apres le nom de commande entre parentheses, starttime est le 20e champ.
+        champs = Path("/proc/self/stat").read_text(encoding="utf-8").rsplit(")", 1)[1].split()
+        lancement = int(champs[19]) / os.sysconf("SC_CLK_TCK")
+        duree_allumage = float(Path("/proc/uptime").read_text(encoding="utf-8").split()[0])
+    except (OSError, ValueError, IndexError):
+        return 0.0
+    return max(0.0, duree_allumage - lancement)
 
 
-def charger_configuration() -> Dict[str, object]:
-    """Charge la configuration du jeu depuis un fichier JSON.
+def creer_trace_demarrage() -> TraceDemarrage:
+    """Demarre la trace de demarrage, imprimee si ``NEON_SUMO_TRACE_DEMARRAGE=1``.
 
     Returns:
-        Dictionnaire de configuration.
+        TraceDemarrage dont l origine est le lancement du processus.
     """
 
-    with FICHIER_CONFIG.open("r", encoding="utf-8") as flux:
-        return json.load(flux)
+    return TraceDemarrage(
+        origine=time.perf_counter() - mesurer_age_processus(),
+        affichee=os.environ.get(VARIABLE_ENV_TRACE_DEMARRAGE, "0") == "1",
+    )
 
 
-def construire_parametres_combat(configuration: Dict[str, object]) -> ParametresCombat:
-    """Construit les parametres de combat depuis la configuration.
+def marquer_etape_demarrage(trace: TraceDemarrage, nom: str) -> None:
+    """Horodate la fin d une etape du demarrage.
 
     Args:
-        configuration: Dictionnaire de configuration globale.
+        trace: Trace de demarrage.
+        nom: Nom de l etape.
 
     Returns:
-        Instance de ParametresCombat.
-    """
-
-    physique = configuration["physique"]
-    gameplay = configuration["gameplay"]
-    cooldowns = configuration["cooldowns"]
-    ulti = configuration["ultime"]
-
-    return ParametresCombat(
-        acceleration=float(physique["acceleration"]),
-        friction_base=float(physique["friction_base"]),
-        friction_frein=float(physique["friction_frein"]),
-        vitesse_max=float(physique["vitesse_max"]),
-        coefficient_rebond_collision=float(physique.get("coefficient_rebond_collision", 0.65)),
-        impulsion_dash=float(gameplay["impulsion_dash"]),
-        impulsion_bump=float(gameplay["impulsion_bump"]),
-        rayon_bump=float(gameplay["rayon_bump"]),
-        multiplicateur_bouclier=float(gameplay["reduction_knockback_bouclier"]),
-        duree_bouclier=float(gameplay["duree_bouclier"]),
-        cooldown_dash=float(cooldowns["dash"]),
-        cooldown_bump=float(cooldowns["bump"]),
-        cooldown_bouclier=float(cooldowns["bouclier"]),
-        cooldown_taunt=float(cooldowns["taunt"]),
-        gain_ultime_par_seconde=float(ulti["gain_par_seconde"]),
-        gain_ultime_par_impact=float(ulti["gain_par_impact"]),
-        rayon_ultime=float(ulti["rayon"]),
-        impulsion_ultime=float(ulti["impulsion"]),
-        delai_sortie_arene=float(gameplay["delai_sortie_arene"]),
-    )
+        None.
+    """
+
+    trace.etapes.append((nom, (time.perf_counter() - trace.origine) * 1000.0))
 
 
-def construire_parametres_style(configuration: Dict[str, object]) -> ParametresStyle:
-    """Construit les parametres du systeme de style.
+def formater_trace_demarrage(trace: TraceDemarrage) -> str:
+    """Resume la trace de demarrage sur une ligne.
 
     Args:
-        configuration: Dictionnaire de configuration globale.
+        trace: Trace de demarrage.
 
     Returns:
-        ParametresStyle initialises.
+        Ligne ``nom=instant`` par etape, en ms depuis le lancement du processus.
     """
 
-    style = configuration.get("style", {})
-    return ParametresStyle(
-        fenetre_combo=float(style.get("fenetre_combo", 2.4)),
-        bonus_combo_par_niveau=int(style.get("bonus_combo_par_niveau", 4)),
-        points_impact=int(style.get("points_impact", 16)),
-        points_esquive=int(style.get("points_esquive", 20)),
-        points_sauvetage=int(style.get("points_sauvetage", 24)),
-        distance_esquive=float(style.get("distance_esquive", 70.0)),
-        cooldown_esquive=float(style.get("cooldown_esquive", 1.0)),
-        marge_sauvetage=float(style.get("marge_sauvetage", 20.0)),
-        duree_affichage_action=float(style.get("duree_affichage_action", 1.1)),
-    )
+    etapes = " | ".join(f"{nom}={instant:.0f}" for nom, instant in trace.etapes)
+    return f"Demarrage Neon Sumo (ms depuis le lancement): {etapes}"
+
+
+def charger_configuration() -> Dict[str, object]:
+    """Charge la configuration du jeu depuis un fichier JSON.
+
+    Returns:
+        Dictionnaire de configuration.
+    """
+
+    with FICHIER_CONFIG.open("r", encoding="utf-8") as flux:
+        return json.load(flux)
 
 
 def construire_parametres_arene_neon(configuration: Dict[str, object]) -> ParametresAreneNeon:
@@ -418,80 +641,6 @@ def construire_parametres_menu_titre(configuration: Dict[str, object]) -> Parame
     )
 
 
-def creer_joueurs(configuration: Dict[str, object], largeur: int, hauteur: int) -> Tuple[Joueur, Joueur]:
-    """Cree les deux joueurs en position de depart.
-
-    Args:
-        configuration: Configuration globale.
-        largeur: Largeur de la fenetre.
-        hauteur: Hauteur de la fenetre.
-
-    Returns:
-        Tuple (joueur_1, joueur_2).
-    """
-
-    rayon = float(configuration["physique"]["rayon_capsule"])
-    distance_depart = float(configuration["physique"]["distance_depart"])
-    centre_x = largeur / 2.0
-    centre_y = hauteur / 2.0
-
-    joueur_1 = Joueur(
-        identifiant="J1",
-        position_x=centre_x - distance_depart,
-        position_y=centre_y,
-        vitesse_x=0.0,
-        vitesse_y=0.0,
-        rayon=rayon,
-        direction_x=1.0,
-        direction_y=0.0,
-        cooldowns={"dash": 0.0, "bump": 0.0, "bouclier": 0.0, "taunt": 0.0},
-    )
-    joueur_2 = Joueur(
-        identifiant="J2",
-        position_x=centre_x + distance_depart,
-        position_y=centre_y,
-        vitesse_x=0.0,
-        vitesse_y=0.0,
-        rayon=rayon,
-        direction_x=-1.0,
-        direction_y=0.0,
-        cooldowns={"dash": 0.0, "bump": 0.0, "bouclier": 0.0, "taunt": 0.0},
-    )
-    return joueur_1, joueur_2
-
-
-def charger_son(chemin_fichier: Path) -> pygame.mixer.Sound | None:
-    """Charge un son de maniere tolerante aux erreurs.
-
-    Args:
-        chemin_fichier: Chemin du fichier audio.
-
-    Returns:
-        Un objet Sound si chargeable, sinon None.
-    """
-
-    if not chemin_fichier.exists() or chemin_fichier.stat().st_size == 0:
-        return None
-    try:
-        return pygame.mixer.Sound(str(chemin_fichier))
-    except pygame.error:
-        return None
-
-
-def jouer_son(son: pygame.mixer.Sound | None) -> None:
-    """Joue un son optionnel.
-
-    Args:
-        son: Son charge, possiblement None.
-
-    Returns:
-        None.
-    """
-
-    if son is not None:
-        son.play()
-
-
 def lire_etat_touches(touches: pygame.key.ScancodeWrapper, entree: EntreeJoueur) -> Tuple[float, float]:
     """Convertit l etat clavier en direction normalisee.
 
@@ -516,73 +665,9 @@ def lire_etat_touches(touches: pygame.key.ScancodeWrapper, entree: EntreeJoueur)
     return axe_x, axe_y
 
 
-def normaliser_direction(direction_x: float, direction_y: float) -> Tuple[float, float]:
-    """Normalise une direction 2D.
-
-    Args:
-        direction_x: Composante X.
-        direction_y: Composante Y.
-
-    Returns:
-        Tuple (x, y) normalise, ou (1, 0) si la direction est nulle.
-    """
-
-    norme_carre = direction_x * direction_x + direction_y * direction_y
-    if norme_carre <= SEUIL_NORME_DIRECTION:
-        return 1.0, 0.0
-    inverse_norme = 1.0 / sqrt(norme_carre)
-    return direction_x * inverse_norme, direction_y * inverse_norme
-
-
-def ajouter_particules_directionnelles(
-    particules: list[ParticuleImpact],
-    origine_x: float,
-    origine_y: float,
-    direction_x: float,
-    direction_y: float,
-    couleur: Tuple[int, int, int],
-    nombre: int,
-    multiplicateur_vitesse: float = 1.0,
-) -> None:
-    """Ajoute des particules projetees selon une direction.
-
-    Args:
-        particules: Liste de particules a enrichir.
-        origine_x: Origine X des particules.
-        origine_y: Origine Y des particules.
-        direction_x: Direction principale X.
-        direction_y: Direction principale Y.
-        couleur: Couleur RGB de la gerbe.
-        nombre: Nombre de particules a creer.
-        multiplicateur_vitesse: Facteur de vitesse applique a la gerbe.
-
-    Returns:
-        None.
-    """
-
-    direction_x, direction_y = normaliser_direction(direction_x, direction_y)
-    angle_central = atan2(direction_y, direction_x)
-    for _ in range(nombre):
-        angle = angle_central + random.uniform(-ANGLE_PARTICULE_DEMI_OUVERTURE, ANGLE_PARTICULE_DEMI_OUVERTURE)
-        vitesse = random.uniform(VITESSE_PARTICULE_MIN, VITESSE_PARTICULE_MAX) * multiplicateur_vitesse
-        duree = random.uniform(DUREE_PARTICULE_MIN_SECONDES, DUREE_PARTICULE_MAX_SECONDES)
-        particules.append(
-            ParticuleImpact(
-                position_x=origine_x,
-                position_y=origine_y,
-                vitesse_x=cos(angle) * vitesse,
-                vitesse_y=sin(angle) * vitesse,
-                duree_totale=duree,
-                temps_restant=duree,
-                taille=random.randint(TAILLE_PARTICULE_MIN, TAILLE_PARTICULE_MAX),
-                couleur=couleur,
-            )
-        )
-
-
 def declencher_feedback_impact(
     etat_feedback: EtatFeedbackCombat,
-    particules: list[ParticuleImpact],
+    particules: PoolParticules | None,
     origine_x: float,
     origine_y: float,
     direction_x: float,
@@ -592,12 +677,13 @@ def declencher_feedback_impact(
     intensite_flash: float,
     nombre_particules: int,
     multiplicateur_vitesse: float = 1.0,
+    generateur: random.Random | None = None,
 ) -> None:
     """Declenche un feedback visuel d impact.
 
     Args:
         etat_feedback: Etat temporaire des effets combat.
-        particules: Liste des particules actives.
+        particules: Pool des particules actives, None avant son chargement.
         origine_x: Origine X de l effet.
         origine_y: Origine Y de l effet.
         direction_x: Direction principale de projection.
@@ -607,6 +693,7 @@ def declencher_feedback_impact(
         intensite_flash: Intensite alpha du flash.
         nombre_particules: Nombre de particules a creer.
         multiplicateur_vitesse: Facteur de vitesse des particules.
+        generateur: Generateur du match pour les particules (defaut: module random).
 
     Returns:
         None.
@@ -616,7 +703,9 @@ def declencher_feedback_impact(
     etat_feedback.flash_restant = DUREE_FLASH_IMPACT_SECONDES
     etat_feedback.flash_intensite_max = max(etat_feedback.flash_intensite_max, intensite_flash)
     etat_feedback.couleur_flash = couleur_flash
-    ajouter_particules_directionnelles(
+    if particules is None:
+        return
+    importer_particules().emettre_particules_directionnelles(
         particules,
         origine_x,
         origine_y,
@@ -625,63 +714,55 @@ def declencher_feedback_impact(
         couleur_particule,
         nombre_particules,
         multiplicateur_vitesse,
+        generateur,
     )
 
 
-def mettre_a_jour_particules(particules: list[ParticuleImpact], delta_temps: float) -> None:
-    """Met a jour la simulation des particules actives.
-
-    Args:
-        particules: Liste des particules.
-        delta_temps: Pas de simulation en secondes.
-
-    Returns:
-        None.
-    """
-
-    particules_vivantes: list[ParticuleImpact] = []
-    multiplicateur_freinage = max(0.0, 1.0 - FREINAGE_PARTICULES * delta_temps)
-    for particule in particules:
-        particule.temps_restant -= delta_temps
-        if particule.temps_restant <= 0.0:
-            continue
-        particule.vitesse_x *= multiplicateur_freinage
-        particule.vitesse_y *= multiplicateur_freinage
-        particule.position_x += particule.vitesse_x * delta_temps
-        particule.position_y += particule.vitesse_y * delta_temps
-        particules_vivantes.append(particule)
-    particules[:] = particules_vivantes
-
-
-def dessiner_particules(surface: pygame.Surface, particules: list[ParticuleImpact]) -> None:
+def dessiner_particules(
+    surface: pygame.Surface,
+    particules: PoolParticules | None,
+) -> pygame.Rect | None:
     """Dessine les particules d impact actives.
 
+    Le calque alpha est limite au rectangle englobant les particules.
+
     Args:
         surface: Surface cible.
-        particules: Liste des particules a afficher.
+        particules: Pool des particules a afficher, ou None.
 
     Returns:
-        None.
+        Rectangle ecran modifie, ou None sans particule visible.
     """
 
-    if not particules:
-        return
+    if particules is None or particules.nombre_actives == 0:
+        return None
 
-    calque = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
-    for particule in particules:
-        ratio = max(0.0, min(1.0, particule.temps_restant / particule.duree_totale))
-        alpha = int(255 * ratio)
-        rayon = max(1, int(particule.taille * (0.6 + 0.4 * ratio)))
-        pygame.draw.circle(
-            calque,
-            (particule.couleur[0], particule.couleur[1], particule.couleur[2], alpha),
-            (int(particule.position_x), int(particule.position_y)),
-            rayon,
-        )
-    surface.blit(calque, (0, 0))
+    abscisses, ordonnees, rayons, opacites, couleurs = (
+        importer_particules().calculer_rendu_particules(particules)
+    )
+    gauche = min(abscisse - rayon for abscisse, rayon in zip(abscisses, rayons))
+    haut = min(ordonnee - rayon for ordonnee, rayon in zip(ordonnees, rayons))
+    rectangle = pygame.Rect(
+        gauche,
+        haut,
+        max(abscisse + rayon for abscisse, rayon in zip(abscisses, rayons)) - gauche + 1,
+        max(ordonnee + rayon for ordonnee, rayon in zip(ordonnees, rayons)) - haut + 1,
+    ).clip(surface.get_rect())
+    if rectangle.width <= 0 or rectangle.height <= 0:
+        return None
+
+    calque = pygame.Surface(rectangle.size, pygame.SRCALPHA)
+    for abscisse, ordonnee, rayon, opacite, couleur in zip(
+        abscisses, ordonnees, rayons, opacites, couleurs
+    ):
+        couleur_particule = (couleur[0], couleur[1], couleur[2], opacite)
+        centre = (abscisse - rectangle.x, ordonnee - rectangle.y)
+        pygame.draw.circle(calque, couleur_particule, centre, rayon)
+    surface.blit(calque, rectangle)
+    return rectangle
 
 
-def appliquer_flash_ecran(surface: pygame.Surface, etat_feedback: EtatFeedbackCombat) -> None:
+def appliquer_flash_ecran(surface: pygame.Surface, etat_feedback: EtatFeedbackCombat) -> bool:
     """Applique un flash ecran decroissant.
 
     Args:
@@ -689,16 +770,16 @@ def appliquer_flash_ecran(surface: pygame.Surface, etat_feedback: EtatFeedbackCo
         etat_feedback: Etat des effets de combat.
 
     Returns:
-        None.
+        True si un flash a ete dessine sur tout l ecran.
     """
 
     if etat_feedback.flash_restant <= 0.0 or etat_feedback.flash_intensite_max <= 0.0:
-        return
+        return False
 
     ratio = etat_feedback.flash_restant / DUREE_FLASH_IMPACT_SECONDES
     alpha = int(max(0.0, min(255.0, etat_feedback.flash_intensite_max * ratio)))
     if alpha <= 0:
-        return
+        return False
 
     calque = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
     calque.fill(
@@ -710,103 +791,289 @@ def appliquer_flash_ecran(surface: pygame.Surface, etat_feedback: EtatFeedbackCo
         )
     )
     surface.blit(calque, (0, 0))
+    return True
 
 
-def mettre_a_jour_feedback_combat(etat_feedback: EtatFeedbackCombat, delta_temps: float) -> None:
-    """Met a jour les timers des effets temporaires de combat.
+def marquer_zones_sales(suivi: SuiviRectanglesSales, *rectangles: pygame.Rect | None) -> None:
+    """Ajoute des zones modifiees a l image courante.
 
     Args:
-        etat_feedback: Etat des feedbacks.
-        delta_temps: Delta temps en secondes.
+        suivi: Suivi des rectangles sales.
+        rectangles: Zones modifiees; les valeurs None sont ignorees.
 
     Returns:
         None.
     """
 
-    etat_feedback.gel_restant = max(0.0, etat_feedback.gel_restant - delta_temps)
-    etat_feedback.flash_restant = max(0.0, etat_feedback.flash_restant - delta_temps)
-    if etat_feedback.flash_restant <= 0.0:
-        etat_feedback.flash_intensite_max = 0.0
+    suivi.rectangles.extend(rectangle for rectangle in rectangles if rectangle is not None)
 
 
-def vider_feedback_combat(etat_feedback: EtatFeedbackCombat, particules: list[ParticuleImpact]) -> None:
-    """Reinitialise tous les feedbacks visuels de combat.
+def marquer_plein_ecran(suivi: SuiviRectanglesSales) -> None:
+    """Signale que l image courante modifie tout l ecran.
 
     Args:
-        etat_feedback: Etat des feedbacks.
-        particules: Liste des particules.
+        suivi: Suivi des rectangles sales.
 
     Returns:
         None.
     """
 
-    etat_feedback.gel_restant = 0.0
-    etat_feedback.flash_restant = 0.0
-    etat_feedback.flash_intensite_max = 0.0
-    particules.clear()
+    suivi.plein_ecran = True
 
 
-def reinitialiser_etat_arene_neon(etat_arene: EtatAreneNeon) -> None:
-    """Remet a zero l etat anime de l arene neon.
+def preparer_presentation(
+    suivi: SuiviRectanglesSales,
+    rectangle_ecran: pygame.Rect,
+) -> List[pygame.Rect] | None:
+    """Calcule les zones a pousser a l ecran puis passe a l image suivante.
 
     Args:
-        etat_arene: Etat visuel de l arene.
+        suivi: Suivi des rectangles sales.
+        rectangle_ecran: Rectangle couvrant la surface d affichage.
 
     Returns:
-        None.
+        Zones a transmettre a display.update, ou None pour un flip complet.
     """
 
-    etat_arene.phase_animation = 0.0
-    etat_arene.energie_impact = 0.0
+    presentation_complete = not suivi.actif or suivi.plein_ecran or suivi.plein_ecran_precedent
+    zones = None
+    if not presentation_complete:
+        zones_candidates = suivi.rectangles_precedents + suivi.rectangles
+        zones = [
+            zone
+            for zone in (rectangle.clip(rectangle_ecran) for rectangle in zones_candidates)
+            if zone.width > 0 and zone.height > 0
+        ]
 
+    suivi.rectangles_precedents = suivi.rectangles
+    suivi.rectangles = []
+    suivi.plein_ecran_precedent = suivi.plein_ecran
+    suivi.plein_ecran = False
+    return zones
 
-def reinitialiser_style_pour_manche(etat_style: EtatStyleJoueur) -> None:
-    """Reinitialise l etat style volatile au debut d une manche.
+
+def mettre_a_jour_feedback_combat(etat_feedback: EtatFeedbackCombat, delta_temps: float) -> None:
+    """Met a jour les timers des effets temporaires de combat.
 
     Args:
-        etat_style: Etat style du joueur.
+        etat_feedback: Etat des feedbacks.
+        delta_temps: Delta temps en secondes.
 
     Returns:
         None.
     """
 
-    etat_style.combo_courant = 0
-    etat_style.temps_combo_restant = 0.0
-    etat_style.cooldown_esquive_restant = 0.0
-    etat_style.dans_zone_danger = False
-    etat_style.dernier_message = ""
-    etat_style.temps_message_restant = 0.0
+    etat_feedback.gel_restant = max(0.0, etat_feedback.gel_restant - delta_temps)
+    etat_feedback.flash_restant = max(0.0, etat_feedback.flash_restant - delta_temps)
+    if etat_feedback.flash_restant <= 0.0:
+        etat_feedback.flash_intensite_max = 0.0
 
 
-def dessiner_texte(
-    surface: pygame.Surface,
-    police: pygame.font.Font,
-    texte: str,
-    couleur: Tuple[int, int, int],
-    position: Tuple[float, float],
-    centrer: bool = True,
+def declencher_effets_pas(
+    etat_feedback: EtatFeedbackCombat,
+    particules: PoolParticules | None,
+    etat_arene: EtatAreneNeon,
+    parametres_arene: ParametresAreneNeon,
+    banque_audio: BanqueAudio,
+    joueur: Joueur,
+    adversaire: Joueur,
+    evenements: EvenementsJoueur,
+    centre_x: float,
+    centre_y: float,
+    en_manche: bool,
+    generateur: random.Random | None = None,
 ) -> None:
-    """Dessine un texte avec alignement optionnel centre.
+    """Joue sons et effets des actions reussies par un joueur pendant un pas.
 
     Args:
-        surface: Surface cible.
-        police: Police a utiliser.
-        texte: Contenu texte.
-        couleur: Couleur RGB.
-        position: Position cible.
-        centrer: Active le centrage.
-
-    Returns:
+        etat_feedback: Etat temporaire des effets combat.
+        particules: Pool des particules actives, ou None.
+        etat_arene: Etat de l arene neon.
+        parametres_arene: Parametres de l arene neon.
+        banque_audio: Banque des sons.
+        joueur: Joueur acteur.
+        adversaire: Joueur adverse.
+        evenements: Evenements du joueur rendus par ``avancer_pas_manche``.
+        centre_x: Centre X de l arene.
+        centre_y: Centre Y de l arene.
+        en_manche: False en mode attract (pas d effet de sauvetage).
+        generateur: Generateur du match pour les particules (defaut: module random).
+
+    Returns:
+        None.
+    """
+
+    if evenements.dash:
+        jouer_son_banque(banque_audio, "dash")
+        declencher_feedback_impact(
+            etat_feedback,
+            particules,
+            joueur.position_x - joueur.direction_x * joueur.rayon * 0.6,
+            joueur.position_y - joueur.direction_y * joueur.rayon * 0.6,
+            -joueur.direction_x,
+            -joueur.direction_y,
+            COULEUR_PARTICULE_DASH,
+            COULEUR_FLASH_DASH,
+            INTENSITE_FLASH_DASH,
+            NOMBRE_PARTICULES_DASH,
+            generateur=generateur,
+        )
+        declencher_reaction_arene_neon(etat_arene, parametres_arene.gain_impact_dash)
+        if evenements.esquive:
+            declencher_feedback_impact(
+                etat_feedback,
+                particules,
+                joueur.position_x,
+                joueur.position_y,
+                joueur.vitesse_x,
+                joueur.vitesse_y,
+                COULEUR_PARTICULE_DASH,
+                COULEUR_FLASH_DASH,
+                INTENSITE_FLASH_DASH * 0.8,
+                NOMBRE_PARTICULES_DASH,
+                generateur=generateur,
+            )
+
+    if evenements.bump:
+        jouer_son_banque(banque_audio, "bump")
+        declencher_feedback_impact(
+            etat_feedback,
+            particules,
+            adversaire.position_x,
+            adversaire.position_y,
+            adversaire.position_x - joueur.position_x,
+            adversaire.position_y - joueur.position_y,
+            COULEUR_PARTICULE_BUMP,
+            COULEUR_FLASH_BUMP,
+            INTENSITE_FLASH_BUMP,
+            NOMBRE_PARTICULES_BUMP,
+            generateur=generateur,
+        )
+        declencher_reaction_arene_neon(etat_arene, parametres_arene.gain_impact_bump)
+
+    if evenements.bouclier:
+        jouer_son_banque(banque_audio, "bouclier")
+
+    if evenements.ultime:
+        jouer_son_banque(banque_audio, "ultime")
+        declencher_feedback_impact(
+            etat_feedback,
+            particules,
+            joueur.position_x,
+            joueur.position_y,
+            adversaire.position_x - joueur.position_x,
+            adversaire.position_y - joueur.position_y,
+            COULEUR_PARTICULE_ULTIME,
+            COULEUR_FLASH_ULTIME,
+            INTENSITE_FLASH_ULTIME,
+            NOMBRE_PARTICULES_ULTIME,
+            multiplicateur_vitesse=1.2,
+            generateur=generateur,
+        )
+        declencher_reaction_arene_neon(etat_arene, parametres_arene.gain_impact_ultime)
+
+    if en_manche and evenements.sauvetage:
+        declencher_feedback_impact(
+            etat_feedback,
+            particules,
+            joueur.position_x,
+            joueur.position_y,
+            centre_x - joueur.position_x,
+            centre_y - joueur.position_y,
+            COULEUR_PARTICULE_ULTIME,
+            COULEUR_FLASH_DASH,
+            INTENSITE_FLASH_DASH,
+            NOMBRE_PARTICULES_DASH,
+            generateur=generateur,
+        )
+        declencher_reaction_arene_neon(etat_arene, parametres_arene.gain_impact_bump)
+
+
+def vider_feedback_combat(
+    etat_feedback: EtatFeedbackCombat,
+    particules: PoolParticules | None,
+) -> None:
+    """Reinitialise tous les feedbacks visuels de combat.
+
+    Args:
+        etat_feedback: Etat des feedbacks.
+        particules: Pool des particules, ou None.
+
+    Returns:
+        None.
+    """
+
+    etat_feedback.gel_restant = 0.0
+    etat_feedback.flash_restant = 0.0
+    etat_feedback.flash_intensite_max = 0.0
+    if particules is not None:
+        importer_particules().vider_pool_particules(particules)
+
+
+def reinitialiser_etat_arene_neon(etat_arene: EtatAreneNeon) -> None:
+    """Remet a zero l etat anime de l arene neon.
+
+    Args:
+        etat_arene: Etat visuel de l arene.
+
+    Returns:
         None.
     """
 
-    rendu = police.render(texte, True, couleur)
+    etat_arene.phase_animation = 0.0
+    etat_arene.energie_impact = 0.0
+
+
+@lru_cache(maxsize=TAILLE_CACHE_TEXTES)
+def rendre_texte(
+    police: pygame.font.Font,
+    texte: str,
+    couleur: Tuple[int, int, int],
+) -> pygame.Surface:
+    """Rend un texte une seule fois et le conserve en cache LRU.
+
+    Args:
+        police: Police a utiliser.
+        texte: Contenu texte.
+        couleur: Couleur RGB.
+
+    Returns:
+        Surface du texte rendu, partagee entre les appels.
+    """
+
+    return police.render(texte, True, couleur)
+
+
+def dessiner_texte(
+    surface: pygame.Surface,
+    police: pygame.font.Font,
+    texte: str,
+    couleur: Tuple[int, int, int],
+    position: Tuple[float, float],
+    centrer: bool = True,
+) -> pygame.Rect:
+    """Dessine un texte avec alignement optionnel centre.
+
+    Args:
+        surface: Surface cible.
+        police: Police a utiliser.
+        texte: Contenu texte.
+        couleur: Couleur RGB.
+        position: Position cible.
+        centrer: Active le centrage.
+
+    Returns:
+        Rectangle ecran occupe par le texte.
+    """
+
+    rendu = rendre_texte(police, texte, tuple(couleur))
     rectangle = rendu.get_rect()
     if centrer:
         rectangle.center = (int(position[0]), int(position[1]))
     else:
         rectangle.topleft = (int(position[0]), int(position[1]))
     surface.blit(rendu, rectangle)
+    return rectangle
 
 
 def borner_opacite(opacite: float) -> int:
@@ -822,33 +1089,36 @@ def borner_opacite(opacite: float) -> int:
     return max(OPACITE_SURFACE_MENU_TITRE_MIN, min(OPACITE_SURFACE_MENU_TITRE_MAX, int(opacite)))
 
 
-def dessiner_texte_neon(
-    surface: pygame.Surface,
+@lru_cache(maxsize=TAILLE_CACHE_SPRITES_TEXTE_NEON)
+def rendre_sprite_texte_neon(
     police: pygame.font.Font,
     texte: str,
     couleur_texte: Tuple[int, int, int],
     couleur_glow: Tuple[int, int, int],
-    position: Tuple[float, float],
     rayon_glow: int,
-) -> None:
-    """Dessine un texte avec halo neon multi-couches.
+) -> pygame.Surface:
+    """Compose une fois le texte neon et son halo dans un sprite ajuste.
+
+    Le sprite couvre uniquement la boite englobante du texte elargie du
+    rayon de halo; il est conserve en cache LRU.
 
     Args:
-        surface: Surface cible.
         police: Police de rendu.
         texte: Texte a dessiner.
         couleur_texte: Couleur du texte principal.
         couleur_glow: Couleur du halo.
-        position: Position centre du texte.
         rayon_glow: Rayon du halo en pixels.
 
     Returns:
-        None.
+        Surface SRCALPHA contenant halo et texte.
     """
 
     rendu_texte = police.render(texte, True, couleur_texte)
-    rectangle_texte = rendu_texte.get_rect(center=(int(position[0]), int(position[1])))
-    calque_glow = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+    largeur_texte, hauteur_texte = rendu_texte.get_size()
+    marge = max(0, rayon_glow)
+    sprite = pygame.Surface((largeur_texte + 2 * marge, hauteur_texte + 2 * marge), pygame.SRCALPHA)
+    centre_x = marge + largeur_texte // 2
+    centre_y = marge + hauteur_texte // 2
 
     for couche in range(rayon_glow, 0, -1):
         opacite = borner_opacite(210 / max(1, couche))
@@ -864,13 +1134,220 @@ def dessiner_texte_neon(
             (couche, -couche),
             (couche, couche),
         ):
-            rectangle_glow = rendu_glow.get_rect(
-                center=(int(position[0] + decalage_x), int(position[1] + decalage_y))
+            sprite.blit(rendu_glow, rendu_glow.get_rect(center=(centre_x + decalage_x, centre_y + decalage_y)))
+
+    sprite.blit(rendu_texte, rendu_texte.get_rect(center=(centre_x, centre_y)))
+    return sprite
+
+
+def dessiner_texte_neon(
+    surface: pygame.Surface,
+    police: pygame.font.Font,
+    texte: str,
+    couleur_texte: Tuple[int, int, int],
+    couleur_glow: Tuple[int, int, int],
+    position: Tuple[float, float],
+    rayon_glow: int,
+) -> None:
+    """Dessine un texte avec halo neon multi-couches.
+
+    Args:
+        surface: Surface cible.
+        police: Police de rendu.
+        texte: Texte a dessiner.
+        couleur_texte: Couleur du texte principal.
+        couleur_glow: Couleur du halo.
+        position: Position centre du texte.
+        rayon_glow: Rayon du halo en pixels.
+
+    Returns:
+        None.
+    """
+
+    sprite = rendre_sprite_texte_neon(police, texte, tuple(couleur_texte), tuple(couleur_glow), rayon_glow)
+    surface.blit(sprite, sprite.get_rect(center=(int(position[0]), int(position[1]))))
+
+
+def melanger_couleurs(
+    couleur_avant: Tuple[int, int, int],
+    couleur_arriere: Tuple[int, int, int],
+    opacite: int,
+) -> Tuple[int, int, int]:
+    """Calcule la couleur opaque d un trace alpha sur un fond uni.
+
+    Args:
+        couleur_avant: Couleur du trace.
+        couleur_arriere: Couleur unie sous le trace.
+        opacite: Opacite alpha du trace (0..255).
+
+    Returns:
+        Couleur RGB resultante.
+    """
+
+    return tuple(
+        arriere + ((avant - arriere) * opacite) // 255
+        for avant, arriere in zip(couleur_avant, couleur_arriere)
+    )
+
+
+def calculer_rectangle_cadre_menu(largeur: int, hauteur: int) -> pygame.Rect:
+    """Calcule le cadre principal du menu titre.
+
+    Args:
+        largeur: Largeur fenetre.
+        hauteur: Hauteur fenetre.
+
+    Returns:
+        Rectangle du cadre.
+    """
+
+    return pygame.Rect(
+        MARGE_CADRE_MENU_TITRE,
+        MARGE_CADRE_MENU_TITRE,
+        largeur - 2 * MARGE_CADRE_MENU_TITRE,
+        hauteur - 2 * MARGE_CADRE_MENU_TITRE,
+    )
+
+
+def calculer_rectangle_carte_controles(largeur: int, hauteur: int) -> pygame.Rect:
+    """Calcule le panneau des controles du menu titre.
+
+    Args:
+        largeur: Largeur fenetre.
+        hauteur: Hauteur fenetre.
+
+    Returns:
+        Rectangle du panneau.
+    """
+
+    return pygame.Rect(
+        MARGE_CADRE_MENU_TITRE + MARGE_CONTENU_MENU_TITRE,
+        int(hauteur * 0.56),
+        largeur - 2 * (MARGE_CADRE_MENU_TITRE + MARGE_CONTENU_MENU_TITRE),
+        HAUTEUR_CARTE_CONTROLES,
+    )
+
+
+def preparer_cache_menu_titre(
+    cache: CacheMenuTitre,
+    largeur: int,
+    hauteur: int,
+    parametres_menu_titre: ParametresMenuTitre,
+    couleur_fond: Tuple[int, int, int],
+) -> None:
+    """Pre-rend les calques statiques du menu titre si la cle a change.
+
+    Args:
+        cache: Cache a mettre a jour.
+        largeur: Largeur fenetre.
+        hauteur: Hauteur fenetre.
+        parametres_menu_titre: Parametres graphiques du menu.
+        couleur_fond: Couleur de fond de l ecran.
+
+    Returns:
+        None.
+    """
+
+    cle = (largeur, hauteur, astuple(parametres_menu_titre), tuple(couleur_fond))
+    if cache.cle == cle:
+        return
+
+    couleur_voile = (4, 12, 34)
+    opacite_voile = borner_opacite(parametres_menu_titre.opacite_voile)
+    fond_statique = pygame.Surface((largeur, hauteur))
+    fond_statique.fill(tuple(couleur_fond))
+    calque_voile = pygame.Surface((largeur, hauteur), pygame.SRCALPHA)
+    calque_voile.fill((*couleur_voile, opacite_voile))
+    fond_statique.blit(calque_voile, (0, 0))
+    pygame.draw.rect(
+        fond_statique,
+        COULEUR_MENU_TITRE_CARTE,
+        calculer_rectangle_cadre_menu(largeur, hauteur),
+        border_radius=RAYON_CADRE_MENU_TITRE,
+    )
+
+    couleur_sous_grille = melanger_couleurs(couleur_voile, tuple(couleur_fond), opacite_voile)
+    nombre_lignes = max(4, parametres_menu_titre.nombre_lignes_grille)
+    lignes_grille = []
+    for index_ligne in range(nombre_lignes):
+        ratio = index_ligne / max(1, nombre_lignes - 1)
+        couleur_ligne = (40 + int(70 * ratio), 130 + int(80 * (1.0 - ratio)), 255)
+        opacite_ligne = borner_opacite(56 + 90 * (1.0 - ratio))
+        lignes_grille.append(
+            (
+                int(hauteur * 0.22 + ratio * hauteur * 0.56),
+                melanger_couleurs(couleur_ligne, couleur_sous_grille, opacite_ligne),
             )
-            calque_glow.blit(rendu_glow, rectangle_glow)
+        )
+
+    rectangle_carte = calculer_rectangle_carte_controles(largeur, hauteur)
+    rectangle_local = pygame.Rect(0, 0, rectangle_carte.width, rectangle_carte.height)
+    carte_controles = pygame.Surface(rectangle_carte.size, pygame.SRCALPHA)
+    pygame.draw.rect(carte_controles, (12, 28, 56, 184), rectangle_local, border_radius=18)
+    # La bordure remplace le fond du panneau: ses pixels sont evides du sprite de fond.
+    pygame.draw.rect(
+        carte_controles,
+        (0, 0, 0, 0),
+        rectangle_local,
+        width=LARGEUR_BORD_PANNEAU_CONTROLES,
+        border_radius=18,
+    )
+    bord_carte_controles = pygame.Surface(rectangle_carte.size, pygame.SRCALPHA)
+    pygame.draw.rect(
+        bord_carte_controles,
+        COULEUR_MENU_TITRE_BORD,
+        rectangle_local,
+        width=LARGEUR_BORD_PANNEAU_CONTROLES,
+        border_radius=18,
+    )
+
+    cache.cle = cle
+    cache.fond_statique = fond_statique
+    cache.lignes_grille = lignes_grille
+    cache.carte_controles = carte_controles
+    cache.bord_carte_controles = bord_carte_controles
+    cache.anneaux = {}
+    cache.reconstructions += 1
+
+
+def obtenir_sprite_anneau(cache: CacheMenuTitre, rayon: int) -> pygame.Surface:
+    """Retourne le sprite opaque d un anneau du menu, rendu a la demande.
+
+    Args:
+        cache: Cache du menu titre.
+        rayon: Rayon de l anneau en pixels.
+
+    Returns:
+        Surface SRCALPHA de cote 2 * rayon + 1.
+    """
 
-    surface.blit(calque_glow, (0, 0))
-    surface.blit(rendu_texte, rectangle_texte)
+    sprite = cache.anneaux.get(rayon)
+    if sprite is None:
+        sprite = pygame.Surface((2 * rayon + 1, 2 * rayon + 1), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, COULEUR_MENU_TITRE_BORD, (rayon, rayon), rayon, width=2)
+        cache.anneaux[rayon] = sprite
+    return sprite
+
+
+def prechauffer_anneaux_menu_titre(
+    cache: CacheMenuTitre,
+    parametres_menu_titre: ParametresMenuTitre,
+) -> None:
+    """Rend d avance tous les rayons que l animation des anneaux peut atteindre.
+
+    Args:
+        cache: Cache du menu titre.
+        parametres_menu_titre: Parametres graphiques du menu.
+
+    Returns:
+        None.
+    """
+
+    ecart = int(ceil(parametres_menu_titre.amplitude_oscillation * 0.35))
+    for index_anneau in range(3):
+        rayon_moyen = 96 + index_anneau * 38
+        for rayon in range(rayon_moyen - ecart, rayon_moyen + ecart + 1):
+            obtenir_sprite_anneau(cache, rayon)
 
 
 def dessiner_menu_titre_neon(
@@ -882,9 +1359,15 @@ def dessiner_menu_titre_neon(
     police_titre: pygame.font.Font,
     police_sous_titre: pygame.font.Font,
     police_info: pygame.font.Font,
+    cache: CacheMenuTitre,
+    couleur_fond: Tuple[int, int, int],
 ) -> None:
     """Dessine le menu titre dans un style neon anime.
 
+    Le fond, le voile et le cadre sont pre-rendus dans ``cache``; seuls
+    les segments visibles de la grille, les bordures et les anneaux sont
+    animes a chaque image.
+
     Args:
         surface: Surface cible.
         largeur: Largeur fenetre.
@@ -894,67 +1377,58 @@ def dessiner_menu_titre_neon(
         police_titre: Police du titre principal.
         police_sous_titre: Police du sous-titre.
         police_info: Police des informations.
+        cache: Calques pre-rendus du menu.
+        couleur_fond: Couleur de fond de l ecran.
 
     Returns:
         None.
     """
 
-    calque_voile = pygame.Surface((largeur, hauteur), pygame.SRCALPHA)
-    calque_voile.fill((4, 12, 34, borner_opacite(parametres_menu_titre.opacite_voile)))
-    surface.blit(calque_voile, (0, 0))
+    preparer_cache_menu_titre(cache, largeur, hauteur, parametres_menu_titre, couleur_fond)
+    surface.blit(cache.fond_statique, (0, 0))
 
     centre_x = largeur / 2.0
     centre_y = hauteur / 2.0
     vitesse = parametres_menu_titre.vitesse_animation
     amplitude = parametres_menu_titre.amplitude_oscillation
+    rectangle_cadre = calculer_rectangle_cadre_menu(largeur, hauteur)
 
-    nombre_lignes = max(4, parametres_menu_titre.nombre_lignes_grille)
-    calque_grille = pygame.Surface((largeur, hauteur), pygame.SRCALPHA)
-    for index_ligne in range(nombre_lignes):
+    # Le cadre opaque masque la grille: seuls les debords lateraux sont traces.
+    nombre_lignes = len(cache.lignes_grille)
+    epaisseur_grille = max(1, parametres_menu_titre.epaisseur_lignes_grille)
+    for index_ligne, (ordonnee, couleur_ligne) in enumerate(cache.lignes_grille):
         ratio = index_ligne / max(1, nombre_lignes - 1)
-        ordonnee = int(hauteur * 0.22 + ratio * hauteur * 0.56)
         oscillation = sin(phase_animation * vitesse + ratio * 4.2) * amplitude
-        couleur_ligne = (
-            40 + int(70 * ratio),
-            130 + int(80 * (1.0 - ratio)),
-            255,
-            borner_opacite(56 + 90 * (1.0 - ratio)),
-        )
-        pygame.draw.line(
-            calque_grille,
-            couleur_ligne,
-            (int(MARGE_BORD_MENU_TITRE + oscillation), ordonnee),
-            (int(largeur - MARGE_BORD_MENU_TITRE - oscillation), ordonnee),
-            width=max(1, parametres_menu_titre.epaisseur_lignes_grille),
-        )
-    surface.blit(calque_grille, (0, 0))
-
-    largeur_cadre = largeur - 2 * MARGE_CADRE_MENU_TITRE
-    hauteur_cadre = hauteur - 2 * MARGE_CADRE_MENU_TITRE
-    rectangle_cadre = pygame.Rect(MARGE_CADRE_MENU_TITRE, MARGE_CADRE_MENU_TITRE, largeur_cadre, hauteur_cadre)
-    rayon_cadre = 26
-    pygame.draw.rect(surface, COULEUR_MENU_TITRE_CARTE, rectangle_cadre, border_radius=rayon_cadre)
+        abscisse_debut = int(MARGE_BORD_MENU_TITRE + oscillation)
+        abscisse_fin = int(largeur - MARGE_BORD_MENU_TITRE - oscillation)
+        if abscisse_debut < rectangle_cadre.left:
+            pygame.draw.line(
+                surface,
+                couleur_ligne,
+                (abscisse_debut, ordonnee),
+                (min(abscisse_fin, rectangle_cadre.left - 1), ordonnee),
+                width=epaisseur_grille,
+            )
+        if abscisse_fin >= rectangle_cadre.right:
+            pygame.draw.line(
+                surface,
+                couleur_ligne,
+                (max(abscisse_debut, rectangle_cadre.right), ordonnee),
+                (abscisse_fin, ordonnee),
+                width=epaisseur_grille,
+            )
 
     epaisseur_bord = 3
     pulsation = 0.55 + 0.45 * sin(phase_animation * vitesse * 2.4)
     opacite_bord_primaire = borner_opacite(110 + pulsation * 120)
-    opacite_bord_secondaire = borner_opacite(90 + (1.0 - pulsation) * 80)
-    couleur_bord_primaire = (
-        COULEUR_MENU_TITRE_BORD[0],
-        COULEUR_MENU_TITRE_BORD[1],
-        COULEUR_MENU_TITRE_BORD[2],
-        opacite_bord_primaire,
-    )
-    couleur_bord_secondaire = (
-        COULEUR_MENU_TITRE_BORD_SECONDAIRE[0],
-        COULEUR_MENU_TITRE_BORD_SECONDAIRE[1],
-        COULEUR_MENU_TITRE_BORD_SECONDAIRE[2],
-        opacite_bord_secondaire,
+    # Le trace primaire recouvre le liseret secondaire du rendu historique.
+    pygame.draw.rect(
+        surface,
+        melanger_couleurs(COULEUR_MENU_TITRE_BORD, COULEUR_MENU_TITRE_CARTE, opacite_bord_primaire),
+        rectangle_cadre,
+        width=epaisseur_bord,
+        border_radius=RAYON_CADRE_MENU_TITRE,
     )
-    calque_bord = pygame.Surface((largeur, hauteur), pygame.SRCALPHA)
-    pygame.draw.rect(calque_bord, couleur_bord_secondaire, rectangle_cadre, width=1, border_radius=rayon_cadre)
-    pygame.draw.rect(calque_bord, couleur_bord_primaire, rectangle_cadre, width=epaisseur_bord, border_radius=rayon_cadre)
-    surface.blit(calque_bord, (0, 0))
 
     for index_anneau in range(3):
         rayon = int(
@@ -962,21 +1436,9 @@ def dessiner_menu_titre_neon(
             + index_anneau * 38
             + sin(phase_animation * vitesse * 1.6 + index_anneau * 1.7) * (amplitude * 0.35)
         )
-        opacite_anneau = borner_opacite(70 - index_anneau * 12 + pulsation * 44)
-        calque_anneau = pygame.Surface((largeur, hauteur), pygame.SRCALPHA)
-        pygame.draw.circle(
-            calque_anneau,
-            (
-                COULEUR_MENU_TITRE_BORD[0],
-                COULEUR_MENU_TITRE_BORD[1],
-                COULEUR_MENU_TITRE_BORD[2],
-                opacite_anneau,
-            ),
-            (int(centre_x), int(centre_y - 84)),
-            rayon,
-            width=2,
-        )
-        surface.blit(calque_anneau, (0, 0))
+        sprite_anneau = obtenir_sprite_anneau(cache, rayon)
+        sprite_anneau.set_alpha(borner_opacite(70 - index_anneau * 12 + pulsation * 44))
+        surface.blit(sprite_anneau, (int(centre_x) - rayon, int(centre_y - 84) - rayon))
 
     dessiner_texte_neon(
         surface,
@@ -997,38 +1459,15 @@ def dessiner_menu_titre_neon(
         rayon_glow=2,
     )
 
-    largeur_carte = largeur - 2 * (MARGE_CADRE_MENU_TITRE + MARGE_CONTENU_MENU_TITRE)
-    rectangle_carte = pygame.Rect(
-        MARGE_CADRE_MENU_TITRE + MARGE_CONTENU_MENU_TITRE,
-        int(hauteur * 0.56),
-        largeur_carte,
-        HAUTEUR_CARTE_CONTROLES,
-    )
-    calque_carte = pygame.Surface((largeur, hauteur), pygame.SRCALPHA)
-    pygame.draw.rect(
-        calque_carte,
-        (12, 28, 56, 184),
-        rectangle_carte,
-        border_radius=18,
-    )
-    pygame.draw.rect(
-        calque_carte,
-        (
-            COULEUR_MENU_TITRE_BORD[0],
-            COULEUR_MENU_TITRE_BORD[1],
-            COULEUR_MENU_TITRE_BORD[2],
-            borner_opacite(160 + pulsation * 54),
-        ),
-        rectangle_carte,
-        width=LARGEUR_BORD_PANNEAU_CONTROLES,
-        border_radius=18,
-    )
-    surface.blit(calque_carte, (0, 0))
+    rectangle_carte = calculer_rectangle_carte_controles(largeur, hauteur)
+    surface.blit(cache.carte_controles, rectangle_carte)
+    cache.bord_carte_controles.set_alpha(borner_opacite(160 + pulsation * 54))
+    surface.blit(cache.bord_carte_controles, rectangle_carte)
 
     dessiner_texte(
         surface,
         police_info,
-        "B1: Start match   |   B6: Retour menu",
+        "B1: Duel   |   B3: Solo vs IA   |   B4: Melee   |   B6: Retour menu",
         COULEUR_MENU_TITRE_TEXTE,
         (centre_x, rectangle_carte.y + DECALAGE_CARTE_CONTROLES),
     )
@@ -1082,21 +1521,72 @@ def dessiner_arene(
     pygame.draw.circle(surface, couleur_danger, centre, int(rayon_danger), 3)
 
 
-def declencher_reaction_arene_neon(etat_arene: EtatAreneNeon, gain_energie: float) -> None:
-    """Augmente temporairement l energie d impact de l arene.
+def calculer_rectangles_couronne_arene(
+    centre_x: float,
+    centre_y: float,
+    rayon: float,
+    largeur_danger: float,
+    parametres_arene: ParametresAreneNeon,
+) -> List[pygame.Rect]:
+    """Couvre la couronne animee de l arene par quatre bandes.
+
+    Le carre inscrit dans le cercle danger ne contient que le fond uni de
+    l arene: il est exclu, les joueurs et particules ayant leurs propres zones.
 
     Args:
-        etat_arene: Etat visuel courant de l arene.
-        gain_energie: Gain d energie a appliquer.
+        centre_x: Centre X de l arene.
+        centre_y: Centre Y de l arene.
+        rayon: Rayon principal de l arene.
+        largeur_danger: Largeur de la couronne danger.
+        parametres_arene: Parametres visuels de l arene.
 
     Returns:
-        None.
+        Bandes haut, bas, gauche et droite (ou un seul carre si l arene est petite).
     """
 
-    etat_arene.energie_impact = max(0.0, min(1.0, etat_arene.energie_impact + max(0.0, gain_energie)))
+    # Les lignes electriques s allongent jusqu a 1.5x sur impact et oscillent du jitter.
+    debord_lignes = 2.0 + parametres_arene.longueur_lignes_max * 1.5
+    debord_lignes += abs(parametres_arene.amplitude_jitter_lignes)
+    debord = max(debord_lignes, 2.0 * (NOMBRE_COUCHES_GLOW_NEON - 1))
+    rayon_exterieur = int(rayon + debord) + 2
+    centre = (int(centre_x), int(centre_y))
+    exterieur = pygame.Rect(
+        centre[0] - rayon_exterieur,
+        centre[1] - rayon_exterieur,
+        2 * rayon_exterieur + 1,
+        2 * rayon_exterieur + 1,
+    )
+    rayon_interieur = min(rayon - 6.0, max(8.0, rayon - largeur_danger) - 3.0) - 1.0
+    demi_cote = int(rayon_interieur / sqrt(2.0)) - 1
+    if demi_cote <= 0:
+        return [exterieur]
+
+    cote = 2 * demi_cote + 1
+    interieur = pygame.Rect(centre[0] - demi_cote, centre[1] - demi_cote, cote, cote)
+    hauteur_bas = exterieur.bottom - interieur.bottom
+    return [
+        pygame.Rect(exterieur.left, exterieur.top, exterieur.width, interieur.top - exterieur.top),
+        pygame.Rect(exterieur.left, interieur.bottom, exterieur.width, hauteur_bas),
+        pygame.Rect(exterieur.left, interieur.top, interieur.left - exterieur.left, cote),
+        pygame.Rect(interieur.right, interieur.top, exterieur.right - interieur.right, cote),
+    ]
 
 
-def mettre_a_jour_arene_neon(
+def declencher_reaction_arene_neon(etat_arene: EtatAreneNeon, gain_energie: float) -> None:
+    """Augmente temporairement l energie d impact de l arene.
+
+    Args:
+        etat_arene: Etat visuel courant de l arene.
+        gain_energie: Gain d energie a appliquer.
+
+    Returns:
+        None.
+    """
+
+    etat_arene.energie_impact = max(0.0, min(1.0, etat_arene.energie_impact + max(0.0, gain_energie)))
+
+
+def mettre_a_jour_arene_neon(
     etat_arene: EtatAreneNeon,
     parametres_arene: ParametresAreneNeon,
     delta_temps: float,
@@ -1119,6 +1609,143 @@ def mettre_a_jour_arene_neon(
     )
 
 
+def rendre_anneau_glow_arene(
+    rayon: int,
+    couleur: Tuple[int, int, int],
+) -> Tuple[pygame.Surface, Tuple[pygame.Rect, ...]]:
+    """Pre-rend les couches du glow neon pour un rayon entier d arene.
+
+    Les couches ont leur opacite maximale; l intensite animee est appliquee
+    au blit par l alpha de surface. Le sprite est surtout transparent: seules
+    ses tuiles non vides sont listees pour le blit.
+
+    Args:
+        rayon: Rayon entier de l arene.
+        couleur: Couleur neon du bord.
+
+    Returns:
+        Surface SRCALPHA de cote 2 * (rayon + debord) + 1, centree sur l arene,
+        et zones non transparentes du sprite.
+    """
+
+    debord = 2 * (NOMBRE_COUCHES_GLOW_NEON - 1)
+    centre = rayon + debord
+    sprite = pygame.Surface((2 * centre + 1, 2 * centre + 1), pygame.SRCALPHA)
+    for index_couche in range(NOMBRE_COUCHES_GLOW_NEON):
+        ratio = 1.0 - (index_couche / max(1, NOMBRE_COUCHES_GLOW_NEON))
+        pygame.draw.circle(
+            sprite,
+            (couleur[0], couleur[1], couleur[2], int(OPACITE_GLOW_NEON_MAX * ratio)),
+            (centre, centre),
+            rayon + index_couche * 2,
+            EPAISSEUR_GLOW_NEON + index_couche * 2,
+        )
+
+    # Par bandes horizontales, la couronne [rayon - epaisseur, rayon + debord] tient
+    # dans un ou deux segments calcules par trigonometrie: le disque interieur,
+    # transparent, n est ni parcouru ni blitte.
+    cote = 2 * centre + 1
+    rayon_trou = rayon - EPAISSEUR_GLOW_NEON - 1
+    zones = []
+    for haut in range(0, cote, HAUTEUR_BANDE_GLOW_ARENE):
+        bas = min(haut + HAUTEUR_BANDE_GLOW_ARENE, cote) - 1
+        ecart_proche = max(haut - centre, 0, centre - bas)
+        ecart_loin = max(abs(haut - centre), abs(bas - centre))
+        demi_largeur = int(sqrt(max(0, (centre + 1) ** 2 - ecart_proche**2))) + 1
+        gauche = max(0, centre - demi_largeur)
+        droite = min(cote - 1, centre + demi_largeur)
+        hauteur_bande = bas - haut + 1
+        if ecart_loin < rayon_trou:
+            demi_trou = int(sqrt(rayon_trou**2 - ecart_loin**2)) - 1
+            if demi_trou > 0:
+                zones.append(pygame.Rect(gauche, haut, centre - demi_trou - gauche, hauteur_bande))
+                largeur_droite = droite - centre - demi_trou
+                zones.append(pygame.Rect(centre + demi_trou + 1, haut, largeur_droite, hauteur_bande))
+                continue
+        zones.append(pygame.Rect(gauche, haut, droite - gauche + 1, hauteur_bande))
+    return sprite, tuple(zones)
+
+
+def obtenir_anneau_glow_arene(
+    cache: CacheAreneNeon,
+    rayon: float,
+    couleur: Tuple[int, int, int],
+) -> Tuple[int, Tuple[Tuple[pygame.Surface, Tuple[int, int]], ...]]:
+    """Retourne le glow du palier de rayon le plus proche, rendu au premier appel.
+
+    Seules les tuiles non vides du sprite sont conservees: un palier pese une
+    couronne, pas un carre de 2 * rayon pixels. En mort subite, le rayon change
+    de palier sans nouveau rendu une fois ``prechauffer_anneaux_glow_arene`` passe.
+
+    Args:
+        cache: Cache de l arene.
+        rayon: Rayon courant de l arene.
+        couleur: Couleur neon du bord.
+
+    Returns:
+        Rayon du palier et tuiles du glow avec leur decalage depuis le coin du sprite.
+    """
+
+    palier = max(1, int(rayon / PAS_RAYON_GLOW_ARENE + 0.5)) * PAS_RAYON_GLOW_ARENE
+    cle = (palier, couleur)
+    tuiles = cache.anneaux_glow.get(cle)
+    if tuiles is None:
+        sprite, zones = rendre_anneau_glow_arene(palier, couleur)
+        tuiles = tuple(
+            (sprite.subsurface(zone).copy(), zone.topleft) for zone in zones if zone.width > 0
+        )
+        cache.anneaux_glow[cle] = tuiles
+    return palier, tuiles
+
+
+def prechauffer_anneaux_glow_arene(
+    cache: CacheAreneNeon,
+    rayon_min: float,
+    rayon_max: float,
+    couleur: Tuple[int, int, int],
+) -> None:
+    """Rend d avance tous les paliers de glow entre deux rayons d arene.
+
+    Args:
+        cache: Cache de l arene.
+        rayon_min: Plus petit rayon atteint par l arene.
+        rayon_max: Rayon de depart de l arene.
+        couleur: Couleur neon du bord.
+
+    Returns:
+        None.
+    """
+
+    palier_min, _ = obtenir_anneau_glow_arene(cache, rayon_min, couleur)
+    palier_max, _ = obtenir_anneau_glow_arene(cache, rayon_max, couleur)
+    for palier in range(palier_min, palier_max, PAS_RAYON_GLOW_ARENE):
+        obtenir_anneau_glow_arene(cache, palier, couleur)
+
+
+@lru_cache(maxsize=4)
+def calculer_geometrie_lignes_electriques(
+    nombre_lignes: int,
+) -> Tuple[Tuple[float, float, float, float], ...]:
+    """Tabule les dephasages fixes de chaque ligne electrique.
+
+    Args:
+        nombre_lignes: Nombre de lignes autour de l arene.
+
+    Returns:
+        Par ligne: angle de base, dephasages de l oscillation d angle, de la longueur et du jitter.
+    """
+
+    return tuple(
+        (
+            index_ligne / max(1, nombre_lignes) * 2.0 * pi,
+            index_ligne * ESPACEMENT_LIGNES_ELECTRIQUES,
+            index_ligne * 1.7,
+            index_ligne * 2.9,
+        )
+        for index_ligne in range(nombre_lignes)
+    )
+
+
 def dessiner_effets_arene_neon(
     surface: pygame.Surface,
     centre_x: float,
@@ -1127,9 +1754,14 @@ def dessiner_effets_arene_neon(
     couleur_bord: Tuple[int, int, int],
     etat_arene: EtatAreneNeon,
     parametres_arene: ParametresAreneNeon,
+    cache: CacheAreneNeon,
 ) -> None:
     """Dessine un faux glow neon et des lignes electriques animees.
 
+    Le glow vient des tuiles du palier de rayon le plus proche
+    (``obtenir_anneau_glow_arene``) et les lignes sont tracees dans le calque
+    persistant de ``cache``.
+
     Args:
         surface: Surface de rendu.
         centre_x: Centre X de l arene.
@@ -1138,77 +1770,86 @@ def dessiner_effets_arene_neon(
         couleur_bord: Couleur neon principale.
         etat_arene: Etat d animation de l arene.
         parametres_arene: Parametres visuels de l arene.
+        cache: Calque des lignes reutilise d une image a l autre.
 
     Returns:
         None.
     """
 
-    centre = (int(centre_x), int(centre_y))
-    calque = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
-    oscillation = 0.5 + 0.5 * sin(etat_arene.phase_animation)
+    phase = etat_arene.phase_animation
+    oscillation = 0.5 + 0.5 * sin(phase)
     intensite = parametres_arene.intensite_glow_base + etat_arene.energie_impact * parametres_arene.intensite_glow_impact
     intensite = max(0.0, min(1.0, intensite))
-
-    for index_couche in range(NOMBRE_COUCHES_GLOW_NEON):
-        ratio = 1.0 - (index_couche / max(1, NOMBRE_COUCHES_GLOW_NEON))
-        alpha = int(OPACITE_GLOW_NEON_MAX * intensite * ratio * (0.65 + 0.35 * oscillation))
-        epaisseur = EPAISSEUR_GLOW_NEON + index_couche * 2
-        if alpha <= 0:
-            continue
-        pygame.draw.circle(
-            calque,
-            (couleur_bord[0], couleur_bord[1], couleur_bord[2], alpha),
-            centre,
-            int(rayon + index_couche * 2),
-            epaisseur,
+    opacite_glow = int(255.0 * intensite * (0.65 + 0.35 * oscillation))
+    if opacite_glow > 0:
+        palier, tuiles_glow = obtenir_anneau_glow_arene(cache, rayon, tuple(couleur_bord))
+        debord = 2 * (NOMBRE_COUCHES_GLOW_NEON - 1)
+        origine_x = int(centre_x) - palier - debord
+        origine_y = int(centre_y) - palier - debord
+        for tuile, _ in tuiles_glow:
+            tuile.set_alpha(opacite_glow)
+        surface.blits(
+            [
+                (tuile, (origine_x + decalage_x, origine_y + decalage_y))
+                for tuile, (decalage_x, decalage_y) in tuiles_glow
+            ],
+            doreturn=False,
         )
 
+    if cache.calque_lignes is None or cache.calque_lignes.get_size() != surface.get_size():
+        cache.calque_lignes = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+    calque = cache.calque_lignes
+    opacite = (
+        parametres_arene.opacite_lignes_base
+        + etat_arene.energie_impact * parametres_arene.opacite_lignes_impact
+    )
+    alpha_ligne = int(255.0 * max(0.0, min(1.0, opacite)))
+    couleur_ligne = (couleur_bord[0], couleur_bord[1], couleur_bord[2], alpha_ligne)
+    rotation = phase * parametres_arene.vitesse_rotation_lignes
     nombre_lignes = max(0, parametres_arene.nombre_lignes_electriques)
-    for index_ligne in range(nombre_lignes):
-        ratio_ligne = index_ligne / max(1, nombre_lignes)
-        angle = (
-            ratio_ligne * 2.0 * pi
-            + etat_arene.phase_animation * parametres_arene.vitesse_rotation_lignes
-            + sin(index_ligne * ESPACEMENT_LIGNES_ELECTRIQUES + etat_arene.phase_animation * 0.9) * 0.15
-        )
-        longueur_ratio = 0.5 + 0.5 * sin(etat_arene.phase_animation * 2.3 + index_ligne * 1.7)
+    for angle_base, dephasage_angle, dephasage_longueur, dephasage_jitter in (
+        calculer_geometrie_lignes_electriques(nombre_lignes)
+    ):
+        angle = angle_base + rotation + sin(dephasage_angle + phase * 0.9) * 0.15
+        longueur_ratio = 0.5 + 0.5 * sin(phase * 2.3 + dephasage_longueur)
         longueur = parametres_arene.longueur_lignes_min + (
             parametres_arene.longueur_lignes_max - parametres_arene.longueur_lignes_min
         ) * longueur_ratio * (1.0 + 0.5 * etat_arene.energie_impact)
         rayon_debut = rayon + 2.0
         rayon_fin = rayon_debut + longueur
-        point_debut_x = centre_x + cos(angle) * rayon_debut
-        point_debut_y = centre_y + sin(angle) * rayon_debut
-        point_fin_x = centre_x + cos(angle) * rayon_fin
-        point_fin_y = centre_y + sin(angle) * rayon_fin
-        normale_x = -sin(angle)
-        normale_y = cos(angle)
+        cosinus = cos(angle)
+        sinus = sin(angle)
+        point_debut_x = centre_x + cosinus * rayon_debut
+        point_debut_y = centre_y + sinus * rayon_debut
+        point_fin_x = centre_x + cosinus * rayon_fin
+        point_fin_y = centre_y + sinus * rayon_fin
+        normale_x = -sinus
+        normale_y = cosinus
         jitter = (
-            sin(etat_arene.phase_animation * 5.2 + index_ligne * 2.9)
+            sin(phase * 5.2 + dephasage_jitter)
             * parametres_arene.amplitude_jitter_lignes
             * (0.4 + 0.6 * etat_arene.energie_impact)
         )
         point_milieu_x = (point_debut_x + point_fin_x) * 0.5 + normale_x * jitter
         point_milieu_y = (point_debut_y + point_fin_y) * 0.5 + normale_y * jitter
-        opacite = parametres_arene.opacite_lignes_base + etat_arene.energie_impact * parametres_arene.opacite_lignes_impact
-        alpha_ligne = int(255.0 * max(0.0, min(1.0, opacite)))
-        couleur_ligne = (couleur_bord[0], couleur_bord[1], couleur_bord[2], alpha_ligne)
-        pygame.draw.line(
+        zone_debut = pygame.draw.line(
             calque,
             couleur_ligne,
             (int(point_debut_x), int(point_debut_y)),
             (int(point_milieu_x), int(point_milieu_y)),
             2,
         )
-        pygame.draw.line(
+        zone_fin = pygame.draw.line(
             calque,
             couleur_ligne,
             (int(point_milieu_x), int(point_milieu_y)),
             (int(point_fin_x), int(point_fin_y)),
             2,
         )
-
-    surface.blit(calque, (0, 0))
+        # Seule la zone de la ligne est composee puis remise a transparent.
+        zone = zone_debut.union(zone_fin)
+        surface.blit(calque, zone, zone)
+        calque.fill((0, 0, 0, 0), zone)
 
 
 def dessiner_joueur(
@@ -1216,7 +1857,8 @@ def dessiner_joueur(
     joueur: Joueur,
     couleur_principale: Tuple[int, int, int],
     couleur_bouclier: Tuple[int, int, int],
-) -> None:
+    position: Tuple[float, float] | None = None,
+) -> pygame.Rect:
     """Dessine une capsule de joueur.
 
     Args:
@@ -1224,17 +1866,27 @@ def dessiner_joueur(
         joueur: Joueur a dessiner.
         couleur_principale: Couleur de base.
         couleur_bouclier: Couleur du halo bouclier.
+        position: Position affichee (interpolee); celle du joueur si None.
 
     Returns:
-        None.
+        Rectangle englobant la capsule et son eventuel bouclier.
     """
 
-    centre = (int(joueur.position_x), int(joueur.position_y))
+    if position is None:
+        position = (joueur.position_x, joueur.position_y)
+    centre = (int(position[0]), int(position[1]))
     pygame.draw.circle(surface, couleur_principale, centre, int(joueur.rayon))
     pygame.draw.circle(surface, COULEUR_BLANC, centre, int(joueur.rayon), 2)
 
     if joueur.actif_bouclier:
         pygame.draw.circle(surface, couleur_bouclier, centre, int(joueur.rayon + 8), 3)
+    rayon_englobant = int(joueur.rayon + 8) + 1
+    return pygame.Rect(
+        centre[0] - rayon_englobant,
+        centre[1] - rayon_englobant,
+        2 * rayon_englobant,
+        2 * rayon_englobant,
+    )
 
 
 def dessiner_jauge(
@@ -1245,7 +1897,7 @@ def dessiner_jauge(
     position_y: int,
     valeur: float,
     label: str,
-) -> None:
+) -> pygame.Rect:
     """Dessine une jauge rectangulaire standard.
 
     Args:
@@ -1258,7 +1910,7 @@ def dessiner_jauge(
         label: Texte associe a la jauge.
 
     Returns:
-        None.
+        Rectangle englobant la jauge et son libelle.
     """
 
     valeur_normalisee = max(0.0, min(1.0, valeur))
@@ -1277,19 +1929,18 @@ def dessiner_jauge(
             HAUTEUR_JAUGE_ULTIME,
         ),
     )
-    pygame.draw.rect(
-        surface,
-        COULEUR_BLANC,
-        pygame.Rect(position_x, position_y, LARGEUR_JAUGE_ULTIME, HAUTEUR_JAUGE_ULTIME),
-        2,
+    rectangle_jauge = pygame.Rect(
+        position_x, position_y, LARGEUR_JAUGE_ULTIME, HAUTEUR_JAUGE_ULTIME
     )
-    dessiner_texte(
+    pygame.draw.rect(surface, COULEUR_BLANC, rectangle_jauge, 2)
+    rectangle_libelle = dessiner_texte(
         surface,
         petite_police,
         label,
         couleur_ui,
         (position_x + LARGEUR_JAUGE_ULTIME / 2, position_y - HAUTEUR_LIBELLE_JAUGE),
     )
+    return rectangle_jauge.union(rectangle_libelle)
 
 
 def calculer_progression_cooldown(cooldown_restant: float, cooldown_total: float) -> float:
@@ -1368,7 +2019,7 @@ def dessiner_indicateurs_competences_joueur(
     parametres: ParametresCombat,
     position_x: int,
     position_y: int,
-) -> None:
+) -> pygame.Rect:
     """Dessine les indicateurs B1/B3/B4 pour un joueur.
 
     Args:
@@ -1380,12 +2031,12 @@ def dessiner_indicateurs_competences_joueur(
         position_y: Position Y des blocs.
 
     Returns:
-        None.
+        Rectangle englobant les trois indicateurs.
     """
 
-    cooldown_dash_restant = joueur.cooldowns.get("dash", 0.0)
-    cooldown_bump_restant = joueur.cooldowns.get("bump", 0.0)
-    cooldown_bouclier_restant = joueur.cooldowns.get("bouclier", 0.0)
+    cooldown_dash_restant = joueur.cooldowns.valeurs[COOLDOWN_DASH]
+    cooldown_bump_restant = joueur.cooldowns.valeurs[COOLDOWN_BUMP]
+    cooldown_bouclier_restant = joueur.cooldowns.valeurs[COOLDOWN_BOUCLIER]
     progression_dash = calculer_progression_cooldown(cooldown_dash_restant, parametres.cooldown_dash)
     progression_bump = calculer_progression_cooldown(cooldown_bump_restant, parametres.cooldown_bump)
     progression_bouclier = calculer_progression_cooldown(cooldown_bouclier_restant, parametres.cooldown_bouclier)
@@ -1420,6 +2071,7 @@ def dessiner_indicateurs_competences_joueur(
         progression_bouclier,
         COULEUR_INDICATEUR_BOUCLIER,
     )
+    return pygame.Rect(depart_x, position_y, largeur_totale, HAUTEUR_INDICATEUR_COMPETENCE)
 
 
 def dessiner_panneau_style_joueur(
@@ -1434,7 +2086,7 @@ def dessiner_panneau_style_joueur(
     titre: str,
     etat_style: EtatStyleJoueur,
     temps_animation: float,
-) -> None:
+) -> pygame.Rect:
     """Dessine un panneau HUD style anime pour un joueur.
 
     Args:
@@ -1451,7 +2103,7 @@ def dessiner_panneau_style_joueur(
         temps_animation: Temps global pour les pulsations.
 
     Returns:
-        None.
+        Rectangle ecran du panneau.
     """
 
     panneau = pygame.Surface((largeur, hauteur), pygame.SRCALPHA)
@@ -1486,7 +2138,7 @@ def dessiner_panneau_style_joueur(
             EPAISSEUR_PULSE_STYLE,
         )
 
-    surface.blit(panneau, (position_x, position_y))
+    return surface.blit(panneau, (position_x, position_y))
 
 
 def dessiner_interface(
@@ -1505,7 +2157,7 @@ def dessiner_interface(
     joueur_1: Joueur,
     joueur_2: Joueur,
     temps_restant: float,
-) -> None:
+) -> List[pygame.Rect]:
     """Dessine l interface HUD.
 
     Args:
@@ -1526,215 +2178,752 @@ def dessiner_interface(
         temps_restant: Temps restant de manche.
 
     Returns:
-        None.
+        Rectangles ecran des elements du HUD.
+    """
+
+    position_y_competences = hauteur_surface - DECALAGE_VERTICAL_INDICATEURS
+    return [
+        dessiner_texte(
+            surface,
+            police,
+            f"J1 {score_j1} - {score_j2} J2",
+            couleur_ui,
+            (largeur_surface / 2, 30),
+        ),
+        dessiner_texte(
+            surface,
+            petite_police,
+            f"Temps: {max(0, int(temps_restant))}s",
+            couleur_ui,
+            (largeur_surface / 2, 58),
+        ),
+        dessiner_jauge(
+            surface,
+            petite_police,
+            couleur_ui,
+            MARGE_JAUGE_GAUCHE,
+            hauteur_surface - MARGE_BASSE_JAUGE,
+            joueur_1.jauge_ultime,
+            "Ultime J1",
+        ),
+        dessiner_jauge(
+            surface,
+            petite_police,
+            couleur_ui,
+            largeur_surface - MARGE_JAUGE_DROITE,
+            hauteur_surface - MARGE_BASSE_JAUGE,
+            joueur_2.jauge_ultime,
+            "Ultime J2",
+        ),
+        dessiner_indicateurs_competences_joueur(
+            surface,
+            petite_police,
+            joueur_1,
+            parametres,
+            MARGE_JAUGE_GAUCHE,
+            position_y_competences,
+        ),
+        dessiner_indicateurs_competences_joueur(
+            surface,
+            petite_police,
+            joueur_2,
+            parametres,
+            largeur_surface - MARGE_JAUGE_DROITE,
+            position_y_competences,
+        ),
+        dessiner_panneau_style_joueur(
+            surface,
+            petite_police,
+            petite_police,
+            MARGE_LATERALE_PANNEAU_STYLE,
+            MARGE_HAUTE_PANNEAU_STYLE,
+            LARGEUR_PANNEAU_STYLE,
+            HAUTEUR_PANNEAU_STYLE,
+            COULEUR_STYLE_J1,
+            "J1",
+            style_j1,
+            temps_animation,
+        ),
+        dessiner_panneau_style_joueur(
+            surface,
+            petite_police,
+            petite_police,
+            largeur_surface - MARGE_LATERALE_PANNEAU_STYLE - LARGEUR_PANNEAU_STYLE,
+            MARGE_HAUTE_PANNEAU_STYLE,
+            LARGEUR_PANNEAU_STYLE,
+            HAUTEUR_PANNEAU_STYLE,
+            COULEUR_STYLE_J2,
+            "J2",
+            style_j2,
+            temps_animation,
+        ),
+    ]
+
+
+def incrementer_highscore(
+    vainqueur: str,
+    stock: highscores.StockHighscore | None = None,
+) -> None:
+    """Met a jour le fichier highscore local.
+
+    Avec le stock partage de la borne, l ecriture est atomique et differee sur
+    un fil d arriere-plan; sans lui (lancement hors borne), le fichier est
+    reecrit directement.
+
+    Args:
+        vainqueur: Identifiant du vainqueur final (J1 ou J2).
+        stock: StockHighscore de ``highscores``, ou None.
+
+    Returns:
+        None.
+    """
+
+    if stock is not None:
+        highscores.incrementer_score(stock, vainqueur)
+        highscores.publier_instantane(stock)
+        return
+
+    scores = {"J1": 0, "J2": 0}
+    if FICHIER_HIGHSCORE.exists():
+        for ligne in FICHIER_HIGHSCORE.read_text(encoding="utf-8").splitlines():
+            if "-" not in ligne:
+                continue
+            nom, valeur = ligne.split("-", 1)
+            if nom in scores:
+                try:
+                    scores[nom] = int(valeur)
+                except ValueError:
+                    scores[nom] = 0
+
+    scores[vainqueur] += 1
+    contenu = f"J1-{scores['J1']}\nJ2-{scores['J2']}\nAAA-0\n"
+    FICHIER_HIGHSCORE.write_text(contenu, encoding="utf-8")
+
+
+def gerer_entree_borne() -> Tuple[EntreeJoueur, EntreeJoueur]:
+    """Construit les mappings de commandes borne pour les deux joueurs.
+
+    Returns:
+        Tuple des mappings (J1, J2).
+    """
+
+    j1 = EntreeJoueur(
+        haut=pygame.K_UP,
+        bas=pygame.K_DOWN,
+        gauche=pygame.K_LEFT,
+        droite=pygame.K_RIGHT,
+        dash=pygame.K_f,
+        frein=pygame.K_g,
+        bump=pygame.K_h,
+        bouclier=pygame.K_r,
+        taunt=pygame.K_t,
+        ultime=pygame.K_y,
+    )
+    j2 = EntreeJoueur(
+        haut=pygame.K_o,
+        bas=pygame.K_l,
+        gauche=pygame.K_k,
+        droite=pygame.K_m,
+        dash=pygame.K_q,
+        frein=pygame.K_s,
+        bump=pygame.K_d,
+        bouclier=pygame.K_a,
+        taunt=pygame.K_z,
+        ultime=pygame.K_e,
+    )
+    return j1, j2
+
+
+def reinitialiser_manche(
+    configuration: Dict[str, object],
+    largeur: int,
+    hauteur: int,
+    duree_manche: float,
+    compte_a_rebours: float,
+    rayon_depart: float,
+) -> Tuple[Joueur, Joueur, float, float, float]:
+    """Reinitialise les donnees dynamiques d une manche.
+
+    Args:
+        configuration: Configuration globale du jeu.
+        largeur: Largeur fenetre.
+        hauteur: Hauteur fenetre.
+        duree_manche: Duree maximale d une manche.
+        compte_a_rebours: Valeur de countdown initiale.
+        rayon_depart: Rayon initial de l arene.
+
+    Returns:
+        Tuple (joueur_1, joueur_2, temps_restant, countdown, rayon_arene).
+    """
+
+    joueur_1, joueur_2 = creer_joueurs(configuration, largeur, hauteur)
+    return joueur_1, joueur_2, duree_manche, compte_a_rebours, rayon_depart
+
+
+def mode_competitif_actif(etat: str) -> bool:
+    """Indique si le jeu est dans un etat competitif humain.
+
+    Args:
+        etat: Etat global du jeu.
+
+    Returns:
+        True si l etat correspond a une manche competitive.
+    """
+
+    return etat == "manche"
+
+
+def construire_accumulateur_simulation(configuration: Dict[str, object]) -> AccumulateurSimulation:
+    """Lit la frequence de simulation dans la section performance.
+
+    Args:
+        configuration: Configuration globale du jeu.
+
+    Returns:
+        AccumulateurSimulation vide.
+    """
+
+    performance = configuration["performance"]
+    frequence = float(performance.get("frequence_simulation", FREQUENCE_SIMULATION_DEFAUT))
+    pas_max = int(performance.get("pas_max_par_image", PAS_MAX_PAR_IMAGE_DEFAUT))
+    return AccumulateurSimulation(pas_fixe=1.0 / frequence, pas_max_par_image=max(1, pas_max))
+
+
+def consommer_pas_simulation(accumulateur: AccumulateurSimulation, delta_temps: float) -> int:
+    """Ajoute le temps d une image et retourne le nombre de pas fixes a jouer.
+
+    Au-dela de ``pas_max_par_image`` pas, le retard est abandonne: apres un
+    accroc, le jeu ralentit une image au lieu d enchainer des images de plus
+    en plus longues a rattraper.
+
+    Args:
+        accumulateur: Accumulateur modifie sur place.
+        delta_temps: Temps reel de l image (0 pendant un gel d impact).
+
+    Returns:
+        Nombre de pas de simulation a jouer pour cette image.
+    """
+
+    accumulateur.reste += delta_temps
+    nombre_pas = int(accumulateur.reste / accumulateur.pas_fixe + EPSILON_PAS_SIMULATION)
+    if nombre_pas > accumulateur.pas_max_par_image:
+        nombre_pas = accumulateur.pas_max_par_image
+        accumulateur.reste = nombre_pas * accumulateur.pas_fixe
+    accumulateur.reste = max(0.0, accumulateur.reste - nombre_pas * accumulateur.pas_fixe)
+    return nombre_pas
+
+
+def rendre_pas_simulation(accumulateur: AccumulateurSimulation, nombre_pas: int) -> None:
+    """Rend a l accumulateur des pas comptes mais non joues.
+
+    La boucle de pas s interrompt sur une elimination ou un gel d impact: les
+    pas restants sont joues aux images suivantes au lieu d etre perdus.
+
+    Args:
+        accumulateur: Accumulateur modifie sur place.
+        nombre_pas: Pas retournes par ``consommer_pas_simulation`` puis non joues.
+
+    Returns:
+        None.
+    """
+
+    accumulateur.reste += max(0, nombre_pas) * accumulateur.pas_fixe
+
+
+def reinitialiser_accumulateur_simulation(accumulateur: AccumulateurSimulation) -> None:
+    """Oublie le temps accumule, au debut d une manche ou d un mode de jeu.
+
+    Args:
+        accumulateur: Accumulateur modifie sur place.
+
+    Returns:
+        None.
+    """
+
+    accumulateur.reste = 0.0
+
+
+def facteur_interpolation(accumulateur: AccumulateurSimulation) -> float:
+    """Retourne la fraction de pas ecoulee depuis le dernier pas simule.
+
+    Args:
+        accumulateur: Accumulateur de simulation.
+
+    Returns:
+        Facteur entre 0 et 1.
+    """
+
+    return min(1.0, accumulateur.reste / accumulateur.pas_fixe)
+
+
+def retirer_actions_commande(commande: CommandeJoueur) -> CommandeJoueur:
+    """Garde la direction et le frein d une commande, sans ses actions.
+
+    Args:
+        commande: Commande du premier pas de l image.
+
+    Returns:
+        CommandeJoueur sans dash, bump, bouclier ni ultime.
+    """
+
+    return CommandeJoueur(
+        entree_x=commande.entree_x,
+        entree_y=commande.entree_y,
+        frein=commande.frein,
+    )
+
+
+def memoriser_etat_interpolation(
+    interpolation: EtatInterpolation,
+    joueur_1: Joueur,
+    joueur_2: Joueur,
+    rayon_arene: float,
+) -> None:
+    """Memorise l etat courant avant un pas de simulation.
+
+    Args:
+        interpolation: Etat d interpolation modifie sur place.
+        joueur_1: Joueur 1.
+        joueur_2: Joueur 2.
+        rayon_arene: Rayon courant de l arene.
+
+    Returns:
+        None.
+    """
+
+    interpolation.joueur_1 = joueur_1
+    interpolation.joueur_2 = joueur_2
+    interpolation.position_j1 = (joueur_1.position_x, joueur_1.position_y)
+    interpolation.position_j2 = (joueur_2.position_x, joueur_2.position_y)
+    interpolation.rayon_arene = rayon_arene
+
+
+def interpoler_etat_rendu(
+    interpolation: EtatInterpolation,
+    joueur_1: Joueur,
+    joueur_2: Joueur,
+    rayon_arene: float,
+    alpha: float,
+) -> Tuple[Tuple[float, float], Tuple[float, float], float]:
+    """Calcule les positions affichees entre les deux derniers pas simules.
+
+    Une manche reinitialisee depuis le dernier pas (nouveaux joueurs) est
+    affichee telle quelle.
+
+    Args:
+        interpolation: Etat memorise avant le dernier pas.
+        joueur_1: Joueur 1.
+        joueur_2: Joueur 2.
+        rayon_arene: Rayon courant de l arene.
+        alpha: Fraction de pas ecoulee depuis le dernier pas.
+
+    Returns:
+        Tuple (position J1, position J2, rayon de l arene) a dessiner.
+    """
+
+    if interpolation.joueur_1 is not joueur_1 or interpolation.joueur_2 is not joueur_2:
+        return (
+            (joueur_1.position_x, joueur_1.position_y),
+            (joueur_2.position_x, joueur_2.position_y),
+            rayon_arene,
+        )
+    ancienne_j1 = interpolation.position_j1
+    ancienne_j2 = interpolation.position_j2
+    return (
+        (
+            ancienne_j1[0] + (joueur_1.position_x - ancienne_j1[0]) * alpha,
+            ancienne_j1[1] + (joueur_1.position_y - ancienne_j1[1]) * alpha,
+        ),
+        (
+            ancienne_j2[0] + (joueur_2.position_x - ancienne_j2[0]) * alpha,
+            ancienne_j2[1] + (joueur_2.position_y - ancienne_j2[1]) * alpha,
+        ),
+        interpolation.rayon_arene + (rayon_arene - interpolation.rayon_arene) * alpha,
+    )
+
+
+def creer_politiques_melee(
+    configuration: Dict[str, object],
+    parametres_melee: ParametresMelee,
+) -> List[Politique | None]:
+    """Confie a l IA tous les combattants de la melee sauf J1.
+
+    J2 reste pilote par l IA tant que le second joueur ne rejoint pas la
+    partie (voir ``rejoindre_melee``).
+
+    Args:
+        configuration: Configuration globale du jeu.
+        parametres_melee: Reglages de la melee.
+
+    Returns:
+        Politique par combattant, None pour un humain.
+    """
+
+    parametres_ia = replace(
+        construire_parametres_ia(configuration), budget_us=parametres_melee.budget_ia_us
+    )
+    politiques: List[Politique | None] = [None]
+    for _ in range(1, parametres_melee.nombre_combattants):
+        politiques.append(creer_politique_ia(configuration, parametres_ia))
+    return politiques
+
+
+def demarrer_melee(
+    configuration: Dict[str, object],
+    parametres_melee: ParametresMelee,
+) -> Tuple[EtatMelee, List[Politique | None], List[int]]:
+    """Prepare une nouvelle melee.
+
+    Args:
+        configuration: Configuration globale du jeu.
+        parametres_melee: Reglages de la melee.
+
+    Returns:
+        Tuple (etat de la premiere manche, politiques, scores a zero).
+    """
+
+    return (
+        creer_etat_melee(configuration, parametres_melee.nombre_combattants),
+        creer_politiques_melee(configuration, parametres_melee),
+        [0] * parametres_melee.nombre_combattants,
+    )
+
+
+def rejoindre_melee(
+    politiques: List[Politique | None],
+    controles: EntreeJoueur,
+    touches_juste_appuyees: set[int],
+) -> bool:
+    """Rend J2 au second joueur des qu il appuie sur une de ses touches d action.
+
+    Args:
+        politiques: Politiques de la melee, modifiees sur place.
+        controles: Mapping des touches de J2.
+        touches_juste_appuyees: Touches appuyees pendant l image.
+
+    Returns:
+        True si J2 est pilote par un humain.
+    """
+
+    actions = (controles.dash, controles.bump, controles.bouclier, controles.ultime)
+    if politiques[1] is not None and any(touche in touches_juste_appuyees for touche in actions):
+        politiques[1] = None
+    return politiques[1] is None
+
+
+def couleur_combattant_melee(
+    indice: int,
+    couleur_joueur_1: Tuple[int, int, int],
+    couleur_joueur_2: Tuple[int, int, int],
+) -> Tuple[int, int, int]:
+    """Choisit la couleur d un combattant de melee.
+
+    Args:
+        indice: Indice du combattant.
+        couleur_joueur_1: Couleur configuree de J1.
+        couleur_joueur_2: Couleur configuree de J2.
+
+    Returns:
+        Couleur RGB du combattant.
+    """
+
+    if indice == 0:
+        return couleur_joueur_1
+    if indice == 1:
+        return couleur_joueur_2
+    return COULEURS_BOTS_MELEE[(indice - 2) % len(COULEURS_BOTS_MELEE)]
+
+
+def doit_reinitialiser_attract(etat: str, elimine_j1: bool, elimine_j2: bool) -> bool:
+    """Indique si une elimination doit relancer une manche IA en mode attract.
+
+    Args:
+        etat: Etat global du jeu.
+        elimine_j1: True si J1 est elimine.
+        elimine_j2: True si J2 est elimine.
+
+    Returns:
+        True si le mode attract doit etre relance.
+    """
+
+    return etat == "attract" and (elimine_j1 or elimine_j2)
+
+
+def demarrer_replay_match(
+    configuration: Dict[str, object],
+) -> Tuple[random.Random, EnregistreurReplay | None]:
+    """Tire la graine d un nouveau match et commence son enregistrement.
+
+    Le generateur du match est propre a ce match: le module ``random`` global
+    n est pas reseede.
+
+    Args:
+        configuration: Configuration globale du jeu.
+
+    Returns:
+        Tuple (generateur seede par la graine, EnregistreurReplay ou None si
+        les replays sont desactives).
+    """
+
+    graine = random.randrange(2**32)
+    generateur_match = random.Random(graine)
+    if not bool(configuration.get("replay", {}).get("actif", True)):
+        return generateur_match, None
+    return generateur_match, creer_enregistreur_replay(configuration, graine)
+
+
+def lire_commande_touches(
+    touches: pygame.key.ScancodeWrapper,
+    touches_juste_appuyees: set[int],
+    controles: EntreeJoueur,
+    simulation_gelee: bool,
+) -> CommandeJoueur:
+    """Traduit les entrees clavier d une image de manche en commande rejouable.
+
+    Args:
+        touches: Etat clavier courant.
+        touches_juste_appuyees: Touches appuyees pendant l image.
+        controles: Mapping des touches du joueur.
+        simulation_gelee: True pendant un gel d impact (axe et actions ignores).
+
+    Returns:
+        CommandeJoueur equivalente.
     """
 
-    dessiner_texte(surface, police, f"J1 {score_j1} - {score_j2} J2", couleur_ui, (largeur_surface / 2, 30))
-    dessiner_texte(
-        surface,
-        petite_police,
-        f"Temps: {max(0, int(temps_restant))}s",
-        couleur_ui,
-        (largeur_surface / 2, 58),
-    )
-    dessiner_jauge(
-        surface,
-        petite_police,
-        couleur_ui,
-        MARGE_JAUGE_GAUCHE,
-        hauteur_surface - MARGE_BASSE_JAUGE,
-        joueur_1.jauge_ultime,
-        "Ultime J1",
-    )
-    dessiner_jauge(
-        surface,
-        petite_police,
-        couleur_ui,
-        largeur_surface - MARGE_JAUGE_DROITE,
-        hauteur_surface - MARGE_BASSE_JAUGE,
-        joueur_2.jauge_ultime,
-        "Ultime J2",
-    )
-    position_y_competences = hauteur_surface - DECALAGE_VERTICAL_INDICATEURS
-    dessiner_indicateurs_competences_joueur(
-        surface,
-        petite_police,
-        joueur_1,
-        parametres,
-        MARGE_JAUGE_GAUCHE,
-        position_y_competences,
-    )
-    dessiner_indicateurs_competences_joueur(
-        surface,
-        petite_police,
-        joueur_2,
-        parametres,
-        largeur_surface - MARGE_JAUGE_DROITE,
-        position_y_competences,
-    )
-    dessiner_panneau_style_joueur(
-        surface,
-        petite_police,
-        petite_police,
-        MARGE_LATERALE_PANNEAU_STYLE,
-        MARGE_HAUTE_PANNEAU_STYLE,
-        LARGEUR_PANNEAU_STYLE,
-        HAUTEUR_PANNEAU_STYLE,
-        COULEUR_STYLE_J1,
-        "J1",
-        style_j1,
-        temps_animation,
-    )
-    dessiner_panneau_style_joueur(
-        surface,
-        petite_police,
-        petite_police,
-        largeur_surface - MARGE_LATERALE_PANNEAU_STYLE - LARGEUR_PANNEAU_STYLE,
-        MARGE_HAUTE_PANNEAU_STYLE,
-        LARGEUR_PANNEAU_STYLE,
-        HAUTEUR_PANNEAU_STYLE,
-        COULEUR_STYLE_J2,
-        "J2",
-        style_j2,
-        temps_animation,
+    axe_x, axe_y = (0.0, 0.0) if simulation_gelee else lire_etat_touches(touches, controles)
+    actions_actives = not simulation_gelee
+    return CommandeJoueur(
+        entree_x=axe_x,
+        entree_y=axe_y,
+        frein=bool(touches[controles.frein]),
+        dash=actions_actives and controles.dash in touches_juste_appuyees,
+        bump=actions_actives and controles.bump in touches_juste_appuyees,
+        bouclier=actions_actives and controles.bouclier in touches_juste_appuyees,
+        ultime=actions_actives and controles.ultime in touches_juste_appuyees,
     )
 
 
-def incrementer_highscore(vainqueur: str) -> None:
-    """Met a jour le fichier highscore local.
+def piloter_ia(
+    politique: Politique,
+    joueur: Joueur,
+    adversaire: Joueur,
+    etat_manche: EtatManche,
+    generateur: random.Random,
+    simulation_gelee: bool,
+) -> CommandeJoueur:
+    """Demande sa commande a l IA, sauf pendant un gel d impact.
 
     Args:
-        vainqueur: Identifiant du vainqueur final (J1 ou J2).
+        politique: IA pilotant le joueur.
+        joueur: Joueur pilote.
+        adversaire: Joueur adverse.
+        etat_manche: Etat courant de l arene.
+        generateur: Generateur pseudo-aleatoire de l IA.
+        simulation_gelee: True pendant un gel d impact.
 
     Returns:
-        None.
+        CommandeJoueur de l IA, ou commande neutre pendant le gel.
     """
 
-    scores = {"J1": 0, "J2": 0}
-    if FICHIER_HIGHSCORE.exists():
-        for ligne in FICHIER_HIGHSCORE.read_text(encoding="utf-8").splitlines():
-            if "-" not in ligne:
-                continue
-            nom, valeur = ligne.split("-", 1)
-            if nom in scores:
-                try:
-                    scores[nom] = int(valeur)
-                except ValueError:
-                    scores[nom] = 0
+    if simulation_gelee:
+        return CommandeJoueur()
+    return politique(joueur, adversaire, etat_manche, generateur)
 
-    scores[vainqueur] += 1
-    contenu = f"J1-{scores['J1']}\nJ2-{scores['J2']}\nAAA-0\n"
-    FICHIER_HIGHSCORE.write_text(contenu, encoding="utf-8")
 
+def sauvegarder_replay_match(
+    configuration: Dict[str, object],
+    enregistreur: EnregistreurReplay | None,
+) -> threading.Thread | None:
+    """Ecrit le replay d un match termine ou abandonne sur un fil d arriere-plan.
 
-def gerer_entree_borne() -> Tuple[EntreeJoueur, EntreeJoueur]:
-    """Construit les mappings de commandes borne pour les deux joueurs.
+    Compression, ecriture et purge ne retardent pas l image de fin de match. Le
+    fil n est pas daemon: un replay ecrit juste avant de quitter est complete.
+
+    Args:
+        configuration: Configuration globale du jeu.
+        enregistreur: Enregistrement du match, ou None.
 
     Returns:
-        Tuple des mappings (J1, J2).
+        Fil d ecriture demarre, ou None sans replay a ecrire.
     """
 
-    j1 = EntreeJoueur(
-        haut=pygame.K_UP,
-        bas=pygame.K_DOWN,
-        gauche=pygame.K_LEFT,
-        droite=pygame.K_RIGHT,
-        dash=pygame.K_f,
-        frein=pygame.K_g,
-        bump=pygame.K_h,
-        bouclier=pygame.K_r,
-        taunt=pygame.K_t,
-        ultime=pygame.K_y,
-    )
-    j2 = EntreeJoueur(
-        haut=pygame.K_o,
-        bas=pygame.K_l,
-        gauche=pygame.K_k,
-        droite=pygame.K_m,
-        dash=pygame.K_q,
-        frein=pygame.K_s,
-        bump=pygame.K_d,
-        bouclier=pygame.K_a,
-        taunt=pygame.K_z,
-        ultime=pygame.K_e,
+    if enregistreur is None or enregistreur.nombre_images == 0:
+        return None
+    parametres_replay = configuration.get("replay", {})
+    nombre_max = int(parametres_replay.get("nombre_max_fichiers", NOMBRE_MAX_REPLAYS_DEFAUT))
+    fil = threading.Thread(
+        target=ecrire_replay_match,
+        args=(finaliser_replay(enregistreur), nombre_max),
+        name="neon_sumo_replay",
     )
-    return j1, j2
+    fil.start()
+    return fil
 
 
-def calculer_ia_attract(joueur: Joueur, centre_x: float, centre_y: float, rayon: float) -> Tuple[float, float]:
-    """Calcule une direction simple d IA pour le mode attract.
+def ecrire_replay_match(replay_match: Replay, nombre_max: int) -> None:
+    """Ecrit un replay et signale un echec d ecriture sans interrompre le jeu.
 
     Args:
-        joueur: Joueur pilote automatiquement.
-        centre_x: Centre X arene.
-        centre_y: Centre Y arene.
-        rayon: Rayon courant arene.
+        replay_match: Replay fige du match.
+        nombre_max: Nombre de replays conserves.
 
     Returns:
-        Direction (x, y) a appliquer.
+        None.
     """
 
-    vers_centre_x = centre_x - joueur.position_x
-    vers_centre_y = centre_y - joueur.position_y
-    distance_centre = sqrt(vers_centre_x * vers_centre_x + vers_centre_y * vers_centre_y)
-    facteur_bord = 1.0 if distance_centre > rayon * 0.75 else 0.3
-    alea_x = random.uniform(-0.7, 0.7)
-    alea_y = random.uniform(-0.7, 0.7)
-    return vers_centre_x * 0.01 * facteur_bord + alea_x, vers_centre_y * 0.01 * facteur_bord + alea_y
+    try:
+        sauvegarder_replay(replay_match, nombre_max=nombre_max)
+    except OSError as erreur:
+        print(f"ERREUR: replay Neon Sumo non sauvegarde: {erreur}", file=sys.stderr)
 
 
-def reinitialiser_manche(
-    configuration: Dict[str, object],
-    largeur: int,
-    hauteur: int,
-    duree_manche: float,
-    compte_a_rebours: float,
-    rayon_depart: float,
-) -> Tuple[Joueur, Joueur, float, float, float]:
-    """Reinitialise les donnees dynamiques d une manche.
+def creer_polices(
+    parametres_menu_titre: ParametresMenuTitre,
+    police_systeme: bool,
+) -> Tuple[pygame.font.Font, ...]:
+    """Cree les cinq polices du jeu.
 
     Args:
-        configuration: Configuration globale du jeu.
-        largeur: Largeur fenetre.
-        hauteur: Hauteur fenetre.
-        duree_manche: Duree maximale d une manche.
-        compte_a_rebours: Valeur de countdown initiale.
-        rayon_depart: Rayon initial de l arene.
+        parametres_menu_titre: Parametres graphiques du menu.
+        police_systeme: False pour la police embarquee par pygame, sans recherche fontconfig.
 
     Returns:
-        Tuple (joueur_1, joueur_2, temps_restant, countdown, rayon_arene).
+        Polices (principale, petite, titre, sous-titre, info du menu).
     """
 
-    joueur_1, joueur_2 = creer_joueurs(configuration, largeur, hauteur)
-    return joueur_1, joueur_2, duree_manche, compte_a_rebours, rayon_depart
+    def creer(taille: int, gras: bool = False) -> pygame.font.Font:
+        """Cree une police systeme DejaVu Sans ou la police embarquee.
+
+        Args:
+            taille: Taille en points.
+            gras: Active le gras.
+
+        Returns:
+            Police pygame.
+        """
+
+        if police_systeme:
+            return pygame.font.SysFont("DejaVu Sans", taille, bold=gras)
+        police = pygame.font.Font(None, taille)
+        police.set_bold(gras)
+        return police
+
+    return (
+        creer(32),
+        creer(20),
+        creer(max(24, parametres_menu_titre.taille_police_titre), gras=True),
+        creer(max(18, parametres_menu_titre.taille_police_sous_titre), gras=True),
+        creer(max(16, parametres_menu_titre.taille_police_info)),
+    )
 
 
-def mode_competitif_actif(etat: str) -> bool:
-    """Indique si le jeu est dans un etat competitif humain.
+def creer_ressources_lancement(
+    configuration: Dict[str, object],
+    parametres_menu_titre: ParametresMenuTitre,
+) -> RessourcesJeu:
+    """Prepare les ressources minimales de la premiere image.
 
     Args:
-        etat: Etat global du jeu.
+        configuration: Configuration globale du jeu.
+        parametres_menu_titre: Parametres graphiques du menu.
 
     Returns:
-        True si l etat correspond a une manche competitive.
+        RessourcesJeu avec polices embarquees et banque audio vide.
     """
 
-    return etat == "manche"
+    return RessourcesJeu(
+        *creer_polices(parametres_menu_titre, police_systeme=False),
+        banque_audio=BanqueAudio(construire_parametres_audio(configuration)),
+    )
 
 
-def doit_reinitialiser_attract(etat: str, elimine_j1: bool, elimine_j2: bool) -> bool:
-    """Indique si une elimination doit relancer une manche IA en mode attract.
+def executer_etape_chargement(
+    chargement: ChargementProgressif,
+    ressources: RessourcesJeu,
+    etape: str,
+) -> None:
+    """Execute une etape du chargement progressif et l horodate.
 
     Args:
-        etat: Etat global du jeu.
-        elimine_j1: True si J1 est elimine.
-        elimine_j2: True si J2 est elimine.
+        chargement: Etat du chargement.
+        ressources: Ressources mises a jour sur place.
+        etape: Nom de l etape (voir ``ETAPES_CHARGEMENT``).
 
     Returns:
-        True si le mode attract doit etre relance.
+        None.
     """
 
-    return etat == "attract" and (elimine_j1 or elimine_j2)
+    if etape == "polices":
+        (
+            ressources.police,
+            ressources.petite_police,
+            ressources.police_titre_menu,
+            ressources.police_sous_titre_menu,
+            ressources.police_info_menu,
+        ) = creer_polices(chargement.parametres_menu_titre, police_systeme=True)
+    elif etape == "audio":
+        # L ouverture du peripherique audio est la partie lente de pygame.init.
+        try:
+            pygame.mixer.init()
+        except pygame.error:
+            pass
+        ressources.banque_audio = creer_banque_audio(chargement.configuration)
+    elif etape == "calques":
+        largeur, hauteur = chargement.taille_ecran
+        preparer_cache_menu_titre(
+            chargement.cache_menu_titre,
+            largeur,
+            hauteur,
+            chargement.parametres_menu_titre,
+            chargement.couleur_fond,
+        )
+        prechauffer_anneaux_menu_titre(
+            chargement.cache_menu_titre, chargement.parametres_menu_titre
+        )
+    elif etape == "arene":
+        arene = chargement.configuration["arene"]
+        prechauffer_anneaux_glow_arene(
+            chargement.cache_arene_neon,
+            float(arene["rayon_min"]),
+            float(arene["rayon_depart"]),
+            tuple(chargement.configuration["couleurs"]["arene_bord"]),
+        )
+    elif etape == "modules":
+        pygame.init()
+    elif etape == "particules":
+        ressources.particules_impact = importer_particules().creer_pool_particules()
+    elif etape == "highscore" and highscores is not None:
+        # Ferme automatiquement a la sortie: le menu relit alors un instantane a jour.
+        ressources.stock_highscore = highscores.ouvrir_stock_highscore(FICHIER_HIGHSCORE)
+    marquer_etape_demarrage(chargement.trace, etape)
+
+
+def avancer_chargement(
+    chargement: ChargementProgressif,
+    ressources: RessourcesJeu,
+    tout: bool = False,
+) -> None:
+    """Execute l etape suivante du chargement, ou toutes les etapes restantes.
+
+    Args:
+        chargement: Etat du chargement.
+        ressources: Ressources mises a jour sur place.
+        tout: True pour terminer le chargement sans attendre (partie lancee).
+
+    Returns:
+        None.
+    """
+
+    if not chargement.etapes_restantes:
+        return
+    while chargement.etapes_restantes:
+        executer_etape_chargement(chargement, ressources, chargement.etapes_restantes.pop(0))
+        if not tout:
+            break
+    if not chargement.etapes_restantes:
+        marquer_etape_demarrage(chargement.trace, "pret")
+        if chargement.trace.affichee:
+            print(formater_trace_demarrage(chargement.trace))
 
 
 def boucle_jeu() -> int:
@@ -1744,15 +2933,20 @@ def boucle_jeu() -> int:
         Code de sortie du programme.
     """
 
-    global pygame
-    pygame = importer_pygame()
+    trace_demarrage = creer_trace_demarrage()
+    importer_pygame()
     configuration = charger_configuration()
     parametres = construire_parametres_combat(configuration)
     parametres_style = construire_parametres_style(configuration)
     parametres_arene_neon = construire_parametres_arene_neon(configuration)
     parametres_menu_titre = construire_parametres_menu_titre(configuration)
+    cache_menu_titre = CacheMenuTitre()
+    marquer_etape_demarrage(trace_demarrage, "lancement_boucle")
 
-    pygame.init()
+    # Seuls l affichage et les polices precedent la premiere image; le reste de
+    # pygame.init (audio, joysticks) est charge par avancer_chargement.
+    pygame.display.init()
+    pygame.font.init()
     pygame.display.set_caption("Neon Sumo")
 
     largeur = int(configuration["ecran"]["largeur"])
@@ -1763,38 +2957,18 @@ def boucle_jeu() -> int:
 
     horloge = pygame.time.Clock()
     fps_cible = int(configuration["performance"]["fps"])
-
-    police = pygame.font.SysFont("DejaVu Sans", 32)
-    petite_police = pygame.font.SysFont("DejaVu Sans", 20)
-    police_titre_menu = pygame.font.SysFont(
-        "DejaVu Sans",
-        max(24, parametres_menu_titre.taille_police_titre),
-        bold=True,
+    suivi_rendu = SuiviRectanglesSales(
+        actif=bool(configuration["performance"].get("rendu_rectangles_sales", False))
     )
-    police_sous_titre_menu = pygame.font.SysFont(
-        "DejaVu Sans",
-        max(18, parametres_menu_titre.taille_police_sous_titre),
-        bold=True,
-    )
-    police_info_menu = pygame.font.SysFont("DejaVu Sans", max(16, parametres_menu_titre.taille_police_info))
+    rectangle_ecran = ecran.get_rect()
 
-    j1_controles, j2_controles = gerer_entree_borne()
+    ressources = creer_ressources_lancement(configuration, parametres_menu_titre)
+    marquer_etape_demarrage(trace_demarrage, "fenetre")
 
-    try:
-        pygame.mixer.init()
-    except pygame.error:
-        pass
-
-    sons = {
-        "dash": charger_son(RACINE_JEU / "assets/sons/dash.mp3"),
-        "bump": charger_son(RACINE_JEU / "assets/sons/bump.mp3"),
-        "bouclier": charger_son(RACINE_JEU / "assets/sons/bouclier.mp3"),
-        "taunt": charger_son(RACINE_JEU / "assets/sons/taunt.mp3"),
-        "ultime": charger_son(RACINE_JEU / "assets/sons/ultime.mp3"),
-        "elimination": charger_son(RACINE_JEU / "assets/sons/elimination.mp3"),
-    }
+    j1_controles, j2_controles = gerer_entree_borne()
 
     etat = "titre"
+    etat_image_precedente = etat
     inactif = 0.0
     score_j1 = 0
     score_j2 = 0
@@ -1828,9 +3002,6 @@ def boucle_jeu() -> int:
     centre_x = largeur / 2.0
     centre_y = hauteur / 2.0
     rayon_depart = float(arene["rayon_depart"])
-    rayon_min = float(arene["rayon_min"])
-    vitesse_retrecissement = float(arene["vitesse_retrecissement"])
-    multiplicateur_sudden_death = float(arene["multiplicateur_sudden_death"])
     largeur_danger = float(arene["largeur_zone_danger"])
 
     joueur_1, joueur_2, temps_restant, countdown, rayon_arene = reinitialiser_manche(
@@ -1847,24 +3018,65 @@ def boucle_jeu() -> int:
     reinitialiser_style_pour_manche(style_j2)
     dernier_vainqueur_manche = ""
     feedback_combat = EtatFeedbackCombat()
-    particules_impact: list[ParticuleImpact] = []
     etat_arene_neon = EtatAreneNeon()
+    cache_arene_neon = CacheAreneNeon()
     temps_animation_hud = 0.0
+    rayon_arene_image_precedente = 0.0
+    profileur = profilage_images.creer_profileur("NeonSumo") if profilage_images else None
+    enregistreur_replay: EnregistreurReplay | None = None
+    mode_solo = False
+    politique_ia_j1 = creer_politique_ia(configuration)
+    politique_ia_j2 = creer_politique_ia(configuration)
+    generateur_match = random.Random()
+    etat_manche_ia = EtatManche(centre_x, centre_y, rayon_arene, temps_restant, largeur_danger)
+    accumulateur_simulation = construire_accumulateur_simulation(configuration)
+    interpolation_rendu = EtatInterpolation()
+    appuis_en_attente: set[int] = set()
+    delta_style_en_attente = 0.0
+    parametres_melee = construire_parametres_melee(configuration)
+    regles_melee = construire_regles_simulation(configuration)
+    regles_duel = construire_regles_simulation(configuration, parametres, parametres_style)
+    evenements_pas = (EvenementsJoueur(), EvenementsJoueur())
+    mode_melee = False
+    etat_melee: EtatMelee | None = None
+    politiques_melee: List[Politique | None] = []
+    scores_melee: List[int] = []
+    commandes_melee: List[CommandeJoueur] = []
+    pause_melee = 0.0
+    chargement = ChargementProgressif(
+        configuration,
+        parametres_menu_titre,
+        cache_menu_titre,
+        (largeur, hauteur),
+        couleur_fond,
+        trace_demarrage,
+        cache_arene_neon,
+    )
 
     while True:
         delta_temps = horloge.tick(fps_cible) / 1000.0
+        if profileur is not None:
+            profilage_images.debuter_image(profileur)
         temps_animation_hud += delta_temps
         quitter = False
         touches_juste_appuyees: set[int] = set()
-        for evenement in pygame.event.get():
+        evenements = pygame.event.get()
+        if profileur is not None:
+            profilage_images.enregistrer_evenements(profileur, evenements)
+        for evenement in evenements:
             if evenement.type == pygame.QUIT:
                 quitter = True
             elif evenement.type == pygame.KEYDOWN:
                 touches_juste_appuyees.add(evenement.key)
+        if touches_juste_appuyees:
+            # Une partie peut demarrer: plus question d attendre les images suivantes.
+            avancer_chargement(chargement, ressources, tout=True)
 
         if quitter:
+            sauvegarder_replay_match(configuration, enregistreur_replay)
             pygame.quit()
             return 0
+        etat_debut_image = etat
 
         touches = pygame.key.get_pressed()
 
@@ -1875,31 +3087,44 @@ def boucle_jeu() -> int:
 
         simulation_gelee = feedback_combat.gel_restant > 0.0
         delta_simulation = 0.0 if simulation_gelee else delta_temps
-        if not simulation_gelee:
-            mettre_a_jour_particules(particules_impact, delta_temps)
+        if not simulation_gelee and ressources.particules_impact is not None:
+            importer_particules().mettre_a_jour_pool_particules(
+                ressources.particules_impact, delta_temps
+            )
         mettre_a_jour_arene_neon(etat_arene_neon, parametres_arene_neon, delta_temps)
         mettre_a_jour_etat_style(style_j1, delta_temps)
         mettre_a_jour_etat_style(style_j2, delta_temps)
+        if profileur is not None:
+            # La suite met a jour et dessine etat par etat: elle compte en dessin.
+            profilage_images.marquer_phase(profileur, profilage_images.PHASE_MISE_A_JOUR)
 
         ecran.fill(couleur_fond)
         appui_dash_global = (j1_controles.dash in touches_juste_appuyees) or (j2_controles.dash in touches_juste_appuyees)
         appui_ultime_global = (j1_controles.ultime in touches_juste_appuyees) or (j2_controles.ultime in touches_juste_appuyees)
 
         if etat == "titre":
+            marquer_plein_ecran(suivi_rendu)
             dessiner_menu_titre_neon(
                 ecran,
                 largeur,
                 hauteur,
                 temps_animation_hud,
                 parametres_menu_titre,
-                police_titre_menu,
-                police_sous_titre_menu,
-                police_info_menu,
+                ressources.police_titre_menu,
+                ressources.police_sous_titre_menu,
+                ressources.police_info_menu,
+                cache_menu_titre,
+                couleur_fond,
             )
 
-            if appui_dash_global:
+            appui_solo = j1_controles.bump in touches_juste_appuyees
+            appui_melee = j1_controles.bouclier in touches_juste_appuyees
+            if appui_dash_global or appui_solo:
+                mode_solo = appui_solo and not appui_dash_global
+                mode_melee = False
                 score_j1 = 0
                 score_j2 = 0
+                generateur_match, enregistreur_replay = demarrer_replay_match(configuration)
                 reinitialiser_etat_style(style_j1)
                 reinitialiser_etat_style(style_j2)
                 joueur_1, joueur_2, temps_restant, countdown, rayon_arene = reinitialiser_manche(
@@ -1912,9 +3137,20 @@ def boucle_jeu() -> int:
                 )
                 reinitialiser_style_pour_manche(style_j1)
                 reinitialiser_style_pour_manche(style_j2)
-                vider_feedback_combat(feedback_combat, particules_impact)
+                vider_feedback_combat(feedback_combat, ressources.particules_impact)
                 reinitialiser_etat_arene_neon(etat_arene_neon)
                 etat = "compte_a_rebours"
+            elif appui_melee:
+                mode_melee = True
+                etat_melee, politiques_melee, scores_melee = demarrer_melee(
+                    configuration, parametres_melee
+                )
+                pause_melee = compte_a_rebours_initial
+                dernier_vainqueur_manche = ""
+                vider_feedback_combat(feedback_combat, ressources.particules_impact)
+                reinitialiser_etat_arene_neon(etat_arene_neon)
+                reinitialiser_accumulateur_simulation(accumulateur_simulation)
+                etat = "melee"
 
             if appui_ultime_global:
                 pygame.quit()
@@ -1936,35 +3172,46 @@ def boucle_jeu() -> int:
                 reinitialiser_style_pour_manche(style_j1)
                 reinitialiser_style_pour_manche(style_j2)
                 countdown = countdown_attract_initial
-                vider_feedback_combat(feedback_combat, particules_impact)
+                vider_feedback_combat(feedback_combat, ressources.particules_impact)
                 reinitialiser_etat_arene_neon(etat_arene_neon)
+                reinitialiser_accumulateur_simulation(accumulateur_simulation)
                 etat = "attract"
 
         elif etat in {"compte_a_rebours", "attract", "manche"}:
             if etat == "compte_a_rebours":
                 countdown -= delta_simulation
-                dessiner_texte(
-                    ecran,
-                    police,
-                    f"{max(1, int(countdown) + 1)}",
-                    couleur_texte_information,
-                    (centre_x, hauteur * 0.2),
+                marquer_zones_sales(
+                    suivi_rendu,
+                    dessiner_texte(
+                        ecran,
+                        ressources.police,
+                        f"{max(1, int(countdown) + 1)}",
+                        couleur_texte_information,
+                        (centre_x, hauteur * 0.2),
+                    ),
                 )
                 if countdown <= 0.0:
+                    reinitialiser_accumulateur_simulation(accumulateur_simulation)
                     etat = "manche"
 
             if etat == "attract":
                 countdown = max(0.0, countdown - delta_simulation)
-                dessiner_texte(
-                    ecran,
-                    petite_police,
-                    "MODE ATTRACT - B1 pour jouer",
-                    couleur_texte_attract,
-                    (centre_x, 28),
+                marquer_zones_sales(
+                    suivi_rendu,
+                    dessiner_texte(
+                        ecran,
+                        ressources.petite_police,
+                        "MODE ATTRACT - B1 pour jouer",
+                        couleur_texte_attract,
+                        (centre_x, 28),
+                    ),
                 )
                 if appui_dash_global:
+                    mode_solo = False
+                    mode_melee = False
                     score_j1 = 0
                     score_j2 = 0
+                    generateur_match, enregistreur_replay = demarrer_replay_match(configuration)
                     reinitialiser_etat_style(style_j1)
                     reinitialiser_etat_style(style_j2)
                     joueur_1, joueur_2, temps_restant, countdown, rayon_arene = reinitialiser_manche(
@@ -1977,273 +3224,137 @@ def boucle_jeu() -> int:
                     )
                     reinitialiser_style_pour_manche(style_j1)
                     reinitialiser_style_pour_manche(style_j2)
-                    vider_feedback_combat(feedback_combat, particules_impact)
+                    vider_feedback_combat(feedback_combat, ressources.particules_impact)
                     reinitialiser_etat_arene_neon(etat_arene_neon)
                     etat = "compte_a_rebours"
                     continue
 
             if etat in {"manche", "attract"}:
                 en_manche = mode_competitif_actif(etat)
-                if en_manche:
-                    if simulation_gelee:
-                        axe_j1 = (0.0, 0.0)
-                        axe_j2 = (0.0, 0.0)
-                    else:
-                        axe_j1 = lire_etat_touches(touches, j1_controles)
-                        axe_j2 = lire_etat_touches(touches, j2_controles)
+                if simulation_gelee:
+                    appuis_en_attente.clear()
                 else:
-                    axe_j1 = calculer_ia_attract(joueur_1, centre_x, centre_y, rayon_arene)
-                    axe_j2 = calculer_ia_attract(joueur_2, centre_x, centre_y, rayon_arene)
-
-                frein_j1 = bool(touches[j1_controles.frein]) if en_manche else False
-                frein_j2 = bool(touches[j2_controles.frein]) if en_manche else False
-
-                appliquer_deplacement_inertiel(
-                    joueur_1,
-                    axe_j1[0],
-                    axe_j1[1],
-                    frein_j1,
-                    delta_simulation,
-                    parametres,
-                )
-                appliquer_deplacement_inertiel(
-                    joueur_2,
-                    axe_j2[0],
-                    axe_j2[1],
-                    frein_j2,
-                    delta_simulation,
-                    parametres,
+                    appuis_en_attente.update(touches_juste_appuyees)
+                if en_manche:
+                    delta_style_en_attente += delta_temps
+                # Les pas rendus apres un gel attendent sa fin pour etre joues.
+                nombre_pas = (
+                    0
+                    if simulation_gelee
+                    else consommer_pas_simulation(accumulateur_simulation, delta_simulation)
                 )
-                resoudre_collision_capsules(joueur_1, joueur_2, parametres)
-
-                decrementer_cooldowns(joueur_1, delta_simulation)
-                decrementer_cooldowns(joueur_2, delta_simulation)
-                mettre_a_jour_bouclier(joueur_1, delta_simulation)
-                mettre_a_jour_bouclier(joueur_2, delta_simulation)
-                charger_ultime(joueur_1, delta_simulation, parametres)
-                charger_ultime(joueur_2, delta_simulation, parametres)
-
-                if en_manche and not simulation_gelee:
-                    j1_dash_presse = j1_controles.dash in touches_juste_appuyees
-                    j2_dash_presse = j2_controles.dash in touches_juste_appuyees
-                    j1_bump_presse = j1_controles.bump in touches_juste_appuyees
-                    j2_bump_presse = j2_controles.bump in touches_juste_appuyees
-                    j1_bouclier_presse = j1_controles.bouclier in touches_juste_appuyees
-                    j2_bouclier_presse = j2_controles.bouclier in touches_juste_appuyees
-                    j1_ultime_presse = j1_controles.ultime in touches_juste_appuyees
-                    j2_ultime_presse = j2_controles.ultime in touches_juste_appuyees
-                    j1_taunt_presse = j1_controles.taunt in touches_juste_appuyees
-                    j2_taunt_presse = j2_controles.taunt in touches_juste_appuyees
-
-                    if j1_dash_presse and activer_dash(joueur_1, parametres):
-                        jouer_son(sons["dash"])
-                        declencher_feedback_impact(
-                            feedback_combat,
-                            particules_impact,
-                            joueur_1.position_x - joueur_1.direction_x * joueur_1.rayon * 0.6,
-                            joueur_1.position_y - joueur_1.direction_y * joueur_1.rayon * 0.6,
-                            -joueur_1.direction_x,
-                            -joueur_1.direction_y,
-                            COULEUR_PARTICULE_DASH,
-                            COULEUR_FLASH_DASH,
-                            INTENSITE_FLASH_DASH,
-                            NOMBRE_PARTICULES_DASH,
-                        )
-                        declencher_reaction_arene_neon(etat_arene_neon, parametres_arene_neon.gain_impact_dash)
-                        if tenter_esquive_proche(joueur_1, joueur_2, style_j1, parametres_style):
-                            declencher_feedback_impact(
-                                feedback_combat,
-                                particules_impact,
-                                joueur_1.position_x,
-                                joueur_1.position_y,
-                                joueur_1.vitesse_x,
-                                joueur_1.vitesse_y,
-                                COULEUR_PARTICULE_DASH,
-                                COULEUR_FLASH_DASH,
-                                INTENSITE_FLASH_DASH * 0.8,
-                                NOMBRE_PARTICULES_DASH,
+                pas_simulation = accumulateur_simulation.pas_fixe
+                elimine_j1 = False
+                elimine_j2 = False
+                duel_courant = EtatDuel(joueur_1, joueur_2, style_j1, style_j2, etat_manche_ia)
+                pas_joues = 0
+                for indice_pas in range(nombre_pas):
+                    pas_joues = indice_pas + 1
+                    memoriser_etat_interpolation(
+                        interpolation_rendu, joueur_1, joueur_2, rayon_arene
+                    )
+                    if indice_pas == 0:
+                        etat_manche_ia.rayon_arene = rayon_arene
+                        etat_manche_ia.temps_restant = temps_restant
+                        if en_manche:
+                            commande_j1 = lire_commande_touches(
+                                touches, appuis_en_attente, j1_controles, simulation_gelee
                             )
-                    if j2_dash_presse and activer_dash(joueur_2, parametres):
-                        jouer_son(sons["dash"])
-                        declencher_feedback_impact(
-                            feedback_combat,
-                            particules_impact,
-                            joueur_2.position_x - joueur_2.direction_x * joueur_2.rayon * 0.6,
-                            joueur_2.position_y - joueur_2.direction_y * joueur_2.rayon * 0.6,
-                            -joueur_2.direction_x,
-                            -joueur_2.direction_y,
-                            COULEUR_PARTICULE_DASH,
-                            COULEUR_FLASH_DASH,
-                            INTENSITE_FLASH_DASH,
-                            NOMBRE_PARTICULES_DASH,
-                        )
-                        declencher_reaction_arene_neon(etat_arene_neon, parametres_arene_neon.gain_impact_dash)
-                        if tenter_esquive_proche(joueur_2, joueur_1, style_j2, parametres_style):
-                            declencher_feedback_impact(
-                                feedback_combat,
-                                particules_impact,
-                                joueur_2.position_x,
-                                joueur_2.position_y,
-                                joueur_2.vitesse_x,
-                                joueur_2.vitesse_y,
-                                COULEUR_PARTICULE_DASH,
-                                COULEUR_FLASH_DASH,
-                                INTENSITE_FLASH_DASH * 0.8,
-                                NOMBRE_PARTICULES_DASH,
+                        else:
+                            commande_j1 = piloter_ia(
+                                politique_ia_j1,
+                                joueur_1,
+                                joueur_2,
+                                etat_manche_ia,
+                                generateur_match,
+                                simulation_gelee,
                             )
-
-                    if j1_bump_presse and executer_bump(joueur_1, joueur_2, parametres):
-                        jouer_son(sons["bump"])
-                        enregistrer_impact_style(style_j1, parametres_style)
-                        declencher_feedback_impact(
-                            feedback_combat,
-                            particules_impact,
-                            joueur_2.position_x,
-                            joueur_2.position_y,
-                            joueur_2.position_x - joueur_1.position_x,
-                            joueur_2.position_y - joueur_1.position_y,
-                            COULEUR_PARTICULE_BUMP,
-                            COULEUR_FLASH_BUMP,
-                            INTENSITE_FLASH_BUMP,
-                            NOMBRE_PARTICULES_BUMP,
-                        )
-                        declencher_reaction_arene_neon(etat_arene_neon, parametres_arene_neon.gain_impact_bump)
-                    if j2_bump_presse and executer_bump(joueur_2, joueur_1, parametres):
-                        jouer_son(sons["bump"])
-                        enregistrer_impact_style(style_j2, parametres_style)
-                        declencher_feedback_impact(
-                            feedback_combat,
-                            particules_impact,
-                            joueur_1.position_x,
-                            joueur_1.position_y,
-                            joueur_1.position_x - joueur_2.position_x,
-                            joueur_1.position_y - joueur_2.position_y,
-                            COULEUR_PARTICULE_BUMP,
-                            COULEUR_FLASH_BUMP,
-                            INTENSITE_FLASH_BUMP,
-                            NOMBRE_PARTICULES_BUMP,
-                        )
-                        declencher_reaction_arene_neon(etat_arene_neon, parametres_arene_neon.gain_impact_bump)
-
-                    if j1_bouclier_presse and activer_bouclier(joueur_1, parametres):
-                        jouer_son(sons["bouclier"])
-                    if j2_bouclier_presse and activer_bouclier(joueur_2, parametres):
-                        jouer_son(sons["bouclier"])
-
-                    vitesse_j2_avant_ultime_x = joueur_2.vitesse_x
-                    vitesse_j2_avant_ultime_y = joueur_2.vitesse_y
-                    if j1_ultime_presse and activer_ultime(joueur_1, joueur_2, parametres):
-                        jouer_son(sons["ultime"])
-                        impact_ultime_j1 = (
-                            abs(joueur_2.vitesse_x - vitesse_j2_avant_ultime_x) > SEUIL_NORME_DIRECTION
-                            or abs(joueur_2.vitesse_y - vitesse_j2_avant_ultime_y) > SEUIL_NORME_DIRECTION
-                        )
-                        declencher_feedback_impact(
-                            feedback_combat,
-                            particules_impact,
-                            joueur_1.position_x,
-                            joueur_1.position_y,
-                            joueur_2.position_x - joueur_1.position_x,
-                            joueur_2.position_y - joueur_1.position_y,
-                            COULEUR_PARTICULE_ULTIME,
-                            COULEUR_FLASH_ULTIME,
-                            INTENSITE_FLASH_ULTIME,
-                            NOMBRE_PARTICULES_ULTIME,
-                            multiplicateur_vitesse=1.2,
-                        )
-                        declencher_reaction_arene_neon(etat_arene_neon, parametres_arene_neon.gain_impact_ultime)
-                        if impact_ultime_j1:
-                            enregistrer_impact_style(style_j1, parametres_style)
-
-                    vitesse_j1_avant_ultime_x = joueur_1.vitesse_x
-                    vitesse_j1_avant_ultime_y = joueur_1.vitesse_y
-                    if j2_ultime_presse and activer_ultime(joueur_2, joueur_1, parametres):
-                        jouer_son(sons["ultime"])
-                        impact_ultime_j2 = (
-                            abs(joueur_1.vitesse_x - vitesse_j1_avant_ultime_x) > SEUIL_NORME_DIRECTION
-                            or abs(joueur_1.vitesse_y - vitesse_j1_avant_ultime_y) > SEUIL_NORME_DIRECTION
+                        if en_manche and not mode_solo:
+                            commande_j2 = lire_commande_touches(
+                                touches, appuis_en_attente, j2_controles, simulation_gelee
+                            )
+                        else:
+                            commande_j2 = piloter_ia(
+                                politique_ia_j2,
+                                joueur_2,
+                                joueur_1,
+                                etat_manche_ia,
+                                generateur_match,
+                                simulation_gelee,
+                            )
+                        taunt_j1 = en_manche and j1_controles.taunt in appuis_en_attente
+                        taunt_j2 = (
+                            en_manche and not mode_solo and j2_controles.taunt in appuis_en_attente
                         )
-                        declencher_feedback_impact(
-                            feedback_combat,
-                            particules_impact,
-                            joueur_2.position_x,
-                            joueur_2.position_y,
-                            joueur_1.position_x - joueur_2.position_x,
-                            joueur_1.position_y - joueur_2.position_y,
-                            COULEUR_PARTICULE_ULTIME,
-                            COULEUR_FLASH_ULTIME,
-                            INTENSITE_FLASH_ULTIME,
-                            NOMBRE_PARTICULES_ULTIME,
-                            multiplicateur_vitesse=1.2,
+                        appuis_en_attente.clear()
+                    else:
+                        # Un appui ne declenche son action qu au premier pas de l image.
+                        commande_j1 = retirer_actions_commande(commande_j1)
+                        commande_j2 = retirer_actions_commande(commande_j2)
+                        taunt_j1 = False
+                        taunt_j2 = False
+
+                    if en_manche and enregistreur_replay is not None:
+                        enregistrer_image_replay(
+                            enregistreur_replay,
+                            commande_j1,
+                            commande_j2,
+                            pas_simulation,
+                            delta_style_en_attente,
                         )
-                        declencher_reaction_arene_neon(etat_arene_neon, parametres_arene_neon.gain_impact_ultime)
-                        if impact_ultime_j2:
-                            enregistrer_impact_style(style_j2, parametres_style)
-
-                    if j1_taunt_presse:
-                        jouer_son(sons["taunt"])
-                    if j2_taunt_presse:
-                        jouer_son(sons["taunt"])
-
-                temps_restant -= delta_simulation
-                multiplicateur = multiplicateur_sudden_death if temps_restant <= 0.0 else 1.0
-                rayon_arene = max(rayon_min, rayon_arene - vitesse_retrecissement * multiplicateur * delta_simulation)
-                if en_manche:
-                    bonus_save_j1 = mettre_a_jour_sauvetage_bord(
-                        joueur_1,
-                        style_j1,
-                        parametres_style,
-                        centre_x,
-                        centre_y,
-                        rayon_arene,
-                        largeur_danger,
-                    )
-                    bonus_save_j2 = mettre_a_jour_sauvetage_bord(
-                        joueur_2,
-                        style_j2,
-                        parametres_style,
-                        centre_x,
-                        centre_y,
-                        rayon_arene,
-                        largeur_danger,
+                    delta_style_en_attente = 0.0
+                    # Timers de style deja avances par image en tete de boucle.
+                    elimine_j1, elimine_j2 = avancer_pas_manche(
+                        duel_courant,
+                        regles_duel,
+                        commande_j1,
+                        commande_j2,
+                        pas_simulation,
+                        0.0,
+                        evenements_pas,
+                        competitif=en_manche,
                     )
-                    if bonus_save_j1:
-                        declencher_feedback_impact(
-                            feedback_combat,
-                            particules_impact,
-                            joueur_1.position_x,
-                            joueur_1.position_y,
-                            centre_x - joueur_1.position_x,
-                            centre_y - joueur_1.position_y,
-                            COULEUR_PARTICULE_ULTIME,
-                            COULEUR_FLASH_DASH,
-                            INTENSITE_FLASH_DASH,
-                            NOMBRE_PARTICULES_DASH,
-                        )
-                        declencher_reaction_arene_neon(etat_arene_neon, parametres_arene_neon.gain_impact_bump)
-                    if bonus_save_j2:
-                        declencher_feedback_impact(
+                    temps_restant = etat_manche_ia.temps_restant
+                    rayon_arene = etat_manche_ia.rayon_arene
+                    for joueur, adversaire, evenements in (
+                        (joueur_1, joueur_2, evenements_pas[0]),
+                        (joueur_2, joueur_1, evenements_pas[1]),
+                    ):
+                        declencher_effets_pas(
                             feedback_combat,
-                            particules_impact,
-                            joueur_2.position_x,
-                            joueur_2.position_y,
-                            centre_x - joueur_2.position_x,
-                            centre_y - joueur_2.position_y,
-                            COULEUR_PARTICULE_ULTIME,
-                            COULEUR_FLASH_DASH,
-                            INTENSITE_FLASH_DASH,
-                            NOMBRE_PARTICULES_DASH,
+                            ressources.particules_impact,
+                            etat_arene_neon,
+                            parametres_arene_neon,
+                            ressources.banque_audio,
+                            joueur,
+                            adversaire,
+                            evenements,
+                            centre_x,
+                            centre_y,
+                            en_manche,
+                            generateur_match,
                         )
-                        declencher_reaction_arene_neon(etat_arene_neon, parametres_arene_neon.gain_impact_bump)
-
-                elimine_j1 = verifier_sortie_arene(joueur_1, centre_x, centre_y, rayon_arene, delta_simulation, parametres)
-                elimine_j2 = verifier_sortie_arene(joueur_2, centre_x, centre_y, rayon_arene, delta_simulation, parametres)
+                    if taunt_j1:
+                        jouer_son_banque(ressources.banque_audio, "taunt")
+                    if taunt_j2:
+                        jouer_son_banque(ressources.banque_audio, "taunt")
+                    if elimine_j1 or elimine_j2 or feedback_combat.gel_restant > 0.0:
+                        break
+                rendre_pas_simulation(accumulateur_simulation, nombre_pas - pas_joues)
+
+                position_j1, position_j2, rayon_rendu = interpoler_etat_rendu(
+                    interpolation_rendu,
+                    joueur_1,
+                    joueur_2,
+                    rayon_arene,
+                    facteur_interpolation(accumulateur_simulation),
+                )
 
                 dessiner_arene(
                     ecran,
                     centre_x,
                     centre_y,
-                    rayon_arene,
+                    rayon_rendu,
                     largeur_danger,
                     couleur_arene_interieur,
                     couleur_arene_bord,
@@ -2253,27 +3364,35 @@ def boucle_jeu() -> int:
                     ecran,
                     centre_x,
                     centre_y,
-                    rayon_arene,
+                    rayon_rendu,
                     couleur_arene_bord,
                     etat_arene_neon,
                     parametres_arene_neon,
+                    cache_arene_neon,
                 )
-                dessiner_joueur(
-                    ecran,
-                    joueur_1,
-                    couleur_joueur_1,
-                    couleur_bouclier,
-                )
-                dessiner_joueur(
-                    ecran,
-                    joueur_2,
-                    couleur_joueur_2,
-                    couleur_bouclier,
+                if rayon_rendu > rayon_arene_image_precedente:
+                    marquer_plein_ecran(suivi_rendu)
+                rayon_arene_image_precedente = rayon_rendu
+                marquer_zones_sales(
+                    suivi_rendu,
+                    *calculer_rectangles_couronne_arene(
+                        centre_x,
+                        centre_y,
+                        rayon_rendu,
+                        largeur_danger,
+                        parametres_arene_neon,
+                    ),
+                    dessiner_joueur(
+                        ecran, joueur_1, couleur_joueur_1, couleur_bouclier, position_j1
+                    ),
+                    dessiner_joueur(
+                        ecran, joueur_2, couleur_joueur_2, couleur_bouclier, position_j2
+                    ),
                 )
-                dessiner_interface(
+                rectangles_interface = dessiner_interface(
                     ecran,
-                    police,
-                    petite_police,
+                    ressources.police,
+                    ressources.petite_police,
                     largeur,
                     hauteur,
                     couleur_ui,
@@ -2287,11 +3406,14 @@ def boucle_jeu() -> int:
                     joueur_2,
                     temps_restant,
                 )
+                marquer_zones_sales(suivi_rendu, *rectangles_interface)
 
                 if elimine_j1 or elimine_j2:
-                    jouer_son(sons["elimination"])
+                    jouer_son_banque(ressources.banque_audio, "elimination")
                     declencher_reaction_arene_neon(etat_arene_neon, parametres_arene_neon.gain_impact_ultime)
                     if en_manche:
+                        if enregistreur_replay is not None:
+                            terminer_manche_replay(enregistreur_replay)
                         if elimine_j1 and not elimine_j2:
                             score_j2 += 1
                             vainqueur_manche = "J2"
@@ -2303,12 +3425,18 @@ def boucle_jeu() -> int:
 
                         if score_j1 >= victoires_pour_gagner:
                             vainqueur_match = "J1"
-                            incrementer_highscore(vainqueur_match)
+                            if not mode_solo:
+                                incrementer_highscore(vainqueur_match, ressources.stock_highscore)
+                            sauvegarder_replay_match(configuration, enregistreur_replay)
+                            enregistreur_replay = None
                             etat = "fin_match"
                             countdown = duree_ecran_fin
                         elif score_j2 >= victoires_pour_gagner:
                             vainqueur_match = "J2"
-                            incrementer_highscore(vainqueur_match)
+                            if not mode_solo:
+                                incrementer_highscore(vainqueur_match, ressources.stock_highscore)
+                            sauvegarder_replay_match(configuration, enregistreur_replay)
+                            enregistreur_replay = None
                             etat = "fin_match"
                             countdown = duree_ecran_fin
                         else:
@@ -2327,25 +3455,141 @@ def boucle_jeu() -> int:
                         reinitialiser_style_pour_manche(style_j1)
                         reinitialiser_style_pour_manche(style_j2)
                         countdown = countdown_attract_initial
-                        vider_feedback_combat(feedback_combat, particules_impact)
+                        vider_feedback_combat(feedback_combat, ressources.particules_impact)
                         reinitialiser_etat_arene_neon(etat_arene_neon)
+                        reinitialiser_accumulateur_simulation(accumulateur_simulation)
                         etat = "attract"
 
-        elif etat == "resultat_manche":
-            countdown -= delta_simulation
-            dessiner_texte(
+        elif etat == "melee" and etat_melee is not None:
+            marquer_plein_ecran(suivi_rendu)
+            humain_j2 = rejoindre_melee(politiques_melee, j2_controles, touches_juste_appuyees)
+            appuis_en_attente.update(touches_juste_appuyees)
+            if pause_melee > 0.0:
+                pause_melee -= delta_simulation
+                appuis_en_attente.clear()
+            else:
+                # La boucle ne s interrompt qu en fin de manche: la manche suivante
+                # repart d un accumulateur vide, aucun pas n est a rendre.
+                nombre_pas = consommer_pas_simulation(accumulateur_simulation, delta_simulation)
+                for indice_pas in range(nombre_pas):
+                    if indice_pas == 0:
+                        commandes_melee = choisir_commandes_melee(
+                            etat_melee, politiques_melee, generateur_match
+                        )
+                        commandes_melee[0] = lire_commande_touches(
+                            touches, appuis_en_attente, j1_controles, False
+                        )
+                        if humain_j2:
+                            commandes_melee[1] = lire_commande_touches(
+                                touches, appuis_en_attente, j2_controles, False
+                            )
+                        appuis_en_attente.clear()
+                    else:
+                        commandes_melee = [
+                            retirer_actions_commande(commande) for commande in commandes_melee
+                        ]
+                    if avancer_pas_melee(
+                        etat_melee, regles_melee, commandes_melee, accumulateur_simulation.pas_fixe
+                    ):
+                        jouer_son_banque(ressources.banque_audio, "elimination")
+                        declencher_reaction_arene_neon(
+                            etat_arene_neon, parametres_arene_neon.gain_impact_ultime
+                        )
+                    restants = lister_combattants_actifs(etat_melee)
+                    if len(restants) > 1:
+                        continue
+                    dernier_vainqueur_manche = "Egalite"
+                    score_vainqueur = 0
+                    if restants:
+                        scores_melee[restants[0]] += 1
+                        score_vainqueur = scores_melee[restants[0]]
+                        dernier_vainqueur_manche = etat_melee.joueurs[restants[0]].identifiant
+                    if score_vainqueur >= parametres_melee.victoires_pour_gagner:
+                        vainqueur_match = dernier_vainqueur_manche
+                        etat = "fin_match"
+                        countdown = duree_ecran_fin
+                    else:
+                        etat_melee = creer_etat_melee(
+                            configuration, parametres_melee.nombre_combattants
+                        )
+                        pause_melee = duree_ecran_resultat + compte_a_rebours_initial
+                        reinitialiser_accumulateur_simulation(accumulateur_simulation)
+                    break
+
+            rayon_melee = etat_melee.etat_manche.rayon_arene
+            dessiner_arene(
                 ecran,
-                police,
-                f"Manche: {dernier_vainqueur_manche}",
-                couleur_texte_information,
-                (centre_x, hauteur * 0.4),
+                centre_x,
+                centre_y,
+                rayon_melee,
+                largeur_danger,
+                couleur_arene_interieur,
+                couleur_arene_bord,
+                couleur_arene_danger,
+            )
+            dessiner_effets_arene_neon(
+                ecran,
+                centre_x,
+                centre_y,
+                rayon_melee,
+                couleur_arene_bord,
+                etat_arene_neon,
+                parametres_arene_neon,
+                cache_arene_neon,
             )
+            for indice, combattant in enumerate(etat_melee.joueurs):
+                if etat_melee.actifs[indice]:
+                    dessiner_joueur(
+                        ecran,
+                        combattant,
+                        couleur_combattant_melee(indice, couleur_joueur_1, couleur_joueur_2),
+                        couleur_bouclier,
+                    )
             dessiner_texte(
                 ecran,
-                petite_police,
-                f"Score {score_j1}-{score_j2}",
+                ressources.petite_police,
+                "   ".join(
+                    f"{combattant.identifiant}: {score}"
+                    for combattant, score in zip(etat_melee.joueurs, scores_melee)
+                ),
                 couleur_texte_information,
-                (centre_x, hauteur * 0.5),
+                (centre_x, 28),
+            )
+            if pause_melee > compte_a_rebours_initial:
+                dessiner_texte(
+                    ecran,
+                    ressources.police,
+                    f"Manche: {dernier_vainqueur_manche}",
+                    couleur_texte_information,
+                    (centre_x, hauteur * 0.2),
+                )
+            elif pause_melee > 0.0:
+                dessiner_texte(
+                    ecran,
+                    ressources.police,
+                    f"{max(1, int(pause_melee) + 1)}",
+                    couleur_texte_information,
+                    (centre_x, hauteur * 0.2),
+                )
+
+        elif etat == "resultat_manche":
+            countdown -= delta_simulation
+            marquer_zones_sales(
+                suivi_rendu,
+                dessiner_texte(
+                    ecran,
+                    ressources.police,
+                    f"Manche: {dernier_vainqueur_manche}",
+                    couleur_texte_information,
+                    (centre_x, hauteur * 0.4),
+                ),
+                dessiner_texte(
+                    ecran,
+                    ressources.petite_police,
+                    f"Score {score_j1}-{score_j2}",
+                    couleur_texte_information,
+                    (centre_x, hauteur * 0.5),
+                ),
             )
             if countdown <= 0.0:
                 joueur_1, joueur_2, temps_restant, countdown, rayon_arene = reinitialiser_manche(
@@ -2358,23 +3602,43 @@ def boucle_jeu() -> int:
                 )
                 reinitialiser_style_pour_manche(style_j1)
                 reinitialiser_style_pour_manche(style_j2)
-                vider_feedback_combat(feedback_combat, particules_impact)
+                vider_feedback_combat(feedback_combat, ressources.particules_impact)
                 reinitialiser_etat_arene_neon(etat_arene_neon)
                 etat = "compte_a_rebours"
 
         elif etat == "fin_match":
             countdown -= delta_simulation
-            dessiner_texte(ecran, police, f"Victoire {vainqueur_match}", couleur_titre, (centre_x, hauteur * 0.35))
-            dessiner_texte(
-                ecran,
-                petite_police,
-                "B1: Revanche  |  B6: Menu",
-                couleur_texte_information,
-                (centre_x, hauteur * 0.47),
+            marquer_zones_sales(
+                suivi_rendu,
+                dessiner_texte(
+                    ecran,
+                    ressources.police,
+                    f"Victoire {vainqueur_match}",
+                    couleur_titre,
+                    (centre_x, hauteur * 0.35),
+                ),
+                dessiner_texte(
+                    ecran,
+                    ressources.petite_police,
+                    "B1: Revanche  |  B6: Menu",
+                    couleur_texte_information,
+                    (centre_x, hauteur * 0.47),
+                ),
             )
-            if appui_dash_global:
+            if appui_dash_global and mode_melee:
+                etat_melee, politiques_melee, scores_melee = demarrer_melee(
+                    configuration, parametres_melee
+                )
+                pause_melee = compte_a_rebours_initial
+                dernier_vainqueur_manche = ""
+                vider_feedback_combat(feedback_combat, ressources.particules_impact)
+                reinitialiser_etat_arene_neon(etat_arene_neon)
+                reinitialiser_accumulateur_simulation(accumulateur_simulation)
+                etat = "melee"
+            elif appui_dash_global:
                 score_j1 = 0
                 score_j2 = 0
+                generateur_match, enregistreur_replay = demarrer_replay_match(configuration)
                 reinitialiser_etat_style(style_j1)
                 reinitialiser_etat_style(style_j2)
                 joueur_1, joueur_2, temps_restant, countdown, rayon_arene = reinitialiser_manche(
@@ -2387,22 +3651,41 @@ def boucle_jeu() -> int:
                 )
                 reinitialiser_style_pour_manche(style_j1)
                 reinitialiser_style_pour_manche(style_j2)
-                vider_feedback_combat(feedback_combat, particules_impact)
+                vider_feedback_combat(feedback_combat, ressources.particules_impact)
                 reinitialiser_etat_arene_neon(etat_arene_neon)
                 etat = "compte_a_rebours"
             if appui_ultime_global:
-                vider_feedback_combat(feedback_combat, particules_impact)
+                vider_feedback_combat(feedback_combat, ressources.particules_impact)
                 reinitialiser_etat_arene_neon(etat_arene_neon)
                 etat = "titre"
             if countdown <= 0.0:
-                vider_feedback_combat(feedback_combat, particules_impact)
+                vider_feedback_combat(feedback_combat, ressources.particules_impact)
                 reinitialiser_etat_arene_neon(etat_arene_neon)
                 etat = "titre"
 
-        dessiner_particules(ecran, particules_impact)
-        appliquer_flash_ecran(ecran, feedback_combat)
-        pygame.display.flip()
+        marquer_zones_sales(suivi_rendu, dessiner_particules(ecran, ressources.particules_impact))
+        if appliquer_flash_ecran(ecran, feedback_combat):
+            marquer_plein_ecran(suivi_rendu)
+        if etat != etat_debut_image or etat_debut_image != etat_image_precedente:
+            marquer_plein_ecran(suivi_rendu)
+        etat_image_precedente = etat
+        if profileur is not None:
+            rectangle_overlay = profilage_images.dessiner_overlay_profilage(profileur, ecran)
+            marquer_zones_sales(suivi_rendu, rectangle_overlay)
+            profilage_images.marquer_phase(profileur, profilage_images.PHASE_DESSIN)
+        zones_a_presenter = preparer_presentation(suivi_rendu, rectangle_ecran)
+        if zones_a_presenter is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(zones_a_presenter)
+        if profileur is not None:
+            profilage_images.marquer_phase(profileur, profilage_images.PHASE_PRESENTATION)
+            profilage_images.terminer_image(profileur)
         mettre_a_jour_feedback_combat(feedback_combat, delta_temps)
+        if not chargement.premiere_image_presentee:
+            chargement.premiere_image_presentee = True
+            marquer_etape_demarrage(trace_demarrage, "premiere_image")
+        avancer_chargement(chargement, ressources)
 
 
 def main() -> None:
@@ -0,0 +1,681 @@
+"""Mode melee (chacun pour soi) de Neon Sumo, de 3 a 8 combattants.
+
+Les interactions restent celles de ``logique.py`` (collision, bump, onde
+ultime), appliquees paire par paire. Pour ne pas tester toutes les paires,
+une grille uniforme (hachage spatial) range les combattants par cellule: la
+collision ne teste que les cellules voisines et les requetes de portee
+(bump, ultime) ne parcourent que les cellules couvertes par leur rayon.
+Aucune dependance pygame.
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, field
+from math import cos, floor, pi, sin
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from logique import (
+    COOLDOWN_BUMP,
+    Joueur,
+    TableCooldowns,
+    activer_bouclier,
+    activer_dash,
+    appliquer_deplacement_inertiel,
+    appliquer_onde_ultime,
+    charger_ultime,
+    construire_parametres_combat,
+    cooldown_pret,
+    decrementer_cooldowns,
+    executer_bump,
+    mettre_a_jour_bouclier,
+    resoudre_collision_capsules,
+    verifier_sortie_arene,
+)
+from simulation import (
+    DELTA_TEMPS_DEFAUT,
+    FACTEUR_DUREE_LIMITE_MANCHE,
+    LIMITE_MANCHES_DEFAUT,
+    CommandeJoueur,
+    EtatManche,
+    Politique,
+    ReglesSimulation,
+    construire_regles_simulation,
+)
+
+
+NOMBRE_MIN_COMBATTANTS = 3
+NOMBRE_MAX_COMBATTANTS = 8
+# Demi-voisinage: chaque paire de cellules adjacentes n est visitee qu une fois.
+DECALAGES_VOISINS = ((1, -1), (1, 0), (1, 1), (0, 1))
+COMMANDE_NEUTRE = CommandeJoueur()
+
+
+@dataclass
+class ParametresMelee:
+    """Reglages du mode melee (section ``melee`` de la configuration).
+
+    Attributes:
+        nombre_combattants: Nombre de combattants, bots compris.
+        victoires_pour_gagner: Manches a gagner pour remporter la melee.
+        budget_ia_us: Budget de recherche par bot et par image, en microsecondes.
+    """
+
+    nombre_combattants: int = 4
+    victoires_pour_gagner: int = 3
+    budget_ia_us: int = 400
+
+
+@dataclass
+class GrilleSpatiale:
+    """Hachage spatial uniforme des combattants actifs.
+
+    Attributes:
+        taille_cellule: Cote d une cellule; au moins la distance de contact de deux capsules.
+        cellules: Indices des combattants par cellule (colonne, ligne), dans l ordre des indices.
+    """
+
+    taille_cellule: float
+    cellules: Dict[Tuple[int, int], List[int]] = field(default_factory=dict)
+
+
+@dataclass
+class EtatMelee:
+    """Etat d une manche de melee.
+
+    Attributes:
+        joueurs: Combattants, J1 et J2 en tete.
+        actifs: False pour les combattants elimines.
+        etat_manche: Etat de l arene.
+        grille: Grille spatiale reconstruite a chaque pas.
+    """
+
+    joueurs: List[Joueur]
+    actifs: List[bool]
+    etat_manche: EtatManche
+    grille: GrilleSpatiale
+
+
+@dataclass
+class ResultatMancheMelee:
+    """Resultat d une manche de melee.
+
+    Attributes:
+        vainqueur: Indice du dernier combattant en lice, None si egalite.
+        ordre_elimination: Indices des combattants dans l ordre de sortie.
+        duree: Duree de jeu en secondes.
+        nombre_pas: Nombre de pas de simulation.
+        interrompue: True si la duree limite a ete atteinte.
+    """
+
+    vainqueur: Optional[int]
+    ordre_elimination: List[int]
+    duree: float
+    nombre_pas: int
+    interrompue: bool = False
+
+
+@dataclass
+class ResultatMelee:
+    """Resultat d une melee complete.
+
+    Attributes:
+        vainqueur: Indice du vainqueur, None si la limite de manches est atteinte.
+        scores: Manches gagnees par combattant.
+        manches: Detail des manches jouees.
+    """
+
+    vainqueur: Optional[int]
+    scores: List[int]
+    manches: List[ResultatMancheMelee] = field(default_factory=list)
+
+
+def construire_parametres_melee(configuration: Dict[str, object]) -> ParametresMelee:
+    """Lit la section ``melee`` de la configuration.
+
+    Args:
+        configuration: Configuration globale du jeu.
+
+    Returns:
+        ParametresMelee, valeurs par defaut pour les cles absentes.
+    """
+
+    section = configuration.get("melee", {})
+    defaut = ParametresMelee()
+    return ParametresMelee(
+        nombre_combattants=int(section.get("nombre_combattants", defaut.nombre_combattants)),
+        victoires_pour_gagner=int(
+            section.get("victoires_pour_gagner", defaut.victoires_pour_gagner)
+        ),
+        budget_ia_us=int(section.get("budget_ia_us", defaut.budget_ia_us)),
+    )
+
+
+def calculer_taille_cellule(configuration: Dict[str, object]) -> float:
+    """Dimensionne les cellules sur la portee du bump (contact compris).
+
+    Args:
+        configuration: Configuration globale du jeu.
+
+    Returns:
+        Cote d une cellule en pixels.
+    """
+
+    parametres = construire_parametres_combat(configuration)
+    rayon = float(configuration["physique"]["rayon_capsule"])
+    return parametres.rayon_bump + 2.0 * rayon
+
+
+def remplir_grille(
+    grille: GrilleSpatiale,
+    joueurs: Sequence[Joueur],
+    actifs: Sequence[bool],
+) -> None:
+    """Range les combattants actifs dans leur cellule.
+
+    Args:
+        grille: Grille modifiee sur place.
+        joueurs: Combattants.
+        actifs: Drapeaux des combattants encore en lice.
+
+    Returns:
+        None.
+    """
+
+    cellules = grille.cellules
+    cellules.clear()
+    inverse_taille = 1.0 / grille.taille_cellule
+    for indice, joueur in enumerate(joueurs):
+        if not actifs[indice]:
+            continue
+        cle = (floor(joueur.position_x * inverse_taille), floor(joueur.position_y * inverse_taille))
+        contenu = cellules.get(cle)
+        if contenu is None:
+            cellules[cle] = [indice]
+        else:
+            contenu.append(indice)
+
+
+def lister_paires_voisines(grille: GrilleSpatiale) -> List[Tuple[int, int]]:
+    """Liste les paires de combattants situes dans des cellules voisines.
+
+    Les paires plus eloignees qu une cellule ne peuvent pas se toucher. Le tri
+    garantit le meme ordre de resolution qu une double boucle sur les indices.
+
+    Args:
+        grille: Grille remplie.
+
+    Returns:
+        Paires (i, j) avec i < j, triees.
+    """
+
+    paires: List[Tuple[int, int]] = []
+    cellules = grille.cellules
+    for (colonne, ligne), indices in cellules.items():
+        nombre = len(indices)
+        for rang, premier in enumerate(indices):
+            for rang_second in range(rang + 1, nombre):
+                paires.append((premier, indices[rang_second]))
+        for decalage_colonne, decalage_ligne in DECALAGES_VOISINS:
+            voisins = cellules.get((colonne + decalage_colonne, ligne + decalage_ligne))
+            if not voisins:
+                continue
+            for premier in indices:
+                for second in voisins:
+                    paires.append((premier, second) if premier < second else (second, premier))
+    paires.sort()
+    return paires
+
+
+def lister_voisins_dans_rayon(
+    grille: GrilleSpatiale,
+    position_x: float,
+    position_y: float,
+    rayon: float,
+) -> List[int]:
+    """Liste les combattants des cellules couvertes par un disque.
+
+    Le resultat est un sur-ensemble: la distance exacte reste testee par les
+    fonctions de ``logique.py``.
+
+    Args:
+        grille: Grille remplie.
+        position_x: Centre X du disque.
+        position_y: Centre Y du disque.
+        rayon: Rayon du disque.
+
+    Returns:
+        Indices candidats, tries.
+    """
+
+    inverse_taille = 1.0 / grille.taille_cellule
+    cellules = grille.cellules
+    candidats: List[int] = []
+    colonne_max = floor((position_x + rayon) * inverse_taille)
+    ligne_min = floor((position_y - rayon) * inverse_taille)
+    ligne_max = floor((position_y + rayon) * inverse_taille)
+    for colonne in range(floor((position_x - rayon) * inverse_taille), colonne_max + 1):
+        for ligne in range(ligne_min, ligne_max + 1):
+            indices = cellules.get((colonne, ligne))
+            if indices:
+                candidats.extend(indices)
+    candidats.sort()
+    return candidats
+
+
+def creer_combattants(
+    configuration: Dict[str, object],
+    nombre_combattants: int,
+    centre_x: float,
+    centre_y: float,
+) -> List[Joueur]:
+    """Place les combattants en cercle, tournes vers le centre.
+
+    J1 part a gauche comme en duel; les suivants se repartissent dans le sens
+    horaire a la distance de depart.
+
+    Args:
+        configuration: Configuration globale du jeu.
+        nombre_combattants: Nombre de combattants.
+        centre_x: Centre X de l arene.
+        centre_y: Centre Y de l arene.
+
+    Returns:
+        Liste des combattants J1..Jn.
+    """
+
+    rayon = float(configuration["physique"]["rayon_capsule"])
+    distance_depart = float(configuration["physique"]["distance_depart"])
+    combattants = []
+    for indice in range(nombre_combattants):
+        angle = pi + 2.0 * pi * indice / nombre_combattants
+        direction_x = cos(angle)
+        direction_y = sin(angle)
+        combattants.append(
+            Joueur(
+                identifiant=f"J{indice + 1}",
+                position_x=centre_x + direction_x * distance_depart,
+                position_y=centre_y + direction_y * distance_depart,
+                vitesse_x=0.0,
+                vitesse_y=0.0,
+                rayon=rayon,
+                direction_x=-direction_x,
+                direction_y=-direction_y,
+                cooldowns=TableCooldowns(),
+            )
+        )
+    return combattants
+
+
+def creer_etat_melee(configuration: Dict[str, object], nombre_combattants: int) -> EtatMelee:
+    """Prepare une manche de melee.
+
+    Args:
+        configuration: Configuration globale du jeu.
+        nombre_combattants: Nombre de combattants, entre 3 et 8.
+
+    Returns:
+        EtatMelee de la nouvelle manche.
+
+    Raises:
+        ValueError: Si le nombre de combattants est hors limites.
+    """
+
+    if not NOMBRE_MIN_COMBATTANTS <= nombre_combattants <= NOMBRE_MAX_COMBATTANTS:
+        raise ValueError(
+            f"Une melee se joue de {NOMBRE_MIN_COMBATTANTS} a {NOMBRE_MAX_COMBATTANTS} combattants."
+        )
+    largeur = int(configuration["ecran"]["largeur"])
+    hauteur = int(configuration["ecran"]["hauteur"])
+    arene = configuration["arene"]
+    etat_manche = EtatManche(
+        centre_x=largeur / 2.0,
+        centre_y=hauteur / 2.0,
+        rayon_arene=float(arene["rayon_depart"]),
+        temps_restant=float(configuration["match"]["duree_max_manche"]),
+        largeur_danger=float(arene["largeur_zone_danger"]),
+    )
+    joueurs = creer_combattants(
+        configuration, nombre_combattants, etat_manche.centre_x, etat_manche.centre_y
+    )
+    return EtatMelee(
+        joueurs=joueurs,
+        actifs=[True] * nombre_combattants,
+        etat_manche=etat_manche,
+        grille=GrilleSpatiale(calculer_taille_cellule(configuration)),
+    )
+
+
+def executer_bump_melee(etat: EtatMelee, indice: int, regles: ReglesSimulation) -> Optional[int]:
+    """Applique le bump d un combattant a la cible valide la plus proche.
+
+    Args:
+        etat: Etat de la melee.
+        indice: Indice de l attaquant.
+        regles: Regles du match.
+
+    Returns:
+        Indice de la cible touchee, ou None.
+    """
+
+    attaquant = etat.joueurs[indice]
+    if not cooldown_pret(attaquant, COOLDOWN_BUMP):
+        return None
+    parametres = regles.parametres
+    portee = parametres.rayon_bump + 2.0 * attaquant.rayon
+    candidats = lister_voisins_dans_rayon(
+        etat.grille, attaquant.position_x, attaquant.position_y, portee + attaquant.rayon
+    )
+    joueurs = etat.joueurs
+
+    def distance_carre(cible: int) -> float:
+        """Distance au carre entre l attaquant et une cible.
+
+        Args:
+            cible: Indice de la cible.
+
+        Returns:
+            Distance au carre.
+        """
+
+        ecart_x = joueurs[cible].position_x - attaquant.position_x
+        ecart_y = joueurs[cible].position_y - attaquant.position_y
+        return ecart_x * ecart_x + ecart_y * ecart_y
+
+    for cible in sorted(candidats, key=distance_carre):
+        if cible != indice and executer_bump(attaquant, joueurs[cible], parametres):
+            return cible
+    return None
+
+
+def activer_ultime_melee(
+    etat: EtatMelee,
+    indice: int,
+    regles: ReglesSimulation,
+) -> Optional[List[int]]:
+    """Lance l onde ultime d un combattant sur toutes les cibles a portee.
+
+    Args:
+        etat: Etat de la melee.
+        indice: Indice du lanceur.
+        regles: Regles du match.
+
+    Returns:
+        Indices des cibles touchees, ou None si la jauge n est pas pleine.
+    """
+
+    attaquant = etat.joueurs[indice]
+    if attaquant.jauge_ultime < 1.0:
+        return None
+    parametres = regles.parametres
+    candidats = lister_voisins_dans_rayon(
+        etat.grille,
+        attaquant.position_x,
+        attaquant.position_y,
+        parametres.rayon_ultime + 2.0 * attaquant.rayon,
+    )
+    touches = [
+        cible
+        for cible in candidats
+        if cible != indice and appliquer_onde_ultime(attaquant, etat.joueurs[cible], parametres)
+    ]
+    attaquant.jauge_ultime = 0.0
+    return touches
+
+
+def trouver_adversaire_proche(etat: EtatMelee, indice: int) -> Optional[int]:
+    """Designe l adversaire actif le plus proche, cible des politiques.
+
+    Args:
+        etat: Etat de la melee.
+        indice: Indice du combattant.
+
+    Returns:
+        Indice de l adversaire, ou None s il est seul.
+    """
+
+    joueur = etat.joueurs[indice]
+    meilleur = None
+    meilleure_distance = 0.0
+    for autre, adversaire in enumerate(etat.joueurs):
+        if autre == indice or not etat.actifs[autre]:
+            continue
+        ecart_x = adversaire.position_x - joueur.position_x
+        ecart_y = adversaire.position_y - joueur.position_y
+        distance_carre = ecart_x * ecart_x + ecart_y * ecart_y
+        if meilleur is None or distance_carre < meilleure_distance:
+            meilleur = autre
+            meilleure_distance = distance_carre
+    return meilleur
+
+
+def choisir_commandes_melee(
+    etat: EtatMelee,
+    politiques: Sequence[Optional[Politique]],
+    generateur: random.Random,
+) -> List[CommandeJoueur]:
+    """Interroge la politique de chaque combattant actif face a son plus proche voisin.
+
+    Args:
+        etat: Etat de la melee.
+        politiques: Politique par combattant; None pour un humain (commande neutre).
+        generateur: Generateur pseudo-aleatoire.
+
+    Returns:
+        Une commande par combattant.
+    """
+
+    commandes = []
+    for indice, politique in enumerate(politiques):
+        adversaire = trouver_adversaire_proche(etat, indice)
+        if politique is None or not etat.actifs[indice] or adversaire is None:
+            commandes.append(COMMANDE_NEUTRE)
+            continue
+        commandes.append(
+            politique(etat.joueurs[indice], etat.joueurs[adversaire], etat.etat_manche, generateur)
+        )
+    return commandes
+
+
+def avancer_pas_melee(
+    etat: EtatMelee,
+    regles: ReglesSimulation,
+    commandes: Sequence[CommandeJoueur],
+    delta_temps: float,
+) -> List[int]:
+    """Avance une manche de melee d un pas, dans l ordre du duel.
+
+    Args:
+        etat: Etat de la melee, modifie sur place.
+        regles: Regles du match.
+        commandes: Une commande par combattant (ignoree pour les elimines).
+        delta_temps: Pas de physique en secondes.
+
+    Returns:
+        Indices des combattants elimines pendant ce pas.
+    """
+
+    joueurs = etat.joueurs
+    actifs = etat.actifs
+    parametres = regles.parametres
+    etat_manche = etat.etat_manche
+
+    for indice, joueur in enumerate(joueurs):
+        if actifs[indice]:
+            commande = commandes[indice]
+            appliquer_deplacement_inertiel(
+                joueur,
+                commande.entree_x,
+                commande.entree_y,
+                commande.frein,
+                delta_temps,
+                parametres,
+            )
+    remplir_grille(etat.grille, joueurs, actifs)
+    for premier, second in lister_paires_voisines(etat.grille):
+        resoudre_collision_capsules(joueurs[premier], joueurs[second], parametres)
+
+    for indice, joueur in enumerate(joueurs):
+        if actifs[indice]:
+            decrementer_cooldowns(joueur, delta_temps)
+            mettre_a_jour_bouclier(joueur, delta_temps)
+            charger_ultime(joueur, delta_temps, parametres)
+
+    for indice, joueur in enumerate(joueurs):
+        if not actifs[indice]:
+            continue
+        commande = commandes[indice]
+        if commande.dash:
+            activer_dash(joueur, parametres)
+        if commande.bump:
+            executer_bump_melee(etat, indice, regles)
+        if commande.bouclier:
+            activer_bouclier(joueur, parametres)
+        if commande.ultime:
+            activer_ultime_melee(etat, indice, regles)
+
+    etat_manche.temps_restant -= delta_temps
+    multiplicateur = regles.multiplicateur_sudden_death if etat_manche.temps_restant <= 0.0 else 1.0
+    etat_manche.rayon_arene = max(
+        regles.rayon_min,
+        etat_manche.rayon_arene - regles.vitesse_retrecissement * multiplicateur * delta_temps,
+    )
+
+    elimines = [
+        indice
+        for indice, joueur in enumerate(joueurs)
+        if actifs[indice]
+        and verifier_sortie_arene(
+            joueur,
+            etat_manche.centre_x,
+            etat_manche.centre_y,
+            etat_manche.rayon_arene,
+            delta_temps,
+            parametres,
+        )
+    ]
+    for indice in elimines:
+        actifs[indice] = False
+    return elimines
+
+
+def lister_combattants_actifs(etat: EtatMelee) -> List[int]:
+    """Liste les combattants encore en lice.
+
+    Args:
+        etat: Etat de la melee.
+
+    Returns:
+        Indices des combattants actifs.
+    """
+
+    return [indice for indice, actif in enumerate(etat.actifs) if actif]
+
+
+def simuler_manche_melee(
+    configuration: Dict[str, object],
+    regles: ReglesSimulation,
+    politiques: Sequence[Politique],
+    generateur: random.Random,
+    delta_temps: float,
+) -> ResultatMancheMelee:
+    """Joue une manche de melee jusqu au dernier combattant en lice.
+
+    Args:
+        configuration: Configuration globale du jeu.
+        regles: Regles du match.
+        politiques: Politique de chaque combattant.
+        generateur: Generateur pseudo-aleatoire du match.
+        delta_temps: Pas de temps fixe en secondes.
+
+    Returns:
+        ResultatMancheMelee de la manche jouee.
+    """
+
+    etat = creer_etat_melee(configuration, len(politiques))
+    duree_limite = etat.etat_manche.temps_restant * FACTEUR_DUREE_LIMITE_MANCHE
+    nombre_pas_max = max(1, int(duree_limite / delta_temps))
+    ordre_elimination: List[int] = []
+    nombre_pas = 0
+    while nombre_pas < nombre_pas_max:
+        nombre_pas += 1
+        commandes = choisir_commandes_melee(etat, politiques, generateur)
+        ordre_elimination.extend(avancer_pas_melee(etat, regles, commandes, delta_temps))
+        restants = lister_combattants_actifs(etat)
+        if len(restants) <= 1:
+            return ResultatMancheMelee(
+                vainqueur=restants[0] if restants else None,
+                ordre_elimination=ordre_elimination,
+                duree=nombre_pas * delta_temps,
+                nombre_pas=nombre_pas,
+            )
+
+    return ResultatMancheMelee(
+        vainqueur=None,
+        ordre_elimination=ordre_elimination,
+        duree=nombre_pas * delta_temps,
+        nombre_pas=nombre_pas,
+        interrompue=True,
+    )
+
+
+def simuler_melee(
+    configuration: Dict[str, object],
+    politiques: Sequence[Politique],
+    seed: int,
+    dt: float = DELTA_TEMPS_DEFAUT,
+    limite_manches: int = LIMITE_MANCHES_DEFAUT,
+) -> ResultatMelee:
+    """Joue une melee complete sans affichage avec un pas de temps fixe.
+
+    Args:
+        configuration: Configuration globale du jeu.
+        politiques: Politique de chaque combattant (leur nombre fixe celui des combattants).
+        seed: Graine du generateur pseudo-aleatoire passe aux politiques.
+        dt: Pas de temps fixe en secondes.
+        limite_manches: Nombre maximal de manches.
+
+    Returns:
+        ResultatMelee de la melee.
+    """
+
+    if dt <= 0.0:
+        raise ValueError("Le pas de temps dt doit etre strictement positif.")
+
+    regles = construire_regles_simulation(configuration)
+    victoires_pour_gagner = construire_parametres_melee(configuration).victoires_pour_gagner
+    generateur = random.Random(seed)
+    resultat = ResultatMelee(vainqueur=None, scores=[0] * len(politiques))
+    while len(resultat.manches) < limite_manches:
+        manche = simuler_manche_melee(configuration, regles, politiques, generateur, dt)
+        resultat.manches.append(manche)
+        if manche.vainqueur is None:
+            continue
+        resultat.scores[manche.vainqueur] += 1
+        if resultat.scores[manche.vainqueur] >= victoires_pour_gagner:
+            resultat.vainqueur = manche.vainqueur
+            break
+    return resultat
+
+
+__all__ = [
+    "NOMBRE_MIN_COMBATTANTS",
+    "NOMBRE_MAX_COMBATTANTS",
+    "ParametresMelee",
+    "GrilleSpatiale",
+    "EtatMelee",
+    "ResultatMancheMelee",
+    "ResultatMelee",
+    "construire_parametres_melee",
+    "remplir_grille",
+    "lister_paires_voisines",
+    "lister_voisins_dans_rayon",
+    "creer_etat_melee",
+    "executer_bump_melee",
+    "activer_ultime_melee",
+    "choisir_commandes_melee",
+    "avancer_pas_melee",
+    "lister_combattants_actifs",
+    "simuler_manche_melee",
+    "simuler_melee",
+]
@@ -0,0 +1,951 @@
+"""Moteur physique vectorise NumPy pour Neon Sumo.
+
+Ce module reproduit a l identique les helpers scalaires de ``logique.py``
+sur des lots de N joueurs stockes en tableaux (struct-of-arrays). Il sert
+aux simulations sans affichage ou de nombreux duels avancent en parallele:
+``simuler_matchs_lot`` garde un meme lot d un pas a l autre pour jouer des
+matchs entiers. ``avancer_joueurs`` ne fait qu un pas sur des joueurs
+scalaires et retombe sur les helpers scalaires sans NumPy.
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, fields
+from typing import Dict, List, Sequence, Tuple
+
+from logique import (
+    FACTEUR_PARTAGE_COLLISION,
+    MULTIPLICATEUR_LIMITE_VITESSE_COLLISION,
+    NOMS_COOLDOWNS,
+    SEUIL_NORME_CARREE,
+    Joueur,
+    ParametresCombat,
+    appliquer_deplacement_inertiel,
+    charger_ultime,
+    creer_joueurs,
+    decrementer_cooldowns,
+    mettre_a_jour_bouclier,
+    resoudre_collision_capsules,
+    verifier_sortie_arene,
+)
+from simulation import (
+    DELTA_TEMPS_DEFAUT,
+    FACTEUR_DUREE_LIMITE_MANCHE,
+    LIMITE_MANCHES_DEFAUT,
+    ReglesSimulation,
+    ResultatManche,
+    ResultatMatch,
+    construire_regles_simulation,
+    determiner_vainqueur_manche,
+)
+
+try:
+    import numpy as np
+except ModuleNotFoundError:  # pragma: no cover - numpy absent de la borne
+    np = None
+
+
+NUMPY_DISPONIBLE = np is not None
+ORDRE_COOLDOWNS = NOMS_COOLDOWNS
+TableauxVecteur = Tuple["np.ndarray", "np.ndarray"]
+EntreeJoueur = Tuple[float, float, bool]
+# Politiques de ``simulation`` sans action, rejouees directement sur le lot.
+POLITIQUES_LOT = ("inactive", "attract")
+
+
+@dataclass
+class LotJoueurs:
+    """Etat dynamique de N joueurs en tableaux contigus.
+
+    Attributes:
+        identifiants: Noms logiques des joueurs, dans l ordre des lignes.
+        position_x: Positions X.
+        position_y: Positions Y.
+        vitesse_x: Vitesses X.
+        vitesse_y: Vitesses Y.
+        rayon: Rayons des capsules.
+        direction_x: Directions principales X.
+        direction_y: Directions principales Y.
+        jauge_ultime: Jauges ultime entre 0 et 1.
+        actif_bouclier: Etats du bouclier.
+        temps_restant_bouclier: Temps restant de bouclier.
+        temps_hors_arene: Temps cumule hors de la zone.
+        cooldowns: Matrice (N, 4) des cooldowns, colonnes dans ORDRE_COOLDOWNS.
+    """
+
+    identifiants: List[str]
+    position_x: np.ndarray
+    position_y: np.ndarray
+    vitesse_x: np.ndarray
+    vitesse_y: np.ndarray
+    rayon: np.ndarray
+    direction_x: np.ndarray
+    direction_y: np.ndarray
+    jauge_ultime: np.ndarray
+    actif_bouclier: np.ndarray
+    temps_restant_bouclier: np.ndarray
+    temps_hors_arene: np.ndarray
+    cooldowns: np.ndarray
+
+    def __len__(self) -> int:
+        """Retourne le nombre de joueurs du lot.
+
+        Returns:
+            Taille du lot.
+        """
+
+        return len(self.identifiants)
+
+
+def construire_lot_joueurs(joueurs: Sequence[Joueur]) -> LotJoueurs:
+    """Copie une sequence de joueurs scalaires dans un lot vectorise.
+
+    Args:
+        joueurs: Joueurs a copier.
+
+    Returns:
+        LotJoueurs contenant une ligne par joueur.
+    """
+
+    def colonne(nom_attribut: str) -> np.ndarray:
+        """Extrait un attribut flottant de tous les joueurs.
+
+        Args:
+            nom_attribut: Nom de l attribut Joueur.
+
+        Returns:
+            Tableau float64 de l attribut.
+        """
+
+        return np.array([float(getattr(joueur, nom_attribut)) for joueur in joueurs], dtype=np.float64)
+
+    cooldowns = np.array(
+        [joueur.cooldowns.valeurs for joueur in joueurs],
+        dtype=np.float64,
+    ).reshape(len(joueurs), len(ORDRE_COOLDOWNS))
+    return LotJoueurs(
+        identifiants=[joueur.identifiant for joueur in joueurs],
+        position_x=colonne("position_x"),
+        position_y=colonne("position_y"),
+        vitesse_x=colonne("vitesse_x"),
+        vitesse_y=colonne("vitesse_y"),
+        rayon=colonne("rayon"),
+        direction_x=colonne("direction_x"),
+        direction_y=colonne("direction_y"),
+        jauge_ultime=colonne("jauge_ultime"),
+        actif_bouclier=np.array([joueur.actif_bouclier for joueur in joueurs], dtype=bool),
+        temps_restant_bouclier=colonne("temps_restant_bouclier"),
+        temps_hors_arene=colonne("temps_hors_arene"),
+        cooldowns=cooldowns,
+    )
+
+
+def ecrire_lot_dans_joueurs(lot: LotJoueurs, joueurs: Sequence[Joueur]) -> None:
+    """Recopie l etat d un lot vers les joueurs scalaires correspondants.
+
+    Args:
+        lot: Lot source.
+        joueurs: Joueurs cibles, dans l ordre des lignes du lot.
+
+    Returns:
+        None.
+    """
+
+    for index, joueur in enumerate(joueurs):
+        joueur.position_x = float(lot.position_x[index])
+        joueur.position_y = float(lot.position_y[index])
+        joueur.vitesse_x = float(lot.vitesse_x[index])
+        joueur.vitesse_y = float(lot.vitesse_y[index])
+        joueur.rayon = float(lot.rayon[index])
+        joueur.direction_x = float(lot.direction_x[index])
+        joueur.direction_y = float(lot.direction_y[index])
+        joueur.jauge_ultime = float(lot.jauge_ultime[index])
+        joueur.actif_bouclier = bool(lot.actif_bouclier[index])
+        joueur.temps_restant_bouclier = float(lot.temps_restant_bouclier[index])
+        joueur.temps_hors_arene = float(lot.temps_hors_arene[index])
+        joueur.cooldowns.valeurs[:] = lot.cooldowns[index].tolist()
+
+
+def normaliser_lot(vecteur_x: np.ndarray, vecteur_y: np.ndarray) -> TableauxVecteur:
+    """Normalise un lot de vecteurs 2D comme ``normaliser``.
+
+    Args:
+        vecteur_x: Composantes X.
+        vecteur_y: Composantes Y.
+
+    Returns:
+        Tuple (x, y) normalise; (0, 0) pour les normes nulles.
+    """
+
+    norme_carre = vecteur_x * vecteur_x + vecteur_y * vecteur_y
+    nul = norme_carre <= SEUIL_NORME_CARREE
+    inverse_norme = 1.0 / np.sqrt(np.where(nul, 1.0, norme_carre))
+    return (
+        np.where(nul, 0.0, vecteur_x * inverse_norme),
+        np.where(nul, 0.0, vecteur_y * inverse_norme),
+    )
+
+
+def limiter_vitesse_lot(
+    vitesse_x: np.ndarray,
+    vitesse_y: np.ndarray,
+    vitesse_max: float,
+) -> TableauxVecteur:
+    """Limite la norme d un lot de vitesses comme ``limiter_vitesse``.
+
+    Args:
+        vitesse_x: Vitesses X.
+        vitesse_y: Vitesses Y.
+        vitesse_max: Norme maximale autorisee.
+
+    Returns:
+        Tuple (x, y) des vitesses eventuellement reduites.
+    """
+
+    norme_carre = vitesse_x * vitesse_x + vitesse_y * vitesse_y
+    vitesse_max_carre = vitesse_max * vitesse_max
+    inchange = (norme_carre <= vitesse_max_carre) | (norme_carre <= SEUIL_NORME_CARREE)
+    facteur = vitesse_max / np.sqrt(np.where(inchange, 1.0, norme_carre))
+    return (
+        np.where(inchange, vitesse_x, vitesse_x * facteur),
+        np.where(inchange, vitesse_y, vitesse_y * facteur),
+    )
+
+
+def appliquer_deplacement_inertiel_lot(
+    lot: LotJoueurs,
+    entrees_x: np.ndarray,
+    entrees_y: np.ndarray,
+    freins_actifs: np.ndarray,
+    delta_temps: float,
+    parametres: ParametresCombat,
+) -> None:
+    """Applique ``appliquer_deplacement_inertiel`` a tout le lot.
+
+    Args:
+        lot: Lot de joueurs a mettre a jour.
+        entrees_x: Axes horizontaux des joysticks.
+        entrees_y: Axes verticaux des joysticks.
+        freins_actifs: Etats du frein par joueur.
+        delta_temps: Pas de simulation en secondes.
+        parametres: Parametres physiques du combat.
+
+    Returns:
+        None.
+    """
+
+    direction_x, direction_y = normaliser_lot(
+        np.asarray(entrees_x, dtype=np.float64),
+        np.asarray(entrees_y, dtype=np.float64),
+    )
+    acceleration = parametres.acceleration * delta_temps
+    lot.vitesse_x += direction_x * acceleration
+    lot.vitesse_y += direction_y * acceleration
+
+    orientee = (direction_x != 0.0) | (direction_y != 0.0)
+    lot.direction_x[orientee] = direction_x[orientee]
+    lot.direction_y[orientee] = direction_y[orientee]
+
+    friction = np.where(freins_actifs, parametres.friction_frein, parametres.friction_base)
+    multiplicateur = np.maximum(0.0, 1.0 - friction * delta_temps)
+    lot.vitesse_x *= multiplicateur
+    lot.vitesse_y *= multiplicateur
+
+    lot.vitesse_x[:], lot.vitesse_y[:] = limiter_vitesse_lot(
+        lot.vitesse_x,
+        lot.vitesse_y,
+        parametres.vitesse_max,
+    )
+
+    lot.position_x += lot.vitesse_x * delta_temps
+    lot.position_y += lot.vitesse_y * delta_temps
+
+
+def resoudre_collisions_capsules_lot(
+    lot: LotJoueurs,
+    indices_1: np.ndarray,
+    indices_2: np.ndarray,
+    parametres: ParametresCombat,
+) -> np.ndarray:
+    """Applique ``resoudre_collision_capsules`` a des paires disjointes.
+
+    Chaque joueur ne doit apparaitre que dans une seule paire afin que le
+    resultat soit identique a des appels scalaires successifs.
+
+    Args:
+        lot: Lot de joueurs.
+        indices_1: Indices du premier joueur de chaque paire.
+        indices_2: Indices du second joueur de chaque paire.
+        parametres: Parametres physiques du combat.
+
+    Returns:
+        Tableau booleen indiquant les paires en collision.
+    """
+
+    indices_1 = np.asarray(indices_1, dtype=np.intp)
+    indices_2 = np.asarray(indices_2, dtype=np.intp)
+    x_1 = lot.position_x[indices_1]
+    y_1 = lot.position_y[indices_1]
+    x_2 = lot.position_x[indices_2]
+    y_2 = lot.position_y[indices_2]
+    vx_1 = lot.vitesse_x[indices_1]
+    vy_1 = lot.vitesse_y[indices_1]
+    vx_2 = lot.vitesse_x[indices_2]
+    vy_2 = lot.vitesse_y[indices_2]
+
+    difference_x = x_2 - x_1
+    difference_y = y_2 - y_1
+    distance_carre = difference_x * difference_x + difference_y * difference_y
+    distance_minimale = lot.rayon[indices_1] + lot.rayon[indices_2]
+    collision = distance_carre < distance_minimale * distance_minimale
+    if not collision.any():
+        return collision
+
+    confondus = distance_carre <= SEUIL_NORME_CARREE
+    normale_relative_x, normale_relative_y = normaliser_lot(vx_2 - vx_1, vy_2 - vy_1)
+    normale_relative_nulle = (normale_relative_x == 0.0) & (normale_relative_y == 0.0)
+    normale_relative_x = np.where(normale_relative_nulle, 1.0, normale_relative_x)
+    normale_relative_y = np.where(normale_relative_nulle, 0.0, normale_relative_y)
+
+    distance = np.where(confondus, 0.0, np.sqrt(distance_carre))
+    inverse_distance = 1.0 / np.where(confondus, 1.0, distance)
+    normale_x = np.where(confondus, normale_relative_x, difference_x * inverse_distance)
+    normale_y = np.where(confondus, normale_relative_y, difference_y * inverse_distance)
+
+    penetration = np.maximum(0.0, distance_minimale - distance)
+    correction = np.where(collision, penetration * FACTEUR_PARTAGE_COLLISION, 0.0)
+    lot.position_x[indices_1] = np.where(collision, x_1 - normale_x * correction, x_1)
+    lot.position_y[indices_1] = np.where(collision, y_1 - normale_y * correction, y_1)
+    lot.position_x[indices_2] = np.where(collision, x_2 + normale_x * correction, x_2)
+    lot.position_y[indices_2] = np.where(collision, y_2 + normale_y * correction, y_2)
+
+    vitesse_normale = (vx_2 - vx_1) * normale_x + (vy_2 - vy_1) * normale_y
+    rebond = collision & (vitesse_normale < 0.0)
+    if not rebond.any():
+        return collision
+
+    coefficient_rebond = max(0.0, min(1.0, parametres.coefficient_rebond_collision))
+    impulsion = -(1.0 + coefficient_rebond) * vitesse_normale * FACTEUR_PARTAGE_COLLISION
+    vitesse_limite = parametres.vitesse_max * MULTIPLICATEUR_LIMITE_VITESSE_COLLISION
+    nouvelle_vx_1, nouvelle_vy_1 = limiter_vitesse_lot(
+        vx_1 - normale_x * impulsion,
+        vy_1 - normale_y * impulsion,
+        vitesse_limite,
+    )
+    nouvelle_vx_2, nouvelle_vy_2 = limiter_vitesse_lot(
+        vx_2 + normale_x * impulsion,
+        vy_2 + normale_y * impulsion,
+        vitesse_limite,
+    )
+    lot.vitesse_x[indices_1] = np.where(rebond, nouvelle_vx_1, vx_1)
+    lot.vitesse_y[indices_1] = np.where(rebond, nouvelle_vy_1, vy_1)
+    lot.vitesse_x[indices_2] = np.where(rebond, nouvelle_vx_2, vx_2)
+    lot.vitesse_y[indices_2] = np.where(rebond, nouvelle_vy_2, vy_2)
+    return collision
+
+
+def decrementer_cooldowns_lot(lot: LotJoueurs, delta_temps: float) -> None:
+    """Applique ``decrementer_cooldowns`` a tout le lot.
+
+    Args:
+        lot: Lot de joueurs.
+        delta_temps: Delta temps en secondes.
+
+    Returns:
+        None.
+    """
+
+    cooldowns_restants = lot.cooldowns - delta_temps
+    lot.cooldowns[:] = np.where(cooldowns_restants > 0.0, cooldowns_restants, 0.0)
+
+
+def mettre_a_jour_bouclier_lot(lot: LotJoueurs, delta_temps: float) -> None:
+    """Applique ``mettre_a_jour_bouclier`` a tout le lot.
+
+    Args:
+        lot: Lot de joueurs.
+        delta_temps: Delta temps en secondes.
+
+    Returns:
+        None.
+    """
+
+    actifs = lot.actif_bouclier
+    temps_restant = np.maximum(0.0, lot.temps_restant_bouclier - delta_temps)
+    lot.temps_restant_bouclier[:] = np.where(actifs, temps_restant, lot.temps_restant_bouclier)
+    lot.actif_bouclier[:] = actifs & ~(lot.temps_restant_bouclier <= 0.0)
+
+
+def charger_ultime_lot(lot: LotJoueurs, delta_temps: float, parametres: ParametresCombat) -> None:
+    """Applique ``charger_ultime`` a tout le lot.
+
+    Args:
+        lot: Lot de joueurs.
+        delta_temps: Delta temps en secondes.
+        parametres: Parametres de combat.
+
+    Returns:
+        None.
+    """
+
+    lot.jauge_ultime[:] = np.minimum(
+        1.0,
+        lot.jauge_ultime + parametres.gain_ultime_par_seconde * delta_temps,
+    )
+
+
+def verifier_sortie_arene_lot(
+    lot: LotJoueurs,
+    centres_x: np.ndarray | float,
+    centres_y: np.ndarray | float,
+    rayons_arene: np.ndarray | float,
+    delta_temps: float,
+    parametres: ParametresCombat,
+) -> np.ndarray:
+    """Applique ``verifier_sortie_arene`` a tout le lot.
+
+    Args:
+        lot: Lot de joueurs.
+        centres_x: Centre X de l arene de chaque joueur (ou commun).
+        centres_y: Centre Y de l arene de chaque joueur (ou commun).
+        rayons_arene: Rayon courant de l arene de chaque joueur (ou commun).
+        delta_temps: Delta temps en secondes.
+        parametres: Parametres de combat.
+
+    Returns:
+        Tableau booleen des joueurs elimines.
+    """
+
+    difference_x = lot.position_x - centres_x
+    difference_y = lot.position_y - centres_y
+    distance_centre_carre = difference_x * difference_x + difference_y * difference_y
+    rayons = np.asarray(rayons_arene, dtype=np.float64)
+    dans_arene = distance_centre_carre <= rayons * rayons
+    lot.temps_hors_arene[:] = np.where(dans_arene, 0.0, lot.temps_hors_arene + delta_temps)
+    return ~dans_arene & (lot.temps_hors_arene >= parametres.delai_sortie_arene)
+
+
+def avancer_lot(
+    lot: LotJoueurs,
+    entrees_x: np.ndarray,
+    entrees_y: np.ndarray,
+    freins_actifs: np.ndarray,
+    indices_1: np.ndarray,
+    indices_2: np.ndarray,
+    centres_x: np.ndarray | float,
+    centres_y: np.ndarray | float,
+    rayons_arene: np.ndarray | float,
+    delta_temps: float,
+    parametres: ParametresCombat,
+) -> np.ndarray:
+    """Avance tous les duels du lot d un pas de physique passive.
+
+    L ordre des etapes reprend celui de ``boucle_jeu``: deplacement,
+    collision, cooldowns, bouclier, charge ultime puis sortie d arene.
+    Les actions declenchees (dash, bump, ultime) restent scalaires.
+
+    Args:
+        lot: Lot de joueurs.
+        entrees_x: Axes horizontaux des joysticks.
+        entrees_y: Axes verticaux des joysticks.
+        freins_actifs: Etats du frein par joueur.
+        indices_1: Premier joueur de chaque duel.
+        indices_2: Second joueur de chaque duel.
+        centres_x: Centre X de l arene de chaque joueur (ou commun).
+        centres_y: Centre Y de l arene de chaque joueur (ou commun).
+        rayons_arene: Rayon courant de l arene de chaque joueur (ou commun).
+        delta_temps: Pas de simulation en secondes.
+        parametres: Parametres physiques du combat.
+
+    Returns:
+        Tableau booleen des joueurs elimines a ce pas.
+    """
+
+    appliquer_deplacement_inertiel_lot(lot, entrees_x, entrees_y, freins_actifs, delta_temps, parametres)
+    resoudre_collisions_capsules_lot(lot, indices_1, indices_2, parametres)
+    decrementer_cooldowns_lot(lot, delta_temps)
+    mettre_a_jour_bouclier_lot(lot, delta_temps)
+    charger_ultime_lot(lot, delta_temps, parametres)
+    return verifier_sortie_arene_lot(lot, centres_x, centres_y, rayons_arene, delta_temps, parametres)
+
+
+def avancer_joueurs_scalaire(
+    joueurs: Sequence[Joueur],
+    entrees: Sequence[EntreeJoueur],
+    paires: Sequence[Tuple[int, int]],
+    centre_x: float,
+    centre_y: float,
+    rayon_arene: float,
+    delta_temps: float,
+    parametres: ParametresCombat,
+) -> List[bool]:
+    """Avance des joueurs scalaires d un pas avec les helpers de ``logique.py``.
+
+    Args:
+        joueurs: Joueurs a avancer.
+        entrees: Tuple (axe X, axe Y, frein) de chaque joueur.
+        paires: Indices des duels, chaque joueur dans une seule paire.
+        centre_x: Centre X de l arene.
+        centre_y: Centre Y de l arene.
+        rayon_arene: Rayon courant de l arene.
+        delta_temps: Pas de simulation en secondes.
+        parametres: Parametres physiques du combat.
+
+    Returns:
+        Liste des eliminations, dans l ordre des joueurs.
+    """
+
+    for joueur, (entree_x, entree_y, frein) in zip(joueurs, entrees):
+        appliquer_deplacement_inertiel(joueur, entree_x, entree_y, frein, delta_temps, parametres)
+    for index_1, index_2 in paires:
+        resoudre_collision_capsules(joueurs[index_1], joueurs[index_2], parametres)
+    eliminations = []
+    for joueur in joueurs:
+        decrementer_cooldowns(joueur, delta_temps)
+        mettre_a_jour_bouclier(joueur, delta_temps)
+        charger_ultime(joueur, delta_temps, parametres)
+        eliminations.append(
+            verifier_sortie_arene(joueur, centre_x, centre_y, rayon_arene, delta_temps, parametres)
+        )
+    return eliminations
+
+
+def avancer_joueurs(
+    joueurs: Sequence[Joueur],
+    entrees: Sequence[EntreeJoueur],
+    paires: Sequence[Tuple[int, int]],
+    centre_x: float,
+    centre_y: float,
+    rayon_arene: float,
+    delta_temps: float,
+    parametres: ParametresCombat,
+) -> List[bool]:
+    """Avance des joueurs scalaires d un pas, vectorise si NumPy est present.
+
+    Les deux chemins donnent des etats identiques bit a bit. Le lot est
+    reconstruit puis recopie a chaque appel: ce pas isole est plus lent que
+    les helpers scalaires pour quelques joueurs. Les simulations longues
+    passent par ``simuler_matchs_lot``, qui garde le lot entre les pas.
+
+    Args:
+        joueurs: Joueurs a avancer.
+        entrees: Tuple (axe X, axe Y, frein) de chaque joueur.
+        paires: Indices des duels, chaque joueur dans une seule paire.
+        centre_x: Centre X de l arene.
+        centre_y: Centre Y de l arene.
+        rayon_arene: Rayon courant de l arene.
+        delta_temps: Pas de simulation en secondes.
+        parametres: Parametres physiques du combat.
+
+    Returns:
+        Liste des eliminations, dans l ordre des joueurs.
+    """
+
+    if not NUMPY_DISPONIBLE:
+        return avancer_joueurs_scalaire(
+            joueurs, entrees, paires, centre_x, centre_y, rayon_arene, delta_temps, parametres
+        )
+    lot = construire_lot_joueurs(joueurs)
+    eliminations = avancer_lot(
+        lot,
+        np.array([entree[0] for entree in entrees], dtype=np.float64),
+        np.array([entree[1] for entree in entrees], dtype=np.float64),
+        np.array([entree[2] for entree in entrees], dtype=bool),
+        np.array([paire[0] for paire in paires], dtype=np.intp),
+        np.array([paire[1] for paire in paires], dtype=np.intp),
+        centre_x,
+        centre_y,
+        rayon_arene,
+        delta_temps,
+        parametres,
+    )
+    ecrire_lot_dans_joueurs(lot, joueurs)
+    return [bool(elimine) for elimine in eliminations]
+
+
+@dataclass
+class DuelsLot:
+    """Duels en cours d un ``simuler_matchs_lot``, avances dans un meme lot.
+
+    Le duel d indice k occupe les lignes 2k (J1) et 2k+1 (J2) du lot.
+
+    Attributes:
+        lot: Joueurs de tous les duels en cours.
+        generateurs: Generateur seed de chaque duel.
+        resultats: Resultat en construction de chaque duel.
+        temps_restant: Temps restant avant la mort subite, par duel.
+        rayon_arene: Rayon courant de l arene, par duel.
+        nombre_pas: Pas joues dans la manche courante, par duel.
+        score_style: Score style cumule, par joueur.
+        combo_style: Niveau de combo courant, par joueur.
+        temps_combo_style: Temps restant avant expiration du combo, par joueur.
+        dans_zone_danger: Joueurs entres dans la couronne danger, par joueur.
+    """
+
+    lot: LotJoueurs
+    generateurs: List[random.Random]
+    resultats: List[ResultatMatch]
+    temps_restant: np.ndarray
+    rayon_arene: np.ndarray
+    nombre_pas: np.ndarray
+    score_style: np.ndarray
+    combo_style: np.ndarray
+    temps_combo_style: np.ndarray
+    dans_zone_danger: np.ndarray
+
+
+def selectionner_lignes_lot(lot: LotJoueurs, lignes: np.ndarray) -> LotJoueurs:
+    """Extrait un sous-lot, par exemple pour retirer les duels termines.
+
+    Args:
+        lot: Lot source.
+        lignes: Indices des lignes conservees, dans l ordre voulu.
+
+    Returns:
+        Nouveau LotJoueurs independant du lot source.
+    """
+
+    valeurs = {
+        champ.name: getattr(lot, champ.name)[lignes]
+        for champ in fields(LotJoueurs)
+        if champ.name != "identifiants"
+    }
+    return LotJoueurs(identifiants=[lot.identifiants[ligne] for ligne in lignes], **valeurs)
+
+
+def reinitialiser_lignes_lot(lot: LotJoueurs, modele: LotJoueurs, lignes: np.ndarray) -> None:
+    """Recopie les lignes d un lot modele, repetees, sur des lignes du lot.
+
+    Args:
+        lot: Lot modifie sur place.
+        modele: Lot modele (par exemple J1 et J2 en debut de manche).
+        lignes: Lignes a remplacer, par blocs de ``len(modele)``.
+
+    Returns:
+        None.
+    """
+
+    repetitions = len(lignes) // len(modele)
+    for champ in fields(LotJoueurs):
+        if champ.name == "identifiants":
+            continue
+        valeurs_modele = getattr(modele, champ.name)
+        getattr(lot, champ.name)[lignes] = np.tile(
+            valeurs_modele, (repetitions,) + (1,) * (valeurs_modele.ndim - 1)
+        )
+
+
+def commandes_attract_lot(
+    duels: DuelsLot,
+    attract: Tuple[bool, bool],
+    centre_x: float,
+    centre_y: float,
+) -> TableauxVecteur:
+    """Calcule les axes de ``politique_attract`` pour tous les joueurs du lot.
+
+    Les tirages suivent l ordre de ``simuler_manche``: J1 puis J2, X puis Y.
+
+    Args:
+        duels: Duels en cours.
+        attract: Pilotage attract de (J1, J2); False pour ``politique_inactive``.
+        centre_x: Centre X de l arene.
+        centre_y: Centre Y de l arene.
+
+    Returns:
+        Tuple (entrees_x, entrees_y) par joueur.
+    """
+
+    entrees_x = np.zeros(len(duels.lot), dtype=np.float64)
+    entrees_y = np.zeros(len(duels.lot), dtype=np.float64)
+    decalages = [decalage for decalage, actif in enumerate(attract) if actif]
+    if not decalages:
+        return entrees_x, entrees_y
+
+    lignes = (2 * np.arange(len(duels.resultats))[:, None] + np.array(decalages)).ravel()
+    # Meme calcul que random.uniform(-0.7, 0.7), applique au lot de tirages.
+    tirages = np.array(
+        [
+            tirer()
+            for tirer in [generateur.random for generateur in duels.generateurs]
+            for _ in range(2 * len(decalages))
+        ],
+        dtype=np.float64,
+    ).reshape(-1, 2)
+    alea = -0.7 + (0.7 - -0.7) * tirages
+    vers_centre_x = centre_x - duels.lot.position_x[lignes]
+    vers_centre_y = centre_y - duels.lot.position_y[lignes]
+    distance_centre = np.sqrt(vers_centre_x * vers_centre_x + vers_centre_y * vers_centre_y)
+    rayons = duels.rayon_arene[lignes // 2]
+    facteur_bord = np.where(distance_centre > rayons * 0.75, 1.0, 0.3)
+    entrees_x[lignes] = vers_centre_x * 0.01 * facteur_bord + alea[:, 0]
+    entrees_y[lignes] = vers_centre_y * 0.01 * facteur_bord + alea[:, 1]
+    return entrees_x, entrees_y
+
+
+def mettre_a_jour_sauvetage_lot(
+    duels: DuelsLot,
+    regles: ReglesSimulation,
+    centre_x: float,
+    centre_y: float,
+    rayons_joueurs: np.ndarray,
+    largeur_danger: float,
+) -> None:
+    """Applique ``mettre_a_jour_sauvetage_bord`` et son gain de style a tout le lot.
+
+    Args:
+        duels: Duels en cours, modifies sur place.
+        regles: Regles constantes du match.
+        centre_x: Centre X de l arene.
+        centre_y: Centre Y de l arene.
+        rayons_joueurs: Rayon courant de l arene de chaque joueur.
+        largeur_danger: Largeur de la couronne danger.
+
+    Returns:
+        None.
+    """
+
+    parametres_style = regles.parametres_style
+    difference_x = duels.lot.position_x - centre_x
+    difference_y = duels.lot.position_y - centre_y
+    distance = np.sqrt(difference_x * difference_x + difference_y * difference_y)
+    limite_danger = np.maximum(0.0, rayons_joueurs - largeur_danger)
+    limite_securite = np.maximum(0.0, limite_danger - max(0.0, parametres_style.marge_sauvetage))
+
+    en_danger = distance >= limite_danger
+    en_securite = distance <= limite_securite
+    sauvetage = ~en_danger & duels.dans_zone_danger & en_securite
+    duels.dans_zone_danger[:] = en_danger | (duels.dans_zone_danger & ~en_securite)
+    if not sauvetage.any():
+        return
+
+    combo = np.where(duels.temps_combo_style > 0.0, duels.combo_style + 1, 1)
+    duels.combo_style[:] = np.where(sauvetage, combo, duels.combo_style)
+    gain = max(0, parametres_style.points_sauvetage) + np.maximum(0, duels.combo_style - 1) * max(
+        0, parametres_style.bonus_combo_par_niveau
+    )
+    duels.score_style[:] += np.where(sauvetage, gain, 0)
+    duels.temps_combo_style[:] = np.where(
+        sauvetage, max(0.0, parametres_style.fenetre_combo), duels.temps_combo_style
+    )
+
+
+def simuler_matchs_lot(
+    configuration: Dict[str, object],
+    politique_j1: str,
+    politique_j2: str,
+    seeds: Sequence[int],
+    dt: float = DELTA_TEMPS_DEFAUT,
+    limite_manches: int = LIMITE_MANCHES_DEFAUT,
+) -> List[ResultatMatch]:
+    """Joue un match par seed, tous avances ensemble dans un lot persistant.
+
+    Le resultat de chaque match est identique a ``simulation.simuler_match``
+    avec les politiques du meme nom. Seules les politiques sans action
+    (``POLITIQUES_LOT``) sont acceptees: dash, bump et ultime restent scalaires.
+    Les duels termines sont retires du lot, les autres gardent leurs tableaux.
+
+    Args:
+        configuration: Configuration globale (contenu de config_jeu.json).
+        politique_j1: Nom de la politique de J1 dans ``POLITIQUES_LOT``.
+        politique_j2: Nom de la politique de J2 dans ``POLITIQUES_LOT``.
+        seeds: Graine de chaque match.
+        dt: Pas de temps fixe en secondes.
+        limite_manches: Nombre maximal de manches par match.
+
+    Returns:
+        ResultatMatch de chaque seed, dans l ordre des seeds.
+
+    Raises:
+        ValueError: Si une politique n est pas rejouable en lot ou si dt est invalide.
+        RuntimeError: Si NumPy n est pas installe.
+    """
+
+    for politique in (politique_j1, politique_j2):
+        if politique not in POLITIQUES_LOT:
+            raise ValueError(f"Politique non rejouable en lot: {politique}")
+    if dt <= 0.0:
+        raise ValueError("Le pas de temps dt doit etre strictement positif.")
+    if not NUMPY_DISPONIBLE:
+        raise RuntimeError("NumPy est requis pour simuler des matchs en lot.")
+
+    regles = construire_regles_simulation(configuration)
+    parametres = regles.parametres
+    victoires_pour_gagner = int(configuration["match"]["victoires_pour_gagner"])
+    largeur = int(configuration["ecran"]["largeur"])
+    hauteur = int(configuration["ecran"]["hauteur"])
+    centre_x = largeur / 2.0
+    centre_y = hauteur / 2.0
+    rayon_depart = float(configuration["arene"]["rayon_depart"])
+    largeur_danger = float(configuration["arene"]["largeur_zone_danger"])
+    duree_manche = float(configuration["match"]["duree_max_manche"])
+    nombre_pas_max = max(1, int(duree_manche * FACTEUR_DUREE_LIMITE_MANCHE / dt))
+    attract = (politique_j1 == "attract", politique_j2 == "attract")
+
+    modele = construire_lot_joueurs(creer_joueurs(configuration, largeur, hauteur))
+    nombre_duels = len(seeds)
+    lignes = np.arange(2 * nombre_duels)
+    lot = selectionner_lignes_lot(modele, lignes % 2)
+    resultats = [
+        ResultatMatch(vainqueur="", score_j1=0, score_j2=0, style_j1=0, style_j2=0)
+        for _ in seeds
+    ]
+    duels = DuelsLot(
+        lot=lot,
+        generateurs=[random.Random(seed) for seed in seeds],
+        resultats=list(resultats),
+        temps_restant=np.full(nombre_duels, duree_manche),
+        rayon_arene=np.full(nombre_duels, rayon_depart),
+        nombre_pas=np.zeros(nombre_duels, dtype=np.int64),
+        score_style=np.zeros(2 * nombre_duels, dtype=np.int64),
+        combo_style=np.zeros(2 * nombre_duels, dtype=np.int64),
+        temps_combo_style=np.zeros(2 * nombre_duels, dtype=np.float64),
+        dans_zone_danger=np.zeros(2 * nombre_duels, dtype=bool),
+    )
+
+    while duels.resultats:
+        nombre_joueurs = len(duels.lot)
+        entrees_x, entrees_y = commandes_attract_lot(duels, attract, centre_x, centre_y)
+
+        duels.temps_restant -= dt
+        multiplicateur = np.where(
+            duels.temps_restant <= 0.0, regles.multiplicateur_sudden_death, 1.0
+        )
+        duels.rayon_arene[:] = np.maximum(
+            regles.rayon_min,
+            duels.rayon_arene - regles.vitesse_retrecissement * multiplicateur * dt,
+        )
+        rayons_joueurs = np.repeat(duels.rayon_arene, 2)
+
+        duels.temps_combo_style[:] = np.maximum(0.0, duels.temps_combo_style - dt)
+        duels.combo_style[duels.temps_combo_style <= 0.0] = 0
+        eliminations = avancer_lot(
+            duels.lot,
+            entrees_x,
+            entrees_y,
+            np.zeros(nombre_joueurs, dtype=bool),
+            np.arange(0, nombre_joueurs, 2),
+            np.arange(1, nombre_joueurs, 2),
+            centre_x,
+            centre_y,
+            rayons_joueurs,
+            dt,
+            parametres,
+        )
+        mettre_a_jour_sauvetage_lot(
+            duels, regles, centre_x, centre_y, rayons_joueurs, largeur_danger
+        )
+        duels.nombre_pas += 1
+
+        elimine_j1 = eliminations[0::2]
+        elimine_j2 = eliminations[1::2]
+        fin_manche = elimine_j1 | elimine_j2 | (duels.nombre_pas >= nombre_pas_max)
+        if not fin_manche.any():
+            continue
+
+        conserves: List[int] = []
+        nouvelles_manches: List[int] = []
+        for index in range(len(duels.resultats)):
+            if not fin_manche[index]:
+                conserves.append(index)
+                continue
+            resultat = duels.resultats[index]
+            interrompue = not (elimine_j1[index] or elimine_j2[index])
+            nombre_pas = int(duels.nombre_pas[index])
+            vainqueur = determiner_vainqueur_manche(
+                bool(elimine_j1[index]), bool(elimine_j2[index])
+            )
+            resultat.manches.append(
+                ResultatManche(
+                    vainqueur=vainqueur,
+                    duree=nombre_pas * dt,
+                    nombre_pas=nombre_pas,
+                    mort_subite=interrompue or bool(duels.temps_restant[index] <= 0.0),
+                    rayon_final=float(duels.rayon_arene[index]),
+                    interrompue=interrompue,
+                )
+            )
+            if vainqueur == "J1":
+                resultat.score_j1 += 1
+            elif vainqueur == "J2":
+                resultat.score_j2 += 1
+
+            if resultat.score_j1 >= victoires_pour_gagner:
+                resultat.vainqueur = "J1"
+            elif resultat.score_j2 >= victoires_pour_gagner:
+                resultat.vainqueur = "J2"
+            if resultat.vainqueur or len(resultat.manches) >= limite_manches:
+                resultat.style_j1 = int(duels.score_style[2 * index])
+                resultat.style_j2 = int(duels.score_style[2 * index + 1])
+                continue
+            conserves.append(index)
+            nouvelles_manches.append(index)
+
+        if nouvelles_manches:
+            indices = np.array(nouvelles_manches)
+            lignes = (2 * indices[:, None] + np.arange(2)).ravel()
+            reinitialiser_lignes_lot(duels.lot, modele, lignes)
+            duels.temps_restant[indices] = duree_manche
+            duels.rayon_arene[indices] = rayon_depart
+            duels.nombre_pas[indices] = 0
+            duels.combo_style[lignes] = 0
+            duels.temps_combo_style[lignes] = 0.0
+            duels.dans_zone_danger[lignes] = False
+        if len(conserves) < len(duels.resultats):
+            duels = retirer_duels_termines(duels, np.array(conserves, dtype=np.intp))
+
+    return resultats
+
+
+def retirer_duels_termines(duels: DuelsLot, conserves: np.ndarray) -> DuelsLot:
+    """Compacte les duels en cours en retirant ceux dont le match est fini.
+
+    Args:
+        duels: Duels courants.
+        conserves: Indices des duels a garder, dans l ordre.
+
+    Returns:
+        Nouveaux DuelsLot ne contenant que les duels conserves.
+    """
+
+    lignes = (2 * conserves[:, None] + np.arange(2)).ravel()
+    return DuelsLot(
+        lot=selectionner_lignes_lot(duels.lot, lignes),
+        generateurs=[duels.generateurs[index] for index in conserves],
+        resultats=[duels.resultats[index] for index in conserves],
+        temps_restant=duels.temps_restant[conserves],
+        rayon_arene=duels.rayon_arene[conserves],
+        nombre_pas=duels.nombre_pas[conserves],
+        score_style=duels.score_style[lignes],
+        combo_style=duels.combo_style[lignes],
+        temps_combo_style=duels.temps_combo_style[lignes],
+        dans_zone_danger=duels.dans_zone_danger[lignes],
+    )
+
+
+__all__ = [
+    "NUMPY_DISPONIBLE",
+    "ORDRE_COOLDOWNS",
+    "POLITIQUES_LOT",
+    "DuelsLot",
+    "LotJoueurs",
+    "construire_lot_joueurs",
+    "ecrire_lot_dans_joueurs",
+    "normaliser_lot",
+    "limiter_vitesse_lot",
+    "appliquer_deplacement_inertiel_lot",
+    "resoudre_collisions_capsules_lot",
+    "decrementer_cooldowns_lot",
+    "mettre_a_jour_bouclier_lot",
+    "charger_ultime_lot",
+    "verifier_sortie_arene_lot",
+    "avancer_lot",
+    "avancer_joueurs_scalaire",
+    "avancer_joueurs",
+    "selectionner_lignes_lot",
+    "reinitialiser_lignes_lot",
+    "commandes_attract_lot",
+    "mettre_a_jour_sauvetage_lot",
+    "simuler_matchs_lot",
+    "retirer_duels_termines",
+]
@@ -0,0 +1,306 @@
+"""Pool de particules d impact a capacite fixe pour Neon Sumo.
+
+Les particules vivantes occupent les ``nombre_actives`` premieres lignes de
+tableaux NumPy pre-alloues. L emission ecrit dans des cases libres, la mise a
+jour est vectorisee et compacte les survivantes sans creer d objet Python.
+Sans NumPy, les memes champs sont des listes Python mises a jour en boucle.
+Le module ne depend pas de pygame; le rendu reste dans ``main.py``.
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from math import atan2, cos, sin
+from typing import List, Tuple
+
+try:
+    import numpy as np
+except ModuleNotFoundError:  # pragma: no cover - numpy absent de la borne
+    np = None
+
+
+CAPACITE_POOL_PARTICULES = 512
+VITESSE_PARTICULE_MIN = 130.0
+VITESSE_PARTICULE_MAX = 360.0
+DUREE_PARTICULE_MIN_SECONDES = 0.12
+DUREE_PARTICULE_MAX_SECONDES = 0.28
+TAILLE_PARTICULE_MIN = 2
+TAILLE_PARTICULE_MAX = 5
+ANGLE_PARTICULE_DEMI_OUVERTURE = 0.45
+FREINAGE_PARTICULES = 5.0
+SEUIL_NORME_DIRECTION = 1e-18
+NUMPY_DISPONIBLE = np is not None
+
+
+@dataclass
+class PoolParticules:
+    """Stocke les particules en tableaux contigus de capacite fixe.
+
+    Les champs sont des tableaux NumPy, ou des listes si NumPy est absent.
+
+    Attributes:
+        position_x: Positions X.
+        position_y: Positions Y.
+        vitesse_x: Vitesses X.
+        vitesse_y: Vitesses Y.
+        duree_totale: Durees de vie initiales.
+        temps_restant: Durees de vie restantes.
+        taille: Rayons de rendu.
+        couleur: Matrice (capacite, 3) des couleurs RGB.
+        nombre_actives: Nombre de lignes vivantes en tete de tableaux.
+        particules_ignorees: Particules non emises faute de place.
+    """
+
+    position_x: "np.ndarray | List[float]"
+    position_y: "np.ndarray | List[float]"
+    vitesse_x: "np.ndarray | List[float]"
+    vitesse_y: "np.ndarray | List[float]"
+    duree_totale: "np.ndarray | List[float]"
+    temps_restant: "np.ndarray | List[float]"
+    taille: "np.ndarray | List[int]"
+    couleur: "np.ndarray | List[Tuple[int, int, int]]"
+    nombre_actives: int = 0
+    particules_ignorees: int = 0
+
+    @property
+    def capacite(self) -> int:
+        """Nombre maximal de particules simultanees.
+
+        Returns:
+            Capacite du pool.
+        """
+
+        return len(self.position_x)
+
+
+def creer_pool_particules(capacite: int = CAPACITE_POOL_PARTICULES) -> PoolParticules:
+    """Alloue un pool vide.
+
+    Args:
+        capacite: Nombre maximal de particules simultanees.
+
+    Returns:
+        PoolParticules pret a l emploi.
+
+    Raises:
+        ValueError: Si la capacite n est pas strictement positive.
+    """
+
+    if capacite <= 0:
+        raise ValueError("La capacite du pool de particules doit etre positive.")
+    if np is None:
+        return PoolParticules(
+            position_x=[0.0] * capacite,
+            position_y=[0.0] * capacite,
+            vitesse_x=[0.0] * capacite,
+            vitesse_y=[0.0] * capacite,
+            duree_totale=[1.0] * capacite,
+            temps_restant=[0.0] * capacite,
+            taille=[0] * capacite,
+            couleur=[(0, 0, 0)] * capacite,
+        )
+    return PoolParticules(
+        position_x=np.zeros(capacite),
+        position_y=np.zeros(capacite),
+        vitesse_x=np.zeros(capacite),
+        vitesse_y=np.zeros(capacite),
+        duree_totale=np.ones(capacite),
+        temps_restant=np.zeros(capacite),
+        taille=np.zeros(capacite, dtype=np.int32),
+        couleur=np.zeros((capacite, 3), dtype=np.uint8),
+    )
+
+
+def emettre_particules_directionnelles(
+    pool: PoolParticules,
+    origine_x: float,
+    origine_y: float,
+    direction_x: float,
+    direction_y: float,
+    couleur: Tuple[int, int, int],
+    nombre: int,
+    multiplicateur_vitesse: float = 1.0,
+    generateur: random.Random | None = None,
+) -> int:
+    """Emet une gerbe de particules dans les cases libres du pool.
+
+    Les particules au-dela de la capacite sont ignorees et comptabilisees.
+
+    Args:
+        pool: Pool cible.
+        origine_x: Origine X des particules.
+        origine_y: Origine Y des particules.
+        direction_x: Direction principale X.
+        direction_y: Direction principale Y.
+        couleur: Couleur RGB de la gerbe.
+        nombre: Nombre de particules demandees.
+        multiplicateur_vitesse: Facteur de vitesse applique a la gerbe.
+        generateur: Source aleatoire (defaut: module random).
+
+    Returns:
+        Nombre de particules effectivement emises.
+    """
+
+    aleatoire = generateur if generateur is not None else random
+    nombre_emises = max(0, min(nombre, pool.capacite - pool.nombre_actives))
+    pool.particules_ignorees += max(0, nombre - nombre_emises)
+    if nombre_emises == 0:
+        return 0
+
+    norme_carre = direction_x * direction_x + direction_y * direction_y
+    angle_central = atan2(direction_y, direction_x) if norme_carre > SEUIL_NORME_DIRECTION else 0.0
+    debut = pool.nombre_actives
+    for index in range(debut, debut + nombre_emises):
+        angle = angle_central + aleatoire.uniform(
+            -ANGLE_PARTICULE_DEMI_OUVERTURE, ANGLE_PARTICULE_DEMI_OUVERTURE
+        )
+        vitesse = aleatoire.uniform(VITESSE_PARTICULE_MIN, VITESSE_PARTICULE_MAX)
+        vitesse *= multiplicateur_vitesse
+        duree = aleatoire.uniform(DUREE_PARTICULE_MIN_SECONDES, DUREE_PARTICULE_MAX_SECONDES)
+        pool.position_x[index] = origine_x
+        pool.position_y[index] = origine_y
+        pool.vitesse_x[index] = cos(angle) * vitesse
+        pool.vitesse_y[index] = sin(angle) * vitesse
+        pool.duree_totale[index] = duree
+        pool.temps_restant[index] = duree
+        pool.taille[index] = aleatoire.randint(TAILLE_PARTICULE_MIN, TAILLE_PARTICULE_MAX)
+    if np is None:
+        pool.couleur[debut : debut + nombre_emises] = [tuple(couleur)] * nombre_emises
+    else:
+        pool.couleur[debut : debut + nombre_emises] = couleur
+    pool.nombre_actives = debut + nombre_emises
+    return nombre_emises
+
+
+def mettre_a_jour_pool_particules(pool: PoolParticules, delta_temps: float) -> None:
+    """Avance les particules vivantes et compacte le pool.
+
+    Args:
+        pool: Pool a mettre a jour.
+        delta_temps: Pas de simulation en secondes.
+
+    Returns:
+        None.
+    """
+
+    nombre = pool.nombre_actives
+    if nombre == 0:
+        return
+    if np is None:
+        mettre_a_jour_pool_particules_listes(pool, delta_temps)
+        return
+
+    temps_restant = pool.temps_restant[:nombre]
+    temps_restant -= delta_temps
+    vivantes = temps_restant > 0.0
+    nombre_vivantes = int(np.count_nonzero(vivantes))
+    if nombre_vivantes < nombre:
+        for tableau in (
+            pool.position_x,
+            pool.position_y,
+            pool.vitesse_x,
+            pool.vitesse_y,
+            pool.duree_totale,
+            pool.temps_restant,
+            pool.taille,
+            pool.couleur,
+        ):
+            tableau[:nombre_vivantes] = tableau[:nombre][vivantes]
+        pool.nombre_actives = nombre = nombre_vivantes
+        if nombre == 0:
+            return
+
+    multiplicateur_freinage = max(0.0, 1.0 - FREINAGE_PARTICULES * delta_temps)
+    vitesse_x = pool.vitesse_x[:nombre]
+    vitesse_y = pool.vitesse_y[:nombre]
+    vitesse_x *= multiplicateur_freinage
+    vitesse_y *= multiplicateur_freinage
+    pool.position_x[:nombre] += vitesse_x * delta_temps
+    pool.position_y[:nombre] += vitesse_y * delta_temps
+
+
+def mettre_a_jour_pool_particules_listes(pool: PoolParticules, delta_temps: float) -> None:
+    """Variante sans NumPy de ``mettre_a_jour_pool_particules``.
+
+    Les calculs suivent le meme ordre que la version vectorisee.
+
+    Args:
+        pool: Pool a listes Python.
+        delta_temps: Pas de simulation en secondes.
+
+    Returns:
+        None.
+    """
+
+    multiplicateur_freinage = max(0.0, 1.0 - FREINAGE_PARTICULES * delta_temps)
+    nombre_vivantes = 0
+    for index in range(pool.nombre_actives):
+        temps_restant = pool.temps_restant[index] - delta_temps
+        if temps_restant <= 0.0:
+            continue
+        vitesse_x = pool.vitesse_x[index] * multiplicateur_freinage
+        vitesse_y = pool.vitesse_y[index] * multiplicateur_freinage
+        pool.position_x[nombre_vivantes] = pool.position_x[index] + vitesse_x * delta_temps
+        pool.position_y[nombre_vivantes] = pool.position_y[index] + vitesse_y * delta_temps
+        pool.vitesse_x[nombre_vivantes] = vitesse_x
+        pool.vitesse_y[nombre_vivantes] = vitesse_y
+        pool.duree_totale[nombre_vivantes] = pool.duree_totale[index]
+        pool.temps_restant[nombre_vivantes] = temps_restant
+        pool.taille[nombre_vivantes] = pool.taille[index]
+        pool.couleur[nombre_vivantes] = pool.couleur[index]
+        nombre_vivantes += 1
+    pool.nombre_actives = nombre_vivantes
+
+
+def vider_pool_particules(pool: PoolParticules) -> None:
+    """Retire toutes les particules sans liberer la memoire.
+
+    Args:
+        pool: Pool a vider.
+
+    Returns:
+        None.
+    """
+
+    pool.nombre_actives = 0
+
+
+def calculer_rendu_particules(
+    pool: PoolParticules,
+) -> Tuple[List[int], List[int], List[int], List[int], List[Tuple[int, int, int]]]:
+    """Calcule les attributs de rendu des particules vivantes.
+
+    Args:
+        pool: Pool a afficher.
+
+    Returns:
+        Tuple (abscisses, ordonnees, rayons, opacites, couleurs) en listes d entiers.
+    """
+
+    nombre = pool.nombre_actives
+    if np is None:
+        abscisses = []
+        ordonnees = []
+        rayons = []
+        opacites = []
+        for index in range(nombre):
+            ratio = min(1.0, max(0.0, pool.temps_restant[index] / pool.duree_totale[index]))
+            abscisses.append(int(pool.position_x[index]))
+            ordonnees.append(int(pool.position_y[index]))
+            rayons.append(max(1, int(pool.taille[index] * (0.6 + 0.4 * ratio))))
+            opacites.append(int(255 * ratio))
+        return abscisses, ordonnees, rayons, opacites, list(pool.couleur[:nombre])
+
+    ratio = np.clip(pool.temps_restant[:nombre] / pool.duree_totale[:nombre], 0.0, 1.0)
+    opacites = (255 * ratio).astype(np.int32)
+    rayons = np.maximum(1, (pool.taille[:nombre] * (0.6 + 0.4 * ratio)).astype(np.int32))
+    abscisses = pool.position_x[:nombre].astype(np.int32)
+    ordonnees = pool.position_y[:nombre].astype(np.int32)
+    return (
+        abscisses.tolist(),
+        ordonnees.tolist(),
+        rayons.tolist(),
+        opacites.tolist(),
+        [tuple(couleur) for couleur in pool.couleur[:nombre].tolist()],
+    )
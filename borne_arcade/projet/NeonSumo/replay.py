@@ -0,0 +1,779 @@
+"""Enregistrement et relecture des matchs Neon Sumo.
+
+Un replay ne stocke que les entrees: graine, configuration et, pour chaque
+image de manche, les pas de temps et les commandes des deux joueurs. La
+relecture rejoue ce flux dans ``simulation.avancer_pas_manche`` (donc dans
+``logique.py``) a n importe quelle vitesse, et se positionne sur une image
+quelconque en repartant de l instantane le plus proche.
+
+Usage:
+    python replay.py replays/neon_sumo_20260101_120000_0123abcd.nsr --image 900
+"""
+
+from __future__ import annotations
+
+import argparse
+import bisect
+import copy
+import hashlib
+import json
+import struct
+import time
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from logique import EtatStyleJoueur, reinitialiser_etat_style
+from simulation import (
+    VAINQUEUR_EGALITE,
+    CommandeJoueur,
+    EtatDuel,
+    ObservateurPas,
+    ReglesSimulation,
+    ResultatManche,
+    ResultatMatch,
+    avancer_pas_manche,
+    construire_regles_simulation,
+    creer_etat_duel,
+    determiner_vainqueur_manche,
+)
+
+
+RACINE_JEU = Path(__file__).resolve().parent
+DOSSIER_REPLAYS_DEFAUT = RACINE_JEU / "replays"
+EXTENSION_REPLAY = ".nsr"
+SIGNATURE_REPLAY = b"NSRP"
+VERSION_FORMAT_REPLAY = 1
+NOMBRE_MAX_REPLAYS_DEFAUT = 20
+INTERVALLE_INSTANTANES_DEFAUT = 300
+# delta_temps, delta_style, axes J1, axes J2, drapeaux.
+STRUCTURE_IMAGE = struct.Struct("<ddddddH")
+STRUCTURE_TAILLE_ENTETE = struct.Struct("<I")
+DRAPEAU_NOUVELLE_MANCHE = 1
+BOUTONS_COMMANDE = ("frein", "dash", "bump", "bouclier", "ultime")
+DECALAGE_BOUTONS_J1 = 1
+DECALAGE_BOUTONS_J2 = DECALAGE_BOUTONS_J1 + len(BOUTONS_COMMANDE)
+
+
+@dataclass
+class EnregistreurReplay:
+    """Accumule les images d un match en cours.
+
+    Attributes:
+        configuration: Configuration du match, copiee dans le replay.
+        graine: Graine pseudo-aleatoire du match.
+        images: Images encodees avec STRUCTURE_IMAGE.
+        nombre_images: Nombre d images enregistrees.
+        nouvelle_manche: True si la prochaine image ouvre une manche.
+        horodatage: Instant de debut du match (secondes epoch).
+    """
+
+    configuration: Dict[str, object]
+    graine: int
+    images: bytearray = field(default_factory=bytearray)
+    nombre_images: int = 0
+    nouvelle_manche: bool = True
+    horodatage: float = field(default_factory=time.time)
+
+
+@dataclass
+class Replay:
+    """Flux d entrees relisible d un match.
+
+    Attributes:
+        configuration: Configuration du match.
+        empreinte_configuration: Empreinte de ``configuration``.
+        graine: Graine pseudo-aleatoire du match.
+        horodatage: Instant de debut du match (secondes epoch).
+        images: Images encodees avec STRUCTURE_IMAGE.
+    """
+
+    configuration: Dict[str, object]
+    empreinte_configuration: str
+    graine: int
+    horodatage: float
+    images: bytes
+
+    @property
+    def nombre_images(self) -> int:
+        """Retourne le nombre d images du replay.
+
+        Returns:
+            Nombre d images.
+        """
+
+        return len(self.images) // STRUCTURE_IMAGE.size
+
+
+@dataclass
+class EtatReplay:
+    """Etat logique reconstruit apres un nombre donne d images.
+
+    Attributes:
+        index_image: Nombre d images deja rejouees.
+        style_j1: Etat style de J1.
+        style_j2: Etat style de J2.
+        duel: Manche en cours, None avant la premiere image.
+        manche_terminee: True si la manche en cours a vu une elimination.
+        pas_manche: Nombre d images jouees dans la manche en cours.
+        duree_manche: Temps de physique cumule dans la manche en cours.
+        resultat: Scores et manches terminees.
+    """
+
+    index_image: int = 0
+    style_j1: EtatStyleJoueur = field(default_factory=EtatStyleJoueur)
+    style_j2: EtatStyleJoueur = field(default_factory=EtatStyleJoueur)
+    duel: Optional[EtatDuel] = None
+    manche_terminee: bool = False
+    pas_manche: int = 0
+    duree_manche: float = 0.0
+    resultat: ResultatMatch = field(
+        default_factory=lambda: ResultatMatch(
+            vainqueur="", score_j1=0, score_j2=0, style_j1=0, style_j2=0
+        )
+    )
+
+
+@dataclass
+class LecteurReplay:
+    """Rejoue un replay image par image.
+
+    Attributes:
+        replay: Replay relu.
+        regles: Regles du match, construites depuis la configuration du replay.
+        victoires_pour_gagner: Manches a gagner pour remporter le match.
+        intervalle_instantanes: Nombre d images entre deux instantanes.
+        etat: Etat courant.
+        instantanes: Copies de l etat, indexees par numero d image.
+        index_instantanes: Numeros d image des instantanes, tries.
+        temps_en_avance: Temps de lecture accumule et pas encore consomme.
+    """
+
+    replay: Replay
+    regles: ReglesSimulation
+    victoires_pour_gagner: int
+    intervalle_instantanes: int = INTERVALLE_INSTANTANES_DEFAUT
+    etat: EtatReplay = field(default_factory=EtatReplay)
+    instantanes: Dict[int, EtatReplay] = field(default_factory=dict)
+    index_instantanes: List[int] = field(default_factory=list)
+    temps_en_avance: float = 0.0
+
+
+def calculer_empreinte_configuration(configuration: Dict[str, object]) -> str:
+    """Calcule une empreinte stable de la configuration.
+
+    Args:
+        configuration: Configuration du jeu.
+
+    Returns:
+        16 premiers caracteres hexadecimaux du SHA-256 du JSON canonique.
+    """
+
+    canonique = json.dumps(configuration, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonique.encode("utf-8")).hexdigest()[:16]
+
+
+def creer_enregistreur_replay(configuration: Dict[str, object], graine: int) -> EnregistreurReplay:
+    """Demarre l enregistrement d un match.
+
+    Args:
+        configuration: Configuration du match.
+        graine: Graine pseudo-aleatoire du match.
+
+    Returns:
+        EnregistreurReplay vide.
+    """
+
+    return EnregistreurReplay(configuration=copy.deepcopy(configuration), graine=graine)
+
+
+def encoder_boutons(commande: CommandeJoueur, decalage: int) -> int:
+    """Encode les boutons d une commande dans un champ de bits.
+
+    Args:
+        commande: Commande du joueur.
+        decalage: Position du premier bit.
+
+    Returns:
+        Bits des boutons presses.
+    """
+
+    drapeaux = 0
+    for rang, nom_bouton in enumerate(BOUTONS_COMMANDE):
+        if getattr(commande, nom_bouton):
+            drapeaux |= 1 << (decalage + rang)
+    return drapeaux
+
+
+def decoder_commande(
+    entree_x: float,
+    entree_y: float,
+    drapeaux: int,
+    decalage: int,
+) -> CommandeJoueur:
+    """Reconstruit une commande a partir de ses axes et de ses bits.
+
+    Args:
+        entree_x: Axe horizontal enregistre.
+        entree_y: Axe vertical enregistre.
+        drapeaux: Champ de bits de l image.
+        decalage: Position du premier bit du joueur.
+
+    Returns:
+        CommandeJoueur equivalente.
+    """
+
+    boutons = {
+        nom_bouton: bool(drapeaux & (1 << (decalage + rang)))
+        for rang, nom_bouton in enumerate(BOUTONS_COMMANDE)
+    }
+    return CommandeJoueur(entree_x=entree_x, entree_y=entree_y, **boutons)
+
+
+def enregistrer_image_replay(
+    enregistreur: EnregistreurReplay,
+    commande_j1: CommandeJoueur,
+    commande_j2: CommandeJoueur,
+    delta_temps: float,
+    delta_style: Optional[float] = None,
+) -> None:
+    """Ajoute une image de manche a l enregistrement.
+
+    Args:
+        enregistreur: Enregistrement en cours.
+        commande_j1: Commande appliquee a J1.
+        commande_j2: Commande appliquee a J2.
+        delta_temps: Pas de physique de l image (0 pendant un gel d impact).
+        delta_style: Pas des timers de style; ``delta_temps`` si None.
+
+    Returns:
+        None.
+    """
+
+    drapeaux = encoder_boutons(commande_j1, DECALAGE_BOUTONS_J1)
+    drapeaux |= encoder_boutons(commande_j2, DECALAGE_BOUTONS_J2)
+    if enregistreur.nouvelle_manche:
+        drapeaux |= DRAPEAU_NOUVELLE_MANCHE
+        enregistreur.nouvelle_manche = False
+    enregistreur.images += STRUCTURE_IMAGE.pack(
+        delta_temps,
+        delta_temps if delta_style is None else delta_style,
+        commande_j1.entree_x,
+        commande_j1.entree_y,
+        commande_j2.entree_x,
+        commande_j2.entree_y,
+        drapeaux,
+    )
+    enregistreur.nombre_images += 1
+
+
+def terminer_manche_replay(enregistreur: EnregistreurReplay) -> None:
+    """Signale que la prochaine image enregistree ouvre une nouvelle manche.
+
+    Args:
+        enregistreur: Enregistrement en cours.
+
+    Returns:
+        None.
+    """
+
+    enregistreur.nouvelle_manche = True
+
+
+def creer_observateur_replay(enregistreur: EnregistreurReplay) -> ObservateurPas:
+    """Branche un enregistreur sur ``simulation.simuler_match``.
+
+    Args:
+        enregistreur: Enregistrement a alimenter.
+
+    Returns:
+        Observateur a passer a ``simuler_match``.
+    """
+
+    def observer(
+        commande_j1: CommandeJoueur,
+        commande_j2: CommandeJoueur,
+        delta_temps: float,
+        nouvelle_manche: bool,
+    ) -> None:
+        """Enregistre un pas simule.
+
+        Args:
+            commande_j1: Commande de J1.
+            commande_j2: Commande de J2.
+            delta_temps: Pas de temps.
+            nouvelle_manche: True au premier pas d une manche.
+
+        Returns:
+            None.
+        """
+
+        if nouvelle_manche:
+            terminer_manche_replay(enregistreur)
+        enregistrer_image_replay(enregistreur, commande_j1, commande_j2, delta_temps)
+
+    return observer
+
+
+def finaliser_replay(enregistreur: EnregistreurReplay) -> Replay:
+    """Fige un enregistrement en replay relisible.
+
+    Args:
+        enregistreur: Enregistrement termine.
+
+    Returns:
+        Replay correspondant.
+    """
+
+    return Replay(
+        configuration=enregistreur.configuration,
+        empreinte_configuration=calculer_empreinte_configuration(enregistreur.configuration),
+        graine=enregistreur.graine,
+        horodatage=enregistreur.horodatage,
+        images=bytes(enregistreur.images),
+    )
+
+
+def encoder_replay(replay: Replay) -> bytes:
+    """Serialise un replay au format binaire compresse.
+
+    Format: signature, octet de version, puis zlib de (taille de l en-tete
+    JSON sur 4 octets, en-tete JSON, images brutes).
+
+    Args:
+        replay: Replay a serialiser.
+
+    Returns:
+        Contenu du fichier replay.
+    """
+
+    entete = json.dumps(
+        {
+            "empreinte_configuration": replay.empreinte_configuration,
+            "graine": replay.graine,
+            "horodatage": replay.horodatage,
+            "nombre_images": replay.nombre_images,
+            "configuration": replay.configuration,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+    ).encode("utf-8")
+    charge = STRUCTURE_TAILLE_ENTETE.pack(len(entete)) + entete + replay.images
+    return SIGNATURE_REPLAY + bytes((VERSION_FORMAT_REPLAY,)) + zlib.compress(charge, 9)
+
+
+def decoder_replay(contenu: bytes) -> Replay:
+    """Relit un replay serialise par ``encoder_replay``.
+
+    Args:
+        contenu: Contenu du fichier replay.
+
+    Returns:
+        Replay relu.
+
+    Raises:
+        ValueError: Si la signature, la version ou le contenu sont invalides.
+    """
+
+    taille_prefixe = len(SIGNATURE_REPLAY) + 1
+    if contenu[: len(SIGNATURE_REPLAY)] != SIGNATURE_REPLAY:
+        raise ValueError("Fichier replay Neon Sumo invalide: signature absente.")
+    version = contenu[len(SIGNATURE_REPLAY)] if len(contenu) >= taille_prefixe else None
+    if version != VERSION_FORMAT_REPLAY:
+        raise ValueError(f"Version de replay non supportee: {version}.")
+    try:
+        charge = zlib.decompress(contenu[taille_prefixe:])
+        (taille_entete,) = STRUCTURE_TAILLE_ENTETE.unpack_from(charge)
+        debut_images = STRUCTURE_TAILLE_ENTETE.size + taille_entete
+        entete = json.loads(charge[STRUCTURE_TAILLE_ENTETE.size : debut_images].decode("utf-8"))
+    except (zlib.error, struct.error, UnicodeDecodeError, json.JSONDecodeError) as erreur:
+        raise ValueError(f"Fichier replay Neon Sumo corrompu: {erreur}.") from erreur
+
+    images = charge[debut_images:]
+    if len(images) != entete["nombre_images"] * STRUCTURE_IMAGE.size:
+        raise ValueError("Fichier replay Neon Sumo tronque: nombre d images incoherent.")
+    configuration = entete["configuration"]
+    if calculer_empreinte_configuration(configuration) != entete["empreinte_configuration"]:
+        raise ValueError("Fichier replay Neon Sumo corrompu: empreinte de configuration invalide.")
+    return Replay(
+        configuration=configuration,
+        empreinte_configuration=entete["empreinte_configuration"],
+        graine=int(entete["graine"]),
+        horodatage=float(entete["horodatage"]),
+        images=images,
+    )
+
+
+def construire_nom_fichier_replay(replay: Replay) -> str:
+    """Construit le nom de fichier d un replay.
+
+    Args:
+        replay: Replay a nommer.
+
+    Returns:
+        Nom ``neon_sumo_<date>_<empreinte>.nsr``.
+    """
+
+    horodatage = time.strftime("%Y%m%d_%H%M%S", time.localtime(replay.horodatage))
+    return f"neon_sumo_{horodatage}_{replay.empreinte_configuration[:8]}{EXTENSION_REPLAY}"
+
+
+def sauvegarder_replay(
+    replay: Replay,
+    dossier: Path = DOSSIER_REPLAYS_DEFAUT,
+    nombre_max: int = NOMBRE_MAX_REPLAYS_DEFAUT,
+) -> Path:
+    """Ecrit un replay et ne conserve que les plus recents du dossier.
+
+    Args:
+        replay: Replay a ecrire.
+        dossier: Dossier des replays.
+        nombre_max: Nombre de replays conserves.
+
+    Returns:
+        Chemin du fichier ecrit.
+    """
+
+    dossier.mkdir(parents=True, exist_ok=True)
+    chemin = dossier / construire_nom_fichier_replay(replay)
+    chemin_temporaire = chemin.with_suffix(".tmp")
+    chemin_temporaire.write_bytes(encoder_replay(replay))
+    chemin_temporaire.replace(chemin)
+
+    anciens = sorted(
+        dossier.glob(f"*{EXTENSION_REPLAY}"),
+        key=lambda fichier: (fichier.stat().st_mtime, fichier.name),
+    )
+    for fichier in anciens[: max(0, len(anciens) - nombre_max)]:
+        fichier.unlink(missing_ok=True)
+    return chemin
+
+
+def charger_replay(chemin: Path) -> Replay:
+    """Lit un fichier replay.
+
+    Args:
+        chemin: Chemin du fichier.
+
+    Returns:
+        Replay relu.
+    """
+
+    return decoder_replay(chemin.read_bytes())
+
+
+def creer_lecteur_replay(
+    replay: Replay,
+    configuration: Optional[Dict[str, object]] = None,
+    intervalle_instantanes: int = INTERVALLE_INSTANTANES_DEFAUT,
+) -> LecteurReplay:
+    """Prepare la relecture d un replay.
+
+    Args:
+        replay: Replay a relire.
+        configuration: Configuration attendue; None pour utiliser celle du replay.
+        intervalle_instantanes: Nombre d images entre deux instantanes de positionnement.
+
+    Returns:
+        LecteurReplay positionne avant la premiere image.
+
+    Raises:
+        ValueError: Si la configuration fournie ne correspond pas a celle du replay.
+    """
+
+    if configuration is not None:
+        empreinte = calculer_empreinte_configuration(configuration)
+        if empreinte != replay.empreinte_configuration:
+            raise ValueError(
+                "Replay enregistre avec une autre configuration "
+                f"({replay.empreinte_configuration} != {empreinte})."
+            )
+    lecteur = LecteurReplay(
+        replay=replay,
+        regles=construire_regles_simulation(replay.configuration),
+        victoires_pour_gagner=int(replay.configuration["match"]["victoires_pour_gagner"]),
+        intervalle_instantanes=max(1, intervalle_instantanes),
+    )
+    memoriser_instantane(lecteur)
+    return lecteur
+
+
+def memoriser_instantane(lecteur: LecteurReplay) -> None:
+    """Conserve une copie de l etat courant du lecteur.
+
+    Args:
+        lecteur: Lecteur concerne.
+
+    Returns:
+        None.
+    """
+
+    index_image = lecteur.etat.index_image
+    if index_image not in lecteur.instantanes:
+        lecteur.instantanes[index_image] = copy.deepcopy(lecteur.etat)
+        bisect.insort(lecteur.index_instantanes, index_image)
+
+
+def cloturer_manche(etat: EtatReplay, interrompue: bool) -> None:
+    """Ajoute la manche en cours au resultat du match.
+
+    Args:
+        etat: Etat du lecteur.
+        interrompue: True si la manche s arrete sans elimination.
+
+    Returns:
+        None.
+    """
+
+    if etat.duel is None or etat.pas_manche == 0:
+        return
+    etat_manche = etat.duel.etat_manche
+    etat.resultat.manches.append(
+        ResultatManche(
+            vainqueur=VAINQUEUR_EGALITE,
+            duree=etat.duree_manche,
+            nombre_pas=etat.pas_manche,
+            mort_subite=etat_manche.temps_restant <= 0.0,
+            rayon_final=etat_manche.rayon_arene,
+            interrompue=interrompue,
+        )
+    )
+
+
+def avancer_image_replay(lecteur: LecteurReplay) -> bool:
+    """Rejoue l image suivante.
+
+    Args:
+        lecteur: Lecteur concerne.
+
+    Returns:
+        False si le replay est termine, sinon True.
+    """
+
+    etat = lecteur.etat
+    if etat.index_image >= lecteur.replay.nombre_images:
+        return False
+
+    delta_temps, delta_style, j1_x, j1_y, j2_x, j2_y, drapeaux = STRUCTURE_IMAGE.unpack_from(
+        lecteur.replay.images, etat.index_image * STRUCTURE_IMAGE.size
+    )
+    if drapeaux & DRAPEAU_NOUVELLE_MANCHE or etat.duel is None:
+        if not etat.manche_terminee:
+            cloturer_manche(etat, interrompue=True)
+        if etat.duel is None:
+            reinitialiser_etat_style(etat.style_j1)
+            reinitialiser_etat_style(etat.style_j2)
+        etat.duel = creer_etat_duel(lecteur.replay.configuration, etat.style_j1, etat.style_j2)
+        etat.manche_terminee = False
+        etat.pas_manche = 0
+        etat.duree_manche = 0.0
+
+    commande_j1 = decoder_commande(j1_x, j1_y, drapeaux, DECALAGE_BOUTONS_J1)
+    commande_j2 = decoder_commande(j2_x, j2_y, drapeaux, DECALAGE_BOUTONS_J2)
+    elimine_j1, elimine_j2 = avancer_pas_manche(
+        etat.duel, lecteur.regles, commande_j1, commande_j2, delta_temps, delta_style
+    )
+    etat.index_image += 1
+    etat.pas_manche += 1
+    etat.duree_manche += delta_temps
+
+    if (elimine_j1 or elimine_j2) and not etat.manche_terminee:
+        etat.manche_terminee = True
+        cloturer_manche(etat, interrompue=False)
+        resultat = etat.resultat
+        resultat.manches[-1].vainqueur = determiner_vainqueur_manche(elimine_j1, elimine_j2)
+        if resultat.manches[-1].vainqueur == "J1":
+            resultat.score_j1 += 1
+        elif resultat.manches[-1].vainqueur == "J2":
+            resultat.score_j2 += 1
+        if not resultat.vainqueur and resultat.score_j1 >= lecteur.victoires_pour_gagner:
+            resultat.vainqueur = "J1"
+        elif not resultat.vainqueur and resultat.score_j2 >= lecteur.victoires_pour_gagner:
+            resultat.vainqueur = "J2"
+    etat.resultat.style_j1 = etat.style_j1.score_total
+    etat.resultat.style_j2 = etat.style_j2.score_total
+
+    if etat.index_image % lecteur.intervalle_instantanes == 0:
+        memoriser_instantane(lecteur)
+    return True
+
+
+def avancer_images_replay(lecteur: LecteurReplay, nombre_images: int) -> int:
+    """Rejoue plusieurs images d affilee.
+
+    Args:
+        lecteur: Lecteur concerne.
+        nombre_images: Nombre maximal d images a rejouer.
+
+    Returns:
+        Nombre d images effectivement rejouees.
+    """
+
+    rejouees = 0
+    while rejouees < nombre_images and avancer_image_replay(lecteur):
+        rejouees += 1
+    return rejouees
+
+
+def avancer_duree_replay(lecteur: LecteurReplay, duree_reelle: float, vitesse: float = 1.0) -> int:
+    """Rejoue les images couvrant une duree reelle a une vitesse donnee.
+
+    Les images sont consommees selon leur ``delta_style`` enregistre, qui suit
+    l horloge du jeu meme pendant les gels d impact. Une vitesse de 4 rejoue
+    quatre secondes de match par seconde d affichage.
+
+    Args:
+        lecteur: Lecteur concerne.
+        duree_reelle: Temps ecoule cote lecteur en secondes.
+        vitesse: Facteur d acceleration (ralenti si inferieur a 1).
+
+    Returns:
+        Nombre d images rejouees.
+    """
+
+    lecteur.temps_en_avance += duree_reelle * max(0.0, vitesse)
+    rejouees = 0
+    images = lecteur.replay.images
+    while lecteur.etat.index_image < lecteur.replay.nombre_images:
+        _, delta_style, *_ = STRUCTURE_IMAGE.unpack_from(
+            images, lecteur.etat.index_image * STRUCTURE_IMAGE.size
+        )
+        if delta_style > lecteur.temps_en_avance:
+            break
+        lecteur.temps_en_avance -= delta_style
+        avancer_image_replay(lecteur)
+        rejouees += 1
+    if lecteur.etat.index_image >= lecteur.replay.nombre_images:
+        lecteur.temps_en_avance = 0.0
+    return rejouees
+
+
+def aller_a_image_replay(lecteur: LecteurReplay, index_image: int) -> None:
+    """Positionne le lecteur juste apres ``index_image`` images.
+
+    Repart de l instantane le plus proche a gauche de la cible, puis rejoue
+    les images restantes; les instantanes sont crees au fil de la lecture.
+
+    Args:
+        lecteur: Lecteur concerne.
+        index_image: Nombre d images a avoir rejouees, borne a la taille du replay.
+
+    Returns:
+        None.
+    """
+
+    cible = max(0, min(index_image, lecteur.replay.nombre_images))
+    position = bisect.bisect_right(lecteur.index_instantanes, cible) - 1
+    depart = lecteur.index_instantanes[position]
+    if cible < lecteur.etat.index_image or depart > lecteur.etat.index_image:
+        lecteur.etat = copy.deepcopy(lecteur.instantanes[depart])
+    lecteur.temps_en_avance = 0.0
+    avancer_images_replay(lecteur, cible - lecteur.etat.index_image)
+
+
+def rejouer_replay(
+    replay: Replay,
+    configuration: Optional[Dict[str, object]] = None,
+) -> ResultatMatch:
+    """Rejoue un replay complet.
+
+    Args:
+        replay: Replay a relire.
+        configuration: Configuration attendue; None pour utiliser celle du replay.
+
+    Returns:
+        ResultatMatch reconstruit.
+    """
+
+    lecteur = creer_lecteur_replay(replay, configuration)
+    avancer_images_replay(lecteur, replay.nombre_images)
+    if not lecteur.etat.manche_terminee:
+        cloturer_manche(lecteur.etat, interrompue=True)
+    return lecteur.etat.resultat
+
+
+def formater_etat_replay(lecteur: LecteurReplay) -> str:
+    """Resume l etat courant du lecteur.
+
+    Args:
+        lecteur: Lecteur concerne.
+
+    Returns:
+        Texte multi-lignes.
+    """
+
+    etat = lecteur.etat
+    lignes = [
+        f"image {etat.index_image}/{lecteur.replay.nombre_images}"
+        f"  manche {len(etat.resultat.manches) + (0 if etat.manche_terminee else 1)}"
+        f"  score {etat.resultat.score_j1}-{etat.resultat.score_j2}"
+    ]
+    if etat.duel is not None:
+        lignes.append(
+            f"arene rayon={etat.duel.etat_manche.rayon_arene:.2f}"
+            f" temps_restant={etat.duel.etat_manche.temps_restant:.3f}"
+        )
+        joueurs = ((etat.duel.joueur_1, etat.style_j1), (etat.duel.joueur_2, etat.style_j2))
+        for joueur, style in joueurs:
+            lignes.append(
+                f"{joueur.identifiant} pos=({joueur.position_x:.2f}, {joueur.position_y:.2f})"
+                f" vit=({joueur.vitesse_x:.2f}, {joueur.vitesse_y:.2f})"
+                f" ultime={joueur.jauge_ultime:.3f} bouclier={joueur.actif_bouclier}"
+                f" style={style.score_total}"
+            )
+    return "\n".join(lignes)
+
+
+def construire_analyseur() -> argparse.ArgumentParser:
+    """Construit l analyseur d arguments de la commande.
+
+    Returns:
+        ArgumentParser configure.
+    """
+
+    analyseur = argparse.ArgumentParser(description="Rejoue un replay Neon Sumo sans affichage.")
+    analyseur.add_argument("fichier", type=Path, help="Fichier .nsr a relire.")
+    analyseur.add_argument(
+        "--image",
+        type=int,
+        default=None,
+        help="Affiche l etat apres ce nombre d images (defaut: fin du replay).",
+    )
+    return analyseur
+
+
+def main(arguments: Optional[Sequence[str]] = None) -> int:
+    """Point d entree de la commande.
+
+    Args:
+        arguments: Arguments de ligne de commande, sys.argv si None.
+
+    Returns:
+        Code de sortie: 0 si succes, 2 si le replay est illisible.
+    """
+
+    options = construire_analyseur().parse_args(arguments)
+    try:
+        replay = charger_replay(options.fichier)
+    except (OSError, ValueError) as erreur:
+        print(f"ERREUR: {erreur}")
+        return 2
+
+    resultat = rejouer_replay(replay)
+    print(
+        f"{options.fichier.name}: {replay.nombre_images} images, graine {replay.graine},"
+        f" configuration {replay.empreinte_configuration}"
+    )
+    print(
+        f"vainqueur {resultat.vainqueur or '-'}  score {resultat.score_j1}-{resultat.score_j2}"
+        f"  style {resultat.style_j1}-{resultat.style_j2}  duree {resultat.duree_totale:.1f}s"
+    )
+    lecteur = creer_lecteur_replay(replay)
+    aller_a_image_replay(lecteur, replay.nombre_images if options.image is None else options.image)
+    print(formater_etat_replay(lecteur))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,734 @@
+"""Simulateur de match Neon Sumo sans affichage.
+
+Ce module rejoue les regles de ``boucle_jeu`` avec un pas de temps fixe et
+uniquement les fonctions pures de ``logique.py``: aucune dependance pygame.
+Il sert aux tests de non-regression et a l equilibrage de ``config_jeu.json``.
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, field
+from math import sqrt
+from typing import Callable, Dict, List, Optional, Tuple
+
+from logique import (
+    EtatStyleJoueur,
+    Joueur,
+    ParametresCombat,
+    ParametresStyle,
+    activer_bouclier,
+    activer_dash,
+    activer_ultime,
+    appliquer_deplacement_inertiel,
+    charger_ultime,
+    construire_parametres_combat,
+    construire_parametres_style,
+    creer_joueurs,
+    decrementer_cooldowns,
+    enregistrer_impact_style,
+    executer_bump,
+    mettre_a_jour_bouclier,
+    mettre_a_jour_etat_style,
+    mettre_a_jour_sauvetage_bord,
+    reinitialiser_style_pour_manche,
+    resoudre_collision_capsules,
+    tenter_esquive_proche,
+    verifier_sortie_arene,
+)
+
+
+DELTA_TEMPS_DEFAUT = 1.0 / 60.0
+LIMITE_MANCHES_DEFAUT = 9
+FACTEUR_DUREE_LIMITE_MANCHE = 3.0
+SEUIL_IMPACT_ULTIME = 1e-18
+VAINQUEUR_EGALITE = "Egalite"
+
+
+@dataclass
+class CommandeJoueur:
+    """Commande emise par une politique pour un pas de simulation.
+
+    Attributes:
+        entree_x: Axe horizontal du joystick.
+        entree_y: Axe vertical du joystick.
+        frein: Frein maintenu.
+        dash: Appui dash sur ce pas.
+        bump: Appui bump sur ce pas.
+        bouclier: Appui bouclier sur ce pas.
+        ultime: Appui ultime sur ce pas.
+    """
+
+    entree_x: float = 0.0
+    entree_y: float = 0.0
+    frein: bool = False
+    dash: bool = False
+    bump: bool = False
+    bouclier: bool = False
+    ultime: bool = False
+
+
+@dataclass
+class EtatManche:
+    """Etat de l arene visible par les politiques.
+
+    Attributes:
+        centre_x: Centre X de l arene.
+        centre_y: Centre Y de l arene.
+        rayon_arene: Rayon courant de l arene.
+        temps_restant: Temps restant avant la mort subite.
+        largeur_danger: Largeur de la couronne danger.
+    """
+
+    centre_x: float
+    centre_y: float
+    rayon_arene: float
+    temps_restant: float
+    largeur_danger: float
+
+
+Politique = Callable[[Joueur, Joueur, EtatManche, random.Random], CommandeJoueur]
+# Recoit (commande_j1, commande_j2, delta_temps, nouvelle_manche) a chaque pas simule.
+ObservateurPas = Callable[[CommandeJoueur, CommandeJoueur, float, bool], None]
+
+
+@dataclass
+class ReglesSimulation:
+    """Parametres constants d un match, lus une fois dans la configuration.
+
+    Attributes:
+        parametres: Parametres de combat.
+        parametres_style: Parametres du systeme de style.
+        rayon_min: Rayon minimal de l arene.
+        vitesse_retrecissement: Retrecissement de l arene en pixels par seconde.
+        multiplicateur_sudden_death: Acceleration du retrecissement en mort subite.
+    """
+
+    parametres: ParametresCombat
+    parametres_style: ParametresStyle
+    rayon_min: float
+    vitesse_retrecissement: float
+    multiplicateur_sudden_death: float
+
+
+@dataclass
+class EtatDuel:
+    """Etat logique d une manche en cours.
+
+    Attributes:
+        joueur_1: Joueur J1.
+        joueur_2: Joueur J2.
+        style_j1: Etat style de J1, conserve entre manches.
+        style_j2: Etat style de J2, conserve entre manches.
+        etat_manche: Etat de l arene.
+    """
+
+    joueur_1: Joueur
+    joueur_2: Joueur
+    style_j1: EtatStyleJoueur
+    style_j2: EtatStyleJoueur
+    etat_manche: EtatManche
+
+
+@dataclass
+class EvenementsJoueur:
+    """Actions reussies par un joueur pendant un pas, pour les effets de ``boucle_jeu``.
+
+    Attributes:
+        dash: Dash declenche.
+        esquive: Esquive proche reussie sur ce dash.
+        bump: Bump ayant touche l adversaire.
+        bouclier: Bouclier active.
+        ultime: Ultime declenche.
+        impact_ultime: Ultime ayant deplace l adversaire.
+        sauvetage: Bonus de sauvetage depuis la zone danger.
+    """
+
+    dash: bool = False
+    esquive: bool = False
+    bump: bool = False
+    bouclier: bool = False
+    ultime: bool = False
+    impact_ultime: bool = False
+    sauvetage: bool = False
+
+
+@dataclass
+class ResultatManche:
+    """Resume d une manche simulee.
+
+    Attributes:
+        vainqueur: J1, J2 ou Egalite.
+        duree: Duree de jeu de la manche en secondes.
+        nombre_pas: Nombre de pas de simulation.
+        mort_subite: True si la manche s est terminee en mort subite.
+        rayon_final: Rayon de l arene a l elimination.
+        interrompue: True si la manche a atteint la duree limite sans elimination.
+    """
+
+    vainqueur: str
+    duree: float
+    nombre_pas: int
+    mort_subite: bool
+    rayon_final: float
+    interrompue: bool = False
+
+
+@dataclass
+class ResultatMatch:
+    """Resume d un match simule.
+
+    Attributes:
+        vainqueur: J1, J2, ou chaine vide si la limite de manches est atteinte.
+        score_j1: Manches gagnees par J1.
+        score_j2: Manches gagnees par J2.
+        style_j1: Score style cumule de J1.
+        style_j2: Score style cumule de J2.
+        manches: Detail des manches jouees.
+    """
+
+    vainqueur: str
+    score_j1: int
+    score_j2: int
+    style_j1: int
+    style_j2: int
+    manches: List[ResultatManche] = field(default_factory=list)
+
+    @property
+    def duree_totale(self) -> float:
+        """Retourne la duree de jeu cumulee du match.
+
+        Returns:
+            Somme des durees de manche en secondes.
+        """
+
+        return sum(manche.duree for manche in self.manches)
+
+
+def politique_inactive(
+    joueur: Joueur,
+    adversaire: Joueur,
+    etat_manche: EtatManche,
+    generateur: random.Random,
+) -> CommandeJoueur:
+    """Politique qui ne touche a aucune commande.
+
+    Args:
+        joueur: Joueur pilote.
+        adversaire: Joueur adverse.
+        etat_manche: Etat courant de l arene.
+        generateur: Generateur pseudo-aleatoire du match.
+
+    Returns:
+        CommandeJoueur neutre.
+    """
+
+    del joueur, adversaire, etat_manche, generateur
+    return CommandeJoueur()
+
+
+def politique_attract(
+    joueur: Joueur,
+    adversaire: Joueur,
+    etat_manche: EtatManche,
+    generateur: random.Random,
+) -> CommandeJoueur:
+    """Reproduit l IA du mode attract avec un generateur seed.
+
+    Args:
+        joueur: Joueur pilote.
+        adversaire: Joueur adverse.
+        etat_manche: Etat courant de l arene.
+        generateur: Generateur pseudo-aleatoire du match.
+
+    Returns:
+        CommandeJoueur de deplacement seul.
+    """
+
+    del adversaire
+    vers_centre_x = etat_manche.centre_x - joueur.position_x
+    vers_centre_y = etat_manche.centre_y - joueur.position_y
+    distance_centre = sqrt(vers_centre_x * vers_centre_x + vers_centre_y * vers_centre_y)
+    facteur_bord = 1.0 if distance_centre > etat_manche.rayon_arene * 0.75 else 0.3
+    alea_x = generateur.uniform(-0.7, 0.7)
+    alea_y = generateur.uniform(-0.7, 0.7)
+    return CommandeJoueur(
+        entree_x=vers_centre_x * 0.01 * facteur_bord + alea_x,
+        entree_y=vers_centre_y * 0.01 * facteur_bord + alea_y,
+    )
+
+
+def politique_agressive(
+    joueur: Joueur,
+    adversaire: Joueur,
+    etat_manche: EtatManche,
+    generateur: random.Random,
+) -> CommandeJoueur:
+    """Fonce sur l adversaire et utilise toutes les actions disponibles.
+
+    Args:
+        joueur: Joueur pilote.
+        adversaire: Joueur adverse.
+        etat_manche: Etat courant de l arene.
+        generateur: Generateur pseudo-aleatoire du match.
+
+    Returns:
+        CommandeJoueur offensive.
+    """
+
+    del etat_manche
+    return CommandeJoueur(
+        entree_x=adversaire.position_x - joueur.position_x,
+        entree_y=adversaire.position_y - joueur.position_y,
+        dash=generateur.random() < 0.05,
+        bump=True,
+        bouclier=generateur.random() < 0.02,
+        ultime=True,
+    )
+
+
+def jouer_dash(
+    commande: CommandeJoueur,
+    joueur: Joueur,
+    adversaire: Joueur,
+    style: Optional[EtatStyleJoueur],
+    parametres: ParametresCombat,
+    parametres_style: ParametresStyle,
+) -> Tuple[bool, bool]:
+    """Declenche le dash et tente l esquive proche associee.
+
+    Args:
+        commande: Commande du joueur.
+        joueur: Joueur acteur.
+        adversaire: Joueur adverse.
+        style: Etat style du joueur acteur, ou None hors mode competitif.
+        parametres: Parametres de combat.
+        parametres_style: Parametres du systeme de style.
+
+    Returns:
+        Tuple (dash declenche, esquive reussie).
+    """
+
+    if commande.dash and activer_dash(joueur, parametres):
+        if style is None:
+            return True, False
+        return True, tenter_esquive_proche(joueur, adversaire, style, parametres_style)
+    return False, False
+
+
+def jouer_bump(
+    commande: CommandeJoueur,
+    joueur: Joueur,
+    adversaire: Joueur,
+    style: Optional[EtatStyleJoueur],
+    parametres: ParametresCombat,
+    parametres_style: ParametresStyle,
+) -> bool:
+    """Declenche le bump et credite le style en cas d impact.
+
+    Args:
+        commande: Commande du joueur.
+        joueur: Joueur acteur.
+        adversaire: Joueur adverse.
+        style: Etat style du joueur acteur, ou None hors mode competitif.
+        parametres: Parametres de combat.
+        parametres_style: Parametres du systeme de style.
+
+    Returns:
+        True si le bump a touche l adversaire.
+    """
+
+    if commande.bump and executer_bump(joueur, adversaire, parametres):
+        if style is not None:
+            enregistrer_impact_style(style, parametres_style)
+        return True
+    return False
+
+
+def jouer_ultime(
+    commande: CommandeJoueur,
+    joueur: Joueur,
+    adversaire: Joueur,
+    style: Optional[EtatStyleJoueur],
+    parametres: ParametresCombat,
+    parametres_style: ParametresStyle,
+) -> Tuple[bool, bool]:
+    """Declenche l ultime et credite le style si l adversaire est touche.
+
+    Args:
+        commande: Commande du joueur.
+        joueur: Joueur lanceur.
+        adversaire: Joueur cible.
+        style: Etat style du lanceur, ou None hors mode competitif.
+        parametres: Parametres de combat.
+        parametres_style: Parametres du systeme de style.
+
+    Returns:
+        Tuple (ultime declenche, adversaire deplace).
+    """
+
+    vitesse_avant_x = adversaire.vitesse_x
+    vitesse_avant_y = adversaire.vitesse_y
+    if commande.ultime and activer_ultime(joueur, adversaire, parametres):
+        impact = (
+            abs(adversaire.vitesse_x - vitesse_avant_x) > SEUIL_IMPACT_ULTIME
+            or abs(adversaire.vitesse_y - vitesse_avant_y) > SEUIL_IMPACT_ULTIME
+        )
+        if impact and style is not None:
+            enregistrer_impact_style(style, parametres_style)
+        return True, impact
+    return False, False
+
+
+def construire_regles_simulation(
+    configuration: Dict[str, object],
+    parametres: Optional[ParametresCombat] = None,
+    parametres_style: Optional[ParametresStyle] = None,
+) -> ReglesSimulation:
+    """Construit les regles constantes d un match.
+
+    Args:
+        configuration: Configuration globale du jeu.
+        parametres: Parametres de combat deja construits, sinon lus dans la configuration.
+        parametres_style: Parametres de style deja construits, sinon lus dans la configuration.
+
+    Returns:
+        ReglesSimulation du match.
+    """
+
+    arene = configuration["arene"]
+    return ReglesSimulation(
+        parametres=parametres or construire_parametres_combat(configuration),
+        parametres_style=parametres_style or construire_parametres_style(configuration),
+        rayon_min=float(arene["rayon_min"]),
+        vitesse_retrecissement=float(arene["vitesse_retrecissement"]),
+        multiplicateur_sudden_death=float(arene["multiplicateur_sudden_death"]),
+    )
+
+
+def creer_etat_duel(
+    configuration: Dict[str, object],
+    style_j1: EtatStyleJoueur,
+    style_j2: EtatStyleJoueur,
+) -> EtatDuel:
+    """Place les joueurs et l arene en debut de manche, comme ``reinitialiser_manche``.
+
+    Args:
+        configuration: Configuration globale du jeu.
+        style_j1: Etat style de J1, remis a zero pour la manche.
+        style_j2: Etat style de J2, remis a zero pour la manche.
+
+    Returns:
+        EtatDuel de la nouvelle manche.
+    """
+
+    largeur = int(configuration["ecran"]["largeur"])
+    hauteur = int(configuration["ecran"]["hauteur"])
+    arene = configuration["arene"]
+    joueur_1, joueur_2 = creer_joueurs(configuration, largeur, hauteur)
+    reinitialiser_style_pour_manche(style_j1)
+    reinitialiser_style_pour_manche(style_j2)
+    etat_manche = EtatManche(
+        centre_x=largeur / 2.0,
+        centre_y=hauteur / 2.0,
+        rayon_arene=float(arene["rayon_depart"]),
+        temps_restant=float(configuration["match"]["duree_max_manche"]),
+        largeur_danger=float(arene["largeur_zone_danger"]),
+    )
+    return EtatDuel(joueur_1, joueur_2, style_j1, style_j2, etat_manche)
+
+
+def avancer_pas_manche(
+    duel: EtatDuel,
+    regles: ReglesSimulation,
+    commande_j1: CommandeJoueur,
+    commande_j2: CommandeJoueur,
+    delta_temps: float,
+    delta_style: Optional[float] = None,
+    evenements: Optional[Tuple[EvenementsJoueur, EvenementsJoueur]] = None,
+    competitif: bool = True,
+) -> Tuple[bool, bool]:
+    """Avance une manche d un pas; ``boucle_jeu`` l appelle a chaque pas fixe.
+
+    Hors mode competitif (attract), le style n evolue pas: ni timers, ni
+    esquive, ni points d impact, ni sauvetage depuis la zone danger.
+
+    Args:
+        duel: Etat de la manche, modifie sur place.
+        regles: Regles constantes du match.
+        commande_j1: Commande de J1 pour ce pas.
+        commande_j2: Commande de J2 pour ce pas.
+        delta_temps: Pas de physique en secondes (0 pendant un gel d impact).
+        delta_style: Pas des timers de style; ``delta_temps`` si None.
+        evenements: Evenements (J1, J2) remplis a chaque pas, ou None.
+        competitif: False en mode attract pour laisser le style intact.
+
+    Returns:
+        Tuple (elimine_j1, elimine_j2).
+    """
+
+    joueur_1 = duel.joueur_1
+    joueur_2 = duel.joueur_2
+    style_j1 = duel.style_j1 if competitif else None
+    style_j2 = duel.style_j2 if competitif else None
+    etat_manche = duel.etat_manche
+    parametres = regles.parametres
+    parametres_style = regles.parametres_style
+
+    if competitif:
+        delta_style = delta_temps if delta_style is None else delta_style
+        mettre_a_jour_etat_style(duel.style_j1, delta_style)
+        mettre_a_jour_etat_style(duel.style_j2, delta_style)
+
+    appliquer_deplacement_inertiel(
+        joueur_1, commande_j1.entree_x, commande_j1.entree_y, commande_j1.frein, delta_temps, parametres
+    )
+    appliquer_deplacement_inertiel(
+        joueur_2, commande_j2.entree_x, commande_j2.entree_y, commande_j2.frein, delta_temps, parametres
+    )
+    resoudre_collision_capsules(joueur_1, joueur_2, parametres)
+
+    decrementer_cooldowns(joueur_1, delta_temps)
+    decrementer_cooldowns(joueur_2, delta_temps)
+    mettre_a_jour_bouclier(joueur_1, delta_temps)
+    mettre_a_jour_bouclier(joueur_2, delta_temps)
+    charger_ultime(joueur_1, delta_temps, parametres)
+    charger_ultime(joueur_2, delta_temps, parametres)
+
+    dash_j1, esquive_j1 = jouer_dash(
+        commande_j1, joueur_1, joueur_2, style_j1, parametres, parametres_style
+    )
+    dash_j2, esquive_j2 = jouer_dash(
+        commande_j2, joueur_2, joueur_1, style_j2, parametres, parametres_style
+    )
+    bump_j1 = jouer_bump(commande_j1, joueur_1, joueur_2, style_j1, parametres, parametres_style)
+    bump_j2 = jouer_bump(commande_j2, joueur_2, joueur_1, style_j2, parametres, parametres_style)
+    bouclier_j1 = commande_j1.bouclier and activer_bouclier(joueur_1, parametres)
+    bouclier_j2 = commande_j2.bouclier and activer_bouclier(joueur_2, parametres)
+    ultime_j1, impact_ultime_j1 = jouer_ultime(
+        commande_j1, joueur_1, joueur_2, style_j1, parametres, parametres_style
+    )
+    ultime_j2, impact_ultime_j2 = jouer_ultime(
+        commande_j2, joueur_2, joueur_1, style_j2, parametres, parametres_style
+    )
+
+    etat_manche.temps_restant -= delta_temps
+    multiplicateur = regles.multiplicateur_sudden_death if etat_manche.temps_restant <= 0.0 else 1.0
+    etat_manche.rayon_arene = max(
+        regles.rayon_min,
+        etat_manche.rayon_arene - regles.vitesse_retrecissement * multiplicateur * delta_temps,
+    )
+    sauvetage_j1 = competitif and mettre_a_jour_sauvetage_bord(
+        joueur_1,
+        duel.style_j1,
+        parametres_style,
+        etat_manche.centre_x,
+        etat_manche.centre_y,
+        etat_manche.rayon_arene,
+        etat_manche.largeur_danger,
+    )
+    sauvetage_j2 = competitif and mettre_a_jour_sauvetage_bord(
+        joueur_2,
+        duel.style_j2,
+        parametres_style,
+        etat_manche.centre_x,
+        etat_manche.centre_y,
+        etat_manche.rayon_arene,
+        etat_manche.largeur_danger,
+    )
+    if evenements is not None:
+        evenements_j1, evenements_j2 = evenements
+        evenements_j1.dash, evenements_j1.esquive = dash_j1, esquive_j1
+        evenements_j2.dash, evenements_j2.esquive = dash_j2, esquive_j2
+        evenements_j1.bump, evenements_j2.bump = bump_j1, bump_j2
+        evenements_j1.bouclier, evenements_j2.bouclier = bouclier_j1, bouclier_j2
+        evenements_j1.ultime, evenements_j1.impact_ultime = ultime_j1, impact_ultime_j1
+        evenements_j2.ultime, evenements_j2.impact_ultime = ultime_j2, impact_ultime_j2
+        evenements_j1.sauvetage, evenements_j2.sauvetage = sauvetage_j1, sauvetage_j2
+
+    elimine_j1 = verifier_sortie_arene(
+        joueur_1, etat_manche.centre_x, etat_manche.centre_y, etat_manche.rayon_arene, delta_temps, parametres
+    )
+    elimine_j2 = verifier_sortie_arene(
+        joueur_2, etat_manche.centre_x, etat_manche.centre_y, etat_manche.rayon_arene, delta_temps, parametres
+    )
+    return elimine_j1, elimine_j2
+
+
+def determiner_vainqueur_manche(elimine_j1: bool, elimine_j2: bool) -> str:
+    """Designe le vainqueur d une manche terminee par elimination.
+
+    Args:
+        elimine_j1: True si J1 est sorti de l arene.
+        elimine_j2: True si J2 est sorti de l arene.
+
+    Returns:
+        J1, J2 ou Egalite.
+    """
+
+    if elimine_j1 and not elimine_j2:
+        return "J2"
+    if elimine_j2 and not elimine_j1:
+        return "J1"
+    return VAINQUEUR_EGALITE
+
+
+def simuler_manche(
+    configuration: Dict[str, object],
+    parametres: ParametresCombat,
+    parametres_style: ParametresStyle,
+    style_j1: EtatStyleJoueur,
+    style_j2: EtatStyleJoueur,
+    politique_j1: Politique,
+    politique_j2: Politique,
+    generateur: random.Random,
+    delta_temps: float,
+    observateur: Optional[ObservateurPas] = None,
+) -> ResultatManche:
+    """Joue une manche complete jusqu a elimination.
+
+    Le gel d impact visuel de ``boucle_jeu`` n est pas simule: chaque pas
+    avance la physique de ``delta_temps``. Une manche sans elimination apres
+    ``FACTEUR_DUREE_LIMITE_MANCHE`` fois la duree max est declaree egalite.
+
+    Args:
+        configuration: Configuration globale du jeu.
+        parametres: Parametres de combat.
+        parametres_style: Parametres du systeme de style.
+        style_j1: Etat style de J1, conserve entre manches.
+        style_j2: Etat style de J2, conserve entre manches.
+        politique_j1: Politique pilotant J1.
+        politique_j2: Politique pilotant J2.
+        generateur: Generateur pseudo-aleatoire du match.
+        delta_temps: Pas de temps fixe en secondes.
+        observateur: Appele avec les commandes de chaque pas (enregistrement de replay).
+
+    Returns:
+        ResultatManche de la manche jouee.
+    """
+
+    regles = construire_regles_simulation(configuration, parametres, parametres_style)
+    duel = creer_etat_duel(configuration, style_j1, style_j2)
+    etat_manche = duel.etat_manche
+
+    duree_limite = etat_manche.temps_restant * FACTEUR_DUREE_LIMITE_MANCHE
+    nombre_pas_max = max(1, int(duree_limite / delta_temps))
+    nombre_pas = 0
+    while nombre_pas < nombre_pas_max:
+        nombre_pas += 1
+        commande_j1 = politique_j1(duel.joueur_1, duel.joueur_2, etat_manche, generateur)
+        commande_j2 = politique_j2(duel.joueur_2, duel.joueur_1, etat_manche, generateur)
+        if observateur is not None:
+            observateur(commande_j1, commande_j2, delta_temps, nombre_pas == 1)
+
+        elimine_j1, elimine_j2 = avancer_pas_manche(
+            duel, regles, commande_j1, commande_j2, delta_temps
+        )
+        if elimine_j1 or elimine_j2:
+            return ResultatManche(
+                vainqueur=determiner_vainqueur_manche(elimine_j1, elimine_j2),
+                duree=nombre_pas * delta_temps,
+                nombre_pas=nombre_pas,
+                mort_subite=etat_manche.temps_restant <= 0.0,
+                rayon_final=etat_manche.rayon_arene,
+            )
+
+    return ResultatManche(
+        vainqueur=VAINQUEUR_EGALITE,
+        duree=nombre_pas * delta_temps,
+        nombre_pas=nombre_pas,
+        mort_subite=True,
+        rayon_final=etat_manche.rayon_arene,
+        interrompue=True,
+    )
+
+
+def simuler_match(
+    configuration: Dict[str, object],
+    politique_j1: Politique,
+    politique_j2: Politique,
+    seed: int,
+    dt: float = DELTA_TEMPS_DEFAUT,
+    limite_manches: int = LIMITE_MANCHES_DEFAUT,
+    observateur: Optional[ObservateurPas] = None,
+) -> ResultatMatch:
+    """Joue un match complet sans affichage avec un pas de temps fixe.
+
+    Deux appels avec la meme configuration, les memes politiques et le meme
+    seed produisent exactement le meme resultat.
+
+    Args:
+        configuration: Configuration globale (contenu de config_jeu.json).
+        politique_j1: Politique pilotant J1.
+        politique_j2: Politique pilotant J2.
+        seed: Graine du generateur pseudo-aleatoire passe aux politiques.
+        dt: Pas de temps fixe en secondes.
+        limite_manches: Nombre maximal de manches (garde contre les egalites).
+        observateur: Appele avec les commandes de chaque pas (enregistrement de replay).
+
+    Returns:
+        ResultatMatch du match.
+    """
+
+    if dt <= 0.0:
+        raise ValueError("Le pas de temps dt doit etre strictement positif.")
+
+    parametres = construire_parametres_combat(configuration)
+    parametres_style = construire_parametres_style(configuration)
+    victoires_pour_gagner = int(configuration["match"]["victoires_pour_gagner"])
+    generateur = random.Random(seed)
+    style_j1 = EtatStyleJoueur()
+    style_j2 = EtatStyleJoueur()
+    resultat = ResultatMatch(vainqueur="", score_j1=0, score_j2=0, style_j1=0, style_j2=0)
+
+    while len(resultat.manches) < limite_manches:
+        manche = simuler_manche(
+            configuration,
+            parametres,
+            parametres_style,
+            style_j1,
+            style_j2,
+            politique_j1,
+            politique_j2,
+            generateur,
+            dt,
+            observateur,
+        )
+        resultat.manches.append(manche)
+        if manche.vainqueur == "J1":
+            resultat.score_j1 += 1
+        elif manche.vainqueur == "J2":
+            resultat.score_j2 += 1
+
+        if resultat.score_j1 >= victoires_pour_gagner:
+            resultat.vainqueur = "J1"
+            break
+        if resultat.score_j2 >= victoires_pour_gagner:
+            resultat.vainqueur = "J2"
+            break
+
+    resultat.style_j1 = style_j1.score_total
+    resultat.style_j2 = style_j2.score_total
+    return resultat
+
+
+__all__ = [
+    "CommandeJoueur",
+    "EtatDuel",
+    "EtatManche",
+    "EvenementsJoueur",
+    "ObservateurPas",
+    "Politique",
+    "ReglesSimulation",
+    "ResultatManche",
+    "ResultatMatch",
+    "politique_inactive",
+    "politique_attract",
+    "politique_agressive",
+    "avancer_pas_manche",
+    "construire_regles_simulation",
+    "creer_etat_duel",
+    "determiner_vainqueur_manche",
+    "simuler_manche",
+    "simuler_match",
+]
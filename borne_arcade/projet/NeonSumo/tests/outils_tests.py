@@ -0,0 +1,19 @@
+"""Outils partages par les tests unitaires de Neon Sumo."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+DOSSIER_JEU = Path(__file__).resolve().parents[1]
+
+
+def charger_configuration_test() -> dict:
+    """Charge la configuration livree avec le jeu.
+
+    Returns:
+        Dictionnaire de configuration.
+    """
+
+    with (DOSSIER_JEU / "config_jeu.json").open("r", encoding="utf-8") as flux:
+        return json.load(flux)
@@ -0,0 +1,101 @@
+"""Tests unitaires du balayage de parametres Neon Sumo."""
+
+from __future__ import annotations
+
+import csv
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+DOSSIER_JEU = Path(__file__).resolve().parents[1]
+if str(DOSSIER_JEU) not in sys.path:
+    sys.path.insert(0, str(DOSSIER_JEU))
+
+from balayage_parametres import (  # noqa: E402
+    FICHIER_CONFIG,
+    appliquer_valeurs_combat,
+    lire_grille,
+    main as lancer_balayage,
+)
+from logique import construire_parametres_combat  # noqa: E402
+
+
+class TestBalayageParametres(unittest.TestCase):
+    """Valide la grille, la surcharge de configuration et la sortie CSV."""
+
+    def test_lire_grille_valide_et_invalide(self) -> None:
+        """Controle l interpretation des options --grille."""
+
+        grille = lire_grille(["impulsion_bump=250,300", "cooldown_dash=1.0"])
+
+        self.assertEqual(grille, {"impulsion_bump": [250.0, 300.0], "cooldown_dash": [1.0]})
+        with self.assertRaises(ValueError):
+            lire_grille(["inconnu=1,2"])
+        with self.assertRaises(ValueError):
+            lire_grille(["vitesse_max=rapide"])
+
+    def test_surcharge_atteint_parametres_combat(self) -> None:
+        """Une valeur de grille se retrouve dans ParametresCombat."""
+
+        configuration = {
+            "physique": {
+                "acceleration": 1.0,
+                "friction_base": 1.0,
+                "friction_frein": 1.0,
+                "vitesse_max": 1.0,
+            },
+            "gameplay": {
+                "impulsion_dash": 1.0,
+                "impulsion_bump": 1.0,
+                "rayon_bump": 1.0,
+                "reduction_knockback_bouclier": 1.0,
+                "duree_bouclier": 1.0,
+                "delai_sortie_arene": 1.0,
+            },
+            "cooldowns": {"dash": 1.0, "bump": 1.0, "bouclier": 1.0, "taunt": 1.0},
+            "ultime": {"gain_par_seconde": 1.0, "gain_par_impact": 1.0, "rayon": 1.0, "impulsion": 1.0},
+        }
+
+        modifiee = appliquer_valeurs_combat(configuration, {"cooldown_dash": 0.5, "multiplicateur_bouclier": 0.2})
+        parametres = construire_parametres_combat(modifiee)
+
+        self.assertEqual(parametres.cooldown_dash, 0.5)
+        self.assertEqual(parametres.multiplicateur_bouclier, 0.2)
+        self.assertEqual(configuration["cooldowns"]["dash"], 1.0)
+
+    def test_balayage_multiprocessus_ecrit_csv(self) -> None:
+        """Un petit balayage sur deux processus produit une ligne par combinaison."""
+
+        with tempfile.TemporaryDirectory() as dossier:
+            sortie = Path(dossier) / "balayage.csv"
+            code = lancer_balayage(
+                [
+                    "--grille",
+                    "impulsion_bump=250,330",
+                    "--matchs",
+                    "2",
+                    "--processus",
+                    "2",
+                    "--config",
+                    str(FICHIER_CONFIG),
+                    "--sortie",
+                    str(sortie),
+                ]
+            )
+            with sortie.open("r", encoding="utf-8") as flux:
+                lignes = list(csv.DictReader(flux))
+
+        self.assertEqual(code, 0)
+        self.assertEqual([float(ligne["impulsion_bump"]) for ligne in lignes], [250.0, 330.0])
+        self.assertTrue(all(ligne["matchs"] == "2" for ligne in lignes))
+
+
+def main() -> None:
+    """Point d entree de la suite de tests unitaire."""
+
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""Tests unitaires de la banque audio (cache WAV et canaux reserves)."""
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import unittest
+import wave
+from pathlib import Path
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+try:
+    import pygame
+except ModuleNotFoundError:  # pragma: no cover - pygame absent
+    pygame = None
+
+DOSSIER_JEU = Path(__file__).resolve().parents[1]
+if str(DOSSIER_JEU) not in sys.path:
+    sys.path.insert(0, str(DOSSIER_JEU))
+
+import banque_audio  # noqa: E402
+
+
+def ecrire_source_wav(chemin: Path, valeur: int) -> None:
+    """Ecrit une seconde de son mono constant, decodable par le mixer.
+
+    Args:
+        chemin: Fichier a ecrire.
+        valeur: Echantillon 16 bits repete.
+
+    Returns:
+        None.
+    """
+
+    with wave.open(str(chemin), "wb") as flux:
+        flux.setnchannels(1)
+        flux.setsampwidth(2)
+        flux.setframerate(22050)
+        flux.writeframes(valeur.to_bytes(2, "little", signed=True) * 22050)
+
+
+@unittest.skipIf(pygame is None, "pygame est requis pour la banque audio")
+class TestBanqueAudio(unittest.TestCase):
+    """Valide le cache PCM, le chargement en arriere-plan et les priorites."""
+
+    def setUp(self) -> None:
+        """Initialise le mixer factice et un dossier de travail.
+
+        Returns:
+            None.
+        """
+
+        try:
+            pygame.mixer.init()
+        except pygame.error as erreur:
+            self.skipTest(f"mixer indisponible: {erreur}")
+        self.dossier = tempfile.TemporaryDirectory()
+        self.racine = Path(self.dossier.name)
+        self.configuration = {"audio": {"dossier_cache": str(self.racine / "cache")}}
+
+    def tearDown(self) -> None:
+        """Libere le mixer et le dossier de travail.
+
+        Returns:
+            None.
+        """
+
+        pygame.mixer.quit()
+        self.dossier.cleanup()
+
+    def test_cache_relu_puis_invalide(self) -> None:
+        """Le PCM en cache redonne le meme son; une source modifiee remplace l entree."""
+
+        source = self.racine / "bip.wav"
+        ecrire_source_wav(source, 100)
+        format_mixer = pygame.mixer.get_init()
+        cache = self.racine / "cache"
+
+        decode = banque_audio.charger_son_cache(source, cache, format_mixer)
+        relu = banque_audio.charger_son_cache(source, cache, format_mixer)
+        premiere_entree = list(cache.iterdir())
+        ecrire_source_wav(source, 200)
+        os.utime(source, ns=(0, source.stat().st_mtime_ns + 10**9))
+        nouveau = banque_audio.charger_son_cache(source, cache, format_mixer)
+        entrees = list(cache.iterdir())
+
+        self.assertEqual(len(premiere_entree), 1)
+        self.assertEqual(relu.get_raw(), decode.get_raw())
+        self.assertEqual(len(entrees), 1)
+        self.assertNotEqual(entrees, premiere_entree)
+        self.assertNotEqual(nouveau.get_raw(), decode.get_raw())
+
+    def test_chargement_en_arriere_plan(self) -> None:
+        """Le fil charge tous les sons; une source vide ou absente donne None."""
+
+        ecrire_source_wav(self.racine / "bip.wav", 100)
+        (self.racine / "vide.mp3").write_bytes(b"")
+        sons = (
+            ("bip", "bip.wav", banque_audio.PRIORITE_NORMALE),
+            ("vide", "vide.mp3", banque_audio.PRIORITE_NORMALE),
+            ("absent", "absent.mp3", banque_audio.PRIORITE_HAUTE),
+        )
+
+        banque = banque_audio.creer_banque_audio(self.configuration, sons, self.racine)
+
+        self.assertTrue(banque_audio.attendre_banque_audio(banque, 10.0))
+        self.assertIsNotNone(banque.sons["bip"])
+        self.assertIsNone(banque.sons["vide"])
+        self.assertIsNone(banque.sons["absent"])
+        banque_audio.jouer_son_banque(banque, "absent")
+
+    def test_sons_prioritaires_jamais_perdus(self) -> None:
+        """Un son prioritaire joue meme quand les sons normaux occupent tous les canaux libres."""
+
+        ecrire_source_wav(self.racine / "bip.wav", 100)
+        sons = (
+            ("fort", "bip.wav", banque_audio.PRIORITE_HAUTE),
+            ("faible", "bip.wav", banque_audio.PRIORITE_NORMALE),
+        )
+        self.configuration["audio"]["chargement_asynchrone"] = False
+        banque = banque_audio.creer_banque_audio(self.configuration, sons, self.racine)
+        nombre_canaux = pygame.mixer.get_num_channels()
+
+        for _ in range(nombre_canaux * 2):
+            banque_audio.jouer_son_banque(banque, "faible")
+        reserves_apres_sons_normaux = [canal.get_busy() for canal in banque.canaux_prioritaires]
+        for _ in range(3):
+            banque_audio.jouer_son_banque(banque, "fort")
+
+        self.assertIsNone(banque.fil_chargement)
+        self.assertEqual(len(banque.canaux_prioritaires), 2)
+        self.assertEqual(reserves_apres_sons_normaux, [False, False])
+        self.assertTrue(all(canal.get_busy() for canal in banque.canaux_prioritaires))
+
+    def test_canal_reserve_le_plus_ancien_interrompu(self) -> None:
+        """Sans canal reserve libre, le son prioritaire lance le plus tot est coupe."""
+
+        ecrire_source_wav(self.racine / "bip.wav", 100)
+        sons = (("fort", "bip.wav", banque_audio.PRIORITE_HAUTE),)
+        self.configuration["audio"]["chargement_asynchrone"] = False
+        banque = banque_audio.creer_banque_audio(self.configuration, sons, self.racine)
+        premier, second = banque.canaux_prioritaires
+
+        banque_audio.jouer_son_banque(banque, "fort")
+        banque_audio.jouer_son_banque(banque, "fort")
+        premier.stop()
+        banque_audio.jouer_son_banque(banque, "fort")
+        self.assertEqual(banque.canaux_prioritaires, [second, premier])
+
+        banque_audio.jouer_son_banque(banque, "fort")
+        self.assertEqual(banque.canaux_prioritaires, [premier, second])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,135 @@
+"""Tests unitaires des benchmarks de la logique Neon Sumo."""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+DOSSIER_JEU = Path(__file__).resolve().parents[1]
+if str(DOSSIER_JEU) not in sys.path:
+    sys.path.insert(0, str(DOSSIER_JEU))
+
+import benchmark_logique  # noqa: E402
+from benchmark_logique import ResultatBenchmark  # noqa: E402
+
+
+def charger_configuration() -> dict:
+    """Charge la configuration du jeu.
+
+    Returns:
+        Contenu de config_jeu.json.
+    """
+
+    with benchmark_logique.FICHIER_CONFIG.open("r", encoding="utf-8") as flux:
+        return json.load(flux)
+
+
+class TestBenchmarkLogique(unittest.TestCase):
+    """Valide la mesure, la reference et la detection de regression."""
+
+    def setUp(self) -> None:
+        """Prepare une reference synthetique.
+
+        Returns:
+            None.
+        """
+
+        self.reference = benchmark_logique.construire_reference(
+            [
+                ResultatBenchmark("bump", 1000.0, calibration_ns=2000.0, octets_par_op=48.0),
+                ResultatBenchmark("match", 1e7, calibration_ns=2000.0, octets_par_op=0.0),
+            ]
+        )
+
+    def test_temps_compare_en_unites_de_calibration(self) -> None:
+        """Une machine deux fois plus lente n est pas une regression."""
+
+        resultats = [
+            ResultatBenchmark("bump", ns_par_op=2000.0, calibration_ns=4000.0, octets_par_op=48.0),
+            ResultatBenchmark("match", ns_par_op=1.5e7, calibration_ns=2000.0, octets_par_op=0.0),
+            ResultatBenchmark("inconnu", ns_par_op=1.0, calibration_ns=1.0, octets_par_op=0.0),
+        ]
+
+        ecarts = benchmark_logique.comparer_a_reference(resultats, self.reference, 0.30)
+
+        self.assertEqual([ecart.nom for ecart in ecarts], ["bump", "match"])
+        self.assertAlmostEqual(ecarts[0].ratio_temps, 1.0)
+        self.assertEqual(ecarts[0].regressions, [])
+        self.assertEqual(ecarts[1].regressions, ["temps x1.50"])
+
+    def test_allocations_comparees_pour_la_meme_version_python(self) -> None:
+        """Les allocations depassant seuil et marge sont signalees, sauf autre Python."""
+
+        resultats = [ResultatBenchmark("bump", 1000.0, 2000.0, octets_par_op=200.0)]
+
+        ecarts = benchmark_logique.comparer_a_reference(resultats, self.reference, 0.30)
+        self.reference["python"] = "2.7"
+        ecarts_autre_python = benchmark_logique.comparer_a_reference(
+            resultats, self.reference, 0.30
+        )
+
+        self.assertEqual(len(ecarts[0].regressions), 1)
+        self.assertTrue(ecarts[0].regressions[0].startswith("allocations 200 o/op"))
+        self.assertIsNone(ecarts_autre_python[0].octets_reference)
+        self.assertEqual(ecarts_autre_python[0].regressions, [])
+
+    def test_reference_ecrite_puis_relue(self) -> None:
+        """La reference survit a l aller-retour JSON; un format inconnu est refuse."""
+
+        with tempfile.TemporaryDirectory() as dossier:
+            chemin = Path(dossier) / "reference.json"
+            benchmark_logique.ecrire_reference(chemin, self.reference)
+            relue = benchmark_logique.lire_reference(chemin)
+            chemin.write_text(json.dumps({"version_format": 0}), encoding="utf-8")
+
+            with self.assertRaises(ValueError):
+                benchmark_logique.lire_reference(chemin)
+            absente = benchmark_logique.lire_reference(Path(dossier) / "absente.json")
+
+        self.assertEqual(relue, self.reference)
+        self.assertIsNone(absente)
+
+    def test_scenarios_executables(self) -> None:
+        """Chaque scenario s execute et produit des mesures positives."""
+
+        configuration = charger_configuration()
+        scenarios = [s for s in benchmark_logique.SCENARIOS if s.nom != "match"]
+
+        resultats = benchmark_logique.executer_benchmarks(
+            configuration, scenarios, repetitions=1, facteur_iterations=0.01
+        )
+
+        self.assertEqual([r.nom for r in resultats], [s.nom for s in scenarios])
+        for resultat in resultats:
+            self.assertGreater(resultat.ns_par_op, 0.0)
+            self.assertGreater(resultat.calibration_ns, 0.0)
+            self.assertGreaterEqual(resultat.octets_par_op, 0.0)
+
+    def test_commande_sans_reference_reussit(self) -> None:
+        """Sans reference, la commande affiche les mesures et invite a en enregistrer une."""
+
+        with tempfile.TemporaryDirectory() as dossier:
+            sortie = io.StringIO()
+            with contextlib.redirect_stdout(sortie):
+                code = benchmark_logique.main(
+                    [
+                        "--scenario",
+                        "ultime",
+                        "--repetitions",
+                        "1",
+                        "--reference",
+                        str(Path(dossier) / "reference.json"),
+                    ]
+                )
+
+        self.assertEqual(code, 0)
+        self.assertIn("--enregistrer", sortie.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+"""Tests unitaires de l IA a recherche par deroulements."""
+
+from __future__ import annotations
+
+import random
+import sys
+import unittest
+from pathlib import Path
+
+DOSSIER_JEU = Path(__file__).resolve().parents[1]
+if str(DOSSIER_JEU) not in sys.path:
+    sys.path.insert(0, str(DOSSIER_JEU))
+
+import ia_recherche  # noqa: E402
+from logique import COOLDOWN_BUMP, creer_joueurs  # noqa: E402
+from outils_tests import charger_configuration_test  # noqa: E402
+from simulation import (  # noqa: E402
+    EtatManche,
+    politique_agressive,
+    politique_attract,
+    simuler_match,
+)
+
+
+def parametres_deterministes() -> ia_recherche.ParametresIA:
+    """Reglages ou seul le plafond de deroulements borne la recherche.
+
+    Returns:
+        ParametresIA sans limite de temps effective.
+    """
+
+    return ia_recherche.ParametresIA(budget_us=10**9, deroulements_max=48)
+
+
+class TestIARecherche(unittest.TestCase):
+    """Valide le niveau de jeu, le budget et le determinisme de l IA."""
+
+    def test_bat_les_politiques_fournies(self) -> None:
+        """L IA remporte ses matchs contre les politiques attract et agressive."""
+
+        configuration = charger_configuration_test()
+        for politique_adverse in (politique_attract, politique_agressive):
+            politique_ia = ia_recherche.creer_politique_ia(
+                configuration, parametres_deterministes()
+            )
+            resultat = simuler_match(configuration, politique_ia, politique_adverse, seed=1)
+            self.assertEqual(resultat.vainqueur, "J1", politique_adverse.__name__)
+
+    def test_budget_nul_limite_a_un_deroulement(self) -> None:
+        """Sans budget, seul le meilleur candidat precedent est reevalue."""
+
+        configuration = charger_configuration_test()
+        etat = ia_recherche.creer_etat_recherche_ia(
+            configuration, ia_recherche.ParametresIA(budget_us=0)
+        )
+        joueur_1, joueur_2 = creer_joueurs(configuration, 1280, 1024)
+        etat_manche = EtatManche(640.0, 512.0, 420.0, 90.0, 60.0)
+        generateur = random.Random(0)
+
+        for _ in range(3):
+            ia_recherche.choisir_commande_ia(etat, joueur_1, joueur_2, etat_manche, generateur)
+            self.assertEqual(etat.deroulements_derniere_decision, 1)
+        self.assertEqual(etat.curseur, 0)
+
+    def test_actions_indisponibles_exclues(self) -> None:
+        """Un bump en recharge ou hors de portee et une ultime vide ne sont pas proposes."""
+
+        configuration = charger_configuration_test()
+        etat = ia_recherche.creer_etat_recherche_ia(configuration)
+        joueur_1, joueur_2 = creer_joueurs(configuration, 1280, 1024)
+        joueur_2.position_x = joueur_1.position_x + joueur_1.rayon * 2.0
+
+        candidats = ia_recherche.lister_candidats(etat, joueur_1, joueur_2)
+        actions_proches = {action for _, action in candidats}
+        joueur_1.cooldowns[COOLDOWN_BUMP] = 1.0
+        candidats = ia_recherche.lister_candidats(etat, joueur_1, joueur_2)
+        actions_recharge = {action for _, action in candidats}
+
+        self.assertIn(ia_recherche.ACTION_BUMP, actions_proches)
+        self.assertNotIn(ia_recherche.ACTION_ULTIME, actions_proches)
+        self.assertNotIn(ia_recherche.ACTION_BUMP, actions_recharge)
+
+    def test_deroulement_sans_effet_sur_les_joueurs_reels(self) -> None:
+        """Les deroulements travaillent sur les copies; deux matchs seedes sont identiques."""
+
+        configuration = charger_configuration_test()
+        joueur_1, joueur_2 = creer_joueurs(configuration, 1280, 1024)
+        avant = (joueur_1.position_x, joueur_1.vitesse_x, list(joueur_1.cooldowns.valeurs))
+        etat = ia_recherche.creer_etat_recherche_ia(configuration, parametres_deterministes())
+        ia_recherche.choisir_commande_ia(
+            etat, joueur_1, joueur_2, EtatManche(640.0, 512.0, 420.0, 90.0, 60.0), random.Random(0)
+        )
+
+        resultats = [
+            simuler_match(
+                configuration,
+                ia_recherche.creer_politique_ia(configuration, parametres_deterministes()),
+                politique_attract,
+                seed=3,
+            )
+            for _ in range(2)
+        ]
+
+        self.assertEqual(
+            (joueur_1.position_x, joueur_1.vitesse_x, list(joueur_1.cooldowns.valeurs)), avant
+        )
+        self.assertIsNot(etat.joueur_simule.cooldowns, joueur_1.cooldowns)
+        self.assertEqual(resultats[0], resultats[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
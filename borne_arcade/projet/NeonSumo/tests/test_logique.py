@@ -11,14 +11,19 @@ if str(DOSSIER_JEU) not in sys.path:
     sys.path.insert(0, str(DOSSIER_JEU))
 
 from logique import (  # noqa: E402
+    COOLDOWN_BUMP,
+    COOLDOWN_DASH,
     EtatStyleJoueur,
     Joueur,
     ParametresCombat,
     ParametresStyle,
+    TableCooldowns,
     activer_dash,
     activer_ultime,
     charger_ultime,
+    cooldown_pret,
     decrementer_cooldowns,
+    demarrer_cooldown,
     enregistrer_impact_style,
     executer_bump,
     mettre_a_jour_etat_style,
@@ -197,6 +202,58 @@ class TestLogiqueNeonSumo(unittest.TestCase):
         self.assertTrue(succes_ultime)
         self.assertEqual(joueur.jauge_ultime, 0.0)
 
+    def test_table_cooldowns_compatible_par_nom(self) -> None:
+        """Les cooldowns restent accessibles par nom comme par identifiant."""
+
+        joueur = self.creer_joueur("J1", 100.0, 100.0)
+
+        demarrer_cooldown(joueur, "bump", 0.5)
+        demarrer_cooldown(joueur, COOLDOWN_DASH, 0.2)
+        decrementer_cooldowns(joueur, 0.3)
+
+        self.assertAlmostEqual(joueur.cooldowns["bump"], 0.2)
+        self.assertAlmostEqual(joueur.cooldowns.valeurs[COOLDOWN_BUMP], 0.2)
+        self.assertEqual(joueur.cooldowns.get("dash"), 0.0)
+        self.assertEqual(joueur.cooldowns.get("inconnu", -1.0), -1.0)
+        self.assertTrue(cooldown_pret(joueur, "dash"))
+        self.assertFalse(cooldown_pret(joueur, COOLDOWN_BUMP))
+        self.assertEqual(sorted(joueur.cooldowns), ["bouclier", "bump", "dash", "taunt"])
+
+    def test_cooldown_inconnu_tolere_comme_un_dictionnaire(self) -> None:
+        """Un nom hors de NOMS_COOLDOWNS se comporte comme dans l ancien dictionnaire."""
+
+        joueur = self.creer_joueur("J1", 100.0, 100.0)
+
+        self.assertTrue(cooldown_pret(joueur, "inconnu"))
+        demarrer_cooldown(joueur, "inconnu", 0.5)
+        self.assertFalse(cooldown_pret(joueur, "inconnu"))
+        decrementer_cooldowns(joueur, 0.3)
+        self.assertAlmostEqual(joueur.cooldowns["inconnu"], 0.2)
+        self.assertIn("inconnu", list(joueur.cooldowns))
+        decrementer_cooldowns(joueur, 0.3)
+        self.assertTrue(cooldown_pret(joueur, "inconnu"))
+        self.assertEqual(joueur.cooldowns.valeurs, [0.0, 0.0, 0.0, 0.0])
+        with self.assertRaises(KeyError):
+            _ = joueur.cooldowns["jamais_renseigne"]
+
+    def test_egalite_tables_cooldowns_avec_noms_inconnus(self) -> None:
+        """Deux tables ne sont egales que si leurs cooldowns aux noms inconnus le sont aussi."""
+
+        table = TableCooldowns({"dash": 0.5, "inconnu": 0.2})
+
+        self.assertEqual(table, TableCooldowns({"dash": 0.5, "inconnu": 0.2}))
+        self.assertNotEqual(table, TableCooldowns({"dash": 0.5}))
+        self.assertNotEqual(table, TableCooldowns({"dash": 0.5, "inconnu": 0.3}))
+
+    def test_etats_joueur_sans_dictionnaire_d_instance(self) -> None:
+        """Joueur et EtatStyleJoueur utilisent des slots quand Python le permet."""
+
+        if sys.version_info < (3, 10):
+            self.skipTest("dataclass(slots=True) requiert Python 3.10")
+
+        self.assertFalse(hasattr(self.creer_joueur("J1", 0.0, 0.0), "__dict__"))
+        self.assertFalse(hasattr(EtatStyleJoueur(), "__dict__"))
+
     def test_style_combo_sur_impacts(self) -> None:
         """Verifie la progression du combo style sur impacts successifs."""
 
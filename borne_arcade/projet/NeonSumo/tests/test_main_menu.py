@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import contextlib
 import importlib.util
+import io
+import random
 import sys
 import types
 import unittest
 from pathlib import Path
+from unittest import mock
 
 MODULE_NEON_SUMO = Path(__file__).resolve().parents[1]
 if str(MODULE_NEON_SUMO) not in sys.path:
@@ -28,6 +32,17 @@ SPEC_MAIN_NEON_SUMO.loader.exec_module(MODULE_MAIN_NEON_SUMO)
 construire_parametres_menu_titre = MODULE_MAIN_NEON_SUMO.construire_parametres_menu_titre
 mode_competitif_actif = MODULE_MAIN_NEON_SUMO.mode_competitif_actif
 doit_reinitialiser_attract = MODULE_MAIN_NEON_SUMO.doit_reinitialiser_attract
+AccumulateurSimulation = MODULE_MAIN_NEON_SUMO.AccumulateurSimulation
+EtatInterpolation = MODULE_MAIN_NEON_SUMO.EtatInterpolation
+consommer_pas_simulation = MODULE_MAIN_NEON_SUMO.consommer_pas_simulation
+facteur_interpolation = MODULE_MAIN_NEON_SUMO.facteur_interpolation
+rendre_pas_simulation = MODULE_MAIN_NEON_SUMO.rendre_pas_simulation
+reinitialiser_accumulateur_simulation = MODULE_MAIN_NEON_SUMO.reinitialiser_accumulateur_simulation
+memoriser_etat_interpolation = MODULE_MAIN_NEON_SUMO.memoriser_etat_interpolation
+interpoler_etat_rendu = MODULE_MAIN_NEON_SUMO.interpoler_etat_rendu
+TraceDemarrage = MODULE_MAIN_NEON_SUMO.TraceDemarrage
+marquer_etape_demarrage = MODULE_MAIN_NEON_SUMO.marquer_etape_demarrage
+formater_trace_demarrage = MODULE_MAIN_NEON_SUMO.formater_trace_demarrage
 
 
 class TestConfigurationMenuTitre(unittest.TestCase):
@@ -112,5 +127,161 @@ class TestConfigurationMenuTitre(unittest.TestCase):
         self.assertFalse(doit_reinitialiser_attract("attract", False, False))
 
 
+class TestPasFixeSimulation(unittest.TestCase):
+    """Valide l accumulateur de pas fixe et l interpolation du rendu."""
+
+    def test_meme_nombre_de_pas_quelle_que_soit_la_cadence(self) -> None:
+        """Une seconde a 60 ou 25 images par seconde donne 120 pas de 1/120 s.
+
+        Returns:
+            Aucun.
+        """
+
+        for images_par_seconde in (60, 25):
+            accumulateur = AccumulateurSimulation(pas_fixe=1.0 / 120.0, pas_max_par_image=8)
+            total = sum(
+                consommer_pas_simulation(accumulateur, 1.0 / images_par_seconde)
+                for _ in range(images_par_seconde)
+            )
+            self.assertEqual(total, 120, images_par_seconde)
+            self.assertLess(facteur_interpolation(accumulateur), 1e-6)
+
+    def test_retard_plafonne_apres_un_accroc(self) -> None:
+        """Une image d une seconde ne joue que le plafond de pas et oublie le reste.
+
+        Returns:
+            Aucun.
+        """
+
+        accumulateur = AccumulateurSimulation(pas_fixe=0.01, pas_max_par_image=4)
+
+        self.assertEqual(consommer_pas_simulation(accumulateur, 1.0), 4)
+        self.assertEqual(accumulateur.reste, 0.0)
+        self.assertEqual(consommer_pas_simulation(accumulateur, 0.005), 0)
+        self.assertAlmostEqual(facteur_interpolation(accumulateur), 0.5)
+
+    def test_pas_non_joues_rendus_puis_oublies_en_nouvelle_manche(self) -> None:
+        """Les pas interrompus sont rejoues ensuite; une nouvelle manche repart de zero.
+
+        Returns:
+            Aucun.
+        """
+
+        accumulateur = AccumulateurSimulation(pas_fixe=0.01, pas_max_par_image=8)
+
+        self.assertEqual(consommer_pas_simulation(accumulateur, 0.035), 3)
+        rendre_pas_simulation(accumulateur, 2)
+        self.assertAlmostEqual(accumulateur.reste, 0.025)
+        self.assertEqual(consommer_pas_simulation(accumulateur, 0.0), 2)
+
+        reinitialiser_accumulateur_simulation(accumulateur)
+        self.assertEqual(accumulateur.reste, 0.0)
+        self.assertEqual(consommer_pas_simulation(accumulateur, 0.005), 0)
+
+    def test_interpolation_entre_deux_pas(self) -> None:
+        """Le rendu est interpole, sauf pour des joueurs recrees depuis le dernier pas.
+
+        Returns:
+            Aucun.
+        """
+
+        joueur_1 = MODULE_MAIN_NEON_SUMO.Joueur("J1", 0.0, 0.0, 0.0, 0.0, 20.0, 1.0, 0.0)
+        joueur_2 = MODULE_MAIN_NEON_SUMO.Joueur("J2", 100.0, 0.0, 0.0, 0.0, 20.0, -1.0, 0.0)
+        interpolation = EtatInterpolation()
+        memoriser_etat_interpolation(interpolation, joueur_1, joueur_2, 400.0)
+        joueur_1.position_x = 10.0
+        joueur_2.position_y = -4.0
+
+        position_j1, position_j2, rayon = interpoler_etat_rendu(
+            interpolation, joueur_1, joueur_2, 398.0, 0.25
+        )
+        nouveau_j1 = MODULE_MAIN_NEON_SUMO.Joueur("J1", 50.0, 50.0, 0.0, 0.0, 20.0, 1.0, 0.0)
+        position_reinitialisee, _, rayon_reinitialise = interpoler_etat_rendu(
+            interpolation, nouveau_j1, joueur_2, 450.0, 0.25
+        )
+
+        self.assertEqual(position_j1, (2.5, 0.0))
+        self.assertEqual(position_j2, (100.0, -1.0))
+        self.assertEqual(rayon, 399.5)
+        self.assertEqual(position_reinitialisee, (50.0, 50.0))
+        self.assertEqual(rayon_reinitialise, 450.0)
+
+
+class TestTraceDemarrage(unittest.TestCase):
+    """Valide l horodatage des etapes du demarrage."""
+
+    def test_etapes_horodatees_depuis_l_origine(self) -> None:
+        """Chaque etape est datee en ms depuis l origine, dans l ordre des marques.
+
+        Returns:
+            Aucun.
+        """
+
+        trace = TraceDemarrage(origine=0.0)
+        marquer_etape_demarrage(trace, "fenetre")
+        marquer_etape_demarrage(trace, "pret")
+        instants = [instant for _, instant in trace.etapes]
+        trace.etapes[:] = [("fenetre", 120.4), ("pret", 310.6)]
+
+        self.assertLessEqual(instants[0], instants[1])
+        self.assertEqual(
+            formater_trace_demarrage(trace),
+            "Demarrage Neon Sumo (ms depuis le lancement): fenetre=120 | pret=311",
+        )
+        self.assertGreaterEqual(MODULE_MAIN_NEON_SUMO.mesurer_age_processus(), 0.0)
+
+
+class TestSauvegardeReplayMatch(unittest.TestCase):
+    """Valide l ecriture des replays de match hors de la boucle de jeu."""
+
+    def test_sans_enregistrement_aucun_fil(self) -> None:
+        """Sans enregistrement, aucun fil d ecriture n est lance."""
+
+        self.assertIsNone(MODULE_MAIN_NEON_SUMO.sauvegarder_replay_match({}, None))
+
+    def test_echec_d_ecriture_signale(self) -> None:
+        """Une erreur disque est ecrite sur stderr au lieu d etre ignoree."""
+
+        enregistreur = MODULE_MAIN_NEON_SUMO.creer_enregistreur_replay({}, 7)
+        MODULE_MAIN_NEON_SUMO.enregistrer_image_replay(
+            enregistreur,
+            MODULE_MAIN_NEON_SUMO.CommandeJoueur(),
+            MODULE_MAIN_NEON_SUMO.CommandeJoueur(),
+            1.0 / 60.0,
+        )
+        sortie_erreur = io.StringIO()
+        with mock.patch.object(
+            MODULE_MAIN_NEON_SUMO, "sauvegarder_replay", side_effect=OSError("disque plein")
+        ), contextlib.redirect_stderr(sortie_erreur):
+            fil = MODULE_MAIN_NEON_SUMO.sauvegarder_replay_match({}, enregistreur)
+            fil.join(timeout=5.0)
+
+        self.assertFalse(fil.is_alive())
+        self.assertIn("disque plein", sortie_erreur.getvalue())
+
+    def test_generateur_du_match_seede_par_la_graine_enregistree(self) -> None:
+        """Le generateur du match suit la graine du replay sans reseeder ``random``."""
+
+        with mock.patch.object(MODULE_MAIN_NEON_SUMO.random, "seed") as reseed:
+            generateur, enregistreur = MODULE_MAIN_NEON_SUMO.demarrer_replay_match({})
+
+        reseed.assert_not_called()
+        reference = random.Random(enregistreur.graine)
+        self.assertEqual(
+            [generateur.random() for _ in range(3)],
+            [reference.random() for _ in range(3)],
+        )
+
+    def test_generateur_du_match_sans_replay(self) -> None:
+        """Replays desactives: le match a tout de meme son propre generateur."""
+
+        generateur, enregistreur = MODULE_MAIN_NEON_SUMO.demarrer_replay_match(
+            {"replay": {"actif": False}}
+        )
+
+        self.assertIsNone(enregistreur)
+        self.assertIsInstance(generateur, random.Random)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,197 @@
+"""Tests unitaires du mode melee et de sa grille spatiale."""
+
+from __future__ import annotations
+
+import random
+import sys
+import unittest
+from pathlib import Path
+
+DOSSIER_JEU = Path(__file__).resolve().parents[1]
+if str(DOSSIER_JEU) not in sys.path:
+    sys.path.insert(0, str(DOSSIER_JEU))
+
+import ia_recherche  # noqa: E402
+import melee  # noqa: E402
+from logique import (  # noqa: E402
+    activer_ultime,
+    construire_parametres_combat,
+    creer_joueurs,
+)
+from outils_tests import charger_configuration_test  # noqa: E402
+from simulation import (  # noqa: E402
+    construire_regles_simulation,
+    politique_agressive,
+    politique_attract,
+)
+
+
+def placer(etat: melee.EtatMelee, positions: list) -> None:
+    """Deplace les combattants et reconstruit la grille.
+
+    Args:
+        etat: Etat de la melee modifie sur place.
+        positions: Positions (x, y) dans l ordre des combattants.
+
+    Returns:
+        None.
+    """
+
+    for joueur, (position_x, position_y) in zip(etat.joueurs, positions):
+        joueur.position_x = position_x
+        joueur.position_y = position_y
+    melee.remplir_grille(etat.grille, etat.joueurs, etat.actifs)
+
+
+class TestGrilleSpatiale(unittest.TestCase):
+    """Valide que la grille ne perd aucune paire en contact ou a portee."""
+
+    def test_paires_identiques_a_la_recherche_exhaustive(self) -> None:
+        """Toutes les paires a portee de bump sont listees, dans l ordre des indices."""
+
+        configuration = charger_configuration_test()
+        etat = melee.creer_etat_melee(configuration, melee.NOMBRE_MAX_COMBATTANTS)
+        taille = etat.grille.taille_cellule
+        generateur = random.Random(5)
+        for _ in range(200):
+            placer(
+                etat,
+                [
+                    (generateur.uniform(300.0, 700.0), generateur.uniform(300.0, 700.0))
+                    for _ in etat.joueurs
+                ],
+            )
+            paires = melee.lister_paires_voisines(etat.grille)
+            exhaustives = [
+                (premier, second)
+                for premier in range(len(etat.joueurs))
+                for second in range(premier + 1, len(etat.joueurs))
+                if (etat.joueurs[premier].position_x - etat.joueurs[second].position_x) ** 2
+                + (etat.joueurs[premier].position_y - etat.joueurs[second].position_y) ** 2
+                <= taille * taille
+            ]
+            self.assertEqual(paires, sorted(paires))
+            self.assertTrue(set(exhaustives) <= set(paires))
+
+    def test_voisins_dans_rayon_couvrent_le_disque(self) -> None:
+        """Un disque plus grand qu une cellule retrouve tous les combattants qu il touche."""
+
+        configuration = charger_configuration_test()
+        etat = melee.creer_etat_melee(configuration, melee.NOMBRE_MAX_COMBATTANTS)
+        generateur = random.Random(9)
+        rayon = construire_parametres_combat(configuration).rayon_ultime
+        for _ in range(200):
+            placer(
+                etat,
+                [
+                    (generateur.uniform(100.0, 900.0), generateur.uniform(100.0, 900.0))
+                    for _ in etat.joueurs
+                ],
+            )
+            centre = etat.joueurs[0]
+            voisins = melee.lister_voisins_dans_rayon(
+                etat.grille, centre.position_x, centre.position_y, rayon
+            )
+            for indice, joueur in enumerate(etat.joueurs):
+                ecart_x = joueur.position_x - centre.position_x
+                ecart_y = joueur.position_y - centre.position_y
+                if ecart_x * ecart_x + ecart_y * ecart_y <= rayon * rayon:
+                    self.assertIn(indice, voisins)
+
+    def test_elimines_absents_de_la_grille(self) -> None:
+        """Un combattant elimine n entre plus dans aucune paire."""
+
+        configuration = charger_configuration_test()
+        etat = melee.creer_etat_melee(configuration, 3)
+        etat.actifs[1] = False
+        placer(etat, [(500.0, 500.0), (510.0, 500.0), (520.0, 500.0)])
+
+        self.assertEqual(melee.lister_paires_voisines(etat.grille), [(0, 2)])
+
+
+class TestCombatMelee(unittest.TestCase):
+    """Valide le ciblage des actions et le deroulement d une melee."""
+
+    def test_nombre_de_combattants_borne(self) -> None:
+        """Une melee se joue de trois a huit combattants."""
+
+        configuration = charger_configuration_test()
+        for nombre in (2, 9):
+            with self.assertRaises(ValueError):
+                melee.creer_etat_melee(configuration, nombre)
+        etat = melee.creer_etat_melee(configuration, 5)
+        self.assertEqual([joueur.identifiant for joueur in etat.joueurs][-1], "J5")
+        self.assertLess(etat.joueurs[0].position_x, etat.etat_manche.centre_x)
+
+    def test_bump_vise_la_cible_la_plus_proche(self) -> None:
+        """Le bump touche le plus proche des combattants places devant l attaquant."""
+
+        configuration = charger_configuration_test()
+        regles = construire_regles_simulation(configuration)
+        etat = melee.creer_etat_melee(configuration, 3)
+        rayon = etat.joueurs[0].rayon
+        placer(etat, [(500.0, 500.0), (500.0 + 2.6 * rayon, 500.0), (500.0 + 2.2 * rayon, 500.0)])
+        etat.joueurs[0].direction_x, etat.joueurs[0].direction_y = 1.0, 0.0
+
+        cible = melee.executer_bump_melee(etat, 0, regles)
+
+        self.assertEqual(cible, 2)
+        self.assertEqual(etat.joueurs[1].vitesse_x, 0.0)
+        self.assertIsNone(melee.executer_bump_melee(etat, 0, regles))
+
+    def test_ultime_touche_toutes_les_cibles_a_portee(self) -> None:
+        """L onde repousse chaque combattant a portee puis vide la jauge."""
+
+        configuration = charger_configuration_test()
+        regles = construire_regles_simulation(configuration)
+        etat = melee.creer_etat_melee(configuration, 4)
+        placer(etat, [(500.0, 500.0), (600.0, 500.0), (500.0, 400.0), (900.0, 900.0)])
+        etat.joueurs[0].jauge_ultime = 1.0
+
+        touches = melee.activer_ultime_melee(etat, 0, regles)
+
+        self.assertEqual(sorted(touches), [1, 2])
+        self.assertEqual(etat.joueurs[3].vitesse_x, 0.0)
+        self.assertEqual(etat.joueurs[0].jauge_ultime, 0.0)
+        self.assertIsNone(melee.activer_ultime_melee(etat, 0, regles))
+
+    def test_onde_ultime_conserve_le_duel(self) -> None:
+        """L extraction de l onde ne change pas l ultime du duel."""
+
+        configuration = charger_configuration_test()
+        parametres = construire_parametres_combat(configuration)
+        joueur_1, joueur_2 = creer_joueurs(configuration, 1280, 1024)
+        joueur_2.position_x = joueur_1.position_x + 100.0
+        joueur_1.jauge_ultime = 1.0
+
+        self.assertTrue(activer_ultime(joueur_1, joueur_2, parametres))
+        self.assertGreater(joueur_2.vitesse_x, 0.0)
+        self.assertEqual(joueur_1.jauge_ultime, 0.0)
+
+    def test_melee_deterministe_et_gagnee_par_l_ia(self) -> None:
+        """Deux melees seedees sont identiques et l IA bat des bots scriptes."""
+
+        configuration = charger_configuration_test()
+        parametres_ia = ia_recherche.ParametresIA(budget_us=10**9, deroulements_max=24)
+        resultats = [
+            melee.simuler_melee(
+                configuration,
+                [
+                    ia_recherche.creer_politique_ia(configuration, parametres_ia),
+                    politique_agressive,
+                    politique_attract,
+                    politique_agressive,
+                ],
+                seed=2,
+            )
+            for _ in range(2)
+        ]
+
+        self.assertEqual(resultats[0], resultats[1])
+        self.assertEqual(resultats[0].vainqueur, 0)
+        for manche in resultats[0].manches:
+            self.assertEqual(len(set(manche.ordre_elimination)), len(manche.ordre_elimination))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,270 @@
+"""Tests d equivalence entre le moteur vectorise et la logique scalaire."""
+
+from __future__ import annotations
+
+import copy
+import json
+import random
+import sys
+import unittest
+from pathlib import Path
+
+DOSSIER_JEU = Path(__file__).resolve().parents[1]
+if str(DOSSIER_JEU) not in sys.path:
+    sys.path.insert(0, str(DOSSIER_JEU))
+
+from logique import (  # noqa: E402
+    Joueur,
+    ParametresCombat,
+    appliquer_deplacement_inertiel,
+    charger_ultime,
+    decrementer_cooldowns,
+    mettre_a_jour_bouclier,
+    resoudre_collision_capsules,
+    verifier_sortie_arene,
+)
+
+from moteur_vectoriel import (  # noqa: E402
+    avancer_joueurs,
+    avancer_joueurs_scalaire,
+    avancer_lot,
+    construire_lot_joueurs,
+    ecrire_lot_dans_joueurs,
+    simuler_matchs_lot,
+)
+from simulation import politique_attract, politique_inactive, simuler_match  # noqa: E402
+
+try:
+    import numpy as np
+except ModuleNotFoundError:  # pragma: no cover - numpy absent
+    np = None
+
+
+FICHIER_CONFIG = DOSSIER_JEU / "config_jeu.json"
+NOMBRE_DUELS = 24
+NOMBRE_PAS = 240
+DELTA_TEMPS = 1.0 / 60.0
+CENTRE = 500.0
+RAYON_ARENE = 300.0
+
+
+def creer_parametres() -> ParametresCombat:
+    """Cree une configuration de test stable.
+
+    Returns:
+        ParametresCombat utilisables dans les tests.
+    """
+
+    return ParametresCombat(
+        acceleration=900.0,
+        friction_base=1.6,
+        friction_frein=5.5,
+        vitesse_max=500.0,
+        coefficient_rebond_collision=0.65,
+        impulsion_dash=350.0,
+        impulsion_bump=280.0,
+        rayon_bump=60.0,
+        multiplicateur_bouclier=0.3,
+        duree_bouclier=0.5,
+        cooldown_dash=1.2,
+        cooldown_bump=0.8,
+        cooldown_bouclier=2.2,
+        cooldown_taunt=1.0,
+        gain_ultime_par_seconde=0.1,
+        gain_ultime_par_impact=0.2,
+        rayon_ultime=160.0,
+        impulsion_ultime=500.0,
+        delai_sortie_arene=0.2,
+    )
+
+
+def creer_joueur_aleatoire(generateur: random.Random, identifiant: str) -> Joueur:
+    """Cree un joueur avec un etat initial aleatoire.
+
+    Args:
+        generateur: Generateur pseudo-aleatoire seed.
+        identifiant: Nom du joueur.
+
+    Returns:
+        Joueur initialise.
+    """
+
+    return Joueur(
+        identifiant=identifiant,
+        position_x=CENTRE + generateur.uniform(-60.0, 60.0),
+        position_y=CENTRE + generateur.uniform(-60.0, 60.0),
+        vitesse_x=generateur.uniform(-300.0, 300.0),
+        vitesse_y=generateur.uniform(-300.0, 300.0),
+        rayon=28.0,
+        direction_x=1.0,
+        direction_y=0.0,
+        jauge_ultime=generateur.uniform(0.0, 1.0),
+        actif_bouclier=generateur.random() < 0.5,
+        temps_restant_bouclier=generateur.uniform(0.0, 0.5),
+        cooldowns={nom: generateur.uniform(0.0, 1.0) for nom in ("dash", "bump", "bouclier", "taunt")},
+    )
+
+
+@unittest.skipIf(np is None, "numpy est requis pour le moteur vectorise")
+class TestMoteurVectoriel(unittest.TestCase):
+    """Compare pas a pas le lot vectorise aux appels scalaires."""
+
+    def test_avancer_lot_identique_au_scalaire(self) -> None:
+        """Verifie l egalite exacte des etats apres plusieurs centaines de pas."""
+
+        parametres = creer_parametres()
+        generateur = random.Random(1234)
+        joueurs_scalaires = [
+            creer_joueur_aleatoire(generateur, f"J{index}") for index in range(2 * NOMBRE_DUELS)
+        ]
+        lot = construire_lot_joueurs(joueurs_scalaires)
+        indices_1 = np.arange(0, 2 * NOMBRE_DUELS, 2)
+        indices_2 = indices_1 + 1
+
+        for _ in range(NOMBRE_PAS):
+            entrees = [
+                (generateur.choice((-1.0, 0.0, 1.0)), generateur.choice((-1.0, 0.0, 1.0)), generateur.random() < 0.2)
+                for _ in joueurs_scalaires
+            ]
+            for joueur, (entree_x, entree_y, frein) in zip(joueurs_scalaires, entrees):
+                appliquer_deplacement_inertiel(joueur, entree_x, entree_y, frein, DELTA_TEMPS, parametres)
+            for index_1, index_2 in zip(indices_1, indices_2):
+                resoudre_collision_capsules(joueurs_scalaires[index_1], joueurs_scalaires[index_2], parametres)
+            eliminations_scalaires = []
+            for joueur in joueurs_scalaires:
+                decrementer_cooldowns(joueur, DELTA_TEMPS)
+                mettre_a_jour_bouclier(joueur, DELTA_TEMPS)
+                charger_ultime(joueur, DELTA_TEMPS, parametres)
+                eliminations_scalaires.append(
+                    verifier_sortie_arene(joueur, CENTRE, CENTRE, RAYON_ARENE, DELTA_TEMPS, parametres)
+                )
+
+            eliminations_lot = avancer_lot(
+                lot,
+                np.array([entree[0] for entree in entrees]),
+                np.array([entree[1] for entree in entrees]),
+                np.array([entree[2] for entree in entrees]),
+                indices_1,
+                indices_2,
+                CENTRE,
+                CENTRE,
+                RAYON_ARENE,
+                DELTA_TEMPS,
+                parametres,
+            )
+            self.assertEqual(eliminations_lot.tolist(), eliminations_scalaires)
+
+        for index, joueur in enumerate(joueurs_scalaires):
+            self.assertEqual(lot.position_x[index], joueur.position_x)
+            self.assertEqual(lot.position_y[index], joueur.position_y)
+            self.assertEqual(lot.vitesse_x[index], joueur.vitesse_x)
+            self.assertEqual(lot.vitesse_y[index], joueur.vitesse_y)
+            self.assertEqual(lot.direction_x[index], joueur.direction_x)
+            self.assertEqual(lot.jauge_ultime[index], joueur.jauge_ultime)
+            self.assertEqual(bool(lot.actif_bouclier[index]), joueur.actif_bouclier)
+            self.assertEqual(lot.temps_hors_arene[index], joueur.temps_hors_arene)
+            self.assertEqual(lot.cooldowns[index, 0], joueur.cooldowns["dash"])
+
+    def test_collision_capsules_confondues(self) -> None:
+        """Controle le cas degenere de deux capsules au meme point."""
+
+        parametres = creer_parametres()
+        joueur_1 = Joueur("J1", 100.0, 100.0, 50.0, 0.0, 28.0, 1.0, 0.0)
+        joueur_2 = Joueur("J2", 100.0, 100.0, -50.0, 0.0, 28.0, -1.0, 0.0)
+        lot = construire_lot_joueurs([joueur_1, joueur_2])
+
+        resoudre_collision_capsules(joueur_1, joueur_2, parametres)
+        avancer_lot(lot, np.zeros(2), np.zeros(2), np.zeros(2, dtype=bool), [0], [1], 100.0, 100.0, 400.0, 0.0, parametres)
+        copie_1 = Joueur("A", 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+        copie_2 = Joueur("B", 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+        ecrire_lot_dans_joueurs(lot, [copie_1, copie_2])
+
+        self.assertEqual(copie_1.position_x, joueur_1.position_x)
+        self.assertEqual(copie_2.position_x, joueur_2.position_x)
+        self.assertEqual(copie_1.vitesse_x, joueur_1.vitesse_x)
+        self.assertEqual(copie_2.vitesse_x, joueur_2.vitesse_x)
+
+
+class TestAvancerJoueurs(unittest.TestCase):
+    """Verifie le point d entree commun aux chemins NumPy et scalaire."""
+
+    def test_avancer_joueurs_identique_au_scalaire(self) -> None:
+        """Le chemin choisi selon NumPy donne le meme etat que les helpers scalaires."""
+
+        parametres = creer_parametres()
+        generateur = random.Random(99)
+        joueurs = [
+            creer_joueur_aleatoire(generateur, f"J{index}")
+            for index in range(4)
+        ]
+        references = copy.deepcopy(joueurs)
+        paires = [(0, 1), (2, 3)]
+
+        for _ in range(60):
+            entrees = [
+                (generateur.choice((-1.0, 0.0, 1.0)), generateur.choice((-1.0, 0.0, 1.0)), False)
+                for _ in joueurs
+            ]
+            eliminations = avancer_joueurs(
+                joueurs, entrees, paires, CENTRE, CENTRE, RAYON_ARENE, DELTA_TEMPS, parametres
+            )
+            attendues = avancer_joueurs_scalaire(
+                references, entrees, paires, CENTRE, CENTRE, RAYON_ARENE, DELTA_TEMPS, parametres
+            )
+            self.assertEqual(eliminations, attendues)
+
+        for joueur, reference in zip(joueurs, references):
+            self.assertEqual(joueur.position_x, reference.position_x)
+            self.assertEqual(joueur.vitesse_y, reference.vitesse_y)
+            self.assertEqual(joueur.cooldowns.valeurs, reference.cooldowns.valeurs)
+
+
+
+@unittest.skipIf(np is None, "numpy est requis pour le moteur vectorise")
+class TestSimulerMatchsLot(unittest.TestCase):
+    """Compare les matchs joues en lot persistant a ``simuler_match``."""
+
+    def setUp(self) -> None:
+        """Charge une configuration aux manches courtes pour garder le test rapide."""
+
+        with FICHIER_CONFIG.open("r", encoding="utf-8") as flux:
+            self.configuration = json.load(flux)
+        self.configuration["match"]["duree_max_manche"] = 4.0
+
+    def test_resultats_identiques_a_simuler_match(self) -> None:
+        """Chaque seed du lot donne le meme resultat que le match scalaire."""
+
+        politiques = {"attract": politique_attract, "inactive": politique_inactive}
+        seeds = list(range(6))
+        for nom_j1, nom_j2 in (("attract", "attract"), ("inactive", "attract")):
+            with self.subTest(politique_j1=nom_j1, politique_j2=nom_j2):
+                resultats = simuler_matchs_lot(
+                    self.configuration, nom_j1, nom_j2, seeds, limite_manches=3
+                )
+                attendus = [
+                    simuler_match(
+                        self.configuration,
+                        politiques[nom_j1],
+                        politiques[nom_j2],
+                        seed,
+                        limite_manches=3,
+                    )
+                    for seed in seeds
+                ]
+                self.assertEqual(resultats, attendus)
+
+    def test_politique_avec_actions_refusee(self) -> None:
+        """Les politiques qui declenchent des actions restent sur le chemin scalaire."""
+
+        with self.assertRaises(ValueError):
+            simuler_matchs_lot(self.configuration, "agressive", "attract", [0])
+
+
+def main() -> None:
+    """Point d entree de la suite de tests unitaire."""
+
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""Tests unitaires du pool de particules d impact."""
+
+from __future__ import annotations
+
+import random
+import sys
+import unittest
+from pathlib import Path
+
+DOSSIER_JEU = Path(__file__).resolve().parents[1]
+if str(DOSSIER_JEU) not in sys.path:
+    sys.path.insert(0, str(DOSSIER_JEU))
+
+import particules  # noqa: E402
+from particules import (  # noqa: E402
+    FREINAGE_PARTICULES,
+    calculer_rendu_particules,
+    creer_pool_particules,
+    emettre_particules_directionnelles,
+    mettre_a_jour_pool_particules,
+    vider_pool_particules,
+)
+
+
+DELTA_TEMPS = 1.0 / 60.0
+
+
+def lister(valeurs) -> list:
+    """Convertit un champ du pool (tableau NumPy ou liste) en liste Python.
+
+    Args:
+        valeurs: Champ du pool.
+
+    Returns:
+        Liste Python equivalente.
+    """
+
+    return valeurs.tolist() if hasattr(valeurs, "tolist") else list(valeurs)
+
+
+class TestPoolParticules(unittest.TestCase):
+    """Valide l emission, la mise a jour et la capacite du pool."""
+
+    def test_emission_limitee_par_la_capacite(self) -> None:
+        """Les particules au-dela de la capacite sont ignorees et comptees."""
+
+        pool = creer_pool_particules(capacite=8)
+
+        emises_1 = emettre_particules_directionnelles(
+            pool, 0.0, 0.0, 1.0, 0.0, (255, 0, 0), 5, generateur=random.Random(1)
+        )
+        emises_2 = emettre_particules_directionnelles(
+            pool, 0.0, 0.0, 1.0, 0.0, (0, 255, 0), 5, generateur=random.Random(2)
+        )
+
+        self.assertEqual((emises_1, emises_2), (5, 3))
+        self.assertEqual(pool.nombre_actives, 8)
+        self.assertEqual(pool.particules_ignorees, 2)
+        self.assertEqual(lister(pool.couleur[7]), [0, 255, 0])
+
+    def test_mise_a_jour_identique_a_la_boucle_scalaire(self) -> None:
+        """Le pool reproduit exactement la simulation particule par particule."""
+
+        pool = creer_pool_particules(capacite=64)
+        generateur = random.Random(42)
+        for index in range(6):
+            emettre_particules_directionnelles(
+                pool, 100.0 * index, 50.0, 1.0, -0.5, (255, 255, 255), 10, generateur=generateur
+            )
+        reference = [
+            [
+                float(pool.position_x[index]),
+                float(pool.position_y[index]),
+                float(pool.vitesse_x[index]),
+                float(pool.vitesse_y[index]),
+                float(pool.temps_restant[index]),
+            ]
+            for index in range(pool.nombre_actives)
+        ]
+
+        for _ in range(12):
+            mettre_a_jour_pool_particules(pool, DELTA_TEMPS)
+            freinage = max(0.0, 1.0 - FREINAGE_PARTICULES * DELTA_TEMPS)
+            survivantes = []
+            for particule in reference:
+                particule[4] -= DELTA_TEMPS
+                if particule[4] <= 0.0:
+                    continue
+                particule[2] *= freinage
+                particule[3] *= freinage
+                particule[0] += particule[2] * DELTA_TEMPS
+                particule[1] += particule[3] * DELTA_TEMPS
+                survivantes.append(particule)
+            reference = survivantes
+
+            self.assertEqual(pool.nombre_actives, len(reference))
+            nombre = pool.nombre_actives
+            self.assertEqual(lister(pool.position_x[:nombre]), [particule[0] for particule in reference])
+            self.assertEqual(lister(pool.vitesse_y[:nombre]), [particule[3] for particule in reference])
+
+        self.assertLess(pool.nombre_actives, 60)
+
+    def test_rendu_et_vidage(self) -> None:
+        """Les attributs de rendu couvrent les particules vivantes puis le pool se vide."""
+
+        pool = creer_pool_particules(capacite=16)
+        emettre_particules_directionnelles(
+            pool, 10.5, 20.5, 0.0, 0.0, (1, 2, 3), 4, generateur=random.Random(3)
+        )
+
+        abscisses, ordonnees, rayons, opacites, couleurs = calculer_rendu_particules(pool)
+        vider_pool_particules(pool)
+
+        self.assertEqual(abscisses, [10, 10, 10, 10])
+        self.assertEqual(ordonnees, [20, 20, 20, 20])
+        self.assertTrue(all(rayon >= 1 for rayon in rayons))
+        self.assertEqual(opacites, [255, 255, 255, 255])
+        self.assertEqual(couleurs, [(1, 2, 3)] * 4)
+        self.assertEqual(pool.nombre_actives, 0)
+
+    def test_capacite_invalide_refusee(self) -> None:
+        """Un pool sans capacite est refuse."""
+
+        with self.assertRaises(ValueError):
+            creer_pool_particules(capacite=0)
+
+
+class TestPoolParticulesSansNumpy(TestPoolParticules):
+    """Rejoue les memes scenarios avec le pool a listes Python."""
+
+    def setUp(self) -> None:
+        """Force le chemin sans NumPy le temps d un test.
+
+        Returns:
+            None.
+        """
+
+        module_numpy = particules.np
+        particules.np = None
+        self.addCleanup(setattr, particules, "np", module_numpy)
+
+
+def main() -> None:
+    """Point d entree de la suite de tests unitaire."""
+
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,402 @@
+"""Tests unitaires des caches de rendu neon de NeonSumo."""
+
+from __future__ import annotations
+
+import importlib.util
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+MODULE_NEON_SUMO = Path(__file__).resolve().parents[1]
+if str(MODULE_NEON_SUMO) not in sys.path:
+    sys.path.insert(0, str(MODULE_NEON_SUMO))
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+try:
+    import pygame as module_pygame
+except ModuleNotFoundError:  # pragma: no cover - pygame absent
+    module_pygame = None
+
+NOM_MODULE_MAIN = "main_neon_sumo"
+if NOM_MODULE_MAIN in sys.modules:
+    MODULE_MAIN_NEON_SUMO = sys.modules[NOM_MODULE_MAIN]
+elif module_pygame is not None:
+    SPEC_MAIN_NEON_SUMO = importlib.util.spec_from_file_location(NOM_MODULE_MAIN, MODULE_NEON_SUMO / "main.py")
+    if SPEC_MAIN_NEON_SUMO is None or SPEC_MAIN_NEON_SUMO.loader is None:
+        raise ImportError("Impossible de charger le module main.py de NeonSumo.")
+    MODULE_MAIN_NEON_SUMO = importlib.util.module_from_spec(SPEC_MAIN_NEON_SUMO)
+    sys.modules[NOM_MODULE_MAIN] = MODULE_MAIN_NEON_SUMO
+    SPEC_MAIN_NEON_SUMO.loader.exec_module(MODULE_MAIN_NEON_SUMO)
+else:  # pragma: no cover - pygame absent
+    MODULE_MAIN_NEON_SUMO = None
+
+import banque_audio  # noqa: E402
+
+PYGAME_DISPONIBLE = module_pygame is not None and hasattr(module_pygame, "Surface")
+
+
+@unittest.skipUnless(PYGAME_DISPONIBLE, "pygame est requis pour les tests de rendu")
+class TestCachesRenduNeon(unittest.TestCase):
+    """Valide la reutilisation des sprites et calques neon."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Initialise pygame en mode sans affichage.
+
+        Returns:
+            None.
+        """
+
+        module_pygame.display.init()
+        module_pygame.font.init()
+        cls.police = module_pygame.font.Font(None, 32)
+
+    def setUp(self) -> None:
+        """Vide les caches LRU avant chaque test.
+
+        Returns:
+            None.
+        """
+
+        MODULE_MAIN_NEON_SUMO.rendre_sprite_texte_neon.cache_clear()
+        MODULE_MAIN_NEON_SUMO.rendre_texte.cache_clear()
+
+    def test_sprite_texte_neon_reutilise_et_ajuste(self) -> None:
+        """Le sprite est rendu une fois et limite a la boite englobante du halo."""
+
+        sprite_1 = MODULE_MAIN_NEON_SUMO.rendre_sprite_texte_neon(
+            self.police, "NEON", (255, 255, 255), (0, 255, 255), 4
+        )
+        sprite_2 = MODULE_MAIN_NEON_SUMO.rendre_sprite_texte_neon(
+            self.police, "NEON", (255, 255, 255), (0, 255, 255), 4
+        )
+        largeur_texte, hauteur_texte = self.police.size("NEON")
+
+        self.assertIs(sprite_1, sprite_2)
+        self.assertEqual(sprite_1.get_size(), (largeur_texte + 8, hauteur_texte + 8))
+        self.assertEqual(MODULE_MAIN_NEON_SUMO.rendre_sprite_texte_neon.cache_info().misses, 1)
+
+    def test_dessiner_texte_neon_centre_le_sprite(self) -> None:
+        """Le halo est dessine autour de la position demandee."""
+
+        surface = module_pygame.Surface((200, 100))
+        MODULE_MAIN_NEON_SUMO.dessiner_texte_neon(
+            surface, self.police, "NEON", (255, 255, 255), (0, 255, 255), (100, 50), 3
+        )
+        MODULE_MAIN_NEON_SUMO.dessiner_texte_neon(
+            surface, self.police, "NEON", (255, 255, 255), (0, 255, 255), (100, 50), 3
+        )
+
+        self.assertNotEqual(surface.get_at((100, 50))[:3], (0, 0, 0))
+        self.assertEqual(surface.get_at((0, 0))[:3], (0, 0, 0))
+        self.assertEqual(MODULE_MAIN_NEON_SUMO.rendre_sprite_texte_neon.cache_info().hits, 1)
+
+    def dessiner_menu(self, surface, phase: float, parametres, cache) -> None:
+        """Dessine le menu titre sur toute la surface avec la police de test.
+
+        Args:
+            surface: Surface cible.
+            phase: Phase d animation.
+            parametres: ParametresMenuTitre utilises.
+            cache: CacheMenuTitre partage entre les appels.
+
+        Returns:
+            None.
+        """
+
+        largeur, hauteur = surface.get_size()
+        MODULE_MAIN_NEON_SUMO.dessiner_menu_titre_neon(
+            surface,
+            largeur,
+            hauteur,
+            phase,
+            parametres,
+            self.police,
+            self.police,
+            self.police,
+            cache,
+            (0, 0, 0),
+        )
+
+    def test_cache_menu_titre_reconstruit_sur_changement_de_cle(self) -> None:
+        """Les calques statiques ne sont refaits qu au changement de resolution ou de parametres."""
+
+        parametres = MODULE_MAIN_NEON_SUMO.construire_parametres_menu_titre({})
+        cache = MODULE_MAIN_NEON_SUMO.CacheMenuTitre()
+        surface = module_pygame.Surface((640, 480))
+
+        for phase in (0.0, 0.4, 1.3):
+            self.dessiner_menu(surface, phase, parametres, cache)
+        self.assertEqual(cache.reconstructions, 1)
+
+        parametres.opacite_voile = 40
+        self.dessiner_menu(surface, 0.0, parametres, cache)
+        grande_surface = module_pygame.Surface((800, 600))
+        self.dessiner_menu(grande_surface, 0.0, parametres, cache)
+
+        self.assertEqual(cache.reconstructions, 3)
+        self.assertEqual(cache.fond_statique.get_size(), (800, 600))
+        self.assertEqual(
+            grande_surface.get_at((400, 300))[:3],
+            MODULE_MAIN_NEON_SUMO.COULEUR_MENU_TITRE_CARTE,
+        )
+
+    def test_melanger_couleurs_bornes(self) -> None:
+        """Le melange opaque reproduit les deux extremes de l opacite."""
+
+        melanger_couleurs = MODULE_MAIN_NEON_SUMO.melanger_couleurs
+
+        self.assertEqual(melanger_couleurs((255, 0, 0), (0, 0, 255), 255), (255, 0, 0))
+        self.assertEqual(melanger_couleurs((255, 0, 0), (0, 0, 255), 0), (0, 0, 255))
+    def test_modules_disponibles_sans_boucle_jeu(self) -> None:
+        """pygame et particules sont accessibles sans que ``boucle_jeu`` ait tourne."""
+
+        self.assertIs(MODULE_MAIN_NEON_SUMO.importer_pygame(), module_pygame)
+        self.assertIs(
+            MODULE_MAIN_NEON_SUMO.importer_particules(), MODULE_MAIN_NEON_SUMO.importer_particules()
+        )
+
+    def test_particules_dessinees_dans_un_calque_borne(self) -> None:
+        """Le rectangle modifie se limite a la gerbe de particules."""
+
+        particules = MODULE_MAIN_NEON_SUMO.importer_particules()
+        pool = particules.creer_pool_particules(capacite=32)
+        particules.emettre_particules_directionnelles(
+            pool, 100.0, 80.0, 1.0, 0.0, (255, 0, 0), 12
+        )
+        surface = module_pygame.Surface((640, 480))
+
+        rectangle = MODULE_MAIN_NEON_SUMO.dessiner_particules(surface, pool)
+        particules.vider_pool_particules(pool)
+
+        self.assertTrue(rectangle.collidepoint(100, 80))
+        self.assertLessEqual(rectangle.width * rectangle.height, 16 * 16)
+        self.assertNotEqual(surface.get_at((100, 80))[:3], (0, 0, 0))
+        self.assertIsNone(MODULE_MAIN_NEON_SUMO.dessiner_particules(surface, pool))
+
+    def test_presentation_partielle_apres_une_image_complete(self) -> None:
+        """Apres une image plein ecran, seules les zones des deux dernieres images sont poussees."""
+
+        suivi = MODULE_MAIN_NEON_SUMO.SuiviRectanglesSales(actif=True)
+        ecran = module_pygame.Rect(0, 0, 640, 480)
+        zone_1 = module_pygame.Rect(10, 10, 20, 20)
+        zone_2 = module_pygame.Rect(630, 470, 40, 40)
+
+        initiale = MODULE_MAIN_NEON_SUMO.preparer_presentation(suivi, ecran)
+        MODULE_MAIN_NEON_SUMO.marquer_zones_sales(suivi, zone_1, None)
+        suivante = MODULE_MAIN_NEON_SUMO.preparer_presentation(suivi, ecran)
+        MODULE_MAIN_NEON_SUMO.marquer_zones_sales(suivi, zone_2)
+        partielle = MODULE_MAIN_NEON_SUMO.preparer_presentation(suivi, ecran)
+        MODULE_MAIN_NEON_SUMO.marquer_plein_ecran(suivi)
+        flash = MODULE_MAIN_NEON_SUMO.preparer_presentation(suivi, ecran)
+        apres_flash = MODULE_MAIN_NEON_SUMO.preparer_presentation(suivi, ecran)
+        stable = MODULE_MAIN_NEON_SUMO.preparer_presentation(suivi, ecran)
+
+        self.assertIsNone(initiale)
+        self.assertIsNone(suivante)
+        self.assertEqual(partielle, [zone_1, module_pygame.Rect(630, 470, 10, 10)])
+        self.assertIsNone(flash)
+        self.assertIsNone(apres_flash)
+        self.assertEqual(stable, [])
+
+    def test_presentation_inactive_toujours_complete(self) -> None:
+        """Sans option, chaque image est presentee par un flip complet."""
+
+        suivi = MODULE_MAIN_NEON_SUMO.SuiviRectanglesSales()
+        ecran = module_pygame.Rect(0, 0, 640, 480)
+
+        MODULE_MAIN_NEON_SUMO.preparer_presentation(suivi, ecran)
+        MODULE_MAIN_NEON_SUMO.marquer_zones_sales(suivi, module_pygame.Rect(0, 0, 4, 4))
+
+        self.assertIsNone(MODULE_MAIN_NEON_SUMO.preparer_presentation(suivi, ecran))
+
+    def test_couronne_arene_couvre_les_effets(self) -> None:
+        """Hors des bandes de la couronne, l arene ne montre que son fond uni."""
+
+        parametres_arene = MODULE_MAIN_NEON_SUMO.construire_parametres_arene_neon({})
+        etat_arene = MODULE_MAIN_NEON_SUMO.EtatAreneNeon(phase_animation=1.3, energie_impact=1.0)
+        surface = module_pygame.Surface((640, 640))
+        couleur_interieur = (20, 20, 35)
+
+        MODULE_MAIN_NEON_SUMO.dessiner_arene(
+            surface, 320.0, 320.0, 200.0, 30.0, couleur_interieur, (0, 255, 255), (255, 80, 80)
+        )
+        MODULE_MAIN_NEON_SUMO.dessiner_effets_arene_neon(
+            surface,
+            320.0,
+            320.0,
+            200.0,
+            (0, 255, 255),
+            etat_arene,
+            parametres_arene,
+            MODULE_MAIN_NEON_SUMO.CacheAreneNeon(),
+        )
+        bandes = MODULE_MAIN_NEON_SUMO.calculer_rectangles_couronne_arene(
+            320.0, 320.0, 200.0, 30.0, parametres_arene
+        )
+
+        exterieur = bandes[0].unionall(bandes[1:])
+
+        self.assertEqual(len(bandes), 4)
+        for x in range(0, 640, 3):
+            for y in range(0, 640, 3):
+                if any(bande.collidepoint(x, y) for bande in bandes):
+                    continue
+                attendu = couleur_interieur if exterieur.collidepoint(x, y) else (0, 0, 0)
+                self.assertEqual(surface.get_at((x, y))[:3], attendu, (x, y))
+
+    def test_anneau_glow_zones_completes(self) -> None:
+        """Les zones listees couvrent tous les pixels non transparents du sprite."""
+
+        sprite, zones = MODULE_MAIN_NEON_SUMO.rendre_anneau_glow_arene(150, (0, 255, 255))
+        masque_zones = module_pygame.Surface(sprite.get_size())
+        for zone in zones:
+            masque_zones.fill((255, 255, 255), zone)
+
+        aire_zones = sum(zone.width * zone.height for zone in zones)
+        self.assertLess(aire_zones, sprite.get_width() ** 2 // 4)
+        for x in range(sprite.get_width()):
+            for y in range(sprite.get_height()):
+                if sprite.get_at((x, y)).a:
+                    self.assertEqual(masque_zones.get_at((x, y))[:3], (255, 255, 255), (x, y))
+
+    def test_anneaux_glow_prechauffes_par_palier(self) -> None:
+        """Apres prechauffage, tout rayon de l arene retombe sur un palier deja rendu."""
+
+        cache = MODULE_MAIN_NEON_SUMO.CacheAreneNeon()
+        pas = MODULE_MAIN_NEON_SUMO.PAS_RAYON_GLOW_ARENE
+        MODULE_MAIN_NEON_SUMO.prechauffer_anneaux_glow_arene(cache, 135.0, 360.0, (0, 255, 255))
+        nombre_paliers = len(cache.anneaux_glow)
+
+        palier, tuiles = MODULE_MAIN_NEON_SUMO.obtenir_anneau_glow_arene(
+            cache, 200.4, (0, 255, 255)
+        )
+
+        self.assertEqual(palier % pas, 0)
+        self.assertLessEqual(abs(palier - 200.4), pas / 2.0)
+        self.assertIs(
+            MODULE_MAIN_NEON_SUMO.obtenir_anneau_glow_arene(cache, 200.9, (0, 255, 255))[1],
+            tuiles,
+        )
+        for dixieme in range(1350, 3601, 7):
+            MODULE_MAIN_NEON_SUMO.obtenir_anneau_glow_arene(cache, dixieme / 10.0, (0, 255, 255))
+        self.assertEqual(len(cache.anneaux_glow), nombre_paliers)
+
+    def test_calque_lignes_transparent_entre_deux_images(self) -> None:
+        """Le calque persistant des lignes est rendu vierge apres chaque image."""
+
+        parametres_arene = MODULE_MAIN_NEON_SUMO.construire_parametres_arene_neon({})
+        cache = MODULE_MAIN_NEON_SUMO.CacheAreneNeon()
+        surface = module_pygame.Surface((640, 640))
+        for phase in (0.0, 0.7):
+            etat_arene = MODULE_MAIN_NEON_SUMO.EtatAreneNeon(phase, energie_impact=1.0)
+            MODULE_MAIN_NEON_SUMO.dessiner_effets_arene_neon(
+                surface, 320.0, 320.0, 200.5, (0, 255, 255), etat_arene, parametres_arene, cache
+            )
+            calque = cache.calque_lignes
+
+            self.assertEqual(calque.get_bounding_rect().size, (0, 0))
+        self.assertIs(cache.calque_lignes, calque)
+        self.assertNotEqual(surface.get_at((320, 320 - 200 - 6))[:3], (0, 0, 0))
+
+
+@unittest.skipUnless(PYGAME_DISPONIBLE, "pygame est requis pour les tests de demarrage")
+class TestChargementProgressif(unittest.TestCase):
+    """Valide le chargement des ressources lourdes apres la premiere image."""
+
+    def setUp(self) -> None:
+        """Prepare un chargement dont le cache audio et les highscores sont temporaires.
+
+        Returns:
+            None.
+        """
+
+        module_pygame.display.init()
+        module_pygame.font.init()
+        self.dossier = tempfile.TemporaryDirectory()
+        self.highscores = MODULE_MAIN_NEON_SUMO.highscores
+        MODULE_MAIN_NEON_SUMO.highscores = None
+        configuration = {
+            "audio": {"dossier_cache": self.dossier.name, "chargement_asynchrone": False},
+            "arene": {"rayon_depart": 120.0, "rayon_min": 60.0},
+            "couleurs": {"arene_bord": [0, 255, 255]},
+        }
+        self.parametres = MODULE_MAIN_NEON_SUMO.construire_parametres_menu_titre({})
+        self.ressources = MODULE_MAIN_NEON_SUMO.creer_ressources_lancement(
+            configuration, self.parametres
+        )
+        self.chargement = MODULE_MAIN_NEON_SUMO.ChargementProgressif(
+            configuration,
+            self.parametres,
+            MODULE_MAIN_NEON_SUMO.CacheMenuTitre(),
+            (320, 240),
+            (0, 0, 0),
+            MODULE_MAIN_NEON_SUMO.creer_trace_demarrage(),
+        )
+
+    def tearDown(self) -> None:
+        """Restaure le module highscores et libere le mixer.
+
+        Returns:
+            None.
+        """
+
+        MODULE_MAIN_NEON_SUMO.highscores = self.highscores
+        module_pygame.mixer.quit()
+        self.dossier.cleanup()
+
+    def test_une_etape_par_image(self) -> None:
+        """Les polices embarquees servent jusqu a l etape polices, puis une etape par appel."""
+
+        police_lancement = self.ressources.police
+        self.assertEqual(len(self.ressources.banque_audio.sons), 0)
+
+        etapes = MODULE_MAIN_NEON_SUMO.ETAPES_CHARGEMENT
+        for indice in range(len(etapes)):
+            MODULE_MAIN_NEON_SUMO.avancer_chargement(self.chargement, self.ressources)
+            self.assertEqual(self.chargement.etapes_restantes, list(etapes[indice + 1 :]))
+
+        noms = [nom for nom, _ in self.chargement.trace.etapes]
+        self.assertEqual(noms, [*etapes, "pret"])
+        self.assertIsNot(self.ressources.police, police_lancement)
+        self.assertEqual(
+            set(self.ressources.banque_audio.sons), {nom for nom, _, _ in banque_audio.SONS_JEU}
+        )
+        self.assertIsNotNone(self.chargement.cache_menu_titre.cle)
+        self.assertEqual(len(self.chargement.cache_arene_neon.anneaux_glow), 21)
+        self.assertIsNone(self.ressources.stock_highscore)
+        self.assertEqual(self.ressources.particules_impact.nombre_actives, 0)
+
+    def test_particules_absentes_avant_leur_etape(self) -> None:
+        """Avant l etape particules, effets et dessin ignorent le pool manquant."""
+
+        feedback = MODULE_MAIN_NEON_SUMO.EtatFeedbackCombat()
+        MODULE_MAIN_NEON_SUMO.declencher_feedback_impact(
+            feedback, None, 10.0, 10.0, 1.0, 0.0, (255, 0, 0), (255, 255, 255), 80.0, 6
+        )
+        MODULE_MAIN_NEON_SUMO.vider_feedback_combat(feedback, None)
+
+        self.assertIsNone(self.ressources.particules_impact)
+        self.assertIsNone(
+            MODULE_MAIN_NEON_SUMO.dessiner_particules(module_pygame.Surface((32, 32)), None)
+        )
+
+    def test_appui_termine_le_chargement(self) -> None:
+        """Un appui de touche charge d un coup toutes les etapes restantes."""
+
+        MODULE_MAIN_NEON_SUMO.avancer_chargement(self.chargement, self.ressources)
+        MODULE_MAIN_NEON_SUMO.avancer_chargement(self.chargement, self.ressources, tout=True)
+        nombre_etapes = len(self.chargement.trace.etapes)
+        MODULE_MAIN_NEON_SUMO.avancer_chargement(self.chargement, self.ressources)
+
+        self.assertEqual(self.chargement.etapes_restantes, [])
+        self.assertEqual(self.chargement.trace.etapes[-1][0], "pret")
+        self.assertEqual(len(self.chargement.trace.etapes), nombre_etapes)
+
+
+if __name__ == "__main__":
+    unittest.main()
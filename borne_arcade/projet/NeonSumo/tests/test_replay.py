@@ -0,0 +1,195 @@
+"""Tests unitaires de l enregistrement et de la relecture des replays."""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+DOSSIER_JEU = Path(__file__).resolve().parents[1]
+if str(DOSSIER_JEU) not in sys.path:
+    sys.path.insert(0, str(DOSSIER_JEU))
+
+import replay  # noqa: E402
+from outils_tests import charger_configuration_test  # noqa: E402
+from simulation import (  # noqa: E402
+    CommandeJoueur,
+    politique_agressive,
+    politique_attract,
+    politique_inactive,
+    simuler_match,
+)
+
+
+def enregistrer_match(configuration: dict, seed: int):
+    """Simule un match agressif contre attract en l enregistrant.
+
+    Args:
+        configuration: Configuration du jeu.
+        seed: Graine du match.
+
+    Returns:
+        Tuple (ResultatMatch simule, Replay enregistre).
+    """
+
+    enregistreur = replay.creer_enregistreur_replay(configuration, seed)
+    resultat = simuler_match(
+        configuration,
+        politique_agressive,
+        politique_attract,
+        seed,
+        observateur=replay.creer_observateur_replay(enregistreur),
+    )
+    return resultat, replay.finaliser_replay(enregistreur)
+
+
+def resumer_joueurs(lecteur: replay.LecteurReplay) -> tuple:
+    """Extrait l etat dynamique des joueurs du lecteur.
+
+    Args:
+        lecteur: Lecteur positionne.
+
+    Returns:
+        Tuple comparable des positions, vitesses et jauges.
+    """
+
+    duel = lecteur.etat.duel
+    return tuple(
+        (
+            joueur.position_x,
+            joueur.position_y,
+            joueur.vitesse_x,
+            joueur.vitesse_y,
+            joueur.jauge_ultime,
+        )
+        for joueur in (duel.joueur_1, duel.joueur_2)
+    )
+
+
+class TestReplay(unittest.TestCase):
+    """Valide le format binaire, la relecture et le positionnement."""
+
+    def test_relecture_reproduit_le_match_simule(self) -> None:
+        """Le replay decode redonne scores, style et decoupage des manches."""
+
+        configuration = charger_configuration_test()
+        resultat, enregistrement = enregistrer_match(configuration, seed=4)
+
+        relu = replay.decoder_replay(replay.encoder_replay(enregistrement))
+        resultat_relu = replay.rejouer_replay(relu, configuration)
+
+        self.assertEqual(relu.graine, 4)
+        self.assertEqual(resultat_relu.vainqueur, resultat.vainqueur)
+        for champ in ("score_j1", "score_j2", "style_j1", "style_j2"):
+            self.assertEqual(getattr(resultat_relu, champ), getattr(resultat, champ), champ)
+        self.assertEqual(
+            [(manche.vainqueur, manche.nombre_pas) for manche in resultat_relu.manches],
+            [(manche.vainqueur, manche.nombre_pas) for manche in resultat.manches],
+        )
+        self.assertAlmostEqual(resultat_relu.duree_totale, resultat.duree_totale, places=6)
+
+    def test_manche_interrompue_sans_elimination(self) -> None:
+        """Une manche coupee par la limite de duree est relue comme interrompue."""
+
+        configuration = charger_configuration_test()
+        configuration["arene"]["vitesse_retrecissement"] = 0.0
+        enregistreur = replay.creer_enregistreur_replay(configuration, 0)
+        resultat = simuler_match(
+            configuration,
+            politique_inactive,
+            politique_inactive,
+            seed=0,
+            dt=0.5,
+            limite_manches=2,
+            observateur=replay.creer_observateur_replay(enregistreur),
+        )
+
+        resultat_relu = replay.rejouer_replay(replay.finaliser_replay(enregistreur))
+
+        self.assertEqual(len(resultat_relu.manches), 2)
+        self.assertTrue(all(manche.interrompue for manche in resultat_relu.manches))
+        self.assertEqual(
+            [manche.nombre_pas for manche in resultat_relu.manches],
+            [manche.nombre_pas for manche in resultat.manches],
+        )
+
+    def test_positionnement_par_instantanes(self) -> None:
+        """Reculer ou sauter a une image redonne l etat d une lecture continue."""
+
+        configuration = charger_configuration_test()
+        _, enregistrement = enregistrer_match(configuration, seed=2)
+        cible = enregistrement.nombre_images // 2 + 7
+        lecture_continue = replay.creer_lecteur_replay(enregistrement, intervalle_instantanes=10**6)
+        replay.avancer_images_replay(lecture_continue, cible)
+
+        lecteur = replay.creer_lecteur_replay(enregistrement, intervalle_instantanes=50)
+        replay.aller_a_image_replay(lecteur, enregistrement.nombre_images)
+        replay.aller_a_image_replay(lecteur, cible)
+
+        self.assertEqual(lecteur.etat.index_image, cible)
+        self.assertIn(cible - cible % 50, lecteur.instantanes)
+        self.assertEqual(resumer_joueurs(lecteur), resumer_joueurs(lecture_continue))
+        self.assertEqual(lecteur.etat.resultat.manches, lecture_continue.etat.resultat.manches)
+
+    def test_lecture_acceleree_suit_le_temps_enregistre(self) -> None:
+        """Une seconde lue en vitesse x4 consomme quatre secondes de match."""
+
+        configuration = charger_configuration_test()
+        enregistreur = replay.creer_enregistreur_replay(configuration, 0)
+        for _ in range(600):
+            replay.enregistrer_image_replay(
+                enregistreur, CommandeJoueur(), CommandeJoueur(), 0.0, 0.01
+            )
+        lecteur = replay.creer_lecteur_replay(replay.finaliser_replay(enregistreur))
+
+        rejouees = replay.avancer_duree_replay(lecteur, 1.0, vitesse=4.0)
+
+        self.assertIn(rejouees, (399, 400))
+        self.assertEqual(lecteur.etat.index_image, rejouees)
+
+    def test_configuration_et_fichier_invalides_refuses(self) -> None:
+        """Une autre configuration ou un fichier altere sont refuses."""
+
+        configuration = charger_configuration_test()
+        _, enregistrement = enregistrer_match(configuration, seed=1)
+        contenu = replay.encoder_replay(enregistrement)
+        autre_configuration = json.loads(json.dumps(configuration))
+        autre_configuration["physique"]["acceleration"] += 1.0
+
+        with self.assertRaises(ValueError):
+            replay.creer_lecteur_replay(enregistrement, autre_configuration)
+        with self.assertRaises(ValueError):
+            replay.decoder_replay(b"ABCD" + contenu[4:])
+        with self.assertRaises(ValueError):
+            replay.decoder_replay(contenu[:-10])
+
+    def test_sauvegarde_garde_les_plus_recents(self) -> None:
+        """La sauvegarde ecrit un fichier relisible et purge les plus anciens."""
+
+        configuration = charger_configuration_test()
+        _, enregistrement = enregistrer_match(configuration, seed=3)
+        with tempfile.TemporaryDirectory() as dossier:
+            chemins = []
+            for decalage in range(3):
+                enregistrement.horodatage += decalage
+                chemins.append(
+                    replay.sauvegarder_replay(enregistrement, Path(dossier), nombre_max=2)
+                )
+            restants = sorted(Path(dossier).iterdir())
+            relu = replay.charger_replay(chemins[-1])
+            sortie = io.StringIO()
+            with contextlib.redirect_stdout(sortie):
+                code = replay.main([str(chemins[-1]), "--image", "10"])
+
+        self.assertEqual(len(restants), 2)
+        self.assertEqual(relu.images, enregistrement.images)
+        self.assertEqual(code, 0)
+        self.assertIn("image 10/", sortie.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
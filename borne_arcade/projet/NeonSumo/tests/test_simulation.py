@@ -0,0 +1,138 @@
+"""Tests unitaires du simulateur de match sans affichage."""
+
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+
+DOSSIER_JEU = Path(__file__).resolve().parents[1]
+if str(DOSSIER_JEU) not in sys.path:
+    sys.path.insert(0, str(DOSSIER_JEU))
+
+from logique import EtatStyleJoueur  # noqa: E402
+from outils_tests import charger_configuration_test  # noqa: E402
+from simulation import (  # noqa: E402
+    VAINQUEUR_EGALITE,
+    CommandeJoueur,
+    EvenementsJoueur,
+    avancer_pas_manche,
+    construire_regles_simulation,
+    creer_etat_duel,
+    politique_agressive,
+    politique_attract,
+    politique_inactive,
+    simuler_match,
+)
+
+
+class TestSimulationMatch(unittest.TestCase):
+    """Valide le deroulement complet d un match simule."""
+
+    def test_match_deterministe_pour_un_meme_seed(self) -> None:
+        """Deux simulations identiques donnent exactement le meme resultat."""
+
+        configuration = charger_configuration_test()
+
+        premier = simuler_match(configuration, politique_agressive, politique_attract, seed=7)
+        second = simuler_match(configuration, politique_agressive, politique_attract, seed=7)
+
+        self.assertEqual(premier, second)
+
+    def test_match_agressif_se_termine_par_un_vainqueur(self) -> None:
+        """Un match entre politiques offensives designe un vainqueur BO3."""
+
+        configuration = charger_configuration_test()
+
+        resultat = simuler_match(configuration, politique_agressive, politique_agressive, seed=3)
+
+        self.assertIn(resultat.vainqueur, {"J1", "J2"})
+        self.assertEqual(max(resultat.score_j1, resultat.score_j2), configuration["match"]["victoires_pour_gagner"])
+        self.assertGreater(resultat.duree_totale, 0.0)
+        self.assertGreater(resultat.style_j1 + resultat.style_j2, 0)
+
+    def test_joueurs_inactifs_sortent_ensemble(self) -> None:
+        """Sans commande, l arene retrecit jusqu a une double sortie."""
+
+        configuration = charger_configuration_test()
+
+        resultat = simuler_match(
+            configuration,
+            politique_inactive,
+            politique_inactive,
+            seed=0,
+            limite_manches=2,
+        )
+
+        self.assertEqual(resultat.vainqueur, "")
+        self.assertEqual(len(resultat.manches), 2)
+        self.assertTrue(all(manche.vainqueur == VAINQUEUR_EGALITE for manche in resultat.manches))
+        self.assertFalse(any(manche.interrompue for manche in resultat.manches))
+
+    def test_pas_de_temps_invalide_refuse(self) -> None:
+        """Un pas de temps nul est refuse."""
+
+        with self.assertRaises(ValueError):
+            simuler_match(charger_configuration_test(), politique_inactive, politique_inactive, seed=0, dt=0.0)
+
+
+class TestEvenementsPas(unittest.TestCase):
+    """Valide les evenements rendus a boucle_jeu par avancer_pas_manche."""
+
+    def test_evenements_remplis_a_chaque_pas(self) -> None:
+        """Les actions reussies sont signalees au pas qui les declenche seulement."""
+
+        configuration = charger_configuration_test()
+        duel = creer_etat_duel(configuration, EtatStyleJoueur(), EtatStyleJoueur())
+        regles = construire_regles_simulation(configuration)
+        evenements = (EvenementsJoueur(), EvenementsJoueur())
+
+        avancer_pas_manche(
+            duel,
+            regles,
+            CommandeJoueur(dash=True, bouclier=True),
+            CommandeJoueur(),
+            1.0 / 60.0,
+            evenements=evenements,
+        )
+        self.assertTrue(evenements[0].dash)
+        self.assertTrue(evenements[0].bouclier)
+        self.assertFalse(evenements[0].bump)
+        self.assertEqual(evenements[1], EvenementsJoueur())
+
+        avancer_pas_manche(
+            duel, regles, CommandeJoueur(), CommandeJoueur(), 1.0 / 60.0, evenements=evenements
+        )
+        self.assertEqual(evenements[0], EvenementsJoueur())
+
+    def test_style_intact_hors_mode_competitif(self) -> None:
+        """En attract, la zone danger ne touche pas au style, comme dans ``boucle_jeu``."""
+
+        configuration = charger_configuration_test()
+        regles = construire_regles_simulation(configuration)
+        for competitif in (False, True):
+            with self.subTest(competitif=competitif):
+                duel = creer_etat_duel(configuration, EtatStyleJoueur(), EtatStyleJoueur())
+                etat_manche = duel.etat_manche
+                duel.joueur_1.position_x = etat_manche.centre_x + etat_manche.rayon_arene - 5.0
+                duel.joueur_1.position_y = etat_manche.centre_y
+
+                avancer_pas_manche(
+                    duel,
+                    regles,
+                    CommandeJoueur(),
+                    CommandeJoueur(),
+                    1.0 / 60.0,
+                    competitif=competitif,
+                )
+                self.assertEqual(duel.style_j1.dans_zone_danger, competitif)
+
+
+def main() -> None:
+    """Point d entree de la suite de tests unitaire."""
+
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
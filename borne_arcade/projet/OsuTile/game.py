@@ -23,6 +23,14 @@ from config import (
 )
 from tile import Tile
 
+# Profilage optionnel du temps image (module partage de la borne)
+try:
+    import profilage_images
+except ModuleNotFoundError:
+    profilage_images = None
+
+PROFILER = profilage_images.creer_profileur("OsuTile") if profilage_images else None
+
 
 def load_beatmap(filename):
     map_name = os.path.splitext(filename)[0]
@@ -44,7 +52,7 @@ def draw_pause_menu(screen, font):
     pygame.display.flip()
 
 
-def draw_scene(screen, font, tiles, current_time, score, combo, feedbacks):
+def draw_scene(screen, font, tiles, current_time, score, combo, feedbacks, profiler=None):
     screen.fill(BACKGROUND_COLOR)
     pygame.draw.line(
         screen, (255, 0, 0), (0, HIT_LINE_Y), (SCREEN_WIDTH, HIT_LINE_Y), 3
@@ -73,7 +81,12 @@ def draw_scene(screen, font, tiles, current_time, score, combo, feedbacks):
             screen.blit(surf, (x, HIT_LINE_Y - 40))
         else:
             feedbacks.remove(fb)
+    if profiler:
+        profilage_images.dessiner_overlay_profilage(profiler, screen)
+        profilage_images.marquer_phase(profiler, profilage_images.PHASE_DESSIN)
     pygame.display.flip()
+    if profiler:
+        profilage_images.marquer_phase(profiler, profilage_images.PHASE_PRESENTATION)
 
 
 def countdown(screen, font, tiles, current_time, score, combo, feedbacks):
@@ -146,10 +159,15 @@ def play_map(filename):
     total_notes = len(tiles)
 
     while running:
+        if PROFILER:
+            profilage_images.debuter_image(PROFILER)
         current_time = (time.time() - start_time) * 1000 if not paused else current_time
         screen.fill(BACKGROUND_COLOR)
 
-        for event in pygame.event.get():
+        events = pygame.event.get()
+        if PROFILER:
+            profilage_images.enregistrer_evenements(PROFILER, events)
+        for event in events:
             if event.type == pygame.QUIT:
                 return "quit"
             elif event.type == pygame.KEYDOWN:
@@ -207,8 +225,12 @@ def play_map(filename):
                 tile.hit = True
                 combo = 0
                 feedbacks.append(("Miss", current_time, tile.lane))
+        if PROFILER:
+            profilage_images.marquer_phase(PROFILER, profilage_images.PHASE_MISE_A_JOUR)
 
-        draw_scene(screen, font, tiles, current_time, score, combo, feedbacks)
+        draw_scene(screen, font, tiles, current_time, score, combo, feedbacks, PROFILER)
+        if PROFILER:
+            profilage_images.terminer_image(PROFILER)
 
         if all(tile.hit for tile in tiles):
             pygame.mixer.music.stop()
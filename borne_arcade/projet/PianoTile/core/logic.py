@@ -6,6 +6,12 @@ from ui.utils.color import Color
 from core.pageState import PageState
 from core.button import Button
 
+# Profilage optionnel du temps image (module partage de la borne)
+try:
+    import profilage_images
+except ModuleNotFoundError:
+    profilage_images = None
+
 class Logic:
     def __init__(self, game) -> None:
         """Initialisation de l'interface."""
@@ -13,6 +19,7 @@ class Logic:
         self.__interface = game.getInterface()
         self.__color: Color = Color()
         self.__button: Button = Button()
+        self.__profileur = profilage_images.creer_profileur("PianoTile") if profilage_images else None
 
     def getGame(self):
         """Game du jeu."""
@@ -412,8 +419,14 @@ class Logic:
                     game_view = new_game_view
                     piano = game_view.getPiano()
 
+                    profileur = self.__profileur
                     while running:
-                        for event in pygame.event.get():
+                        if profileur:
+                            profilage_images.debuter_image(profileur)
+                        events = pygame.event.get()
+                        if profileur:
+                            profilage_images.enregistrer_evenements(profileur, events)
+                        for event in events:
                             if event.type == pygame.QUIT:
                                 pygame.quit()
                                 exit()
@@ -434,6 +447,8 @@ class Logic:
                             if keys[key]:
                                 game_view.checkHit(self.getButton().update(
                                     pygame.event.Event(pygame.KEYDOWN, key=key, unicode=pygame.key.name(key))))
+                        if profileur:
+                            profilage_images.marquer_phase(profileur, profilage_images.PHASE_MISE_A_JOUR)
 
                         self.getInterface().getWindowManager().getWindow().fill((30, 30, 30))
 
@@ -447,7 +462,11 @@ class Logic:
                                 game_started = True
                                 self.getInterface().setUpdate(True)
                         else:
+                            if profileur:
+                                profilage_images.marquer_phase(profileur, profilage_images.PHASE_DESSIN)
                             game_view.update()
+                            if profileur:
+                                profilage_images.marquer_phase(profileur, profilage_images.PHASE_MISE_A_JOUR)
                             game_view.affichagePiano()
                             self.getInterface().setUpdate(True)
 
@@ -456,7 +475,14 @@ class Logic:
                                 running = False
                                 self.getInterface().setUpdate(True)
 
+                        if profileur:
+                            profilage_images.dessiner_overlay_profilage(
+                                profileur, self.getInterface().getWindowManager().getWindow())
+                            profilage_images.marquer_phase(profileur, profilage_images.PHASE_DESSIN)
                         pygame.display.flip()
+                        if profileur:
+                            profilage_images.marquer_phase(profileur, profilage_images.PHASE_PRESENTATION)
+                            profilage_images.terminer_image(profileur)
                         clock.tick(60)
 
             elif isinstance(direction, tuple):
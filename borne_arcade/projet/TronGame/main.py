@@ -12,6 +12,12 @@ from menu_main import Menu
 from game_main import Game
 from config import *  # Import all constants from config.py
 
+# Profilage optionnel du temps image (module partage de la borne)
+try:
+    import profilage_images
+except ModuleNotFoundError:
+    profilage_images = None
+
 # Initialisation de Pygame
 pygame.init()
 pygame.mixer.init()  # Pour les effets sonores et musiques
@@ -44,6 +50,7 @@ class TronGame:
         self.game = None
         self.options = None
         self.score_screen = None
+        self.profiler = profilage_images.creer_profileur("TronGame") if profilage_images else None
 
         # Lancer la musique du menu
         self.current_music = None
@@ -71,7 +78,10 @@ class TronGame:
 
     def run(self):
         while self.running:
-            for event in pygame.event.get():
+            if self.profiler:
+                profilage_images.debuter_image(self.profiler)
+            events = pygame.event.get()
+            for event in events:
                 if event.type == pygame.QUIT:
                     self.running = False
                 elif event.type == pygame.KEYDOWN:
@@ -104,6 +114,8 @@ class TronGame:
                         elif action == "menu":
                             self.current_state = "menu"
                             self.play_music("./assets/sounds/music_menu.wav")
+            if self.profiler:
+                profilage_images.enregistrer_evenements(self.profiler, events)
 
             # Mise à jour
             if self.current_state == "menu":
@@ -119,6 +131,9 @@ class TronGame:
             elif self.current_state == "score_screen" and self.score_screen:
                 self.score_screen.update()
 
+            if self.profiler:
+                profilage_images.marquer_phase(self.profiler, profilage_images.PHASE_MISE_A_JOUR)
+
             # Rendu
             self.screen.fill(BLACK)
 
@@ -130,8 +145,14 @@ class TronGame:
                 self.options.draw()
             elif self.current_state == "score_screen" and self.score_screen:
                 self.score_screen.draw()
+            if self.profiler:
+                profilage_images.dessiner_overlay_profilage(self.profiler, self.screen)
+                profilage_images.marquer_phase(self.profiler, profilage_images.PHASE_DESSIN)
 
             pygame.display.flip()
+            if self.profiler:
+                profilage_images.marquer_phase(self.profiler, profilage_images.PHASE_PRESENTATION)
+                profilage_images.terminer_image(self.profiler)
             self.clock.tick(FPS)
 
     def process_menu_action(self, action):
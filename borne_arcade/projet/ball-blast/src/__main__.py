@@ -5,6 +5,18 @@ from game import Game
 import pygame
 import random
 import os
+from pathlib import Path
+
+# Profilage optionnel du temps image (module partage de la borne)
+try:
+    import profilage_images
+except ModuleNotFoundError:
+    profilage_images = None
+
+try:
+    import highscores
+except ModuleNotFoundError:
+    highscores = None
 
 # Initialize Pygame
 pygame.init()
@@ -36,13 +48,22 @@ gameOver = False
 credits = False
 
 playMusic = True
+profiler = profilage_images.creer_profileur("ball-blast") if profilage_images else None
+# L ancien fichier n etait jamais tronque: le stock garde toutes les entrees.
+highscoreStore = None
+if highscores:
+    highscoreStore = highscores.ouvrir_stock_highscore(Path("highscore"), nombre_max_lignes=None)
 
 pygame.mixer.music.load("assets/sound/menu.mp3")
 pygame.mixer.music.play()
 
 while running:
+    if profiler:
+        profilage_images.debuter_image(profiler)
 
     events = pygame.event.get()
+    if profiler:
+        profilage_images.enregistrer_evenements(profiler, events)
     
     for event in events:
         if event.type == pygame.QUIT:
@@ -54,7 +75,7 @@ while running:
     elif not gameState:
         gameState, newGame, credits = menu.showMenu(events, pause)
         if gameState and newGame:
-            game = Game(screen)
+            game = Game(screen, highscoreStore)
             newGame = False
 
         # Si on passe du menu au jeu
@@ -77,8 +98,17 @@ while running:
             pygame.mixer.music.load("assets/sound/menu.mp3")
             pygame.mixer.music.play()
 
+    if profiler:
+        # showMenu/showGame mettent a jour et dessinent: le tout compte en dessin
+        profilage_images.dessiner_overlay_profilage(profiler, screen)
+        profilage_images.marquer_phase(profiler, profilage_images.PHASE_DESSIN)
     pygame.display.update()
+    if profiler:
+        profilage_images.marquer_phase(profiler, profilage_images.PHASE_PRESENTATION)
+        profilage_images.terminer_image(profiler)
     clock.tick(40)
 
+if highscoreStore:
+    highscores.fermer_stock_highscore(highscoreStore)
 pygame.quit()
 exit(0)
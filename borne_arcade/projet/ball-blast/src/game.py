@@ -6,10 +6,17 @@ from constantes import WHITE, BLACK, RED, GREEN, BLUE, SCREEN_WIDTH, SCREEN_HEIG
 import pygame
 import random
 
+# Stockage atomique des highscores (module partage de la borne)
+try:
+    import highscores
+except ModuleNotFoundError:
+    highscores = None
+
 
 class Game():
-    def __init__(self, screen: pygame.Surface):
+    def __init__(self, screen: pygame.Surface, highscoreStore=None):
         self.screen: pygame.Surface = screen
+        self.highscoreStore = highscoreStore
         self.level = 0
         # Création des variables de jeu
         self.ball_level = [[BLACK, 50], [RED, 40], [GREEN, 33], [BLUE, 25]]
@@ -312,6 +319,11 @@ class Game():
     
     def _saveScore(self, pseudo):
         """Sauvegarde le score avec le pseudo dans le fichier highscore, trié par score décroissant"""
+        if self.highscoreStore is not None:
+            # Ecriture atomique faite en arriere-plan
+            highscores.ajouter_score(self.highscoreStore, pseudo, self.player.score)
+            highscores.publier_instantane(self.highscoreStore)
+            return
         try:
             # Lire les scores existants
             scores = []
@@ -8,6 +8,7 @@ source "${SCRIPT_DIR}/../lib/outils_communs.sh"
 FICHIER_VERROU_POST_PULL=""
 FICHIER_JOURNAL_PIPELINE=""
 VERROU_FICHIER_ACTIF=0
+ETAPES_POST_PULL_COMPLETES="installation compilation lint tests documentation"
 
 #######################################
 # Selectionne un dossier de journaux
@@ -130,6 +131,76 @@ gerer_echec_pipeline() {
   exit "${code_retour}"
 }
 
+#######################################
+# Indique si une etape du pipeline est
+# demandee (POST_PULL_ETAPES, toutes par
+# defaut).
+# Arguments:
+#   $1: nom de l etape
+# Retour:
+#   0 si l etape doit s executer, 1 sinon
+#######################################
+etape_post_pull_demandee() {
+  local etape="$1"
+  local etapes="${POST_PULL_ETAPES-${ETAPES_POST_PULL_COMPLETES}}"
+  if [[ " ${etapes} " == *" ${etape} "* ]]; then
+    return 0
+  fi
+  journaliser "Pipeline post-pull: ${etape} ignoree (non concernee par le dernier pull)"
+  return 1
+}
+
+#######################################
+# Compile le menu et les jeux retenus
+# par le plan incremental, sinon tout.
+# Arguments:
+#   aucun
+# Retour:
+#   0
+#######################################
+compiler_post_pull() {
+  local -a environnement_compilation=("COMPILER_MENU=${POST_PULL_COMPILER_MENU:-1}")
+  if [[ -n "${POST_PULL_JEUX+x}" ]]; then
+    environnement_compilation+=("JEUX_A_COMPILER=${POST_PULL_JEUX}")
+  fi
+  env "${environnement_compilation[@]}" "${REPERTOIRE_BORNE}/compilation.sh"
+}
+
+#######################################
+# Lance les outils de lint retenus par
+# le plan incremental, sinon tous.
+# Arguments:
+#   aucun
+# Retour:
+#   0
+#######################################
+linter_post_pull() {
+  local -a environnement_lint=()
+  if [[ -n "${POST_PULL_OUTILS_LINT+x}" ]]; then
+    environnement_lint+=("LINT_OUTILS=${POST_PULL_OUTILS_LINT}")
+  fi
+  if [[ -n "${POST_PULL_REPERTOIRES_PYLINT+x}" ]]; then
+    environnement_lint+=("LINT_REPERTOIRES_PYLINT=${POST_PULL_REPERTOIRES_PYLINT}")
+  fi
+  env "${environnement_lint[@]}" "${RACINE_PROJET}/scripts/lint/lancer_lint.sh"
+}
+
+#######################################
+# Memorise le commit reconstruit avec
+# succes: le prochain plan incremental
+# part de ce commit.
+# Arguments:
+#   aucun
+# Retour:
+#   0
+#######################################
+enregistrer_commit_reconstruit() {
+  local commit
+  if commit="$(git -C "${RACINE_PROJET}" rev-parse --verify HEAD 2>/dev/null)"; then
+    printf '%s\n' "${commit}" > "${RACINE_PROJET}/.commit_derniere_maj"
+  fi
+}
+
 #######################################
 # Execute la sequence de mise a jour post pull.
 # Arguments:
@@ -138,22 +209,33 @@ gerer_echec_pipeline() {
 #   0
 #######################################
 executer_pipeline_post_pull() {
-  journaliser "Pipeline post-pull: installation"
-  INSTALLATION_SYSTEME_OPTIONNEL=1 "${RACINE_PROJET}/scripts/install/installer_borne.sh"
+  if etape_post_pull_demandee installation; then
+    journaliser "Pipeline post-pull: installation"
+    INSTALLATION_SYSTEME_OPTIONNEL=1 "${RACINE_PROJET}/scripts/install/installer_borne.sh"
+  fi
 
-  journaliser "Pipeline post-pull: compilation"
-  "${REPERTOIRE_BORNE}/compilation.sh"
+  if etape_post_pull_demandee compilation; then
+    journaliser "Pipeline post-pull: compilation"
+    compiler_post_pull
+  fi
 
-  journaliser "Pipeline post-pull: lint"
-  "${RACINE_PROJET}/scripts/lint/lancer_lint.sh"
+  if etape_post_pull_demandee lint; then
+    journaliser "Pipeline post-pull: lint"
+    linter_post_pull
+  fi
 
-  journaliser "Pipeline post-pull: tests"
-  EVITER_TEST_DEPLOIEMENT=1 "${RACINE_PROJET}/scripts/tests/lancer_suite.sh"
+  if etape_post_pull_demandee tests; then
+    journaliser "Pipeline post-pull: tests"
+    EVITER_TEST_DEPLOIEMENT=1 "${RACINE_PROJET}/scripts/tests/lancer_suite.sh"
+  fi
 
-  journaliser "Pipeline post-pull: documentation"
-  "${RACINE_PROJET}/scripts/docs/generer_documentation.sh"
+  if etape_post_pull_demandee documentation; then
+    journaliser "Pipeline post-pull: documentation"
+    "${RACINE_PROJET}/scripts/docs/generer_documentation.sh"
+  fi
 
   date '+%Y-%m-%d %H:%M:%S' > "${RACINE_PROJET}/.etat_derniere_maj"
+  enregistrer_commit_reconstruit
 }
 
 #######################################
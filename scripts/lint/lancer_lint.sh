@@ -8,12 +8,26 @@ source "${SCRIPT_DIR}/../lib/outils_communs.sh"
 VERSION_SHELLCHECK_OUTIL="${VERSION_SHELLCHECK_OUTIL:-0.10.0}"
 VERSION_CHECKSTYLE_OUTIL="${VERSION_CHECKSTYLE_OUTIL:-10.17.0}"
 VERSION_PYLINT_OUTIL="${VERSION_PYLINT_OUTIL:-3.3.1}"
+LINT_OUTILS="${LINT_OUTILS-shellcheck checkstyle pylint}"
 REPERTOIRE_OUTILS_LINT=""
 COMMANDE_SHELLCHECK=()
 COMMANDE_CHECKSTYLE=()
 COMMANDE_PYLINT=()
 REPERTOIRES_PYLINT=()
 
+#######################################
+# Indique si un outil de lint est demande
+# dans LINT_OUTILS.
+# Arguments:
+#   $1: nom de l outil
+# Retour:
+#   0 si l outil doit s executer, 1 sinon
+#######################################
+outil_lint_demande() {
+  local outil="$1"
+  [[ " ${LINT_OUTILS} " == *" ${outil} "* ]]
+}
+
 #######################################
 # Telecharge un fichier avec curl ou wget.
 # Arguments:
@@ -185,6 +199,19 @@ charger_repertoires_pylint() {
   local chemin_absolu=""
 
   REPERTOIRES_PYLINT=()
+  if [[ -n "${LINT_REPERTOIRES_PYLINT+x}" ]]; then
+    # Selection du pipeline incremental: sous-ensemble de la liste configuree.
+    local -a repertoires_demandes=()
+    read -r -a repertoires_demandes <<< "${LINT_REPERTOIRES_PYLINT}"
+    for ligne in "${repertoires_demandes[@]}"; do
+      chemin_absolu="${RACINE_PROJET}/${ligne}"
+      if [[ -d "${chemin_absolu}" ]]; then
+        REPERTOIRES_PYLINT+=("${chemin_absolu}")
+      fi
+    done
+    return 0
+  fi
+
   if [[ ! -f "${fichier_repertoires}" ]]; then
     REPERTOIRES_PYLINT=(
       "${RACINE_PROJET}/scripts"
@@ -317,12 +344,18 @@ main() {
   charger_configuration_borne
   preparer_repertoire_outils_lint
   verifier_outil_telechargement
-  assurer_shellcheck
-  assurer_checkstyle
-  assurer_pylint
-  executer_shellcheck
-  executer_checkstyle
-  executer_pylint
+  if outil_lint_demande shellcheck; then
+    assurer_shellcheck
+    executer_shellcheck
+  fi
+  if outil_lint_demande checkstyle; then
+    assurer_checkstyle
+    executer_checkstyle
+  fi
+  if outil_lint_demande pylint; then
+    assurer_pylint
+    executer_pylint
+  fi
   journaliser "Lint termine"
 }
 
@@ -26,6 +26,10 @@ main() {
   "${SCRIPT_DIR}/test_architecture.sh"
   "${SCRIPT_DIR}/test_couts.sh"
   "${SCRIPT_DIR}/test_jeux.sh"
+  # Benchmarks chronometres: trop sensibles a la charge machine pour la suite par defaut.
+  if [[ "${LANCER_TEST_PERFORMANCE:-0}" == "1" ]]; then
+    "${SCRIPT_DIR}/test_performance.sh"
+  fi
   "${SCRIPT_DIR}/test_documentation.sh"
 
   if [[ "${EVITER_TEST_DEPLOIEMENT:-0}" != "1" ]]; then
@@ -20,6 +20,10 @@ verifier_pipeline_post_pull() {
   fi
   [[ -f "${RACINE_PROJET}/.etat_derniere_maj" ]] || arreter_sur_erreur "Marqueur .etat_derniere_maj absent"
   [[ ! -f "${RACINE_PROJET}/.post_pull.lock" ]] || arreter_sur_erreur "Verrou .post_pull.lock non libere apres pipeline"
+  if git -C "${RACINE_PROJET}" rev-parse --verify HEAD >/dev/null 2>&1; then
+    [[ "$(cat "${RACINE_PROJET}/.commit_derniere_maj" 2>/dev/null)" == "$(git -C "${RACINE_PROJET}" rev-parse HEAD)" ]] \
+      || arreter_sur_erreur "Commit reconstruit .commit_derniere_maj absent ou different de HEAD"
+  fi
   find "${RACINE_PROJET}/logs" -maxdepth 1 -type f -name 'post_pull_update_*.log' | grep -q . \
     || arreter_sur_erreur "Journal post-pull absent dans logs/"
 }
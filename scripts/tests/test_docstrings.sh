@@ -48,6 +48,7 @@ def collecter_fichiers_python(dossier_racine):
     cibles = [
         dossier_racine / "scripts",
         Path(sys.argv[2]) / "projet" / "NeonSumo",
+        Path(sys.argv[2]) / "commun_python",
     ]
     fichiers = []
     for cible in cibles:
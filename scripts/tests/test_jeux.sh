@@ -114,6 +114,21 @@ tester_unitaire_pianotile() {
   )
 }
 
+#######################################
+# Execute les tests unitaires Python des
+# modules partages entre jeux.
+# Arguments:
+#   aucun
+# Retour:
+#   0
+#######################################
+tester_unitaire_commun_python() {
+  (
+    cd "${RACINE_PROJET}"
+    "${COMMANDE_PYTHON}" -m unittest discover -s borne_arcade/commun_python/tests -p "test_*.py"
+  )
+}
+
 #######################################
 # Point d entree test jeux.
 # Arguments:
@@ -128,6 +143,7 @@ main() {
   tester_unitaire_neon_sumo
   tester_unitaire_maintenance_mode
   tester_unitaire_pianotile
+  tester_unitaire_commun_python
   tester_lancement_tous_les_jeux
   journaliser "Test jeux: OK"
 }
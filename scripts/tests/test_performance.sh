@@ -0,0 +1,39 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+# shellcheck source=../lib/outils_communs.sh
+source "${SCRIPT_DIR}/../lib/outils_communs.sh"
+
+#######################################
+# Compare les benchmarks de la logique
+# Neon Sumo a la reference versionnee.
+# Arguments:
+#   aucun
+# Retour:
+#   0
+#######################################
+verifier_benchmarks_neon_sumo() {
+  local seuil="${SEUIL_REGRESSION_PERFORMANCE:-0.30}"
+  (
+    cd "${REPERTOIRE_BORNE}/projet/NeonSumo"
+    "${COMMANDE_PYTHON}" benchmark_logique.py --seuil "${seuil}"
+  ) || arreter_sur_erreur \
+    "Regression de performance detectee dans la logique Neon Sumo." \
+    "Optimisez la fonction signalee (surcout voulu: benchmark_logique.py --enregistrer)."
+}
+
+#######################################
+# Point d entree du test performance.
+# Arguments:
+#   aucun
+# Retour:
+#   0
+#######################################
+main() {
+  charger_configuration_borne
+  verifier_benchmarks_neon_sumo
+  journaliser "Test performance: OK"
+}
+
+main "$@"